@@ -4,6 +4,7 @@ from uuid import UUID
 
 from car_washes.models import CarWashServicePrice, CarWash
 from car_washes.exceptions import CarWashNotFoundError
+from core.profiling import profiled
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -30,6 +31,7 @@ class CarWashServicePriceListDto:
 class CarWashServicePriceListUseCase:
     car_wash_id: int
 
+    @profiled
     def execute(self) -> CarWashServicePriceListDto:
         try:
             car_wash = CarWash.objects.only(
@@ -2,6 +2,10 @@ from django.conf import settings
 from django.contrib import admin
 from django.urls import include, path
 
+from core.views import metrics_view
+
+
+admin.autodiscover()
 
 urlpatterns = [
     path("admin/", admin.site.urls),
@@ -12,6 +16,8 @@ urlpatterns = [
     path("photo-upload/", include("photo_upload.urls")),
     path("texts/", include("texts.urls")),
     path("dry-cleaning/", include("dry_cleaning.urls")),
+    path("internal/", include("core.urls")),
+    path("metrics", metrics_view, name="metrics"),
 ]
 
 if settings.DEBUG:
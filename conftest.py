@@ -0,0 +1,16 @@
+import pytest
+from django.core.cache import cache
+
+
+@pytest.fixture(autouse=True)
+def write_staff_activity_immediately(settings):
+    """Tests expect activity time to be stored right after a request."""
+    settings.STAFF_ACTIVITY_FLUSH_INTERVAL = 0
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Cache is not rolled back with the test database transaction."""
+    cache.clear()
+    yield
+    cache.clear()
@@ -1,8 +1,142 @@
+from django.contrib import admin
 from django.contrib.admin import site
 from django.conf import settings
+from django.core.exceptions import PermissionDenied
+from django.db import router
+from django.http import FileResponse, StreamingHttpResponse
+from import_export.formats.base_formats import CSV, XLSX
+from import_export.signals import post_export
+
+from core.exports import iter_csv_chunks, write_xlsx
+from core.models import ProfilingRule, SlowQuery
+from core.replica import using_replica
+
+
+__all__ = ("ReplicaExportMixin", "StreamingExportMixin")
 
 
 if settings.APP_NAME:
     site.site_header = f"{settings.APP_NAME} admin"
     site.site_title = f"{settings.APP_NAME} admin"
     site.index_title = f"{settings.APP_NAME} administration"
+
+
+class ReplicaExportMixin:
+    """
+    Read rows of django-import-export exports from the replica,
+    so large exports do not load the primary database.
+    """
+
+    def get_data_for_export(self, request, queryset, **kwargs):
+        with using_replica():
+            return super().get_data_for_export(request, queryset, **kwargs)
+
+
+class StreamingExportMixin(ReplicaExportMixin):
+    """
+    Export CSV and XLSX files row by row instead of building a dataset of
+    all rows first. Rows are read from the replica in chunks of
+    ``export_chunk_size`` with ``export_select_related`` relations joined,
+    so fields resolved through foreign keys do not query every row.
+    Other formats are exported by django-import-export as usual.
+    """
+
+    export_select_related: tuple[str, ...] = ()
+    export_chunk_size: int = 2000
+
+    def _do_file_export(self, file_format, request, queryset, export_form=None):
+        if not isinstance(file_format, (CSV, XLSX)):
+            return super()._do_file_export(
+                file_format,
+                request,
+                queryset,
+                export_form=export_form,
+            )
+        if not self.has_export_permission(request):
+            raise PermissionDenied
+
+        resource_class = self.choose_export_resource_class(export_form, request)
+        resource = resource_class(**self.get_export_resource_kwargs(request))
+        export_fields = self.get_export_resource_fields_from_form(export_form)
+        force_native_type = isinstance(file_format, XLSX)
+
+        # Routing is resolved now, rows are read while the response is sent.
+        with using_replica():
+            database = router.db_for_read(self.model)
+        queryset = resource.filter_export(
+            queryset.using(database).select_related(*self.export_select_related),
+        )
+        headers = [
+            str(header)
+            for header in resource.get_export_headers(selected_fields=export_fields)
+        ]
+        rows = (
+            resource.export_resource(
+                instance,
+                selected_fields=export_fields,
+                force_native_type=force_native_type,
+            )
+            for instance in queryset.iterator(chunk_size=self.export_chunk_size)
+        )
+        filename = self.get_export_filename(request, queryset, file_format)
+
+        if force_native_type:
+            response = FileResponse(
+                write_xlsx(headers, rows),
+                as_attachment=True,
+                filename=filename,
+                content_type=file_format.get_content_type(),
+            )
+        else:
+            response = StreamingHttpResponse(
+                iter_csv_chunks(
+                    headers,
+                    rows,
+                    encoding=self.to_encoding or settings.DEFAULT_CHARSET,
+                ),
+                content_type=file_format.get_content_type(),
+            )
+            response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        post_export.send(sender=None, model=self.model)
+        return response
+
+
+@admin.register(ProfilingRule)
+class ProfilingRuleAdmin(admin.ModelAdmin):
+    list_display = ("operation_name", "sample_rate", "is_enabled")
+    list_editable = ("sample_rate", "is_enabled")
+    search_fields = ("operation_name",)
+
+
+@admin.register(SlowQuery)
+class SlowQueryAdmin(admin.ModelAdmin):
+    list_display = (
+        "__str__",
+        "count",
+        "duration_sum",
+        "duration_max",
+        "p95_duration",
+        "last_seen_at",
+        "explained_at",
+    )
+    ordering = ("-duration_sum",)
+    search_fields = ("fingerprint",)
+    readonly_fields = (
+        "fingerprint",
+        "sql",
+        "count",
+        "duration_sum",
+        "duration_max",
+        "p95_duration",
+        "plan_sql",
+        "plan",
+        "explained_at",
+        "first_seen_at",
+        "last_seen_at",
+    )
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
@@ -0,0 +1,17 @@
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+
+
+__all__ = ("is_cache_shared",)
+
+# Backends whose entries are seen only by the process that set them.
+PROCESS_LOCAL_CACHE_BACKENDS = (LocMemCache, DummyCache)
+
+
+def is_cache_shared(alias: str = "default") -> bool:
+    """
+    Whether entries of the cache are seen by all worker processes,
+    so deleting one invalidates it everywhere.
+    """
+    return not isinstance(caches[alias], PROCESS_LOCAL_CACHE_BACKENDS)
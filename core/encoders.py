@@ -0,0 +1,215 @@
+import dataclasses
+import datetime
+import enum
+import functools
+import itertools
+import types
+import typing
+from collections.abc import (
+    Callable,
+    Collection,
+    Iterable,
+    Mapping,
+    Sequence,
+    Set,
+)
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+from django.conf import settings
+from django.utils import timezone
+from rest_framework import serializers
+
+
+__all__ = (
+    "encode_dataclass",
+    "encode_value",
+    "get_dataclass_encoder",
+)
+
+# Called with an instance and the timezone datetimes are represented in.
+DataclassEncoder = Callable[[Any, datetime.tzinfo | None], dict]
+
+# Values of these types are passed to the JSON encoder as is.
+PLAIN_TYPES: frozenset[type] = frozenset({int, float, str, bool, type(None)})
+LIST_ORIGINS: frozenset[type] = frozenset(
+    {list, tuple, set, frozenset, Collection, Iterable, Sequence, Set},
+)
+DICT_ORIGINS: frozenset[type] = frozenset({dict, Mapping})
+
+datetime_field = serializers.DateTimeField()
+
+
+def encode_datetime(
+    value: datetime.datetime,
+    current_timezone: datetime.tzinfo | None,
+) -> str:
+    """
+    Represent the datetime as DRF ``DateTimeField`` does, without looking
+    up the current timezone for every value.
+    """
+    if value.tzinfo is None:
+        # Naive datetimes are rare, DRF makes them aware.
+        return datetime_field.to_representation(value)
+    if current_timezone is None:
+        value = value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    else:
+        value = value.astimezone(current_timezone)
+    representation = value.isoformat()
+    if representation.endswith("+00:00"):
+        representation = representation[:-6] + "Z"
+    return representation
+
+
+def encode_value(value: Any, current_timezone: datetime.tzinfo | None) -> Any:
+    """
+    Encode a value whose type is not known in advance,
+    e.g. annotated with ``Any`` or a union of several types.
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        if isinstance(value, enum.Enum):
+            return value.value
+        return value
+    if isinstance(value, datetime.datetime):
+        return encode_datetime(value, current_timezone)
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (UUID, Decimal)):
+        return str(value)
+    if isinstance(value, enum.Enum):
+        return value.value
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return get_dataclass_encoder(type(value))(value, current_timezone)
+    if isinstance(value, Mapping):
+        return {
+            key: encode_value(item, current_timezone) for key, item in value.items()
+        }
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [encode_value(item, current_timezone) for item in value]
+    return value
+
+
+class DataclassEncoderCompiler:
+    """
+    Generate source of a function converting instances of a dataclass
+    to dicts, with conversion of each field picked once from its
+    annotation instead of on every call.
+    """
+
+    def __init__(self, dataclass_type: type):
+        self.__dataclass_type = dataclass_type
+        self.__namespace: dict[str, Any] = {}
+        self.__names_ids = itertools.count()
+
+    def compile(self) -> DataclassEncoder:
+        type_hints = typing.get_type_hints(self.__dataclass_type)
+        items = [
+            f"{field.name!r}: "
+            + self.get_expression(type_hints[field.name], f"instance.{field.name}")
+            for field in dataclasses.fields(self.__dataclass_type)
+        ]
+        function_name = f"encode_{self.__dataclass_type.__name__}"
+        source = (
+            f"def {function_name}(instance, current_timezone):\n"
+            f"    return {{{', '.join(items)}}}\n"
+        )
+        exec(source, self.__namespace)
+        return self.__namespace[function_name]
+
+    def get_name(self, prefix: str) -> str:
+        return f"{prefix}{next(self.__names_ids)}"
+
+    def add_to_namespace(self, value: Any) -> str:
+        name = self.get_name("_")
+        self.__namespace[name] = value
+        return name
+
+    def call(self, function: Callable, value: str) -> str:
+        return f"{self.add_to_namespace(function)}({value}, current_timezone)"
+
+    def get_expression(self, annotation: Any, value: str) -> str:
+        """Python expression converting ``value`` of the annotated type."""
+        if annotation in PLAIN_TYPES:
+            return value
+
+        origin = typing.get_origin(annotation)
+        arguments = typing.get_args(annotation)
+
+        if origin in (typing.Union, types.UnionType):
+            not_none_types = [
+                argument for argument in arguments if argument is not type(None)
+            ]
+            if len(not_none_types) != 1:
+                return self.call(encode_value, value)
+            expression = self.get_expression(not_none_types[0], value)
+            if expression == value:
+                return value
+            return f"(None if {value} is None else {expression})"
+
+        if origin in LIST_ORIGINS:
+            if origin is tuple and arguments[1:] != (...,):
+                # Items of fixed length tuples may be of different types.
+                item_annotation = Any
+            else:
+                item_annotation = arguments[0] if arguments else Any
+            item = self.get_name("item")
+            item_expression = self.get_expression(item_annotation, item)
+            if item_expression == item:
+                return f"list({value})"
+            return f"[{item_expression} for {item} in {value}]"
+
+        if origin in DICT_ORIGINS:
+            value_annotation = arguments[1] if arguments else Any
+            key = self.get_name("key")
+            item = self.get_name("item")
+            item_expression = self.get_expression(value_annotation, item)
+            if item_expression == item:
+                return f"dict({value})"
+            return (
+                f"{{{key}: {item_expression}" f" for {key}, {item} in {value}.items()}}"
+            )
+
+        if origin is typing.Literal:
+            return value
+
+        if isinstance(annotation, type):
+            if dataclasses.is_dataclass(annotation):
+                return self.call(get_dataclass_encoder(annotation), value)
+            if issubclass(annotation, enum.Enum):
+                return f"{value}.value"
+            if issubclass(annotation, datetime.datetime):
+                return self.call(encode_datetime, value)
+            if issubclass(annotation, (datetime.date, datetime.time)):
+                return f"{value}.isoformat()"
+            if issubclass(annotation, (UUID, Decimal)):
+                return f"str({value})"
+            if issubclass(annotation, (bool, int, float, str)):
+                return value
+
+        return self.call(encode_value, value)
+
+
+@functools.cache
+def get_dataclass_encoder(dataclass_type: type) -> DataclassEncoder:
+    """
+    Function converting instances of the dataclass to JSON-compatible
+    dicts the way DRF serializers with the same fields would: dates in
+    ISO 8601, datetimes in the given timezone, UUIDs and decimals as
+    strings, enums as their values, nested dataclasses and lists
+    converted recursively. Compiled once per dataclass.
+    """
+    if not dataclasses.is_dataclass(dataclass_type):
+        raise TypeError(f"{dataclass_type!r} is not a dataclass")
+    return DataclassEncoderCompiler(dataclass_type).compile()
+
+
+def get_representation_timezone() -> datetime.tzinfo | None:
+    if settings.USE_TZ:
+        return timezone.get_current_timezone()
+    return None
+
+
+def encode_dataclass(instance: Any) -> dict:
+    encoder = get_dataclass_encoder(type(instance))
+    return encoder(instance, get_representation_timezone())
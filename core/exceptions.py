@@ -1,7 +1,10 @@
 from typing import Any
 
 import drf_standardized_errors.formatter
+from django.utils.translation import gettext_lazy as _
 from drf_standardized_errors.types import ErrorResponse
+from rest_framework import status
+from rest_framework.exceptions import APIException
 
 
 class ExceptionFormatter(drf_standardized_errors.formatter.ExceptionFormatter):
@@ -16,3 +19,21 @@ class ExceptionFormatter(drf_standardized_errors.formatter.ExceptionFormatter):
                 del error["attr"]
 
         return error_response
+
+
+class InvalidIdempotencyKeyError(APIException):
+    status_code = status.HTTP_400_BAD_REQUEST
+    default_detail = _("idempotency key must be from 1 to 255 characters long")
+    default_code = "invalid_idempotency_key"
+
+
+class IdempotencyKeyInUseError(APIException):
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = _("request with this idempotency key is being processed")
+    default_code = "idempotency_key_in_use"
+
+
+class IdempotencyKeyReusedError(APIException):
+    status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+    default_detail = _("idempotency key is already used for another request")
+    default_code = "idempotency_key_reused"
@@ -0,0 +1,72 @@
+import csv
+import io
+import tempfile
+from collections.abc import Iterable, Iterator
+from typing import Any, BinaryIO, Final
+
+from openpyxl import Workbook
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE, KNOWN_TYPES
+
+
+__all__ = (
+    "EXPORT_CSV_CHUNK_SIZE",
+    "iter_csv_chunks",
+    "write_xlsx",
+)
+
+# Characters of CSV written before the buffer is flushed to the response.
+EXPORT_CSV_CHUNK_SIZE: Final[int] = 64 * 1024
+
+
+def iter_csv_chunks(
+    headers: Iterable[Any],
+    rows: Iterable[Iterable[Any]],
+    *,
+    encoding: str = "utf-8",
+) -> Iterator[bytes]:
+    """
+    Encode the rows as CSV in chunks of about ``EXPORT_CSV_CHUNK_SIZE``
+    characters, so the whole file is never held in memory.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(headers)
+    for row in rows:
+        writer.writerow(row)
+        if buffer.tell() >= EXPORT_CSV_CHUNK_SIZE:
+            yield buffer.getvalue().encode(encoding)
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode(encoding)
+
+
+def clean_xlsx_value(value: Any) -> Any:
+    """Strip characters Excel rejects and stringify types it can not store."""
+    if isinstance(value, str):
+        return ILLEGAL_CHARACTERS_RE.sub("", value)
+    if not isinstance(value, KNOWN_TYPES):
+        return str(value)
+    return value
+
+
+def write_xlsx(
+    headers: Iterable[Any],
+    rows: Iterable[Iterable[Any]],
+) -> BinaryIO:
+    """
+    Write the rows to a write-only workbook, which keeps them in temporary
+    files instead of memory.
+
+    Returns:
+        Temporary file with the workbook positioned at its start.
+    """
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet()
+    worksheet.append([clean_xlsx_value(header) for header in headers])
+    for row in rows:
+        worksheet.append([clean_xlsx_value(value) for value in row])
+
+    file = tempfile.TemporaryFile()
+    workbook.save(file)
+    file.seek(0)
+    return file
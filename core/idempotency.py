@@ -0,0 +1,174 @@
+import datetime
+import functools
+import hashlib
+import json
+from collections.abc import Callable
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from core.exceptions import (
+    IdempotencyKeyInUseError,
+    IdempotencyKeyReusedError,
+    InvalidIdempotencyKeyError,
+)
+from core.models import IdempotencyKey
+
+
+__all__ = (
+    "IDEMPOTENCY_KEY_HEADER",
+    "IDEMPOTENT_REPLAYED_HEADER",
+    "idempotent",
+)
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+IDEMPOTENT_REPLAYED_HEADER = "Idempotent-Replayed"
+IDEMPOTENCY_KEY_MAX_LENGTH = 255
+
+ViewMethod = Callable[..., Response]
+
+
+def get_request_fingerprint(request: Request, kwargs: dict) -> str:
+    serialized_request = json.dumps(
+        {"data": request.data, "kwargs": kwargs},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(serialized_request.encode()).hexdigest()
+
+
+def get_idempotency_key_hash(idempotency_key: str) -> str:
+    return hashlib.sha256(idempotency_key.encode()).hexdigest()
+
+
+def replay_response(
+    stored_key: IdempotencyKey,
+    request_fingerprint: str,
+) -> Response:
+    if stored_key.request_fingerprint != request_fingerprint:
+        raise IdempotencyKeyReusedError
+    return Response(
+        stored_key.response_data,
+        status=stored_key.status_code,
+        headers={IDEMPOTENT_REPLAYED_HEADER: "true"},
+    )
+
+
+def lock_idempotency_key(
+    *,
+    name: str,
+    key_hash: str,
+    request_fingerprint: str,
+) -> IdempotencyKey | Response:
+    """
+    Take the key for the request, or replay the stored response of it.
+
+    Expired keys and keys locked longer than ``IDEMPOTENCY_LOCK_TIMEOUT``
+    (e.g. the worker was killed) are taken over.
+
+    Returns:
+        Locked key, or the replayed response.
+
+    Raises:
+        IdempotencyKeyInUseError: If request with the same key is
+                                  being processed.
+        IdempotencyKeyReusedError: If the key is used for a request
+                                   with different data.
+    """
+    now = timezone.now()
+    expired_before = now - datetime.timedelta(seconds=settings.IDEMPOTENCY_KEY_TTL)
+    lock_expired_before = now - datetime.timedelta(
+        seconds=settings.IDEMPOTENCY_LOCK_TIMEOUT,
+    )
+    IdempotencyKey.objects.filter(created_at__lt=expired_before).delete()
+
+    try:
+        with transaction.atomic():
+            return IdempotencyKey.objects.create(
+                name=name,
+                key_hash=key_hash,
+                request_fingerprint=request_fingerprint,
+                locked_at=now,
+                created_at=now,
+            )
+    except IntegrityError:
+        pass
+
+    stored_key = IdempotencyKey.objects.filter(name=name, key_hash=key_hash).first()
+    if stored_key is None:
+        raise IdempotencyKeyInUseError
+    if stored_key.status_code is not None:
+        return replay_response(stored_key, request_fingerprint)
+    is_taken_over = IdempotencyKey.objects.filter(
+        id=stored_key.id,
+        status_code__isnull=True,
+        locked_at__lt=lock_expired_before,
+    ).update(
+        request_fingerprint=request_fingerprint,
+        locked_at=now,
+        created_at=now,
+    )
+    if not is_taken_over:
+        raise IdempotencyKeyInUseError
+    stored_key.request_fingerprint = request_fingerprint
+    return stored_key
+
+
+def idempotent(name: str) -> Callable[[ViewMethod], ViewMethod]:
+    """
+    Replay response of the view method for requests repeated with the same
+    ``Idempotency-Key`` header, e.g. retries of the Telegram bot on timeout,
+    instead of doing the work again.
+
+    Successful responses are stored in the database for
+    ``IDEMPOTENCY_KEY_TTL`` seconds, so retries are replayed by any worker
+    process. Failed requests are not stored, so they can be retried with
+    the same key. Requests without the header are processed as usual.
+
+    Args:
+        name: name of the operation keys are scoped to.
+
+    Raises:
+        InvalidIdempotencyKeyError: If key is empty or too long.
+        IdempotencyKeyInUseError: If request with the same key is
+                                  being processed.
+        IdempotencyKeyReusedError: If the key is used for a request
+                                   with different data.
+    """
+
+    def decorator(view_method: ViewMethod) -> ViewMethod:
+        @functools.wraps(view_method)
+        def wrapper(view, request: Request, *args, **kwargs) -> Response:
+            idempotency_key: str | None = request.headers.get(IDEMPOTENCY_KEY_HEADER)
+            if idempotency_key is None:
+                return view_method(view, request, *args, **kwargs)
+            if not 0 < len(idempotency_key) <= IDEMPOTENCY_KEY_MAX_LENGTH:
+                raise InvalidIdempotencyKeyError
+
+            request_fingerprint = get_request_fingerprint(request, kwargs)
+            locked_key = lock_idempotency_key(
+                name=name,
+                key_hash=get_idempotency_key_hash(idempotency_key),
+                request_fingerprint=request_fingerprint,
+            )
+            if isinstance(locked_key, Response):
+                return locked_key
+
+            response = None
+            try:
+                response = view_method(view, request, *args, **kwargs)
+            finally:
+                if response is not None and response.status_code < 300:
+                    locked_key.status_code = response.status_code
+                    locked_key.response_data = response.data
+                    locked_key.save(update_fields=("status_code", "response_data"))
+                else:
+                    locked_key.delete()
+            return response
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,533 @@
+"""
+Load generator simulating the night-shift peak, when drivers start
+shifts, transfer cars to car washes, switch car washes, request dry
+cleaning and finish shifts with photos.
+
+Requests go through the real URLconf and middleware in threads, one
+session per driver. Telegram, S3 and photo downloads are replaced with
+local stand-ins. Used by the ``run_load_test`` command, which runs it
+against a throwaway test database.
+"""
+
+import contextlib
+import datetime
+import io
+import math
+import random
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Final
+from unittest import mock
+from uuid import UUID
+
+from django.db import connection, connections
+from django.test import Client
+from django.urls import reverse
+from django.utils import timezone
+
+from car_washes.tests.factories import (
+    CarWashFactory,
+    CarWashServiceFactory,
+    CarWashServicePriceFactory,
+)
+from dry_cleaning.models.dry_cleaning_admins import DryCleaningAdmin
+from economics.models import StaffServicePrice
+from shifts.models import CarToWash
+from shifts.tests.factories import ShiftFactory
+
+
+__all__ = (
+    "DriverBehaviour",
+    "EndpointStats",
+    "LoadTestData",
+    "LoadTestReport",
+    "run_load_test",
+    "seed_load_test_data",
+    "use_external_service_stand_ins",
+)
+
+LOCK_WAIT_SAMPLING_INTERVAL: Final[float] = 0.05
+CAR_NUMBER_LETTERS: Final[str] = "АВЕКМНОРСТУХ"
+# Photos are only passed through to the S3 stand-in.
+FAKE_PHOTO: Final[bytes] = b"\xff\xd8\xff\xe0" + b"\x00" * 2048 + b"\xff\xd9"
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class DriverBehaviour:
+    """Random distributions of actions of a driver during a shift."""
+
+    min_cars_per_shift: int = 5
+    max_cars_per_shift: int = 20
+    car_wash_switch_probability: float = 0.1
+    additional_services_probability: float = 0.3
+    dry_cleaning_probability: float = 0.05
+    finish_photos_count: int = 4
+    # Seconds a driver waits between requests.
+    min_think_time: float = 0
+    max_think_time: float = 0.5
+    # Latency of Telegram and S3 stand-ins in seconds.
+    external_service_latency: float = 0.05
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Driver:
+    staff_id: int
+    shift_id: int
+    car_wash_id: int
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class LoadTestData:
+    drivers: list[Driver]
+    car_wash_ids: list[int]
+    service_ids: list[UUID]
+
+
+def seed_load_test_data(
+    *,
+    drivers_count: int,
+    car_washes_count: int,
+    services_count: int,
+    shift_date: datetime.date,
+) -> LoadTestData:
+    """
+    Confirmed not started shifts of the shift date, car washes and
+    prices, existing staff service prices are kept.
+    """
+    car_washes = CarWashFactory.create_batch(car_washes_count)
+    services = CarWashServiceFactory.create_batch(services_count, parent=None)
+    for car_wash in car_washes:
+        for service in services:
+            CarWashServicePriceFactory(car_wash=car_wash, service=service)
+    StaffServicePrice.objects.bulk_create(
+        [
+            StaffServicePrice(service=service, price=random.randint(100, 1000))
+            for service in StaffServicePrice.ServiceType.values
+        ],
+        ignore_conflicts=True,
+    )
+    DryCleaningAdmin.objects.get_or_create(id=1, defaults={"name": "load test"})
+
+    shifts = [
+        ShiftFactory(
+            date=shift_date,
+            started_at=None,
+            finished_at=None,
+            rejected_at=None,
+            confirmed_at=timezone.now(),
+            car_wash=random.choice(car_washes),
+        )
+        for _ in range(drivers_count)
+    ]
+    return LoadTestData(
+        drivers=[
+            Driver(
+                staff_id=shift.staff_id,
+                shift_id=shift.id,
+                car_wash_id=shift.car_wash_id,
+            )
+            for shift in shifts
+        ],
+        car_wash_ids=[car_wash.id for car_wash in car_washes],
+        service_ids=[service.id for service in services],
+    )
+
+
+class FakeTelegramBot:
+    def __init__(self, token: str, *, latency: float):
+        self.token = token
+        self.latency = latency
+
+    def __wait(self) -> None:
+        time.sleep(self.latency)
+
+    def send_message(self, chat_id, text, **kwargs) -> SimpleNamespace:
+        self.__wait()
+        return SimpleNamespace(message_id=1, chat_id=chat_id, text=text)
+
+    def send_media_group(self, chat_id, media, **kwargs) -> list:
+        self.__wait()
+        return []
+
+    def get_chat(self, chat_id) -> SimpleNamespace:
+        self.__wait()
+        return SimpleNamespace(id=chat_id, username=None)
+
+    def get_file_url(self, file_id: str) -> str:
+        self.__wait()
+        return f"https://telegram.test/file/{file_id}.jpg"
+
+
+class FakeS3Client:
+    def __init__(self, *, latency: float, **kwargs):
+        self.latency = latency
+
+    def put_object(self, bucket_name, object_name, data, length, **kwargs):
+        data.read(length)
+        time.sleep(self.latency)
+        return SimpleNamespace(bucket_name=bucket_name, object_name=object_name)
+
+
+@dataclass(frozen=True, slots=True)
+class FakeHttpResponse:
+    content: bytes = FAKE_PHOTO
+    headers: dict = field(default_factory=lambda: {"Content-Type": "image/jpeg"})
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+@contextlib.contextmanager
+def use_external_service_stand_ins(latency: float) -> Iterator[None]:
+    """
+    Replace Telegram bot, S3 client and photo downloads,
+    which are imported on first use, with local stand-ins.
+    """
+
+    def get(url: str, **kwargs) -> FakeHttpResponse:
+        time.sleep(latency)
+        return FakeHttpResponse()
+
+    def create_bot(token: str, *args, **kwargs) -> FakeTelegramBot:
+        return FakeTelegramBot(token, latency=latency)
+
+    def create_s3_client(**kwargs) -> FakeS3Client:
+        return FakeS3Client(latency=latency, **kwargs)
+
+    with (
+        mock.patch("telebot.TeleBot", create_bot),
+        mock.patch("minio.Minio", create_s3_client),
+        mock.patch("httpx.get", get),
+    ):
+        yield
+
+
+@dataclass(slots=True)
+class EndpointStats:
+    durations: list[float] = field(default_factory=list)
+    status_code_counts: Counter[int] = field(default_factory=Counter)
+    # Seconds requests to the endpoint waited for database locks.
+    lock_wait: float = 0
+
+    @property
+    def request_count(self) -> int:
+        return len(self.durations)
+
+    @property
+    def error_count(self) -> int:
+        return sum(
+            count
+            for status_code, count in self.status_code_counts.items()
+            if status_code >= 400
+        )
+
+    def get_percentile(self, percentile: float) -> float:
+        """Duration percentile, nearest-rank method."""
+        if not self.durations:
+            return 0
+        durations = sorted(self.durations)
+        rank = math.ceil(len(durations) * percentile / 100)
+        return durations[max(rank, 1) - 1]
+
+
+@dataclass(slots=True)
+class LoadTestReport:
+    duration: float = 0
+    endpoint_to_stats: dict[str, EndpointStats] = field(default_factory=dict)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def add(self, *, endpoint: str, duration: float, status_code: int) -> None:
+        with self.lock:
+            stats = self.endpoint_to_stats.setdefault(endpoint, EndpointStats())
+            stats.durations.append(duration)
+            stats.status_code_counts[status_code] += 1
+
+    def add_lock_wait(self, *, endpoint: str, duration: float) -> None:
+        with self.lock:
+            stats = self.endpoint_to_stats.setdefault(endpoint, EndpointStats())
+            stats.lock_wait += duration
+
+    def render(self) -> str:
+        header = (
+            f"{'endpoint':<46} {'requests':>8} {'errors':>6} {'rps':>7}"
+            f" {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8}"
+            f" {'lock wait s':>11}"
+        )
+        lines = [header, "-" * len(header)]
+        for endpoint, stats in sorted(self.endpoint_to_stats.items()):
+            throughput = stats.request_count / self.duration if self.duration else 0
+            lines.append(
+                f"{endpoint:<46} {stats.request_count:>8} {stats.error_count:>6}"
+                f" {throughput:>7.2f}"
+                f" {stats.get_percentile(50) * 1000:>8.1f}"
+                f" {stats.get_percentile(95) * 1000:>8.1f}"
+                f" {stats.get_percentile(99) * 1000:>8.1f}"
+                f" {stats.get_percentile(100) * 1000:>8.1f}"
+                f" {stats.lock_wait:>11.2f}"
+            )
+        request_count = sum(
+            stats.request_count for stats in self.endpoint_to_stats.values()
+        )
+        lines.append(
+            f"{request_count} requests in {self.duration:.1f} seconds,"
+            f" {request_count / self.duration if self.duration else 0:.2f} rps"
+        )
+        return "\n".join(lines)
+
+
+class LockWaitSampler:
+    """
+    Sample PostgreSQL backends waiting for locks. Every driver session
+    sets ``application_name`` of its connection to the current endpoint,
+    so lock waits are attributed to endpoints.
+    """
+
+    def __init__(self, report: LoadTestReport, interval: float):
+        self.__report = report
+        self.__interval = interval
+        self.__stop_event = threading.Event()
+        self.__thread = threading.Thread(target=self.__run, name="lock-wait-sampler")
+
+    def __enter__(self) -> "LockWaitSampler":
+        self.__thread.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.__stop_event.set()
+        self.__thread.join()
+
+    def __run(self) -> None:
+        try:
+            while not self.__stop_event.wait(self.__interval):
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        "SELECT application_name, count(*) FROM pg_stat_activity"
+                        " WHERE wait_event_type = 'Lock'"
+                        " AND datname = current_database()"
+                        " AND application_name <> ''"
+                        " GROUP BY application_name",
+                    )
+                    rows = cursor.fetchall()
+                for endpoint, count in rows:
+                    self.__report.add_lock_wait(
+                        endpoint=endpoint,
+                        duration=count * self.__interval,
+                    )
+        finally:
+            connections.close_all()
+
+
+def generate_car_number() -> str:
+    return (
+        f"{random.choice(CAR_NUMBER_LETTERS)}{random.randint(100, 999)}"
+        f"{random.choice(CAR_NUMBER_LETTERS)}{random.choice(CAR_NUMBER_LETTERS)}"
+        f"{random.randint(100, 999)}"
+    )
+
+
+class DriverSession:
+    def __init__(
+        self,
+        *,
+        driver: Driver,
+        data: LoadTestData,
+        behaviour: DriverBehaviour,
+        report: LoadTestReport,
+        track_lock_waits: bool,
+    ):
+        self.__driver = driver
+        self.__data = data
+        self.__behaviour = behaviour
+        self.__report = report
+        self.__track_lock_waits = track_lock_waits
+        self.__client = Client(raise_request_exception=False)
+        self.__car_wash_id = driver.car_wash_id
+
+    def __think(self) -> None:
+        time.sleep(
+            random.uniform(
+                self.__behaviour.min_think_time,
+                self.__behaviour.max_think_time,
+            )
+        )
+
+    def __request(self, endpoint: str, path: str, **kwargs):
+        if self.__track_lock_waits:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT set_config('application_name', %s, false)",
+                    (endpoint,),
+                )
+        method = endpoint.split(" ", 1)[0].lower()
+        started_at = time.perf_counter()
+        response = getattr(self.__client, method)(path, **kwargs)
+        self.__report.add(
+            endpoint=endpoint,
+            duration=time.perf_counter() - started_at,
+            status_code=response.status_code,
+        )
+        self.__think()
+        return response
+
+    def __switch_car_wash(self) -> None:
+        other_car_wash_ids = [
+            car_wash_id
+            for car_wash_id in self.__data.car_wash_ids
+            if car_wash_id != self.__car_wash_id
+        ]
+        if not other_car_wash_ids:
+            return
+        self.__car_wash_id = random.choice(other_car_wash_ids)
+        self.__request(
+            "PATCH /shifts/current/<staff_id>/car-washes/",
+            reverse("shifts:current-shift-car-wash", args=(self.__driver.staff_id,)),
+            data={"car_wash_id": self.__car_wash_id},
+            content_type="application/json",
+        )
+
+    def __add_car(self) -> None:
+        additional_services = []
+        if random.random() < self.__behaviour.additional_services_probability:
+            additional_services = [
+                {"id": str(service_id), "count": random.randint(1, 3)}
+                for service_id in random.sample(
+                    self.__data.service_ids,
+                    k=random.randint(1, len(self.__data.service_ids)),
+                )
+            ]
+        self.__request(
+            "POST /shifts/cars/",
+            reverse("shifts:transferred-car-list-create"),
+            data={
+                "staff_id": self.__driver.staff_id,
+                "number": generate_car_number(),
+                "car_class": random.choice(CarToWash.CarType.values),
+                "wash_type": random.choice(CarToWash.WashType.values),
+                "windshield_washer_type": random.choice(
+                    CarToWash.WindshieldWasherType.values,
+                ),
+                "windshield_washer_refilled_bottle_percentage": random.randint(0, 100),
+                "additional_services": additional_services,
+            },
+            content_type="application/json",
+        )
+
+    def __request_dry_cleaning(self) -> None:
+        self.__request(
+            "POST /dry-cleaning/requests/",
+            reverse("dry-cleaning-request-list-create"),
+            data={
+                "shift_id": self.__driver.shift_id,
+                "car_number": generate_car_number(),
+                "photo_file_ids": ["load-test-photo-1", "load-test-photo-2"],
+                "services": [
+                    {"id": str(random.choice(self.__data.service_ids)), "count": 1},
+                ],
+            },
+            content_type="application/json",
+        )
+
+    def __upload_photo(self) -> None:
+        photo = io.BytesIO(FAKE_PHOTO)
+        photo.name = "photo.jpg"
+        self.__request(
+            "POST /photo-upload/",
+            reverse("photo_upload"),
+            data={"photo": photo, "folder": "shift_finish"},
+        )
+
+    def run(self) -> None:
+        staff_id = self.__driver.staff_id
+        try:
+            self.__request(
+                "POST /shifts/start/",
+                reverse("shifts:start"),
+                data={"shift_id": self.__driver.shift_id},
+                content_type="application/json",
+            )
+            self.__request(
+                "GET /shifts/current/<staff_id>/",
+                reverse("shifts:current-shift", args=(staff_id,)),
+            )
+            cars_count = random.randint(
+                self.__behaviour.min_cars_per_shift,
+                self.__behaviour.max_cars_per_shift,
+            )
+            for _ in range(cars_count):
+                if random.random() < self.__behaviour.car_wash_switch_probability:
+                    self.__switch_car_wash()
+                self.__add_car()
+                if random.random() < self.__behaviour.dry_cleaning_probability:
+                    self.__request_dry_cleaning()
+
+            self.__request(
+                "GET /shifts/cars/",
+                reverse("shifts:transferred-car-list-create"),
+                data={"shift_id": self.__driver.shift_id},
+            )
+            for _ in range(self.__behaviour.finish_photos_count):
+                self.__upload_photo()
+            self.__request(
+                "POST /shifts/finish/",
+                reverse("shifts:finish"),
+                data={
+                    "staff_id": staff_id,
+                    "photo_file_ids": [
+                        f"load-test-finish-photo-{index}"
+                        for index in range(self.__behaviour.finish_photos_count)
+                    ],
+                },
+                content_type="application/json",
+            )
+        finally:
+            connections.close_all()
+
+
+def run_load_test(
+    *,
+    data: LoadTestData,
+    behaviour: DriverBehaviour,
+    concurrency: int,
+    ramp_up: float,
+) -> LoadTestReport:
+    """
+    Run a session of every driver, sessions start at random moments
+    within ``ramp_up`` seconds and at most ``concurrency`` run at once.
+    """
+    report = LoadTestReport()
+    track_lock_waits = connection.vendor == "postgresql"
+
+    def run_session(driver: Driver, delay: float) -> None:
+        time.sleep(max(0.0, started_at + delay - time.perf_counter()))
+        DriverSession(
+            driver=driver,
+            data=data,
+            behaviour=behaviour,
+            report=report,
+            track_lock_waits=track_lock_waits,
+        ).run()
+
+    delays = sorted(random.uniform(0, ramp_up) for _ in data.drivers)
+    started_at = time.perf_counter()
+    with contextlib.ExitStack() as stack:
+        stack.enter_context(
+            use_external_service_stand_ins(behaviour.external_service_latency),
+        )
+        if track_lock_waits:
+            stack.enter_context(
+                LockWaitSampler(report, interval=LOCK_WAIT_SAMPLING_INTERVAL),
+            )
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = [
+                executor.submit(run_session, driver, delay)
+                for driver, delay in zip(data.drivers, delays)
+            ]
+            for future in futures:
+                future.result()
+    report.duration = time.perf_counter() - started_at
+    return report
@@ -0,0 +1,215 @@
+import time
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from django.core.management import BaseCommand
+from django.utils import timezone
+from rest_framework.serializers import Serializer
+
+from core.encoders import encode_dataclass
+from economics.selectors import PenaltiesPage, PenaltiesPageItem
+from economics.serializers import PenaltyListOutputSerializer
+from shifts.models import CarToWash, Shift
+from shifts.selectors import ShiftsPage, ShiftsPageItem
+from shifts.serializers import (
+    ShiftListV2OutputSerializer,
+    TransferredCarListOutputSerializer,
+)
+from shifts.services.transferred_cars.list import (
+    TransferredCarAdditionService,
+    TransferredCarListItem,
+    TransferredCarListResponseData,
+)
+from staff.selectors import StaffListItem, StaffListPage, StaffListPagePagination
+from staff.serializers import StaffListOutputSerializer
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class BenchmarkCase:
+    name: str
+    page: Any
+    serializer_class: type[Serializer]
+
+
+def get_penalties_page(items_count: int) -> PenaltiesPage:
+    now = timezone.now()
+    return PenaltiesPage(
+        penalties=[
+            PenaltiesPageItem(
+                id=i,
+                staff_id=i,
+                staff_full_name=f"Staff {i}",
+                shift_id=i,
+                shift_date=now.date(),
+                consequence=None,
+                reason="Late",
+                amount=100,
+                photo_urls=["https://example.com/photo.jpg"],
+                created_at=now,
+            )
+            for i in range(items_count)
+        ],
+        is_end_of_list_reached=True,
+    )
+
+
+def get_shifts_page(items_count: int) -> ShiftsPage:
+    now = timezone.now()
+    return ShiftsPage(
+        shifts=[
+            ShiftsPageItem(
+                id=i,
+                date=now.date(),
+                car_wash_id=i,
+                car_wash_name=f"Car wash {i}",
+                staff_id=i,
+                staff_full_name=f"Staff {i}",
+                started_at=now,
+                finished_at=None,
+                rejected_at=None,
+                confirmed_at=now,
+                created_at=now,
+                type=Shift.Type.REGULAR,
+            )
+            for i in range(items_count)
+        ],
+        is_end_of_list_reached=True,
+    )
+
+
+def get_transferred_cars(items_count: int) -> TransferredCarListResponseData:
+    now = timezone.now()
+    return TransferredCarListResponseData(
+        staff_id=1,
+        staff_full_name="Staff",
+        shift_id=1,
+        shift_date=now.date(),
+        transferred_cars=[
+            TransferredCarListItem(
+                id=i,
+                number=f"а{i % 1000:03}аа777",
+                class_type=CarToWash.CarType.COMFORT,
+                wash_type=CarToWash.WashType.PLANNED,
+                car_wash_id=1,
+                car_wash_name="Car wash",
+                windshield_washer_type=CarToWash.WindshieldWasherType.ANTIFREEZE,
+                windshield_washer_refilled_bottle_percentage=50,
+                additional_services=[
+                    TransferredCarAdditionService(
+                        id=uuid.uuid4(),
+                        name="Cleaning",
+                        count=1,
+                    ),
+                ],
+                created_at=now,
+            )
+            for i in range(items_count)
+        ],
+    )
+
+
+def get_staff_list_page(items_count: int) -> StaffListPage:
+    now = timezone.now()
+    return StaffListPage(
+        staff=[
+            StaffListItem(
+                id=i,
+                full_name=f"Staff {i}",
+                car_sharing_phone_number="+79000000000",
+                console_phone_number="+79000000000",
+                created_at=now,
+                banned_at=None,
+                last_activity_at=now,
+            )
+            for i in range(items_count)
+        ],
+        pagination=StaffListPagePagination(
+            limit=items_count,
+            offset=0,
+            total_count=items_count,
+        ),
+    )
+
+
+def measure(function: Callable[[], Any], repeat: int) -> float:
+    """Best time of several runs, in seconds."""
+    durations = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - started_at)
+    return min(durations)
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare per-item cost of DRF output serializers and compiled"
+        " dataclass encoders for pages of list endpoints"
+    )
+
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--items",
+            type=int,
+            default=1000,
+            help="Number of items in each page",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=5,
+            help="Runs of each case, the best one is reported",
+        )
+
+    def handle(self, *args, **options):
+        items_count: int = options["items"]
+        repeat: int = options["repeat"]
+
+        cases = (
+            BenchmarkCase(
+                name="penalties",
+                page=get_penalties_page(items_count),
+                serializer_class=PenaltyListOutputSerializer,
+            ),
+            BenchmarkCase(
+                name="shifts",
+                page=get_shifts_page(items_count),
+                serializer_class=ShiftListV2OutputSerializer,
+            ),
+            BenchmarkCase(
+                name="transferred cars",
+                page=get_transferred_cars(items_count),
+                serializer_class=TransferredCarListOutputSerializer,
+            ),
+            BenchmarkCase(
+                name="staff",
+                page=get_staff_list_page(items_count),
+                serializer_class=StaffListOutputSerializer,
+            ),
+        )
+
+        self.stdout.write(
+            f"{'page':<20}{'serializer, µs':>16}{'encoder, µs':>14}{'speedup':>10}"
+        )
+        for case in cases:
+            serializer_duration = measure(
+                lambda: case.serializer_class(case.page).data,
+                repeat=repeat,
+            )
+            encoder_duration = measure(
+                lambda: encode_dataclass(case.page),
+                repeat=repeat,
+            )
+            serializer_item_cost = serializer_duration / items_count * 1_000_000
+            encoder_item_cost = encoder_duration / items_count * 1_000_000
+            speedup = serializer_duration / encoder_duration
+            self.stdout.write(
+                f"{case.name:<20}"
+                f"{serializer_item_cost:>16.2f}"
+                f"{encoder_item_cost:>14.2f}"
+                f"{speedup:>9.1f}x"
+            )
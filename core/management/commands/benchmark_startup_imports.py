@@ -0,0 +1,136 @@
+import re
+import subprocess
+import sys
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.management import BaseCommand
+
+
+# Modules imported by scheduled commands and services on startup.
+STARTUP_IMPORTS = (
+    "dry_cleaning.services",
+    "economics.services",
+    "shifts.management.commands.remind_finish_shift",
+    "shifts.management.commands.remind_start_shift",
+    "shifts.management.commands.send_shift_finish_reports",
+    "shifts.services",
+    "staff.services",
+)
+
+STARTUP_SCRIPT = f"""
+import time
+
+started_at = time.perf_counter()
+
+import django
+
+django.setup()
+
+import {", ".join(STARTUP_IMPORTS)}
+
+print(time.perf_counter() - started_at)
+"""
+
+IMPORT_TIME_LINE_PATTERN = re.compile(
+    r"^import time:\s+(?P<self>\d+) \|\s+(?P<cumulative>\d+) \|(?P<module>.+)$"
+)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ModuleImportTime:
+    module: str
+    # Microseconds spent importing the module itself and with its imports.
+    self_duration: int
+    cumulative_duration: int
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class StartupRun:
+    # Seconds of django.setup() and startup imports.
+    duration: float
+    module_import_times: list[ModuleImportTime]
+
+
+def parse_import_times(output: str) -> list[ModuleImportTime]:
+    """Module import times from ``-X importtime`` output."""
+    module_import_times: list[ModuleImportTime] = []
+    for line in output.splitlines():
+        match = IMPORT_TIME_LINE_PATTERN.match(line)
+        if match is None:
+            continue
+        module_import_times.append(
+            ModuleImportTime(
+                module=match["module"].strip(),
+                self_duration=int(match["self"]),
+                cumulative_duration=int(match["cumulative"]),
+            )
+        )
+    return module_import_times
+
+
+def run_startup() -> StartupRun:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", STARTUP_SCRIPT],
+        cwd=settings.BASE_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return StartupRun(
+        duration=float(result.stdout.strip().splitlines()[-1]),
+        module_import_times=parse_import_times(result.stderr),
+    )
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure django.setup() and startup imports in a fresh interpreter"
+        " with -X importtime and show modules with the largest cumulative"
+        " import time"
+    )
+
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--top",
+            type=int,
+            default=20,
+            help="Number of slowest modules to show",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=5,
+            help="Startup runs, the fastest one is reported",
+        )
+
+    def handle(self, *args, **options):
+        top: int = options["top"]
+        repeat: int = options["repeat"]
+
+        runs = [run_startup() for _ in range(repeat)]
+        fastest_run = min(runs, key=lambda run: run.duration)
+        total_import_duration = sum(
+            module_import_time.self_duration
+            for module_import_time in fastest_run.module_import_times
+        )
+        slowest_module_import_times = sorted(
+            fastest_run.module_import_times,
+            key=lambda module_import_time: module_import_time.cumulative_duration,
+            reverse=True,
+        )[:top]
+
+        self.stdout.write(
+            f"startup: {fastest_run.duration * 1000:.0f}ms,"
+            f" {len(fastest_run.module_import_times)} modules imported"
+            f" in {total_import_duration / 1000:.0f}ms"
+        )
+        self.stdout.write(f"{'module':<60}{'self, ms':>10}{'cumulative, ms':>16}")
+        for module_import_time in slowest_module_import_times:
+            self.stdout.write(
+                f"{module_import_time.module:<60}"
+                f"{module_import_time.self_duration / 1000:>10.1f}"
+                f"{module_import_time.cumulative_duration / 1000:>16.1f}"
+            )
@@ -0,0 +1,85 @@
+import io
+import pstats
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management import BaseCommand
+from django.utils import timezone
+
+from core.profiling import PROFILE_FILE_SUFFIX
+from photo_upload.services import get_s3_client, upload_binary
+
+
+class Command(BaseCommand):
+    help = (
+        "Merge sampled profiles of interactors and use cases written by all"
+        " processes and print the most expensive functions"
+    )
+
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "operation_names",
+            nargs="*",
+            help="Interactor or use case class names, all profiled if empty",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=30,
+            help="Number of functions to print",
+        )
+        parser.add_argument(
+            "--sort",
+            default="cumulative",
+            help="pstats sort key, e.g. cumulative, tottime, ncalls",
+        )
+        parser.add_argument(
+            "--upload",
+            action="store_true",
+            help="Upload merged profiles to S3",
+        )
+
+    def handle(self, *args, **options):
+        profiling_dir = Path(settings.PROFILING_DIR)
+        operation_names: list[str] = options["operation_names"]
+        if not operation_names and profiling_dir.exists():
+            operation_names = sorted(
+                path.name for path in profiling_dir.iterdir() if path.is_dir()
+            )
+
+        for operation_name in operation_names:
+            file_paths = sorted(
+                (profiling_dir / operation_name).glob(f"*{PROFILE_FILE_SUFFIX}")
+            )
+            if not file_paths:
+                self.stderr.write(self.style.ERROR(f"No profiles of {operation_name}"))
+                continue
+
+            stats = pstats.Stats(*map(str, file_paths), stream=self.stdout)
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{operation_name}: {len(file_paths)} process profiles"
+                )
+            )
+            stats.sort_stats(options["sort"]).print_stats(options["limit"])
+
+            if options["upload"]:
+                self.upload(operation_name, stats)
+
+    def upload(self, operation_name: str, stats: pstats.Stats) -> None:
+        merged_file_path = Path(settings.PROFILING_DIR) / (
+            f"{operation_name}{PROFILE_FILE_SUFFIX}"
+        )
+        stats.dump_stats(merged_file_path)
+        data = merged_file_path.read_bytes()
+        timestamp = timezone.now().strftime("%Y%m%d%H%M%S")
+        uploaded_file = upload_binary(
+            file_io=io.BytesIO(data),
+            length=len(data),
+            content_type="application/octet-stream",
+            object_name=f"profiles/{operation_name}-{timestamp}{PROFILE_FILE_SUFFIX}",
+            client=get_s3_client(),
+        )
+        self.stdout.write(f"Uploaded to {uploaded_file.url}")
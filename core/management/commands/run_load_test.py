@@ -0,0 +1,119 @@
+import datetime
+
+from django.core.management import BaseCommand
+from django.test.utils import setup_databases, teardown_databases
+from django.utils import timezone
+
+from core.services import get_current_shift_date
+from staff.services import get_staff_activity_tracker
+
+
+class Command(BaseCommand):
+    help = (
+        "Simulate the night-shift peak against a throwaway test database"
+        " and report throughput, latency percentiles and database lock"
+        " waits by endpoint. Requires development dependencies."
+    )
+
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument("--drivers", type=int, default=200)
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=20,
+            help="Number of drivers making requests at once",
+        )
+        parser.add_argument(
+            "--ramp-up",
+            type=float,
+            default=30,
+            help="Seconds within which drivers start their shifts",
+        )
+        parser.add_argument("--car-washes", type=int, default=5)
+        parser.add_argument("--services", type=int, default=5)
+        parser.add_argument("--min-cars", type=int, default=5)
+        parser.add_argument("--max-cars", type=int, default=20)
+        parser.add_argument("--car-wash-switch-probability", type=float, default=0.1)
+        parser.add_argument("--dry-cleaning-probability", type=float, default=0.05)
+        parser.add_argument("--finish-photos", type=int, default=4)
+        parser.add_argument(
+            "--think-time",
+            type=float,
+            default=0.5,
+            help="Maximum seconds a driver waits between requests",
+        )
+        parser.add_argument(
+            "--external-latency",
+            type=float,
+            default=0.05,
+            help="Seconds Telegram and S3 stand-ins take to respond",
+        )
+        parser.add_argument(
+            "--at",
+            type=datetime.time.fromisoformat,
+            default=datetime.time(23, 0),
+            help="Local time of the night shift the load is simulated at",
+        )
+        parser.add_argument(
+            "--noinput",
+            "--no-input",
+            action="store_false",
+            dest="interactive",
+            help="Drop a test database left by a previous run without asking",
+        )
+
+    def handle(self, *args, **options):
+        from freezegun import freeze_time
+
+        from core.load_test import (
+            DriverBehaviour,
+            run_load_test,
+            seed_load_test_data,
+        )
+
+        shift_date = get_current_shift_date()
+        simulated_at = datetime.datetime.combine(
+            shift_date,
+            options["at"],
+            tzinfo=timezone.get_current_timezone(),
+        )
+        if options["at"].hour < 12:
+            simulated_at += datetime.timedelta(days=1)
+
+        behaviour = DriverBehaviour(
+            min_cars_per_shift=options["min_cars"],
+            max_cars_per_shift=options["max_cars"],
+            car_wash_switch_probability=options["car_wash_switch_probability"],
+            dry_cleaning_probability=options["dry_cleaning_probability"],
+            finish_photos_count=options["finish_photos"],
+            max_think_time=options["think_time"],
+            external_service_latency=options["external_latency"],
+        )
+
+        old_config = setup_databases(
+            verbosity=options["verbosity"],
+            interactive=options["interactive"],
+        )
+        try:
+            # Time passes as usual from the moment of the night shift,
+            # the harness measures latency with the real clock.
+            with freeze_time(simulated_at, tick=True, ignore=["core.load_test"]):
+                data = seed_load_test_data(
+                    drivers_count=options["drivers"],
+                    car_washes_count=options["car_washes"],
+                    services_count=options["services"],
+                    shift_date=shift_date,
+                )
+                report = run_load_test(
+                    data=data,
+                    behaviour=behaviour,
+                    concurrency=options["concurrency"],
+                    ramp_up=options["ramp_up"],
+                )
+                get_staff_activity_tracker().flush()
+        finally:
+            teardown_databases(old_config, verbosity=options["verbosity"])
+
+        self.stdout.write(report.render())
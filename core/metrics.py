@@ -0,0 +1,341 @@
+import atexit
+import bisect
+import contextlib
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import ClassVar, Final, TypeVar
+
+from django.conf import settings
+
+
+__all__ = (
+    "DEFAULT_DURATION_BUCKETS",
+    "Counter",
+    "Histogram",
+    "MetricsRegistry",
+    "metrics_registry",
+)
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds of duration histogram buckets in seconds.
+DEFAULT_DURATION_BUCKETS: Final[tuple[float, ...]] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+    30,
+)
+
+LabelValues = tuple[str, ...]
+
+
+def escape_label_value(value: str) -> str:
+    return value.replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+def format_labels(names: Iterable[str], values: Iterable[str]) -> str:
+    labels = ",".join(
+        f'{name}="{escape_label_value(value)}"' for name, value in zip(names, values)
+    )
+    return f"{{{labels}}}" if labels else ""
+
+
+def format_float(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value))
+
+
+class Metric:
+    type: ClassVar[str]
+
+    def __init__(
+        self,
+        *,
+        registry: "MetricsRegistry",
+        name: str,
+        help_text: str,
+        labelnames: Iterable[str],
+    ):
+        self.registry = registry
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+
+    def get_label_values(self, labels: dict[str, object]) -> LabelValues:
+        if labels.keys() != set(self.labelnames):
+            raise ValueError(
+                f"Metric {self.name} expects labels {self.labelnames},"
+                f" got {tuple(labels)}"
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+
+MetricT = TypeVar("MetricT", bound=Metric)
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def inc(self, amount: float = 1, **labels: object) -> None:
+        self.registry.add_to_counter(self, self.get_label_values(labels), amount)
+
+    def render(self, values: dict[LabelValues, float]) -> list[str]:
+        return [
+            f"{self.name}{format_labels(self.labelnames, label_values)}"
+            f" {format_float(value)}"
+            for label_values, value in sorted(values.items())
+        ]
+
+
+class Histogram(Metric):
+    type = "histogram"
+
+    def __init__(self, *, buckets: Iterable[float], **kwargs):
+        super().__init__(**kwargs)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels: object) -> None:
+        self.registry.add_to_histogram(
+            self,
+            self.get_label_values(labels),
+            bisect.bisect_left(self.buckets, value),
+            value,
+        )
+
+    @contextlib.contextmanager
+    def time(self, **labels: object) -> Iterator[None]:
+        """
+        Observe duration of the block with ``outcome`` label set to
+        ``error`` if the block raises and ``ok`` otherwise.
+        """
+        outcome = "error"
+        started_at = time.perf_counter()
+        try:
+            yield
+            outcome = "ok"
+        finally:
+            self.observe(time.perf_counter() - started_at, outcome=outcome, **labels)
+
+    def render(self, values: dict[LabelValues, list[float]]) -> list[str]:
+        lines: list[str] = []
+        labelnames = (*self.labelnames, "le")
+        for label_values, bucket_counts_and_sum in sorted(values.items()):
+            *bucket_counts, value_sum = bucket_counts_and_sum
+            cumulative_count = 0
+            for upper_bound, count in zip(
+                (*self.buckets, float("inf")),
+                bucket_counts,
+            ):
+                cumulative_count += count
+                bucket_labels = format_labels(
+                    labelnames,
+                    (*label_values, format_float(upper_bound)),
+                )
+                lines.append(
+                    f"{self.name}_bucket{bucket_labels} {format_float(cumulative_count)}"
+                )
+            labels = format_labels(self.labelnames, label_values)
+            lines.append(f"{self.name}_sum{labels} {format_float(value_sum)}")
+            lines.append(f"{self.name}_count{labels} {format_float(cumulative_count)}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Counters and histograms rendered in Prometheus text format.
+
+    Values are kept in memory of the process. With ``METRICS_DIR`` set,
+    every process also writes them to ``<METRICS_DIR>/<pid>.json`` at
+    most every ``METRICS_FLUSH_INTERVAL`` seconds and on exit, and
+    rendered metrics are summed over all files in the directory, so
+    any gunicorn worker serves metrics of all of them. The directory
+    should be emptied before the server starts.
+    """
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__metrics: dict[str, Metric] = {}
+        self.__values: dict[str, dict[LabelValues, float | list[float]]] = {}
+        self.__flushed_at = time.monotonic()
+
+    def counter(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Iterable[str] = (),
+    ) -> Counter:
+        return self.register(
+            Counter(
+                registry=self,
+                name=name,
+                help_text=help_text,
+                labelnames=labelnames,
+            )
+        )
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_DURATION_BUCKETS,
+    ) -> Histogram:
+        return self.register(
+            Histogram(
+                registry=self,
+                name=name,
+                help_text=help_text,
+                labelnames=labelnames,
+                buckets=buckets,
+            )
+        )
+
+    def register(self, metric: MetricT) -> MetricT:
+        with self.__lock:
+            if metric.name in self.__metrics:
+                raise ValueError(f"Metric {metric.name} is already registered")
+            self.__metrics[metric.name] = metric
+            self.__values[metric.name] = {}
+        return metric
+
+    def add_to_counter(
+        self,
+        counter: Counter,
+        label_values: LabelValues,
+        amount: float,
+    ) -> None:
+        with self.__lock:
+            values = self.__values[counter.name]
+            values[label_values] = values.get(label_values, 0) + amount
+        self.flush_if_due()
+
+    def add_to_histogram(
+        self,
+        histogram: Histogram,
+        label_values: LabelValues,
+        bucket_index: int,
+        value: float,
+    ) -> None:
+        with self.__lock:
+            values = self.__values[histogram.name]
+            bucket_counts_and_sum = values.get(label_values)
+            if bucket_counts_and_sum is None:
+                bucket_counts_and_sum = [0] * (len(histogram.buckets) + 2)
+                values[label_values] = bucket_counts_and_sum
+            bucket_counts_and_sum[bucket_index] += 1
+            bucket_counts_and_sum[-1] += value
+        self.flush_if_due()
+
+    def get_values(self) -> dict[str, list]:
+        with self.__lock:
+            return {
+                name: [
+                    [
+                        list(label_values),
+                        list(value) if isinstance(value, list) else value,
+                    ]
+                    for label_values, value in values.items()
+                ]
+                for name, values in self.__values.items()
+            }
+
+    def get_process_file_path(self, pid: int) -> Path:
+        return Path(settings.METRICS_DIR) / f"{pid}.json"
+
+    def flush(self) -> None:
+        if not settings.METRICS_DIR:
+            return
+        with self.__lock:
+            self.__flushed_at = time.monotonic()
+        file_path = self.get_process_file_path(os.getpid())
+        temporary_file_path = file_path.with_suffix(".tmp")
+        try:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            temporary_file_path.write_text(json.dumps(self.get_values()))
+            # Readers never see partially written file.
+            temporary_file_path.replace(file_path)
+        except OSError:
+            logger.warning("Could not write metrics to %s", file_path, exc_info=True)
+
+    def flush_if_due(self) -> None:
+        if (
+            settings.METRICS_DIR
+            and time.monotonic() - self.__flushed_at >= settings.METRICS_FLUSH_INTERVAL
+        ):
+            self.flush()
+
+    def read_other_processes_values(self) -> Iterator[dict[str, list]]:
+        if not settings.METRICS_DIR:
+            return
+        own_file_path = self.get_process_file_path(os.getpid())
+        for file_path in Path(settings.METRICS_DIR).glob("*.json"):
+            if file_path == own_file_path:
+                continue
+            try:
+                yield json.loads(file_path.read_text())
+            except (OSError, ValueError):
+                logger.warning("Could not read metrics from %s", file_path)
+
+    def collect(self) -> dict[str, dict[LabelValues, float | list[float]]]:
+        """
+        Values of this and other processes summed by metric and labels.
+        """
+        name_to_values: dict[str, dict[LabelValues, float | list[float]]] = {
+            name: {} for name in self.__metrics
+        }
+        for process_values in (
+            self.get_values(),
+            *self.read_other_processes_values(),
+        ):
+            for name, samples in process_values.items():
+                metric = self.__metrics.get(name)
+                if metric is None:
+                    continue
+                values = name_to_values[name]
+                for label_values, value in samples:
+                    label_values = tuple(label_values)
+                    if isinstance(metric, Counter):
+                        values[label_values] = values.get(label_values, 0) + value
+                        continue
+                    current_value = values.get(label_values)
+                    if current_value is None:
+                        values[label_values] = list(value)
+                    # Processes of the previous deploy may have other buckets.
+                    elif len(current_value) == len(value):
+                        values[label_values] = [
+                            a + b for a, b in zip(current_value, value)
+                        ]
+        return name_to_values
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for name, values in self.collect().items():
+            metric = self.__metrics[name]
+            lines.append(f"# HELP {name} {metric.help_text}")
+            lines.append(f"# TYPE {name} {metric.type}")
+            lines += metric.render(values)
+        return "\n".join(lines) + "\n"
+
+    def clear(self) -> None:
+        with self.__lock:
+            for values in self.__values.values():
+                values.clear()
+
+
+metrics_registry = MetricsRegistry()
+
+atexit.register(metrics_registry.flush)
@@ -0,0 +1,127 @@
+import contextlib
+import logging
+import time
+from collections.abc import Callable
+from typing import Final
+
+from django.conf import settings
+from django.db import connections
+from django.http import HttpRequest, HttpResponse
+
+from core.metrics import metrics_registry
+from core.request_stats import QueryStats, request_stats_registry
+from core.slow_queries import slow_query_logger
+
+
+__all__ = ("RequestTimingMiddleware",)
+
+logger = logging.getLogger(__name__)
+
+UNMATCHED_ROUTE: Final[str] = "<unmatched>"
+SLOW_REQUEST_LOGGED_FINGERPRINTS_COUNT: Final[int] = 10
+
+API_REQUEST_DURATION = metrics_registry.histogram(
+    "api_request_duration_seconds",
+    "Duration of API requests by URL pattern.",
+    labelnames=("method", "route", "status"),
+)
+API_REQUEST_QUERIES = metrics_registry.counter(
+    "api_request_db_queries_total",
+    "Database queries made by API requests by URL pattern.",
+    labelnames=("method", "route"),
+)
+
+
+def get_route_pattern(request: HttpRequest) -> str:
+    resolver_match = request.resolver_match
+    if resolver_match is None:
+        return UNMATCHED_ROUTE
+    return f"/{resolver_match.route}"
+
+
+def format_server_timing(*, duration: float, query_stats: QueryStats) -> str:
+    return (
+        f'db;dur={query_stats.duration * 1000:.1f};desc="{query_stats.count} queries",'
+        f" total;dur={duration * 1000:.1f}"
+    )
+
+
+def log_slow_request(
+    *,
+    route: str,
+    duration: float,
+    query_stats: QueryStats,
+) -> None:
+    fingerprints = "\n".join(
+        f"{count} x {fingerprint}"
+        for fingerprint, count in query_stats.get_most_common_fingerprints(
+            SLOW_REQUEST_LOGGED_FINGERPRINTS_COUNT,
+        )
+    )
+    logger.warning(
+        "Slow request %s took %.3f seconds, %d queries took %.3f seconds:\n%s",
+        route,
+        duration,
+        query_stats.count,
+        query_stats.duration,
+        fingerprints,
+    )
+
+
+class RequestTimingMiddleware:
+    """
+    Count queries and measure database and total time of every request.
+
+    Timings are sent in the ``Server-Timing`` header, aggregated by
+    route in ``request_stats_registry`` and exported as metrics.
+    Requests slower than ``SLOW_REQUEST_THRESHOLD`` seconds are logged
+    with their most frequent query fingerprints, queries slower than
+    ``SLOW_QUERY_THRESHOLD`` seconds are saved with their plans.
+
+    Time of streaming responses does not include sending their content.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if not settings.REQUEST_TIMING_ENABLED:
+            return self.get_response(request)
+
+        query_stats = QueryStats()
+        started_at = time.perf_counter()
+        with contextlib.ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(query_stats))
+                stack.enter_context(connection.execute_wrapper(slow_query_logger))
+            response = self.get_response(request)
+        duration = time.perf_counter() - started_at
+
+        route_pattern = get_route_pattern(request)
+        route = f"{request.method} {route_pattern}"
+        response["Server-Timing"] = format_server_timing(
+            duration=duration,
+            query_stats=query_stats,
+        )
+        request_stats_registry.add(
+            route=route,
+            duration=duration,
+            query_stats=query_stats,
+        )
+        API_REQUEST_DURATION.observe(
+            duration,
+            method=request.method,
+            route=route_pattern,
+            status=response.status_code,
+        )
+        API_REQUEST_QUERIES.inc(
+            query_stats.count,
+            method=request.method,
+            route=route_pattern,
+        )
+
+        slow_request_threshold: float = settings.SLOW_REQUEST_THRESHOLD
+        if 0 < slow_request_threshold <= duration:
+            log_slow_request(route=route, duration=duration, query_stats=query_stats)
+
+        return response
@@ -0,0 +1,53 @@
+# Generated by Django 5.2 on 2026-10-19 06:30
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="ProfilingRule",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "operation_name",
+                    models.CharField(
+                        help_text=(
+                            "interactor or use case class name,"
+                            " e.g. ShiftSummaryInteractor"
+                        ),
+                        max_length=255,
+                        unique=True,
+                    ),
+                ),
+                (
+                    "sample_rate",
+                    models.FloatField(
+                        help_text="fraction of calls profiled, from 0 to 1",
+                        validators=[
+                            django.core.validators.MinValueValidator(0),
+                            django.core.validators.MaxValueValidator(1),
+                        ],
+                    ),
+                ),
+                ("is_enabled", models.BooleanField(default=True)),
+            ],
+            options={
+                "verbose_name": "profiling rule",
+                "verbose_name_plural": "profiling rules",
+            },
+        ),
+    ]
@@ -0,0 +1,67 @@
+# Generated by Django 5.2 on 2026-10-19 06:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SlowQuery",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "fingerprint_hash",
+                    models.CharField(editable=False, max_length=32, unique=True),
+                ),
+                (
+                    "fingerprint",
+                    models.TextField(
+                        help_text="SQL with values replaced by placeholders",
+                    ),
+                ),
+                ("sql", models.TextField(help_text="latest slow query")),
+                (
+                    "count",
+                    models.PositiveIntegerField(
+                        help_text="number of queries slower than the threshold",
+                    ),
+                ),
+                ("duration_sum", models.FloatField(help_text="seconds")),
+                ("duration_max", models.FloatField(help_text="seconds")),
+                (
+                    "p95_duration",
+                    models.FloatField(
+                        help_text=(
+                            "95th percentile of durations of all queries with"
+                            " the fingerprint in the process that made the"
+                            " latest slow query, seconds"
+                        ),
+                    ),
+                ),
+                ("plan", models.TextField(blank=True)),
+                (
+                    "plan_sql",
+                    models.TextField(blank=True, help_text="explained query"),
+                ),
+                ("explained_at", models.DateTimeField(blank=True, null=True)),
+                ("first_seen_at", models.DateTimeField(auto_now_add=True)),
+                ("last_seen_at", models.DateTimeField()),
+            ],
+            options={
+                "verbose_name": "slow query",
+                "verbose_name_plural": "slow queries",
+            },
+        ),
+    ]
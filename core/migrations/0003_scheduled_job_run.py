@@ -0,0 +1,44 @@
+# Generated by Django 5.2 on 2026-10-19 07:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0002_slow_query"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ScheduledJobRun",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=100)),
+                ("shift_date", models.DateField()),
+                ("started_at", models.DateTimeField()),
+                (
+                    "duration",
+                    models.FloatField(blank=True, help_text="seconds", null=True),
+                ),
+                ("succeeded_at", models.DateTimeField(blank=True, null=True)),
+                ("error", models.TextField(blank=True)),
+            ],
+            options={
+                "verbose_name": "scheduled job run",
+                "verbose_name_plural": "scheduled job runs",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("name", "shift_date"), name="unique_scheduled_job_run"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 5.2 on 2026-10-19 07:38
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0003_scheduled_job_run"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IdempotencyKey",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=100)),
+                ("key_hash", models.CharField(max_length=64)),
+                ("request_fingerprint", models.CharField(max_length=64)),
+                (
+                    "status_code",
+                    models.PositiveSmallIntegerField(
+                        blank=True,
+                        help_text="empty while the request is being processed",
+                        null=True,
+                    ),
+                ),
+                (
+                    "response_data",
+                    models.JSONField(
+                        blank=True,
+                        encoder=django.core.serializers.json.DjangoJSONEncoder,
+                        null=True,
+                    ),
+                ),
+                ("locked_at", models.DateTimeField()),
+                ("created_at", models.DateTimeField(db_index=True)),
+            ],
+            options={
+                "verbose_name": "idempotency key",
+                "verbose_name_plural": "idempotency keys",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("name", "key_hash"), name="unique_idempotency_key"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,117 @@
+from django.core.serializers.json import DjangoJSONEncoder
+from django.core.validators import MaxValueValidator, MinValueValidator
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+__all__ = ("IdempotencyKey", "ProfilingRule", "ScheduledJobRun", "SlowQuery")
+
+
+class ProfilingRule(models.Model):
+    operation_name = models.CharField(
+        max_length=255,
+        unique=True,
+        help_text=_("interactor or use case class name, e.g. ShiftSummaryInteractor"),
+    )
+    sample_rate = models.FloatField(
+        validators=[MinValueValidator(0), MaxValueValidator(1)],
+        help_text=_("fraction of calls profiled, from 0 to 1"),
+    )
+    is_enabled = models.BooleanField(default=True)
+
+    class Meta:
+        verbose_name = _("profiling rule")
+        verbose_name_plural = _("profiling rules")
+
+    def __str__(self):
+        return self.operation_name
+
+
+class SlowQuery(models.Model):
+    fingerprint_hash = models.CharField(max_length=32, unique=True, editable=False)
+    fingerprint = models.TextField(
+        help_text=_("SQL with values replaced by placeholders"),
+    )
+    sql = models.TextField(help_text=_("latest slow query"))
+    count = models.PositiveIntegerField(
+        help_text=_("number of queries slower than the threshold"),
+    )
+    duration_sum = models.FloatField(help_text=_("seconds"))
+    duration_max = models.FloatField(help_text=_("seconds"))
+    p95_duration = models.FloatField(
+        help_text=_(
+            "95th percentile of durations of all queries with the fingerprint"
+            " in the process that made the latest slow query, seconds"
+        ),
+    )
+    plan = models.TextField(blank=True)
+    plan_sql = models.TextField(blank=True, help_text=_("explained query"))
+    explained_at = models.DateTimeField(null=True, blank=True)
+    first_seen_at = models.DateTimeField(auto_now_add=True)
+    last_seen_at = models.DateTimeField()
+
+    class Meta:
+        verbose_name = _("slow query")
+        verbose_name_plural = _("slow queries")
+
+    def __str__(self):
+        return self.fingerprint[:100]
+
+
+class ScheduledJobRun(models.Model):
+    """Run of the scheduled job, jobs run once per shift date."""
+
+    name = models.CharField(max_length=100)
+    shift_date = models.DateField()
+    started_at = models.DateTimeField()
+    duration = models.FloatField(null=True, blank=True, help_text=_("seconds"))
+    succeeded_at = models.DateTimeField(null=True, blank=True)
+    error = models.TextField(blank=True)
+
+    class Meta:
+        verbose_name = _("scheduled job run")
+        verbose_name_plural = _("scheduled job runs")
+        constraints = (
+            models.UniqueConstraint(
+                fields=("name", "shift_date"),
+                name="unique_scheduled_job_run",
+            ),
+        )
+
+    def __str__(self):
+        return f"{self.name} {self.shift_date}"
+
+
+class IdempotencyKey(models.Model):
+    """
+    Idempotency key of the request being processed or its stored response.
+    """
+
+    name = models.CharField(max_length=100)
+    key_hash = models.CharField(max_length=64)
+    request_fingerprint = models.CharField(max_length=64)
+    status_code = models.PositiveSmallIntegerField(
+        null=True,
+        blank=True,
+        help_text=_("empty while the request is being processed"),
+    )
+    response_data = models.JSONField(
+        null=True,
+        blank=True,
+        encoder=DjangoJSONEncoder,
+    )
+    locked_at = models.DateTimeField()
+    created_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        verbose_name = _("idempotency key")
+        verbose_name_plural = _("idempotency keys")
+        constraints = (
+            models.UniqueConstraint(
+                fields=("name", "key_hash"),
+                name="unique_idempotency_key",
+            ),
+        )
+
+    def __str__(self):
+        return f"{self.name} {self.key_hash}"
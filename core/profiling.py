@@ -0,0 +1,191 @@
+import contextlib
+import cProfile
+import functools
+import logging
+import os
+import pstats
+import random
+import threading
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Final, ParamSpec, TypeVar
+
+from django.conf import settings
+from django.db import DatabaseError
+
+from core.models import ProfilingRule
+
+
+__all__ = (
+    "PROFILE_FILE_SUFFIX",
+    "get_profiling_sample_rate",
+    "profiled",
+    "profiling_rules",
+)
+
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+PROFILE_FILE_SUFFIX: Final[str] = ".pstats"
+PROFILING_RULES_REFRESH_INTERVAL: Final[float] = 30
+ALL_OPERATIONS: Final[str] = "*"
+
+
+class ProfilingRulesCache:
+    """
+    Sample rates set in admin, read from the database at most once
+    per interval per process, so they can be changed at runtime
+    without a query on every call.
+    """
+
+    def __init__(self, interval: float = PROFILING_RULES_REFRESH_INTERVAL):
+        self.__interval = interval
+        self.__lock = threading.Lock()
+        self.__operation_name_to_sample_rate: dict[str, float] = {}
+        self.__refreshed_at: float | None = None
+
+    def get(self) -> dict[str, float]:
+        with self.__lock:
+            now = time.monotonic()
+            if (
+                self.__refreshed_at is None
+                or now - self.__refreshed_at >= self.__interval
+            ):
+                self.__refreshed_at = now
+                try:
+                    self.__operation_name_to_sample_rate = {
+                        operation_name: sample_rate if is_enabled else 0
+                        for operation_name, sample_rate, is_enabled in (
+                            ProfilingRule.objects.values_list(
+                                "operation_name",
+                                "sample_rate",
+                                "is_enabled",
+                            )
+                        )
+                    }
+                except DatabaseError:
+                    logger.warning("Could not read profiling rules", exc_info=True)
+            return self.__operation_name_to_sample_rate
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__operation_name_to_sample_rate = {}
+            self.__refreshed_at = None
+
+
+profiling_rules = ProfilingRulesCache()
+
+
+def get_profiling_sample_rate(operation_name: str) -> float:
+    """
+    Fraction of calls of the operation to profile.
+
+    Rules set in admin take precedence over ``PROFILING_SAMPLE_RATES``
+    setting, where ``*`` sets the rate of all operations.
+    """
+    if not settings.PROFILING_ENABLED:
+        return 0
+    operation_name_to_sample_rate = profiling_rules.get()
+    if operation_name in operation_name_to_sample_rate:
+        return operation_name_to_sample_rate[operation_name]
+    sample_rates: dict[str, float] = settings.PROFILING_SAMPLE_RATES
+    return sample_rates.get(operation_name, sample_rates.get(ALL_OPERATIONS, 0))
+
+
+class ProfileStorage:
+    """
+    Profiles of the operation aggregated in the process and written to
+    ``<PROFILING_DIR>/<operation name>/<pid>.pstats`` after every sample.
+    Files of all processes are merged by the ``collect_profiles`` command.
+    """
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__operation_name_to_stats: dict[str, pstats.Stats] = {}
+
+    def add(self, operation_name: str, profile: cProfile.Profile) -> None:
+        file_path = (
+            Path(settings.PROFILING_DIR)
+            / operation_name
+            / f"{os.getpid()}{PROFILE_FILE_SUFFIX}"
+        )
+        with self.__lock:
+            stats = self.__operation_name_to_stats.get(operation_name)
+            if stats is None:
+                stats = pstats.Stats(profile)
+                self.__operation_name_to_stats[operation_name] = stats
+            else:
+                stats.add(profile)
+            try:
+                file_path.parent.mkdir(parents=True, exist_ok=True)
+                stats.dump_stats(file_path)
+            except OSError:
+                logger.warning("Could not write profile to %s", file_path)
+
+
+profile_storage = ProfileStorage()
+
+# Only one profiler can be active in the interpreter at a time.
+profiler_lock = threading.Lock()
+
+
+@contextlib.contextmanager
+def start_operation_span(operation_name: str) -> Iterator[None]:
+    if not settings.SENTRY_DSN:
+        yield
+        return
+
+    import sentry_sdk
+
+    with sentry_sdk.start_span(op="business.operation", name=operation_name):
+        yield
+
+
+def run_profiled(
+    operation_name: str,
+    function: Callable[P, T],
+    *args: P.args,
+    **kwargs: P.kwargs,
+) -> T:
+    if not profiler_lock.acquire(blocking=False):
+        return function(*args, **kwargs)
+    try:
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Another profiling tool (e.g. silk) is active.
+            return function(*args, **kwargs)
+        try:
+            return function(*args, **kwargs)
+        finally:
+            profile.disable()
+            profile_storage.add(operation_name, profile)
+    finally:
+        profiler_lock.release()
+
+
+def profiled(execute: Callable[P, T]) -> Callable[P, T]:
+    """
+    Trace ``execute()`` of interactors and use cases as a Sentry span
+    named after the class and profile sampled calls with cProfile.
+
+    Sample rate is set per class name in admin (profiling rules) or
+    in ``PROFILING_SAMPLE_RATES`` setting, calls are sampled only if
+    ``PROFILING_ENABLED`` is set. The profiler sees all threads of the
+    process, so profiles of threaded workers include other requests.
+    """
+    operation_name = execute.__qualname__.rpartition(".")[0]
+
+    @functools.wraps(execute)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+        with start_operation_span(operation_name):
+            sample_rate = get_profiling_sample_rate(operation_name)
+            if sample_rate > 0 and random.random() < sample_rate:
+                return run_profiled(operation_name, execute, *args, **kwargs)
+            return execute(*args, **kwargs)
+
+    return wrapper
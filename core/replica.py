@@ -0,0 +1,178 @@
+import contextlib
+import logging
+import threading
+import time
+from collections.abc import Iterator
+from contextvars import ContextVar
+from typing import Final
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+
+
+__all__ = (
+    "REPLICA_DATABASE_ALIAS",
+    "ReplicaRouter",
+    "get_replica_lag",
+    "is_replica_available",
+    "using_primary",
+    "using_replica",
+)
+
+logger = logging.getLogger(__name__)
+
+REPLICA_DATABASE_ALIAS: Final[str] = "replica"
+REPLICA_LAG_CHECK_INTERVAL: Final[float] = 5
+
+read_from_replica: ContextVar[bool] = ContextVar(
+    "read_from_replica",
+    default=False,
+)
+primary_forced: ContextVar[bool] = ContextVar(
+    "primary_forced",
+    default=False,
+)
+
+
+class ReplicaLagCache:
+    """
+    Replication lag checked at most once per interval per process,
+    so reads routed to the replica do not pay for an extra query each.
+    """
+
+    def __init__(self, interval: float = REPLICA_LAG_CHECK_INTERVAL):
+        self.__interval = interval
+        self.__lock = threading.Lock()
+        self.__lag: float | None = None
+        self.__checked_at: float | None = None
+
+    def get(self) -> float | None:
+        """
+        Returns:
+            Lag in seconds, None if replica is unreachable.
+        """
+        with self.__lock:
+            now = time.monotonic()
+            if self.__checked_at is None or now - self.__checked_at >= self.__interval:
+                self.__lag = get_replica_lag()
+                self.__checked_at = now
+            return self.__lag
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__lag = None
+            self.__checked_at = None
+
+
+def get_replica_lag() -> float | None:
+    """
+    Get how many seconds the replica is behind the primary.
+
+    Replica that replayed everything it received is considered up to
+    date. Databases that are not PostgreSQL standbys (e.g. second local
+    PostgreSQL instance or sqlite alias) have no lag.
+
+    Returns:
+        Lag in seconds, None if replica is unreachable.
+    """
+    connection = connections[REPLICA_DATABASE_ALIAS]
+    if connection.vendor != "postgresql":
+        return 0
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT CASE
+                    WHEN NOT pg_is_in_recovery()
+                        OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn()
+                    THEN 0
+                    ELSE COALESCE(
+                        EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()),
+                        0
+                    )
+                END
+                """
+            )
+            (lag,) = cursor.fetchone()
+    except DatabaseError:
+        logger.warning("Replica database is unreachable", exc_info=True)
+        return None
+    return float(lag)
+
+
+replica_lag_cache = ReplicaLagCache()
+
+
+def is_replica_available() -> bool:
+    """
+    Check whether reads can go to the replica.
+
+    Reads stay on the primary when the replica is not configured,
+    when it is unreachable or lags more than ``REPLICA_MAX_LAG``
+    seconds, and inside transactions on the primary, so they see
+    rows written in them.
+    """
+    if REPLICA_DATABASE_ALIAS not in settings.DATABASES:
+        return False
+    if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+        return False
+    lag = replica_lag_cache.get()
+    return lag is not None and lag <= settings.REPLICA_MAX_LAG
+
+
+@contextlib.contextmanager
+def using_replica() -> Iterator[bool]:
+    """
+    Route reads made inside the block to the replica if it is available.
+
+    Works both as context manager and as decorator. Querysets are routed
+    when they are evaluated, so decorated functions must evaluate them
+    before returning.
+
+    Yields:
+        Whether reads go to the replica.
+    """
+    token = read_from_replica.set(
+        not primary_forced.get() and is_replica_available(),
+    )
+    try:
+        yield read_from_replica.get()
+    finally:
+        read_from_replica.reset(token)
+
+
+@contextlib.contextmanager
+def using_primary() -> Iterator[None]:
+    """
+    Route reads made inside the block to the primary, including reads
+    of nested ``using_replica`` blocks. For results that are stored,
+    so replication lag must not get into them.
+    """
+    primary_token = primary_forced.set(True)
+    replica_token = read_from_replica.set(False)
+    try:
+        yield
+    finally:
+        read_from_replica.reset(replica_token)
+        primary_forced.reset(primary_token)
+
+
+class ReplicaRouter:
+    """
+    Send reads to the replica inside ``using_replica`` blocks,
+    everything else to the primary.
+    """
+
+    def db_for_read(self, model, **hints) -> str | None:
+        if read_from_replica.get():
+            return REPLICA_DATABASE_ALIAS
+        return None
+
+    def db_for_write(self, model, **hints) -> str:
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints) -> bool | None:
+        databases = {DEFAULT_DB_ALIAS, REPLICA_DATABASE_ALIAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
@@ -0,0 +1,141 @@
+import bisect
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Final
+
+from core.metrics import DEFAULT_DURATION_BUCKETS
+
+
+__all__ = (
+    "QueryStats",
+    "RouteStats",
+    "RequestStatsRegistry",
+    "get_sql_fingerprint",
+    "request_stats_registry",
+)
+
+SQL_FINGERPRINT_REPLACEMENTS: Final[tuple[tuple[re.Pattern, str], ...]] = (
+    (re.compile(r"'(?:[^']|'')*'"), "?"),
+    (re.compile(r"%s|\b\d+(?:\.\d+)?\b"), "?"),
+    (re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)"), "(...)"),
+    (re.compile(r"\s+"), " "),
+)
+
+
+def get_sql_fingerprint(sql: str) -> str:
+    """
+    SQL with literals and placeholders replaced by ``?`` and value lists
+    collapsed, so queries that differ only in values (e.g. N+1 queries
+    or ``IN`` lists of different length) have the same fingerprint.
+    """
+    for pattern, replacement in SQL_FINGERPRINT_REPLACEMENTS:
+        sql = pattern.sub(replacement, sql)
+    return sql.strip()
+
+
+@dataclass(slots=True)
+class QueryStats:
+    """
+    Database execute wrapper that counts queries and their time.
+
+    Queries are counted by SQL with placeholders, which is cheap;
+    fingerprints are computed only when they are reported.
+    """
+
+    count: int = 0
+    # Seconds spent in the database.
+    duration: float = 0
+    sql_to_count: Counter[str] = field(default_factory=Counter)
+
+    def __call__(self, execute, sql, params, many, context):
+        started_at = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - started_at
+            self.count += 1
+            self.sql_to_count[sql] += 1
+
+    def get_most_common_fingerprints(self, limit: int) -> list[tuple[str, int]]:
+        fingerprint_to_count: Counter[str] = Counter()
+        for sql, count in self.sql_to_count.items():
+            fingerprint_to_count[get_sql_fingerprint(sql)] += count
+        return fingerprint_to_count.most_common(limit)
+
+
+@dataclass(slots=True)
+class RouteStats:
+    request_count: int = 0
+    duration_sum: float = 0
+    duration_max: float = 0
+    db_duration_sum: float = 0
+    query_count_sum: int = 0
+    query_count_max: int = 0
+    duration_bucket_counts: list[int] = field(
+        default_factory=lambda: [0] * (len(DEFAULT_DURATION_BUCKETS) + 1),
+    )
+
+    def add(self, *, duration: float, query_stats: QueryStats) -> None:
+        self.request_count += 1
+        self.duration_sum += duration
+        self.duration_max = max(self.duration_max, duration)
+        self.db_duration_sum += query_stats.duration
+        self.query_count_sum += query_stats.count
+        self.query_count_max = max(self.query_count_max, query_stats.count)
+        bucket_index = bisect.bisect_left(DEFAULT_DURATION_BUCKETS, duration)
+        self.duration_bucket_counts[bucket_index] += 1
+
+    def to_dict(self) -> dict:
+        cumulative_count = 0
+        buckets: list[dict] = []
+        for upper_bound, count in zip(
+            (*DEFAULT_DURATION_BUCKETS, None),
+            self.duration_bucket_counts,
+        ):
+            cumulative_count += count
+            buckets.append({"le": upper_bound, "count": cumulative_count})
+        return {
+            "request_count": self.request_count,
+            "duration_sum": self.duration_sum,
+            "duration_max": self.duration_max,
+            "db_duration_sum": self.db_duration_sum,
+            "query_count_sum": self.query_count_sum,
+            "query_count_max": self.query_count_max,
+            "duration_buckets": buckets,
+        }
+
+
+class RequestStatsRegistry:
+    """
+    Per-route request stats of the current process.
+
+    Every worker process has its own stats.
+    """
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__route_to_stats: dict[str, RouteStats] = {}
+
+    def add(self, *, route: str, duration: float, query_stats: QueryStats) -> None:
+        with self.__lock:
+            route_stats = self.__route_to_stats.get(route)
+            if route_stats is None:
+                route_stats = self.__route_to_stats[route] = RouteStats()
+            route_stats.add(duration=duration, query_stats=query_stats)
+
+    def to_dict(self) -> dict[str, dict]:
+        with self.__lock:
+            return {
+                route: route_stats.to_dict()
+                for route, route_stats in self.__route_to_stats.items()
+            }
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__route_to_stats.clear()
+
+
+request_stats_registry = RequestStatsRegistry()
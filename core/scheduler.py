@@ -0,0 +1,194 @@
+import datetime
+import logging
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+
+from django.db import IntegrityError, connections, transaction
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from core.models import ScheduledJobRun
+from core.services import SHIFT_DATE_START_HOUR, get_current_shift_date
+from core.slow_queries import capture_slow_queries
+
+
+__all__ = (
+    "ScheduledJob",
+    "JobStats",
+    "Scheduler",
+    "get_job_stats",
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ScheduledJob:
+    """
+    Job that runs once per shift date at the given local time.
+
+    Times from ``SHIFT_DATE_START_HOUR`` belong to the evening of the
+    shift date, earlier times - to the morning after it, e.g. with
+    shift date 2025-01-01 the job at 22:00 runs on 2025-01-01 and
+    the job at 07:00 runs on 2025-01-02.
+    """
+
+    name: str
+    time: datetime.time
+    run: Callable[[], object]
+
+    def get_run_at(self, shift_date: datetime.date) -> datetime.datetime:
+        run_date = shift_date
+        if self.time.hour < SHIFT_DATE_START_HOUR:
+            run_date += datetime.timedelta(days=1)
+        return timezone.make_aware(datetime.datetime.combine(run_date, self.time))
+
+
+@dataclass(slots=True, kw_only=True)
+class JobStats:
+    name: str
+    shift_date: datetime.date | None = None
+    last_started_at: datetime.datetime | None = None
+    # Seconds the last run took.
+    last_duration: float | None = None
+    last_success_at: datetime.datetime | None = None
+    last_error: str | None = None
+    run_count: int = 0
+    failure_count: int = 0
+
+
+def get_job_stats(names: Iterable[str]) -> dict[str, JobStats]:
+    """Stats of the jobs from their runs saved by any scheduler process."""
+    names = list(names)
+    name_to_counts = {
+        counts["name"]: counts
+        for counts in ScheduledJobRun.objects.filter(name__in=names)
+        .values("name")
+        .annotate(
+            run_count=Count("id"),
+            failure_count=Count("id", filter=~Q(error="")),
+        )
+        .order_by()
+    }
+    name_to_last_run = {
+        run.name: run
+        for run in ScheduledJobRun.objects.filter(name__in=names)
+        .order_by("name", "-shift_date")
+        .distinct("name")
+    }
+    name_to_last_success_at = dict(
+        ScheduledJobRun.objects.filter(name__in=names, succeeded_at__isnull=False)
+        .order_by("name", "-shift_date")
+        .distinct("name")
+        .values_list("name", "succeeded_at")
+    )
+
+    name_to_stats: dict[str, JobStats] = {}
+    for name in names:
+        last_run = name_to_last_run.get(name)
+        if last_run is None:
+            name_to_stats[name] = JobStats(name=name)
+            continue
+        name_to_stats[name] = JobStats(
+            name=name,
+            shift_date=last_run.shift_date,
+            last_started_at=last_run.started_at,
+            last_duration=last_run.duration,
+            last_success_at=name_to_last_success_at.get(name),
+            last_error=last_run.error or None,
+            run_count=name_to_counts[name]["run_count"],
+            failure_count=name_to_counts[name]["failure_count"],
+        )
+    return name_to_stats
+
+
+def close_unusable_database_connections() -> None:
+    """
+    Keep connections open between jobs and reopen only those
+    dropped by the database server since the last job.
+    """
+    for connection in connections.all(initialized_only=True):
+        if connection.connection is not None and not connection.is_usable():
+            connection.close()
+
+
+class Scheduler:
+    """
+    Runs jobs in the current process, so they share warm database and
+    Telegram connections instead of paying for startup on each run.
+
+    Job that is not run in ``misfire_grace_time`` after its time
+    (e.g. scheduler was down) is skipped until the next shift date.
+    Runs are saved in the database before the job starts, so a restarted
+    or second scheduler does not run the job for the same shift date again.
+    Jobs run one after another, a long job delays the others.
+    """
+
+    def __init__(
+        self,
+        jobs: Iterable[ScheduledJob],
+        *,
+        misfire_grace_time: datetime.timedelta,
+    ):
+        self.__jobs = tuple(jobs)
+        self.__misfire_grace_time = misfire_grace_time
+
+    def get_due_jobs(self) -> list[ScheduledJob]:
+        now = timezone.now()
+        shift_date = get_current_shift_date()
+        jobs: list[ScheduledJob] = []
+        for job in self.__jobs:
+            run_at = job.get_run_at(shift_date)
+            if run_at <= now <= run_at + self.__misfire_grace_time:
+                jobs.append(job)
+        if not jobs:
+            return []
+        ran_job_names = set(
+            ScheduledJobRun.objects.filter(
+                name__in=[job.name for job in jobs],
+                shift_date=shift_date,
+            ).values_list("name", flat=True)
+        )
+        return [job for job in jobs if job.name not in ran_job_names]
+
+    def run_job(self, job: ScheduledJob) -> JobStats | None:
+        """
+        Returns:
+            Stats of the job, None if it already ran for the shift date.
+        """
+        close_unusable_database_connections()
+        try:
+            with transaction.atomic():
+                job_run = ScheduledJobRun.objects.create(
+                    name=job.name,
+                    shift_date=get_current_shift_date(),
+                    started_at=timezone.now(),
+                )
+        except IntegrityError:
+            # Run by another scheduler process since the due jobs were read.
+            return None
+
+        started_at = time.perf_counter()
+        try:
+            with capture_slow_queries():
+                job.run()
+        except Exception as error:
+            job_run.error = repr(error)
+            logger.exception("Scheduled job %s failed", job.name)
+        else:
+            job_run.succeeded_at = timezone.now()
+        finally:
+            job_run.duration = time.perf_counter() - started_at
+            job_run.save(update_fields=("duration", "succeeded_at", "error"))
+
+        logger.info(
+            "Scheduled job %s finished in %.3f seconds",
+            job.name,
+            job_run.duration,
+        )
+        return get_job_stats([job.name])[job.name]
+
+    def run_pending(self) -> list[JobStats]:
+        job_stats = (self.run_job(job) for job in self.get_due_jobs())
+        return [stats for stats in job_stats if stats is not None]
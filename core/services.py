@@ -1,9 +1,18 @@
 import datetime
+from typing import Final
 
 from django.utils import timezone
 
 
-__all__ = ("get_current_shift_date",)
+__all__ = (
+    "SHIFT_DATE_START_HOUR",
+    "get_current_shift_date",
+    "get_month_date_range",
+    "get_year_date_range",
+)
+
+# Hour from which the current shift date is today, before it - yesterday.
+SHIFT_DATE_START_HOUR: Final[int] = 21
 
 
 def get_current_shift_date() -> datetime.date:
@@ -18,7 +27,42 @@ def get_current_shift_date() -> datetime.date:
         The date of the shift.
     """
     now = timezone.localtime()
-    if now.hour <= 20:
+    if now.hour < SHIFT_DATE_START_HOUR:
         previous_day = now - datetime.timedelta(days=1)
         return previous_day.date()
     return now.date()
+
+
+def get_month_date_range(
+    *,
+    year: int,
+    month: int,
+) -> tuple[datetime.date, datetime.date]:
+    """
+    Half-open date range of the month: ``from_date <= date < to_date``.
+
+    Filtering by this range instead of ``date__month``/``date__year``
+    lookups lets the database use indexes on date columns, because
+    ``EXTRACT(...)`` is not applied to the column.
+
+    Keyword Args:
+        year: year of the month.
+        month: month number from 1 to 12.
+
+    Returns:
+        First day of the month and first day of the next month.
+    """
+    from_date = datetime.date(year, month, 1)
+    if month == 12:
+        return from_date, datetime.date(year + 1, 1, 1)
+    return from_date, datetime.date(year, month + 1, 1)
+
+
+def get_year_date_range(year: int) -> tuple[datetime.date, datetime.date]:
+    """
+    Half-open date range of the year: ``from_date <= date < to_date``.
+
+    Returns:
+        First day of the year and first day of the next year.
+    """
+    return datetime.date(year, 1, 1), datetime.date(year + 1, 1, 1)
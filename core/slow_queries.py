@@ -0,0 +1,321 @@
+import contextlib
+import functools
+import hashlib
+import logging
+import math
+import queue
+import re
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Final
+
+from django.conf import settings
+from django.db import DatabaseError, connections, transaction
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from core.models import SlowQuery
+from core.request_stats import get_sql_fingerprint
+
+
+__all__ = (
+    "FingerprintStats",
+    "QueryFingerprintRegistry",
+    "SlowQueryLogger",
+    "SlowQuerySample",
+    "capture_slow_queries",
+    "get_fingerprint_hash",
+    "query_fingerprint_registry",
+    "save_slow_query",
+    "slow_query_logger",
+    "slow_query_worker",
+)
+
+logger = logging.getLogger(__name__)
+
+# Durations of the latest queries kept per fingerprint for percentiles.
+DURATION_SAMPLE_SIZE: Final[int] = 500
+# Distinct SQL strings whose fingerprints are cached per process.
+FINGERPRINT_CACHE_SIZE: Final[int] = 4096
+# Slow queries waiting for the worker, newer ones are dropped.
+SLOW_QUERY_QUEUE_SIZE: Final[int] = 100
+# Parts of reads that lock rows, create tables or change state when the
+# query is executed, such queries are explained without ANALYZE.
+UNSAFE_TO_ANALYZE_RE: Final[re.Pattern[str]] = re.compile(
+    r"""
+    \bFOR\s+(?:NO\s+KEY\s+)?UPDATE\b
+    | \bFOR\s+(?:KEY\s+)?SHARE\b
+    | \bINTO\b
+    | \b(?:NEXTVAL|SETVAL|SET_CONFIG|PG_(?:TRY_)?ADVISORY_\w+|PG_NOTIFY)\s*\(
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+
+
+get_cached_sql_fingerprint = functools.lru_cache(maxsize=FINGERPRINT_CACHE_SIZE)(
+    get_sql_fingerprint,
+)
+
+
+def get_fingerprint_hash(fingerprint: str) -> str:
+    return hashlib.md5(fingerprint.encode(), usedforsecurity=False).hexdigest()
+
+
+def is_explainable(sql: str) -> bool:
+    """Only reads are explained."""
+    return sql.lstrip().upper().startswith("SELECT")
+
+
+def is_analyzable(sql: str) -> bool:
+    """
+    EXPLAIN ANALYZE executes the query, so reads that lock rows or call
+    functions with side effects are explained without it.
+    """
+    return UNSAFE_TO_ANALYZE_RE.search(sql) is None
+
+
+@dataclass(slots=True)
+class FingerprintStats:
+    count: int = 0
+    duration_sum: float = 0
+    duration_max: float = 0
+    durations: deque[float] = field(
+        default_factory=lambda: deque(maxlen=DURATION_SAMPLE_SIZE),
+    )
+
+    def add(self, duration: float) -> None:
+        self.count += 1
+        self.duration_sum += duration
+        self.duration_max = max(self.duration_max, duration)
+        self.durations.append(duration)
+
+    @property
+    def p95_duration(self) -> float:
+        """95th percentile of the latest durations, nearest-rank method."""
+        if not self.durations:
+            return 0
+        durations = sorted(self.durations)
+        return durations[math.ceil(len(durations) * 0.95) - 1]
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "duration_sum": self.duration_sum,
+            "duration_max": self.duration_max,
+            "p95_duration": self.p95_duration,
+        }
+
+
+class QueryFingerprintRegistry:
+    """
+    Count and latency of queries by fingerprint in the current process.
+    """
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__fingerprint_to_stats: dict[str, FingerprintStats] = {}
+
+    def add(self, fingerprint: str, duration: float) -> None:
+        with self.__lock:
+            stats = self.__fingerprint_to_stats.get(fingerprint)
+            if stats is None:
+                stats = self.__fingerprint_to_stats[fingerprint] = FingerprintStats()
+            stats.add(duration)
+
+    def get_p95_duration(self, fingerprint: str) -> float:
+        with self.__lock:
+            stats = self.__fingerprint_to_stats.get(fingerprint)
+            return 0 if stats is None else stats.p95_duration
+
+    def to_list(self, limit: int) -> list[dict]:
+        """Fingerprints with the largest total time first."""
+        with self.__lock:
+            items = sorted(
+                self.__fingerprint_to_stats.items(),
+                key=lambda item: item[1].duration_sum,
+                reverse=True,
+            )[:limit]
+            return [
+                {"fingerprint": fingerprint, **stats.to_dict()}
+                for fingerprint, stats in items
+            ]
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__fingerprint_to_stats.clear()
+
+
+query_fingerprint_registry = QueryFingerprintRegistry()
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class SlowQuerySample:
+    database_alias: str
+    sql: str
+    params: tuple | list | dict | None
+    fingerprint: str
+    duration: float
+    p95_duration: float
+    is_explainable: bool
+
+
+def explain_query(sample: SlowQuerySample) -> str:
+    connection = connections[sample.database_alias]
+    if connection.vendor == "postgresql" and is_analyzable(sample.sql):
+        explain_prefix = "EXPLAIN (ANALYZE, BUFFERS)"
+    else:
+        explain_prefix = "EXPLAIN"
+    timeout_milliseconds = int(settings.SLOW_QUERY_EXPLAIN_TIMEOUT * 1000)
+
+    with transaction.atomic(using=sample.database_alias):
+        with connection.cursor() as cursor:
+            if connection.vendor == "postgresql":
+                cursor.execute(
+                    "SELECT set_config('statement_timeout', %s, true)",
+                    (str(timeout_milliseconds),),
+                )
+            cursor.execute(f"{explain_prefix} {sample.sql}", sample.params)
+            rows = cursor.fetchall()
+        transaction.set_rollback(True, using=sample.database_alias)
+    return "\n".join(" | ".join(map(str, row)) for row in rows)
+
+
+def save_slow_query(sample: SlowQuerySample) -> SlowQuery:
+    """
+    Add the sample to stats of its fingerprint and capture the query plan
+    unless it was captured within ``SLOW_QUERY_EXPLAIN_INTERVAL``.
+    """
+    now = timezone.now()
+    fingerprint_hash = get_fingerprint_hash(sample.fingerprint)
+    slow_query, is_created = SlowQuery.objects.get_or_create(
+        fingerprint_hash=fingerprint_hash,
+        defaults={
+            "fingerprint": sample.fingerprint,
+            "sql": sample.sql,
+            "count": 1,
+            "duration_sum": sample.duration,
+            "duration_max": sample.duration,
+            "p95_duration": sample.p95_duration,
+            "last_seen_at": now,
+        },
+    )
+    if not is_created:
+        SlowQuery.objects.filter(id=slow_query.id).update(
+            sql=sample.sql,
+            count=F("count") + 1,
+            duration_sum=F("duration_sum") + sample.duration,
+            duration_max=Greatest("duration_max", sample.duration),
+            p95_duration=sample.p95_duration,
+            last_seen_at=now,
+        )
+
+    explain_interval = timedelta(seconds=settings.SLOW_QUERY_EXPLAIN_INTERVAL)
+    if sample.is_explainable and (
+        slow_query.explained_at is None
+        or slow_query.explained_at <= now - explain_interval
+    ):
+        try:
+            plan = explain_query(sample)
+        except DatabaseError as error:
+            plan = f"Could not explain the query: {error}"
+        SlowQuery.objects.filter(id=slow_query.id).update(
+            plan=plan,
+            plan_sql=sample.sql,
+            explained_at=now,
+        )
+
+    slow_query.refresh_from_db()
+    return slow_query
+
+
+class SlowQueryWorker:
+    """
+    Save slow queries and explain them in a background thread,
+    so the request that made the query does not wait for it.
+    """
+
+    def __init__(self, maxsize: int = SLOW_QUERY_QUEUE_SIZE):
+        self.__queue: queue.Queue[SlowQuerySample] = queue.Queue(maxsize=maxsize)
+        self.__lock = threading.Lock()
+        self.__thread: threading.Thread | None = None
+
+    def put(self, sample: SlowQuerySample) -> None:
+        self.__start()
+        try:
+            self.__queue.put_nowait(sample)
+        except queue.Full:
+            logger.debug("Slow query queue is full, dropped %s", sample.fingerprint)
+
+    def __start(self) -> None:
+        with self.__lock:
+            if self.__thread is None or not self.__thread.is_alive():
+                self.__thread = threading.Thread(
+                    target=self.__run,
+                    name="slow-query-worker",
+                    daemon=True,
+                )
+                self.__thread.start()
+
+    def __run(self) -> None:
+        while True:
+            sample = self.__queue.get()
+            try:
+                save_slow_query(sample)
+            except Exception:
+                logger.exception("Could not save slow query %s", sample.fingerprint)
+            finally:
+                connections.close_all()
+
+
+slow_query_worker = SlowQueryWorker()
+
+
+class SlowQueryLogger:
+    """
+    Database execute wrapper that aggregates latency of queries by
+    fingerprint and saves queries slower than ``SLOW_QUERY_THRESHOLD``
+    seconds with their plans to show them in admin.
+    """
+
+    def __call__(self, execute, sql, params, many, context):
+        started_at = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - started_at
+            fingerprint = get_cached_sql_fingerprint(sql)
+            query_fingerprint_registry.add(fingerprint, duration)
+
+            threshold: float = settings.SLOW_QUERY_THRESHOLD
+            if 0 < threshold <= duration:
+                p95_duration = query_fingerprint_registry.get_p95_duration(
+                    fingerprint,
+                )
+                slow_query_worker.put(
+                    SlowQuerySample(
+                        database_alias=context["connection"].alias,
+                        sql=sql,
+                        params=params,
+                        fingerprint=fingerprint,
+                        duration=duration,
+                        p95_duration=p95_duration,
+                        is_explainable=not many and is_explainable(sql),
+                    ),
+                )
+
+
+slow_query_logger = SlowQueryLogger()
+
+
+@contextlib.contextmanager
+def capture_slow_queries() -> Iterator[None]:
+    """Wrap queries of all database connections of the current thread."""
+    with contextlib.ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(slow_query_logger))
+        yield
@@ -0,0 +1,85 @@
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any, Final, TypeVar
+
+from django.http import StreamingHttpResponse
+from rest_framework.settings import api_settings
+from rest_framework.utils.encoders import JSONEncoder
+
+
+__all__ = (
+    "StreamingJsonResponse",
+    "dump_json",
+    "iter_json_list_object",
+)
+
+T = TypeVar("T")
+
+# Encoded items are sent in chunks of about this many bytes,
+# so large lists are not written item by item.
+STREAMING_CHUNK_SIZE: Final[int] = 64 * 1024
+
+json_encoder = JSONEncoder(
+    ensure_ascii=not api_settings.UNICODE_JSON,
+    allow_nan=not api_settings.STRICT_JSON,
+    separators=(",", ":") if api_settings.COMPACT_JSON else (", ", ": "),
+)
+
+
+def dump_json(value: Any) -> str:
+    """JSON the same as rendered by DRF ``JSONRenderer``."""
+    return (
+        json_encoder.encode(value)
+        .replace("\u2028", "\\u2028")
+        .replace("\u2029", "\\u2029")
+    )
+
+
+def iter_json_list_object(
+    *,
+    key: str,
+    items: Iterable[T],
+    serialize: Callable[[T], Any],
+) -> Iterator[bytes]:
+    """
+    Encode ``{key: [items]}`` item by item, so neither serialized items
+    nor the whole JSON document are held in memory at once.
+    """
+    chunk: list[str] = [f"{{{dump_json(key)}:["]
+    chunk_size = 0
+    separator = ""
+    for item in items:
+        encoded_item = dump_json(serialize(item))
+        chunk.append(separator)
+        chunk.append(encoded_item)
+        separator = ","
+        chunk_size += len(encoded_item)
+        if chunk_size >= STREAMING_CHUNK_SIZE:
+            yield "".join(chunk).encode()
+            chunk.clear()
+            chunk_size = 0
+    chunk.append("]}")
+    yield "".join(chunk).encode()
+
+
+class StreamingJsonResponse(StreamingHttpResponse):
+    """
+    JSON object with a single list, e.g. ``{"staff_list": [...]}``,
+    serialized while it is sent.
+
+    Items must be computed before the response is returned,
+    database connections may be closed while it is streamed.
+    """
+
+    def __init__(
+        self,
+        *,
+        key: str,
+        items: Iterable[T],
+        serialize: Callable[[T], Any] = lambda item: item,
+        **kwargs,
+    ):
+        kwargs.setdefault("content_type", "application/json")
+        super().__init__(
+            iter_json_list_object(key=key, items=items, serialize=serialize),
+            **kwargs,
+        )
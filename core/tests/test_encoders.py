@@ -0,0 +1,134 @@
+import datetime
+import enum
+import uuid
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+from rest_framework import serializers
+
+from core.encoders import encode_dataclass, get_dataclass_encoder
+from core.management.commands.benchmark_dto_encoding import (
+    get_penalties_page,
+    get_shifts_page,
+    get_staff_list_page,
+    get_transferred_cars,
+)
+from economics.serializers import PenaltyListOutputSerializer
+from shifts.serializers import (
+    ShiftListV2OutputSerializer,
+    TransferredCarListOutputSerializer,
+)
+from staff.serializers import StaffListOutputSerializer
+
+
+class Color(enum.StrEnum):
+    RED = "red"
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Tag:
+    id: uuid.UUID
+    color: Color
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Item:
+    id: int
+    date: datetime.date
+    created_at: datetime.datetime
+    finished_at: datetime.datetime | None
+    price: Decimal
+    tags: list[Tag]
+    tag_ids: tuple[uuid.UUID, ...]
+    counts: dict[str, int]
+    main_tag: Tag | None
+    extra: Any
+
+
+def test_encode_dataclass():
+    tag = Tag(id=uuid.UUID(int=1), color=Color.RED)
+    item = Item(
+        id=1,
+        date=datetime.date(2025, 3, 1),
+        created_at=datetime.datetime(2025, 3, 1, 9, tzinfo=datetime.UTC),
+        finished_at=None,
+        price=Decimal("10.50"),
+        tags=[tag],
+        tag_ids=(tag.id,),
+        counts={"cars": 2},
+        main_tag=tag,
+        extra=[datetime.date(2025, 3, 2), tag],
+    )
+    encoded_tag = {"id": "00000000-0000-0000-0000-000000000001", "color": "red"}
+
+    with timezone.override("Europe/Moscow"):
+        assert encode_dataclass(item) == {
+            "id": 1,
+            "date": "2025-03-01",
+            "created_at": "2025-03-01T12:00:00+03:00",
+            "finished_at": None,
+            "price": "10.50",
+            "tags": [encoded_tag],
+            "tag_ids": ["00000000-0000-0000-0000-000000000001"],
+            "counts": {"cars": 2},
+            "main_tag": encoded_tag,
+            "extra": ["2025-03-02", encoded_tag],
+        }
+
+
+@pytest.mark.parametrize("timezone_name", ["UTC", "Europe/Moscow"])
+def test_encode_datetime_same_as_drf(timezone_name):
+    tag = Tag(id=uuid.uuid4(), color=Color.RED)
+    created_at = datetime.datetime(2025, 3, 1, 9, 30, 15, 123, tzinfo=datetime.UTC)
+    item = Item(
+        id=1,
+        date=created_at.date(),
+        created_at=created_at,
+        finished_at=created_at,
+        price=Decimal(1),
+        tags=[tag],
+        tag_ids=(),
+        counts={},
+        main_tag=None,
+        extra=None,
+    )
+
+    with timezone.override(timezone_name):
+        encoded = encode_dataclass(item)
+        expected = serializers.DateTimeField().to_representation(created_at)
+
+    assert encoded["created_at"] == encoded["finished_at"] == expected
+
+
+def test_encoder_compiled_once_per_dataclass():
+    assert get_dataclass_encoder(Tag) is get_dataclass_encoder(Tag)
+
+
+def test_encoder_rejects_not_dataclass():
+    with pytest.raises(TypeError):
+        get_dataclass_encoder(dict)
+
+
+@pytest.mark.parametrize(
+    "page, serializer_class",
+    [
+        (get_penalties_page(3), PenaltyListOutputSerializer),
+        (get_shifts_page(3), ShiftListV2OutputSerializer),
+        (get_transferred_cars(3), TransferredCarListOutputSerializer),
+        (get_staff_list_page(3), StaffListOutputSerializer),
+    ],
+)
+def test_encode_dataclass_same_as_output_serializer(page, serializer_class):
+    assert encode_dataclass(page) == serializer_class(page).data
+
+
+def test_benchmark_dto_encoding_command(capsys):
+    call_command("benchmark_dto_encoding", items=5, repeat=1)
+
+    output = capsys.readouterr().out
+    for page_name in ("penalties", "shifts", "transferred cars", "staff"):
+        assert page_name in output
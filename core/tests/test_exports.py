@@ -0,0 +1,40 @@
+import csv
+import io
+import uuid
+
+from openpyxl import load_workbook
+
+from core.exports import EXPORT_CSV_CHUNK_SIZE, iter_csv_chunks, write_xlsx
+
+
+def test_csv_written_in_chunks():
+    headers = ["id", "name"]
+    rows = [[index, "x" * 100] for index in range(2000)]
+
+    chunks = list(iter_csv_chunks(headers, iter(rows)))
+
+    assert len(chunks) > 1
+    assert all(len(chunk) < EXPORT_CSV_CHUNK_SIZE + 200 for chunk in chunks)
+    content = b"".join(chunks).decode()
+    assert list(csv.reader(io.StringIO(content))) == [
+        headers,
+        *[[str(value) for value in row] for row in rows],
+    ]
+
+
+def test_csv_encoded_with_encoding():
+    content = b"".join(iter_csv_chunks(["name"], [["мойка"]], encoding="utf-8-sig"))
+
+    assert content.decode("utf-8-sig") == "name\r\nмойка\r\n"
+
+
+def test_xlsx_values_cleaned():
+    service_id = uuid.uuid4()
+
+    file = write_xlsx(["id", "name"], [[service_id, "car\x07 wash"]])
+
+    workbook = load_workbook(file, read_only=True)
+    assert list(workbook.active.values) == [
+        ("id", "name"),
+        (str(service_id), "car wash"),
+    ]
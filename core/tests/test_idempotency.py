@@ -0,0 +1,126 @@
+import datetime
+
+import pytest
+from django.core.cache import cache
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+
+from core.idempotency import get_idempotency_key_hash, idempotent
+from core.models import IdempotencyKey
+
+
+pytestmark = pytest.mark.django_db
+
+
+class CounterCreateApi(APIView):
+    calls: list[dict] = []
+
+    @idempotent("counter-create")
+    def post(self, request: Request) -> Response:
+        self.calls.append(request.data)
+        if request.data.get("fail"):
+            return Response({"detail": "failed"}, status.HTTP_400_BAD_REQUEST)
+        return Response({"count": len(self.calls)}, status.HTTP_201_CREATED)
+
+
+@pytest.fixture(autouse=True)
+def clear_calls():
+    CounterCreateApi.calls = []
+
+
+def post(data: dict, idempotency_key: str | None = None) -> Response:
+    headers = {}
+    if idempotency_key is not None:
+        headers["Idempotency-Key"] = idempotency_key
+    request = APIRequestFactory().post("/", data, format="json", headers=headers)
+    response = CounterCreateApi.as_view()(request)
+    response.render()
+    return response
+
+
+def test_repeated_request_is_replayed():
+    first_response = post({"name": "a"}, idempotency_key="key")
+    second_response = post({"name": "a"}, idempotency_key="key")
+
+    assert first_response.status_code == status.HTTP_201_CREATED
+    assert second_response.status_code == status.HTTP_201_CREATED
+    assert second_response.data == first_response.data
+    assert second_response["Idempotent-Replayed"] == "true"
+    assert len(CounterCreateApi.calls) == 1
+
+
+def test_requests_without_key_are_not_replayed():
+    post({"name": "a"})
+    post({"name": "a"})
+
+    assert len(CounterCreateApi.calls) == 2
+
+
+def test_failed_request_is_not_stored():
+    post({"fail": True}, idempotency_key="key")
+    post({"fail": True}, idempotency_key="key")
+
+    assert len(CounterCreateApi.calls) == 2
+
+
+def test_key_reused_for_another_request():
+    post({"name": "a"}, idempotency_key="key")
+    response = post({"name": "b"}, idempotency_key="key")
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert response.data["errors"][0]["code"] == "idempotency_key_reused"
+
+
+def lock_key(locked_at: datetime.datetime) -> None:
+    IdempotencyKey.objects.create(
+        name="counter-create",
+        key_hash=get_idempotency_key_hash("key"),
+        request_fingerprint="fingerprint",
+        locked_at=locked_at,
+        created_at=locked_at,
+    )
+
+
+def test_response_replayed_by_other_worker():
+    first_response = post({"name": "a"}, idempotency_key="key")
+    # Other worker process does not see the cache of this one.
+    cache.clear()
+
+    second_response = post({"name": "a"}, idempotency_key="key")
+
+    assert second_response.data == first_response.data
+    assert second_response["Idempotent-Replayed"] == "true"
+    assert len(CounterCreateApi.calls) == 1
+
+
+def test_key_in_use():
+    lock_key(timezone.now())
+
+    response = post({"name": "a"}, idempotency_key="key")
+
+    assert response.status_code == status.HTTP_409_CONFLICT
+    assert response.data["errors"][0]["code"] == "idempotency_key_in_use"
+    assert CounterCreateApi.calls == []
+
+
+def test_key_locked_by_killed_request_is_taken_over(settings):
+    lock_key(
+        timezone.now()
+        - datetime.timedelta(seconds=settings.IDEMPOTENCY_LOCK_TIMEOUT + 1),
+    )
+
+    response = post({"name": "a"}, idempotency_key="key")
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert len(CounterCreateApi.calls) == 1
+
+
+def test_invalid_key():
+    response = post({"name": "a"}, idempotency_key="k" * 256)
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.data["errors"][0]["code"] == "invalid_idempotency_key"
@@ -0,0 +1,48 @@
+import datetime
+
+import pytest
+from django.utils import timezone
+from freezegun import freeze_time
+
+from core.load_test import DriverBehaviour, run_load_test, seed_load_test_data
+from dry_cleaning.models import DryCleaningRequest
+from shifts.models import CarToWash, Shift
+
+
+@pytest.mark.django_db(transaction=True)
+def test_load_test_runs_driver_sessions():
+    shift_date = datetime.date(2025, 1, 1)
+    simulated_at = datetime.datetime.combine(
+        shift_date,
+        datetime.time(23, 0),
+        tzinfo=timezone.get_current_timezone(),
+    )
+    behaviour = DriverBehaviour(
+        min_cars_per_shift=2,
+        max_cars_per_shift=2,
+        dry_cleaning_probability=1,
+        finish_photos_count=1,
+        max_think_time=0,
+        external_service_latency=0,
+    )
+
+    with freeze_time(simulated_at, tick=True, ignore=["core.load_test"]):
+        data = seed_load_test_data(
+            drivers_count=2,
+            car_washes_count=2,
+            services_count=2,
+            shift_date=shift_date,
+        )
+        report = run_load_test(
+            data=data,
+            behaviour=behaviour,
+            concurrency=2,
+            ramp_up=0,
+        )
+
+    assert report.endpoint_to_stats["POST /shifts/cars/"].request_count == 4
+    assert all(stats.error_count == 0 for stats in report.endpoint_to_stats.values())
+    assert "POST /shifts/finish/" in report.render()
+    assert CarToWash.objects.count() == 4
+    assert DryCleaningRequest.objects.count() == 4
+    assert not Shift.objects.filter(finished_at__isnull=True).exists()
@@ -0,0 +1,105 @@
+import json
+import os
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.metrics import MetricsRegistry
+
+
+@pytest.fixture
+def registry() -> MetricsRegistry:
+    return MetricsRegistry()
+
+
+def test_render_counter_and_histogram(registry):
+    counter = registry.counter("jobs_total", "Jobs.", labelnames=("name",))
+    histogram = registry.histogram(
+        "job_duration_seconds",
+        "Job duration.",
+        labelnames=("name",),
+        buckets=(0.1, 1),
+    )
+
+    counter.inc(name="report")
+    counter.inc(2, name="report")
+    histogram.observe(0.05, name="report")
+    histogram.observe(0.5, name="report")
+    histogram.observe(5, name="report")
+
+    assert registry.render() == (
+        "# HELP jobs_total Jobs.\n"
+        "# TYPE jobs_total counter\n"
+        'jobs_total{name="report"} 3.0\n'
+        "# HELP job_duration_seconds Job duration.\n"
+        "# TYPE job_duration_seconds histogram\n"
+        'job_duration_seconds_bucket{name="report",le="0.1"} 1.0\n'
+        'job_duration_seconds_bucket{name="report",le="1.0"} 2.0\n'
+        'job_duration_seconds_bucket{name="report",le="+Inf"} 3.0\n'
+        'job_duration_seconds_sum{name="report"} 5.55\n'
+        'job_duration_seconds_count{name="report"} 3.0\n'
+    )
+
+
+def test_histogram_time_observes_outcome(registry):
+    histogram = registry.histogram(
+        "call_duration_seconds",
+        "Call duration.",
+        labelnames=("outcome",),
+    )
+
+    with histogram.time():
+        pass
+    with pytest.raises(ValueError), histogram.time():
+        raise ValueError
+
+    rendered = registry.render()
+    assert 'call_duration_seconds_count{outcome="ok"} 1.0' in rendered
+    assert 'call_duration_seconds_count{outcome="error"} 1.0' in rendered
+
+
+def test_metrics_of_other_processes_are_summed(registry, settings, tmp_path):
+    settings.METRICS_DIR = str(tmp_path)
+    counter = registry.counter("jobs_total", "Jobs.", labelnames=("name",))
+    counter.inc(name="report")
+    (tmp_path / "1.json").write_text(
+        json.dumps({"jobs_total": [[["report"], 2], [["reminder"], 1]]}),
+    )
+
+    registry.flush()
+
+    assert (tmp_path / f"{os.getpid()}.json").exists()
+    rendered = registry.render()
+    assert 'jobs_total{name="report"} 3.0' in rendered
+    assert 'jobs_total{name="reminder"} 1.0' in rendered
+
+
+@pytest.mark.django_db
+def test_metrics_endpoint(settings):
+    client = APIClient()
+    client.get(reverse("car-washes:wash-list-create"))
+
+    response = client.get(reverse("metrics"))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response["Content-Type"].startswith("text/plain")
+    assert (
+        'api_request_duration_seconds_count{method="GET",route="/car-washes/",'
+        'status="200"}'
+    ) in response.content.decode()
+
+
+def test_metrics_endpoint_requires_token(settings):
+    settings.METRICS_AUTH_TOKEN = "secret"
+    client = APIClient()
+
+    response = client.get(reverse("metrics"))
+    authorized_response = client.get(
+        reverse("metrics"),
+        headers={"Authorization": "Bearer secret"},
+    )
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    assert authorized_response.status_code == status.HTTP_200_OK
@@ -0,0 +1,66 @@
+from dataclasses import dataclass
+
+import pytest
+from django.core.management import call_command
+
+from core.models import ProfilingRule
+from core.profiling import (
+    get_profiling_sample_rate,
+    profiled,
+    profiling_rules,
+)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class SumInteractor:
+    numbers: list[int]
+
+    @profiled
+    def execute(self) -> int:
+        return sum(self.numbers)
+
+
+@pytest.fixture(autouse=True)
+def clear_profiling_rules():
+    profiling_rules.clear()
+    yield
+    profiling_rules.clear()
+
+
+@pytest.fixture
+def profiling_settings(settings, tmp_path):
+    settings.PROFILING_ENABLED = True
+    settings.PROFILING_SAMPLE_RATES = {"*": 1}
+    settings.PROFILING_DIR = tmp_path
+    return settings
+
+
+def test_sample_rate_is_zero_if_profiling_disabled(settings):
+    settings.PROFILING_ENABLED = False
+    settings.PROFILING_SAMPLE_RATES = {"*": 1}
+
+    assert get_profiling_sample_rate("SumInteractor") == 0
+
+
+@pytest.mark.django_db
+def test_sampled_call_is_profiled(profiling_settings, tmp_path, capsys):
+    assert SumInteractor(numbers=[1, 2]).execute() == 3
+
+    assert list((tmp_path / "SumInteractor").glob("*.pstats"))
+
+    call_command("collect_profiles", "SumInteractor", limit=5)
+    assert "SumInteractor: 1 process profiles" in capsys.readouterr().out
+
+
+@pytest.mark.django_db
+def test_disabled_rule_overrides_settings(profiling_settings, tmp_path):
+    ProfilingRule.objects.create(
+        operation_name="SumInteractor",
+        sample_rate=1,
+        is_enabled=False,
+    )
+
+    assert SumInteractor(numbers=[1, 2]).execute() == 3
+
+    assert get_profiling_sample_rate("SumInteractor") == 0
+    assert not (tmp_path / "SumInteractor").exists()
@@ -0,0 +1,111 @@
+import pytest
+from django.conf import settings
+from django.db import transaction
+
+from core import replica
+from core.replica import (
+    REPLICA_DATABASE_ALIAS,
+    ReplicaRouter,
+    using_primary,
+    using_replica,
+)
+from shifts.models import Shift
+
+
+@pytest.fixture
+def replica_lag(monkeypatch):
+    lag_checks: list[float | None] = []
+
+    def set_lag(lag: float | None) -> list[float | None]:
+        monkeypatch.setitem(
+            settings.DATABASES,
+            REPLICA_DATABASE_ALIAS,
+            {**settings.DATABASES["default"], "TEST": {"MIRROR": "default"}},
+        )
+
+        def get_replica_lag() -> float | None:
+            lag_checks.append(lag)
+            return lag
+
+        monkeypatch.setattr(replica, "get_replica_lag", get_replica_lag)
+        return lag_checks
+
+    replica.replica_lag_cache.clear()
+    yield set_lag
+    replica.replica_lag_cache.clear()
+
+
+def test_reads_routed_to_replica(replica_lag):
+    replica_lag(0)
+    router = ReplicaRouter()
+
+    with using_replica() as is_replica_used:
+        db_for_read = router.db_for_read(Shift)
+        db_for_write = router.db_for_write(Shift)
+
+    assert is_replica_used
+    assert db_for_read == REPLICA_DATABASE_ALIAS
+    assert db_for_write == "default"
+    assert router.db_for_read(Shift) is None
+
+
+def test_reads_forced_to_primary_in_nested_replica_blocks(replica_lag):
+    replica_lag(0)
+    router = ReplicaRouter()
+
+    with using_replica():
+        with using_primary():
+            with using_replica() as is_replica_used:
+                db_for_read = router.db_for_read(Shift)
+        db_for_read_after = router.db_for_read(Shift)
+
+    assert not is_replica_used
+    assert db_for_read is None
+    assert db_for_read_after == REPLICA_DATABASE_ALIAS
+
+
+def test_decorated_function_reads_from_replica(replica_lag):
+    replica_lag(0)
+
+    @using_replica()
+    def get_db_for_read() -> str | None:
+        return ReplicaRouter().db_for_read(Shift)
+
+    assert get_db_for_read() == REPLICA_DATABASE_ALIAS
+
+
+@pytest.mark.parametrize("lag", [settings.REPLICA_MAX_LAG + 1, None])
+def test_reads_fall_back_to_primary_when_replica_lags_or_unreachable(
+    replica_lag,
+    lag,
+):
+    replica_lag(lag)
+
+    with using_replica() as is_replica_used:
+        db_for_read = ReplicaRouter().db_for_read(Shift)
+
+    assert not is_replica_used
+    assert db_for_read is None
+
+
+def test_reads_fall_back_to_primary_when_replica_not_configured():
+    with using_replica() as is_replica_used:
+        assert not is_replica_used
+
+
+@pytest.mark.django_db
+def test_reads_stay_on_primary_inside_transaction(replica_lag):
+    replica_lag(0)
+
+    with transaction.atomic(), using_replica() as is_replica_used:
+        assert not is_replica_used
+
+
+def test_replica_lag_checked_once_per_interval(replica_lag):
+    lag_checks = replica_lag(0)
+
+    for _ in range(3):
+        with using_replica():
+            pass
+
+    assert len(lag_checks) == 1
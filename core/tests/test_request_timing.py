@@ -0,0 +1,68 @@
+import logging
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from car_washes.tests.factories import CarWashFactory
+from core.request_stats import get_sql_fingerprint, request_stats_registry
+
+
+@pytest.fixture(autouse=True)
+def clear_request_stats():
+    request_stats_registry.clear()
+
+
+def test_sql_fingerprint():
+    sql = (
+        'SELECT "shift"."id" FROM "shift" WHERE ("shift"."staff_id" = 15'
+        ' AND "shift"."date" = \'2025-01-01\' AND "shift"."id" IN (%s, %s))'
+    )
+
+    assert get_sql_fingerprint(sql) == (
+        'SELECT "shift"."id" FROM "shift" WHERE ("shift"."staff_id" = ?'
+        ' AND "shift"."date" = ? AND "shift"."id" IN (...))'
+    )
+
+
+@pytest.mark.django_db
+def test_server_timing_header_and_route_stats():
+    CarWashFactory()
+    client = APIClient()
+
+    response = client.get(reverse("car-washes:wash-list-create"))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response["Server-Timing"].startswith("db;dur=")
+    assert "total;dur=" in response["Server-Timing"]
+    route_stats = request_stats_registry.to_dict()["GET /car-washes/"]
+    assert route_stats["request_count"] == 1
+    assert route_stats["query_count_sum"] >= 1
+    assert route_stats["duration_buckets"][-1]["count"] == 1
+
+
+@pytest.mark.django_db
+def test_slow_request_is_logged_with_fingerprints(settings, caplog):
+    settings.SLOW_REQUEST_THRESHOLD = 0.000001
+    client = APIClient()
+
+    with caplog.at_level(logging.WARNING, logger="core.middleware"):
+        client.get(reverse("car-washes:wash-list-create"))
+
+    assert "Slow request GET /car-washes/" in caplog.text
+    assert "car_washes_carwash" in caplog.text
+
+
+@pytest.mark.django_db
+def test_request_stats_api_is_available_only_for_admins(admin_client):
+    url = reverse("core:request-stats")
+    admin_client.get(reverse("car-washes:wash-list-create"))
+
+    response = admin_client.get(url)
+    anonymous_response = APIClient().get(url)
+
+    assert response.status_code == status.HTTP_200_OK
+    routes = [route["route"] for route in response.json()["routes"]]
+    assert "GET /car-washes/" in routes
+    assert anonymous_response.status_code == status.HTTP_403_FORBIDDEN
@@ -0,0 +1,111 @@
+import datetime
+
+import pytest
+from freezegun import freeze_time
+
+from core.models import ScheduledJobRun
+from core.scheduler import ScheduledJob, Scheduler, get_job_stats
+
+
+pytestmark = pytest.mark.django_db
+
+MISFIRE_GRACE_TIME = datetime.timedelta(minutes=10)
+
+
+def create_scheduler(*jobs: ScheduledJob) -> Scheduler:
+    return Scheduler(jobs, misfire_grace_time=MISFIRE_GRACE_TIME)
+
+
+def test_evening_job_runs_once_per_shift_date():
+    calls = []
+    job = ScheduledJob(
+        name="evening",
+        time=datetime.time(22, 0),
+        run=lambda: calls.append(1),
+    )
+    scheduler = create_scheduler(job)
+
+    with freeze_time("2025-01-01 21:59:00+03:00"):
+        assert scheduler.run_pending() == []
+
+    with freeze_time("2025-01-01 22:01:00+03:00"):
+        (stats,) = scheduler.run_pending()
+        assert scheduler.run_pending() == []
+
+    assert calls == [1]
+    assert stats.shift_date == datetime.date(2025, 1, 1)
+    assert stats.run_count == 1
+    assert stats.last_duration is not None
+    assert stats.last_success_at is not None
+
+
+def test_morning_job_runs_for_previous_shift_date():
+    job = ScheduledJob(name="morning", time=datetime.time(7, 0), run=lambda: None)
+    scheduler = create_scheduler(job)
+
+    with freeze_time("2025-01-02 07:05:00+03:00"):
+        (stats,) = scheduler.run_pending()
+
+    assert stats.shift_date == datetime.date(2025, 1, 1)
+
+
+def test_job_missed_beyond_grace_time_is_skipped():
+    job = ScheduledJob(name="evening", time=datetime.time(22, 0), run=lambda: None)
+    scheduler = create_scheduler(job)
+
+    with freeze_time("2025-01-01 22:11:00+03:00"):
+        assert scheduler.run_pending() == []
+
+
+def test_failed_job_stats_are_saved():
+    def fail():
+        raise ValueError("boom")
+
+    job = ScheduledJob(name="failing", time=datetime.time(22, 0), run=fail)
+    scheduler = create_scheduler(job)
+
+    with freeze_time("2025-01-01 22:01:00+03:00"):
+        scheduler.run_pending()
+
+    stats = get_job_stats(["failing"])["failing"]
+    assert stats.failure_count == 1
+    assert stats.last_error == "ValueError('boom')"
+    assert stats.last_success_at is None
+
+
+def test_restarted_scheduler_does_not_run_job_again():
+    calls = []
+    job = ScheduledJob(
+        name="evening",
+        time=datetime.time(22, 0),
+        run=lambda: calls.append(1),
+    )
+
+    with freeze_time("2025-01-01 22:01:00+03:00"):
+        create_scheduler(job).run_pending()
+    with freeze_time("2025-01-01 22:02:00+03:00"):
+        assert create_scheduler(job).run_pending() == []
+
+    assert calls == [1]
+
+
+def test_job_run_by_other_scheduler_is_not_run_again():
+    calls = []
+    job = ScheduledJob(
+        name="evening",
+        time=datetime.time(22, 0),
+        run=lambda: calls.append(1),
+    )
+    scheduler = create_scheduler(job)
+
+    with freeze_time("2025-01-01 22:01:00+03:00"):
+        (due_job,) = scheduler.get_due_jobs()
+        ScheduledJobRun.objects.create(
+            name="evening",
+            shift_date=datetime.date(2025, 1, 1),
+            started_at=datetime.datetime.now(datetime.UTC),
+        )
+
+        assert scheduler.run_job(due_job) is None
+
+    assert calls == []
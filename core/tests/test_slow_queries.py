@@ -0,0 +1,118 @@
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from car_washes.tests.factories import CarWashFactory
+from core.models import SlowQuery
+from core.slow_queries import (
+    FingerprintStats,
+    SlowQuerySample,
+    query_fingerprint_registry,
+    is_analyzable,
+    save_slow_query,
+    slow_query_worker,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_query_fingerprints():
+    query_fingerprint_registry.clear()
+
+
+def create_sample(**kwargs) -> SlowQuerySample:
+    return SlowQuerySample(
+        **{
+            "database_alias": "default",
+            "sql": 'SELECT "id" FROM "car_washes_carwash" WHERE "id" > %s',
+            "params": (0,),
+            "fingerprint": 'SELECT "id" FROM "car_washes_carwash" WHERE "id" > ?',
+            "duration": 1,
+            "p95_duration": 0.5,
+            "is_explainable": True,
+        }
+        | kwargs,
+    )
+
+
+def test_p95_duration():
+    stats = FingerprintStats()
+    for duration in range(1, 101):
+        stats.add(duration)
+
+    assert stats.p95_duration == 95
+    assert stats.count == 100
+    assert stats.duration_max == 100
+
+
+@pytest.mark.django_db
+def test_slow_query_is_saved_with_plan():
+    slow_query = save_slow_query(create_sample())
+    save_slow_query(create_sample(duration=3))
+    slow_query.refresh_from_db()
+
+    assert slow_query.count == 2
+    assert slow_query.duration_sum == 4
+    assert slow_query.duration_max == 3
+    assert "actual time" in slow_query.plan
+    assert slow_query.explained_at is not None
+
+
+@pytest.mark.django_db
+def test_writes_are_not_explained():
+    slow_query = save_slow_query(
+        create_sample(
+            sql='DELETE FROM "car_washes_carwash" WHERE "id" > %s',
+            is_explainable=False,
+        ),
+    )
+
+    assert slow_query.plan == ""
+    assert slow_query.explained_at is None
+
+
+@pytest.mark.parametrize(
+    "sql, expected",
+    [
+        ('SELECT "id" FROM "staff_staff" WHERE "id" = %s', True),
+        ('SELECT "id" FROM "staff_staff" FOR UPDATE', False),
+        ('SELECT "id" FROM "staff_staff" FOR NO KEY UPDATE SKIP LOCKED', False),
+        ('SELECT "id" FROM "staff_staff" for share', False),
+        ('SELECT "id" FROM "staff_staff" FOR KEY SHARE NOWAIT', False),
+        ("SELECT nextval('staff_staff_id_seq')", False),
+        ("SELECT setval('staff_staff_id_seq', 1)", False),
+        ("SELECT set_config('statement_timeout', '0', false)", False),
+        ("SELECT pg_advisory_lock(1)", False),
+        ('SELECT * INTO "staff_copy" FROM "staff_staff"', False),
+    ],
+)
+def test_is_analyzable(sql, expected):
+    assert is_analyzable(sql) is expected
+
+
+@pytest.mark.django_db
+def test_locking_reads_are_explained_without_analyze():
+    slow_query = save_slow_query(
+        create_sample(
+            sql='SELECT "id" FROM "car_washes_carwash" WHERE "id" > %s FOR UPDATE',
+        ),
+    )
+
+    assert "LockRows" in slow_query.plan
+    assert "actual time" not in slow_query.plan
+
+
+@pytest.mark.django_db
+def test_slow_queries_of_request_are_queued(settings, monkeypatch):
+    settings.SLOW_QUERY_THRESHOLD = 0.000001
+    samples = []
+    monkeypatch.setattr(slow_query_worker, "put", samples.append)
+    CarWashFactory()
+
+    APIClient().get(reverse("car-washes:wash-list-create"))
+
+    assert any("car_washes_carwash" in sample.sql for sample in samples)
+    fingerprints = [
+        query["fingerprint"] for query in query_fingerprint_registry.to_list(10)
+    ]
+    assert any("car_washes_carwash" in fingerprint for fingerprint in fingerprints)
+    assert not SlowQuery.objects.exists()
@@ -0,0 +1,68 @@
+import os
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management import call_command
+
+from core.management.commands.benchmark_startup_imports import (
+    STARTUP_IMPORTS,
+    parse_import_times,
+)
+
+
+HEAVY_MODULES = (
+    "telebot",
+    "minio",
+    "httpx",
+    "openpyxl",
+    "import_export.formats.base_formats",
+)
+
+SCRIPT = f"""
+import sys
+
+import django
+
+django.setup()
+
+import {", ".join(STARTUP_IMPORTS)}
+
+print(",".join(name for name in sys.argv[1:] if name in sys.modules))
+"""
+
+
+def test_heavy_modules_not_imported_on_startup():
+    result = subprocess.run(
+        [sys.executable, "-c", SCRIPT, *HEAVY_MODULES],
+        env={**os.environ, "DJANGO_SETTINGS_MODULE": "carsharing.settings"},
+        cwd=settings.BASE_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == ""
+
+
+def test_parse_import_times():
+    output = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |     _io\n"
+        "import time:      1500 |       1620 |   django.conf\n"
+    )
+
+    module_import_times = parse_import_times(output)
+
+    assert [
+        (item.module, item.self_duration, item.cumulative_duration)
+        for item in module_import_times
+    ] == [("_io", 120, 120), ("django.conf", 1500, 1620)]
+
+
+def test_benchmark_startup_imports_command(capsys):
+    call_command("benchmark_startup_imports", top=3, repeat=1)
+
+    output = capsys.readouterr().out
+    assert output.startswith("startup: ")
+    assert "django" in output
@@ -0,0 +1,70 @@
+import datetime
+import json
+from decimal import Decimal
+
+from rest_framework.renderers import JSONRenderer
+
+from core import streaming
+from core.streaming import StreamingJsonResponse, dump_json
+
+
+def read_content(response: StreamingJsonResponse) -> bytes:
+    return b"".join(response.streaming_content)
+
+
+def test_dump_json_same_as_json_renderer():
+    value = {
+        "full_name": "Иванов Иван",
+        "separator": "  ",
+        "amount": Decimal("10.50"),
+        "created_at": datetime.datetime(2025, 3, 1, 10, 30),
+        "items": [1, 2.5, None, True],
+    }
+
+    assert dump_json(value).encode() == JSONRenderer().render(value)
+
+
+def test_streaming_response_same_as_json_renderer():
+    items = [{"id": i, "name": f"Мойка {i}"} for i in range(3)]
+
+    response = StreamingJsonResponse(key="car_washes", items=items)
+
+    assert response["Content-Type"] == "application/json"
+    assert read_content(response) == JSONRenderer().render({"car_washes": items})
+
+
+def test_streaming_response_empty_list():
+    response = StreamingJsonResponse(key="staff_list", items=[])
+
+    assert read_content(response) == b'{"staff_list":[]}'
+
+
+def test_streaming_response_serializes_items_lazily():
+    serialized_ids: list[int] = []
+
+    def serialize(item_id: int) -> dict:
+        serialized_ids.append(item_id)
+        return {"id": item_id}
+
+    response = StreamingJsonResponse(
+        key="staff_list",
+        items=[1, 2],
+        serialize=serialize,
+    )
+
+    assert serialized_ids == []
+    assert json.loads(read_content(response)) == {
+        "staff_list": [{"id": 1}, {"id": 2}],
+    }
+    assert serialized_ids == [1, 2]
+
+
+def test_streaming_response_split_into_chunks(monkeypatch):
+    monkeypatch.setattr(streaming, "STREAMING_CHUNK_SIZE", 20)
+    items = [{"id": i, "name": "x" * 10} for i in range(10)]
+
+    response = StreamingJsonResponse(key="staff_list", items=items)
+    chunks = list(response.streaming_content)
+
+    assert len(chunks) > 1
+    assert b"".join(chunks) == JSONRenderer().render({"staff_list": items})
@@ -0,0 +1,9 @@
+from django.urls import path
+
+from core.views import RequestStatsApi
+
+
+app_name = "core"
+urlpatterns = [
+    path(r"request-stats/", RequestStatsApi.as_view(), name="request-stats"),
+]
@@ -0,0 +1,52 @@
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+from rest_framework.permissions import IsAdminUser
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core.metrics import metrics_registry
+from core.request_stats import request_stats_registry
+from core.slow_queries import query_fingerprint_registry
+
+
+__all__ = ("RequestStatsApi", "metrics_view")
+
+METRICS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+QUERY_FINGERPRINTS_LIMIT = 50
+
+
+class RequestStatsApi(APIView):
+    """
+    Per-route request timings and query counts of the worker process
+    that serves the request, slowest routes first, and queries with the
+    largest total time by fingerprint.
+    """
+
+    permission_classes = (IsAdminUser,)
+
+    def get(self, request: Request) -> Response:
+        route_to_stats = request_stats_registry.to_dict()
+        routes = [
+            {"route": route, **stats}
+            for route, stats in sorted(
+                route_to_stats.items(),
+                key=lambda item: item[1]["duration_sum"],
+                reverse=True,
+            )
+        ]
+        queries = query_fingerprint_registry.to_list(QUERY_FINGERPRINTS_LIMIT)
+        return Response({"routes": routes, "queries": queries})
+
+
+def metrics_view(request: HttpRequest) -> HttpResponse:
+    """
+    Metrics in Prometheus text format.
+
+    Requires ``Authorization: Bearer <METRICS_AUTH_TOKEN>`` header
+    if the token is set.
+    """
+    token: str | None = settings.METRICS_AUTH_TOKEN
+    if token and request.headers.get("Authorization") != f"Bearer {token}":
+        return HttpResponse(status=401)
+    return HttpResponse(metrics_registry.render(), content_type=METRICS_CONTENT_TYPE)
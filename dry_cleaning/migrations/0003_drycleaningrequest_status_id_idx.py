@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-19 06:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("dry_cleaning", "0002_drycleaningadmin"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="drycleaningrequest",
+            index=models.Index(
+                fields=["status", "-id"], name="dry_cleaning_status_id_idx"
+            ),
+        ),
+    ]
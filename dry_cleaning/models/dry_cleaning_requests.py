@@ -37,6 +37,12 @@ class DryCleaningRequest(models.Model):
     class Meta:
         verbose_name = _("Dry cleaning request")
         verbose_name_plural = _("Dry cleaning requests")
+        indexes = [
+            models.Index(
+                fields=("status", "-id"),
+                name="dry_cleaning_status_id_idx",
+            ),
+        ]
 
     def __str__(self):
         return gettext("Car number %(car_number)s - shift %(shift_date)s") % {
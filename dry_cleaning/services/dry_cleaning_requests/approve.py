@@ -5,6 +5,7 @@ from uuid import UUID
 
 from django.db import transaction
 
+from core.profiling import profiled
 from dry_cleaning.exceptions import (
     DryCleaningRequestInvalidStatusError,
     DryCleaningRequestNotFoundError,
@@ -28,6 +29,7 @@ class DryCleaningRequestApproveInteractor:
     services: Iterable[HasIdAndCount]
     response_comment: str | None
 
+    @profiled
     @transaction.atomic
     def execute(self) -> None:
         try:
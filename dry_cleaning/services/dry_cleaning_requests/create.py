@@ -1,15 +1,15 @@
 import datetime
+import functools
 from collections.abc import Iterable
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import TypedDict
+from typing import TYPE_CHECKING, TypedDict
 from uuid import UUID
 
 from django.conf import settings
 from django.db import transaction
-from telebot.types import InlineKeyboardButton, InlineKeyboardMarkup
-from telebot import TeleBot
 
+from core.profiling import profiled
 from dry_cleaning.models import (
     DryCleaningRequest,
     DryCleaningRequestPhoto,
@@ -20,12 +20,17 @@ from photo_upload.services import upload_via_urls
 from shifts.services.shifts.validators import ensure_shift_exists
 from telegram.services import (
     get_dry_cleaning_telegram_bot,
+    get_file_url,
     get_telegram_bot,
     try_send_message,
     try_send_photos_media_group,
 )
 
 
+if TYPE_CHECKING:
+    from telebot import TeleBot
+
+
 class HasIdAndCount(TypedDict):
     id: UUID
     count: int
@@ -54,9 +59,9 @@ class DryCleaningRequestCreateResponseDto:
     updated_at: datetime.datetime
 
 
-def get_file_urls(bot: TeleBot, file_ids: Iterable[str]) -> list[str]:
+def get_file_urls(bot: "TeleBot", file_ids: Iterable[str]) -> list[str]:
     with ThreadPoolExecutor() as executor:
-        return list(executor.map(bot.get_file_url, file_ids))
+        return list(executor.map(functools.partial(get_file_url, bot), file_ids))
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -66,8 +71,11 @@ class DryCleaningRequestCreateInteractor:
     photo_file_ids: Iterable[str]
     services: Iterable[HasIdAndCount]
 
+    @profiled
     @transaction.atomic
     def execute(self) -> DryCleaningRequestCreateResponseDto:
+        from telebot.types import InlineKeyboardButton, InlineKeyboardMarkup
+
         ensure_shift_exists(self.shift_id)
         dry_cleaning_request = DryCleaningRequest.objects.create(
             shift_id=self.shift_id,
@@ -4,8 +4,10 @@ from collections.abc import Iterable
 from dataclasses import dataclass
 from uuid import UUID
 
+from core.profiling import profiled
 from dry_cleaning.models import (
     DryCleaningRequest,
+    DryCleaningRequestPhoto,
     DryCleaningRequestService,
 )
 
@@ -33,61 +35,149 @@ class DryCleaningRequestListItemDto:
     updated_at: datetime.datetime
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
+class DryCleaningRequestsPage:
+    dry_cleaning_requests: list[DryCleaningRequestListItemDto]
+    next_cursor: int | None
+    is_end_of_list_reached: bool
+
+
 def get_services_grouped_by_request_id(
-    requests: Iterable[DryCleaningRequest],
-) -> dict[int, list[DryCleaningRequestService]]:
-    services = DryCleaningRequestService.objects.select_related("service").filter(
-        request__in=requests
+    request_ids: Iterable[int],
+) -> dict[int, list[DryCleaningRequestServiceDto]]:
+    services = (
+        DryCleaningRequestService.objects.filter(request_id__in=request_ids)
+        .select_related("service")
+        .only(
+            "request_id",
+            "count",
+            "service__id",
+            "service__name",
+            "service__is_countable",
+        )
     )
     services_grouped_by_request_id = defaultdict(list)
     for service in services:
-        services_grouped_by_request_id[service.request_id].append(service)
+        services_grouped_by_request_id[service.request_id].append(
+            DryCleaningRequestServiceDto(
+                id=service.service_id,
+                name=service.service.name,
+                count=service.count,
+                is_countable=service.service.is_countable,
+            )
+        )
     return services_grouped_by_request_id
 
 
+def get_photo_urls_grouped_by_request_id(
+    request_ids: Iterable[int],
+) -> dict[int, list[str]]:
+    photos = DryCleaningRequestPhoto.objects.filter(
+        request_id__in=request_ids,
+    ).values_list("request_id", "url")
+    photo_urls_grouped_by_request_id = defaultdict(list)
+    for request_id, url in photos:
+        photo_urls_grouped_by_request_id[request_id].append(url)
+    return photo_urls_grouped_by_request_id
+
+
 @dataclass(frozen=True, slots=True, kw_only=True)
 class DryCleaningRequestListInteractor:
+    """
+    Page through dry cleaning requests from newest to oldest.
+
+    Filters are applied first, then the page is cut with keyset
+    pagination on id (``cursor`` is the id of the last request on the
+    previous page), so the cost of a page does not depend on how many
+    requests have been made so far. Services and photos are fetched
+    only for requests on the page.
+
+    Args:
+        shift_ids: filter by shift IDs.
+        staff_ids: filter by staff IDs.
+        statuses: filter by statuses.
+        from_date: filter by shift date, inclusive.
+        to_date: filter by shift date, inclusive.
+        cursor: ID of the last request on the previous page.
+        limit: maximum number of requests on the page.
+    """
+
     shift_ids: Iterable[int] | None = None
+    staff_ids: Iterable[int] | None = None
     statuses: Iterable[int] | None = None
+    from_date: datetime.date | None = None
+    to_date: datetime.date | None = None
+    cursor: int | None = None
+    limit: int = 100
 
-    def execute(self) -> list[DryCleaningRequestListItemDto]:
-        requests = DryCleaningRequest.objects.prefetch_related("photos").select_related(
-            "shift__staff"
-        )
-        request_id_to_services = get_services_grouped_by_request_id(requests)
+    def get_requests(self) -> list[DryCleaningRequest]:
+        requests = DryCleaningRequest.objects.all()
 
         if self.shift_ids is not None:
             requests = requests.filter(shift_id__in=self.shift_ids)
 
+        if self.staff_ids is not None:
+            requests = requests.filter(shift__staff_id__in=self.staff_ids)
+
         if self.statuses is not None:
             requests = requests.filter(status__in=self.statuses)
 
-        result: list[DryCleaningRequestListItemDto] = []
-        for request in requests:
-            services = request_id_to_services.get(request.id, [])
-            photo_urls = [photo.url for photo in request.photos.all()]
-            services = [
-                DryCleaningRequestServiceDto(
-                    id=service.service_id,
-                    name=service.service.name,
-                    count=service.count,
-                    is_countable=service.service.is_countable,
-                )
-                for service in services
-            ]
-            item = DryCleaningRequestListItemDto(
+        if self.from_date is not None:
+            requests = requests.filter(shift__date__gte=self.from_date)
+
+        if self.to_date is not None:
+            requests = requests.filter(shift__date__lte=self.to_date)
+
+        if self.cursor is not None:
+            requests = requests.filter(id__lt=self.cursor)
+
+        requests = (
+            requests.select_related("shift__staff")
+            .only(
+                "id",
+                "shift_id",
+                "shift__staff_id",
+                "shift__staff__full_name",
+                "car_number",
+                "status",
+                "response_comment",
+                "created_at",
+                "updated_at",
+            )
+            .order_by("-id")
+        )
+        return list(requests[: self.limit + 1])
+
+    @profiled
+    def execute(self) -> DryCleaningRequestsPage:
+        requests = self.get_requests()
+        is_end_of_list_reached = len(requests) <= self.limit
+        requests = requests[: self.limit]
+
+        request_ids = [request.id for request in requests]
+        request_id_to_services = get_services_grouped_by_request_id(request_ids)
+        request_id_to_photo_urls = get_photo_urls_grouped_by_request_id(request_ids)
+
+        dry_cleaning_requests = [
+            DryCleaningRequestListItemDto(
                 id=request.id,
                 shift_id=request.shift_id,
                 staff_id=request.shift.staff_id,
                 staff_full_name=request.shift.staff.full_name,
                 car_number=request.car_number,
-                photo_urls=photo_urls,
-                services=services,
+                photo_urls=request_id_to_photo_urls[request.id],
+                services=request_id_to_services[request.id],
                 status=request.status,
                 response_comment=request.response_comment,
                 created_at=request.created_at,
                 updated_at=request.updated_at,
             )
-            result.append(item)
-
-        return result
+            for request in requests
+        ]
+        return DryCleaningRequestsPage(
+            dry_cleaning_requests=dry_cleaning_requests,
+            next_cursor=(
+                None if is_end_of_list_reached or not requests else requests[-1].id
+            ),
+            is_end_of_list_reached=is_end_of_list_reached,
+        )
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 
+from core.profiling import profiled
 from dry_cleaning.exceptions import (
     DryCleaningRequestInvalidStatusError,
     DryCleaningRequestNotFoundError,
@@ -17,6 +18,7 @@ class DryCleaningRequestRejectInteractor:
     dry_cleaning_request_id: int
     response_comment: str | None
 
+    @profiled
     def execute(self) -> None:
         try:
             dry_cleaning_request = DryCleaningRequest.objects.get(
@@ -3,6 +3,7 @@ from collections.abc import Iterable
 from dataclasses import dataclass
 from uuid import UUID
 
+from core.profiling import profiled
 from dry_cleaning.exceptions import DryCleaningRequestNotFoundError
 from dry_cleaning.models import (
     DryCleaningRequest,
@@ -38,6 +39,7 @@ class DryCleaningRequestRetrieveResponseDto:
 class DryCleaningRequestRetrieveByIdInteractor:
     dry_cleaning_request_id: int
 
+    @profiled
     def execute(self) -> DryCleaningRequestRetrieveResponseDto:
         try:
             dry_cleaning_request = (
@@ -1,8 +1,11 @@
+import datetime
+
 from rest_framework import status
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from core.idempotency import idempotent
 from shifts.serializers import (
     DryCleaningRequestCreateInputSerializer,
     DryCleaningRequestListInputSerializer,
@@ -22,18 +25,35 @@ class DryCleaningRequestListCreateApi(APIView):
         serializer.is_valid(raise_exception=True)
         shift_ids: list[int] | None = serializer.validated_data["shift_ids"]
         statuses: list[int] | None = serializer.validated_data["statuses"]
+        staff_ids: list[int] | None = serializer.validated_data["staff_ids"]
+        from_date: datetime.date | None = serializer.validated_data["from_date"]
+        to_date: datetime.date | None = serializer.validated_data["to_date"]
+        cursor: int | None = serializer.validated_data["cursor"]
+        limit: int = serializer.validated_data["limit"]
 
-        dry_cleaning_requests = DryCleaningRequestListInteractor(
+        page = DryCleaningRequestListInteractor(
             shift_ids=shift_ids,
+            staff_ids=staff_ids,
             statuses=statuses,
+            from_date=from_date,
+            to_date=to_date,
+            cursor=cursor,
+            limit=limit,
         ).execute()
 
         serializer = DryCleaningRequestSerializer(
-            dry_cleaning_requests,
+            page.dry_cleaning_requests,
             many=True,
         )
-        return Response({"dry_cleaning_requests": serializer.data})
+        return Response(
+            {
+                "dry_cleaning_requests": serializer.data,
+                "next_cursor": page.next_cursor,
+                "is_end_of_list_reached": page.is_end_of_list_reached,
+            },
+        )
 
+    @idempotent("dry-cleaning-request-create")
     def post(self, request: Request) -> Response:
         serializer = DryCleaningRequestCreateInputSerializer(
             data=request.data,
@@ -2,6 +2,7 @@ from django.contrib import admin
 from import_export.admin import ImportExportModelAdmin
 from import_export.resources import ModelResource
 
+from core.admin import ReplicaExportMixin
 from economics.models import (
     Penalty,
     StaffServicePrice,
@@ -9,7 +10,10 @@ from economics.models import (
     CarWashPenalty,
     CarWashSurcharge,
     PenaltyPhoto,
+    ClosedReportPeriod,
+    ReportSnapshot,
 )
+from economics.services.reports import reopen_report_periods
 
 
 class CarWashPenaltyResource(ModelResource):
@@ -38,7 +42,7 @@ class PenaltyPhotoAdmin(admin.ModelAdmin):
 
 
 @admin.register(Penalty)
-class PenaltyAdmin(ImportExportModelAdmin):
+class PenaltyAdmin(ReplicaExportMixin, ImportExportModelAdmin):
     resource_class = PenaltyResource
     list_display = (
         "shift__staff",
@@ -58,7 +62,7 @@ class PenaltyAdmin(ImportExportModelAdmin):
 
 
 @admin.register(Surcharge)
-class SurchargeAdmin(ImportExportModelAdmin):
+class SurchargeAdmin(ReplicaExportMixin, ImportExportModelAdmin):
     resource_class = SurchargeResource
     list_display = (
         "shift__staff",
@@ -93,7 +97,7 @@ class StaffServicePriceAdmin(admin.ModelAdmin):
 
 
 @admin.register(CarWashPenalty)
-class CarWashPenaltyAdmin(ImportExportModelAdmin):
+class CarWashPenaltyAdmin(ReplicaExportMixin, ImportExportModelAdmin):
     resource_class = CarWashPenaltyResource
     list_display = (
         "car_wash",
@@ -110,7 +114,7 @@ class CarWashPenaltyAdmin(ImportExportModelAdmin):
 
 
 @admin.register(CarWashSurcharge)
-class CarWashSurchargeAdmin(ImportExportModelAdmin):
+class CarWashSurchargeAdmin(ReplicaExportMixin, ImportExportModelAdmin):
     resource_class = CarWashSurchargeResource
     list_display = (
         "car_wash",
@@ -124,3 +128,35 @@ class CarWashSurchargeAdmin(ImportExportModelAdmin):
     )
     search_fields = ("car_wash__name", "reason")
     search_help_text = "Search by car wash name, reason"
+
+
+@admin.register(ClosedReportPeriod)
+class ClosedReportPeriodAdmin(admin.ModelAdmin):
+    list_display = ("from_date", "to_date", "closed_at")
+    ordering = ("-from_date",)
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, *args):
+        return False
+
+    def delete_model(self, request, obj):
+        reopen_report_periods([(obj.from_date, obj.to_date)])
+
+    def delete_queryset(self, request, queryset):
+        reopen_report_periods(queryset.values_list("from_date", "to_date"))
+
+
+@admin.register(ReportSnapshot)
+class ReportSnapshotAdmin(admin.ModelAdmin):
+    list_display = ("report_type", "from_date", "to_date", "object_id", "created_at")
+    list_filter = ("report_type",)
+    ordering = ("-from_date",)
+    exclude = ("payload",)
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, *args):
+        return False
@@ -6,3 +6,8 @@ class EconomicsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "economics"
     verbose_name = _("economics")
+
+    def ready(self):
+        from economics.signals import connect_report_snapshot_invalidation
+
+        connect_report_snapshot_invalidation()
@@ -7,6 +7,7 @@ __all__ = (
     "InvalidPenaltyConsequenceError",
     "CarTransporterPenaltyNotFoundError",
     "CarTransporterSurchargeNotFoundError",
+    "InvalidReportPeriodError",
 )
 
 
@@ -44,3 +45,9 @@ class CarTransporterSurchargeNotFoundError(APIException):
     status_code = status.HTTP_404_NOT_FOUND
     default_code = "car_transfer_surcharge_not_found"
     default_detail = _("Car transfer surcharge not found")
+
+
+class InvalidReportPeriodError(APIException):
+    status_code = status.HTTP_400_BAD_REQUEST
+    default_code = "invalid_report_period"
+    default_detail = _("report period must be either 1-15 or 16-last day of month")
@@ -0,0 +1,86 @@
+# Generated by Django 5.2 on 2026-10-19 06:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("economics", "0006_carwashpenalty_date_carwashsurcharge_date"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ClosedReportPeriod",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("from_date", models.DateField()),
+                ("to_date", models.DateField()),
+                ("closed_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "verbose_name": "closed report period",
+                "verbose_name_plural": "closed report periods",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("from_date", "to_date"),
+                        name="unique_closed_report_period",
+                    )
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="ReportSnapshot",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "report_type",
+                    models.CharField(
+                        choices=[
+                            ("staff_shifts_statistics", "staff shifts statistics"),
+                            ("car_washes_revenue", "car washes revenue"),
+                        ],
+                        max_length=64,
+                    ),
+                ),
+                ("from_date", models.DateField()),
+                ("to_date", models.DateField()),
+                (
+                    "object_id",
+                    models.PositiveBigIntegerField(
+                        blank=True,
+                        help_text="car wash ID for car washes revenue report",
+                        null=True,
+                    ),
+                ),
+                ("payload", models.BinaryField(help_text="zlib compressed JSON")),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "verbose_name": "report snapshot",
+                "verbose_name_plural": "report snapshots",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("report_type", "from_date", "to_date", "object_id"),
+                        name="unique_report_snapshot",
+                        nulls_distinct=False,
+                    )
+                ],
+            },
+        ),
+    ]
@@ -12,6 +12,8 @@ __all__ = (
     "CarWashPenalty",
     "CarWashSurcharge",
     "PenaltyPhoto",
+    "ClosedReportPeriod",
+    "ReportSnapshot",
 )
 
 
@@ -138,3 +140,56 @@ class StaffServicePrice(models.Model):
 
     def __str__(self):
         return self.get_service_display()
+
+
+class ClosedReportPeriod(models.Model):
+    from_date = models.DateField()
+    to_date = models.DateField()
+    closed_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = _("closed report period")
+        verbose_name_plural = _("closed report periods")
+        constraints = [
+            models.UniqueConstraint(
+                fields=("from_date", "to_date"),
+                name="unique_closed_report_period",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.from_date} - {self.to_date}"
+
+
+class ReportSnapshot(models.Model):
+    class ReportType(models.TextChoices):
+        STAFF_SHIFTS_STATISTICS = (
+            "staff_shifts_statistics",
+            _("staff shifts statistics"),
+        )
+        CAR_WASHES_REVENUE = "car_washes_revenue", _("car washes revenue")
+
+    report_type = models.CharField(max_length=64, choices=ReportType.choices)
+    from_date = models.DateField()
+    to_date = models.DateField()
+    object_id = models.PositiveBigIntegerField(
+        null=True,
+        blank=True,
+        help_text=_("car wash ID for car washes revenue report"),
+    )
+    payload = models.BinaryField(help_text=_("zlib compressed JSON"))
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = _("report snapshot")
+        verbose_name_plural = _("report snapshots")
+        constraints = [
+            models.UniqueConstraint(
+                fields=("report_type", "from_date", "to_date", "object_id"),
+                name="unique_report_snapshot",
+                nulls_distinct=False,
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.get_report_type_display()} {self.from_date} - {self.to_date}"
@@ -5,6 +5,7 @@ from dataclasses import dataclass
 
 from django.db.models import Sum
 
+from core.replica import using_replica
 from economics.models import (
     CarWashPenalty,
     CarWashSurcharge,
@@ -40,6 +41,7 @@ class CarWashPenaltiesAndSurchargesByDate:
     surcharges_amount: int
 
 
+@using_replica()
 def get_car_wash_penalties_and_surcharges_for_period(
     *,
     car_wash_ids: Iterable[int],
@@ -140,6 +142,7 @@ def group_by_staff_id(
     ]
 
 
+@using_replica()
 def get_penalties_for_period(
     *,
     from_date: datetime.date,
@@ -158,6 +161,7 @@ def get_penalties_for_period(
     return group_by_staff_id(penalties_grouped_by_staff_id_and_shift_date)
 
 
+@using_replica()
 def get_surcharges_for_period(
     *,
     from_date: datetime.date,
@@ -232,6 +236,7 @@ def map_surcharges_to_page_items(
     ]
 
 
+@using_replica()
 def get_surcharges_page(
     *,
     staff_ids: Iterable[int] | None = None,
@@ -290,6 +295,7 @@ def map_penalties_to_page_items(
     ]
 
 
+@using_replica()
 def get_penalties_page(
     *,
     staff_ids: Iterable[int] | None = None,
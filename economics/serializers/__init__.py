@@ -23,6 +23,10 @@ from .reports import (
     CarWashesRevenueReportOutputSerializer,
     CarWashRevenueForShiftSerializer,
     CarWashRevenueForShiftAdditionalServiceSerializer,
+    ReportPeriodCloseInputSerializer,
+    ReportPeriodCloseOutputSerializer,
+    serialize_car_wash_revenue,
+    serialize_staff_shifts_statistics,
 )
 from .surcharges import (
     SurchargeCreateInputSerializer,
@@ -48,6 +52,10 @@ __all__ = (
     "CarWashesRevenueReportOutputSerializer",
     "CarWashRevenueForShiftSerializer",
     "CarWashRevenueForShiftAdditionalServiceSerializer",
+    "ReportPeriodCloseInputSerializer",
+    "ReportPeriodCloseOutputSerializer",
+    "serialize_car_wash_revenue",
+    "serialize_staff_shifts_statistics",
     "SurchargeCreateInputSerializer",
     "SurchargeCreateOutputSerializer",
     "SurchargeListOutputSerializer",
@@ -3,6 +3,13 @@ import datetime
 from django.utils.translation import gettext as _
 from rest_framework import serializers
 
+from economics.services.reports.staff_shifts_statistics import (
+    ShiftStatisticsWithPenaltyAndSurcharge,
+    StaffShiftsStatistics,
+    TotalStatistics,
+)
+from staff.selectors import StaffItem
+
 
 __all__ = (
     "StaffItemSerializer",
@@ -14,8 +21,15 @@ __all__ = (
     "CarWashesRevenueReportOutputSerializer",
     "CarWashRevenueForShiftSerializer",
     "CarWashRevenueForShiftAdditionalServiceSerializer",
+    "ReportPeriodCloseInputSerializer",
+    "ReportPeriodCloseOutputSerializer",
+    "serialize_car_wash_revenue",
+    "serialize_staff_shifts_statistics",
 )
 
+# Formats datetimes the same as serializers of the module.
+datetime_field = serializers.DateTimeField()
+
 
 class CarWashesRevenueReportInputSerializer(serializers.Serializer):
     from_date = serializers.DateField()
@@ -137,3 +151,123 @@ class StaffShiftsStatisticsReportOutputSerializer(serializers.Serializer):
     staff_list = serializers.ListField(
         child=StaffShiftsStatisticsSerializer(),
     )
+
+
+class ReportPeriodCloseInputSerializer(serializers.Serializer):
+    from_date = serializers.DateField()
+    to_date = serializers.DateField()
+
+
+class ReportPeriodCloseOutputSerializer(serializers.Serializer):
+    from_date = serializers.DateField()
+    to_date = serializers.DateField()
+    closed_at = serializers.DateTimeField()
+
+
+def serialize_car_wash_revenue(car_wash_revenue: dict) -> dict:
+    """Same as ``CarWashRevenueForShiftSerializer``, without field objects."""
+    return {
+        "shift_date": car_wash_revenue["shift_date"].isoformat(),
+        "comfort_cars_washed_count": car_wash_revenue["comfort_cars_washed_count"],
+        "business_cars_washed_count": car_wash_revenue["business_cars_washed_count"],
+        "van_cars_washed_count": car_wash_revenue["van_cars_washed_count"],
+        "windshield_washer_refilled_bottle_count": car_wash_revenue[
+            "windshield_washer_refilled_bottle_count"
+        ],
+        "total_cost": car_wash_revenue["total_cost"],
+        "additional_services": [
+            {
+                "id": str(service.id),
+                "name": service.name,
+                "count": service.count,
+            }
+            for service in car_wash_revenue["additional_services"]
+        ],
+        "penalties_amount": car_wash_revenue["penalties_amount"],
+        "surcharges_amount": car_wash_revenue["surcharges_amount"],
+    }
+
+
+def serialize_staff(staff: StaffItem) -> dict:
+    return {
+        "id": staff.id,
+        "full_name": staff.full_name,
+        "car_sharing_phone_number": staff.car_sharing_phone_number,
+        "console_phone_number": staff.console_phone_number,
+        "created_at": datetime_field.to_representation(staff.created_at),
+        "banned_at": (
+            None
+            if staff.banned_at is None
+            else datetime_field.to_representation(staff.banned_at)
+        ),
+    }
+
+
+def serialize_shift_statistics(
+    shift_statistics: ShiftStatisticsWithPenaltyAndSurcharge,
+) -> dict:
+    return {
+        "shift_date": shift_statistics.shift_date.isoformat(),
+        "penalty_amount": shift_statistics.penalty_amount,
+        "surcharge_amount": shift_statistics.surcharge_amount,
+        "planned_comfort_cars_washed_count": (
+            shift_statistics.planned_comfort_cars_washed_count
+        ),
+        "planned_business_cars_washed_count": (
+            shift_statistics.planned_business_cars_washed_count
+        ),
+        "planned_vans_washed_count": shift_statistics.planned_vans_washed_count,
+        "urgent_cars_washed_count": shift_statistics.urgent_cars_washed_count,
+        "is_extra_shift": shift_statistics.is_extra_shift,
+        "dry_cleaning_items_count": shift_statistics.dry_cleaning_items_count,
+        "washed_cars_total_cost": shift_statistics.washed_cars_total_cost,
+        "washed_cars_total_count": shift_statistics.washed_cars_total_count,
+        "dirty_revenue": shift_statistics.dirty_revenue,
+        "road_accident_deposit_amount": float(
+            shift_statistics.road_accident_deposit_amount
+        ),
+    }
+
+
+def serialize_total_statistics(total_statistics: TotalStatistics) -> dict:
+    return {
+        "penalty_amount": total_statistics.penalty_amount,
+        "surcharge_amount": total_statistics.surcharge_amount,
+        "planned_comfort_cars_washed_count": (
+            total_statistics.planned_comfort_cars_washed_count
+        ),
+        "planned_business_cars_washed_count": (
+            total_statistics.planned_business_cars_washed_count
+        ),
+        "planned_vans_washed_count": total_statistics.planned_vans_washed_count,
+        "urgent_cars_washed_count": total_statistics.urgent_cars_washed_count,
+        "extra_shifts_count": total_statistics.extra_shifts_count,
+        "dry_cleaning_items_count": total_statistics.dry_cleaning_items_count,
+        "washed_cars_total_cost": total_statistics.washed_cars_total_cost,
+        "washed_cars_total_count": total_statistics.washed_cars_total_count,
+        "dirty_revenue": total_statistics.dirty_revenue,
+        "road_accident_deposit_amount": float(
+            total_statistics.road_accident_deposit_amount
+        ),
+        "fine_deposit_amount": total_statistics.fine_deposit_amount,
+        "net_revenue": float(total_statistics.net_revenue),
+    }
+
+
+def serialize_staff_shifts_statistics(
+    staff_shifts_statistics: StaffShiftsStatistics,
+) -> dict:
+    """
+    Same as ``StaffShiftsStatisticsSerializer``, without field objects,
+    so large reports are serialized several times faster.
+    """
+    return {
+        "staff": serialize_staff(staff_shifts_statistics.staff),
+        "shifts_statistics": [
+            serialize_shift_statistics(shift_statistics)
+            for shift_statistics in staff_shifts_statistics.shifts_statistics
+        ],
+        "total_statistics": serialize_total_statistics(
+            staff_shifts_statistics.total_statistics,
+        ),
+    }
@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from django.core.exceptions import ValidationError
 
 from car_washes.exceptions import CarWashNotFoundError
+from core.profiling import profiled
 from economics.models import CarWashPenalty
 
 __all__ = (
@@ -42,6 +43,7 @@ class CarWashPenaltyCreateInteractor:
     amount: int
     date: datetime.date
 
+    @profiled
     def execute(self) -> CarWashPenaltyCreateResult:
         penalty = CarWashPenalty(
             car_wash_id=self.car_wash_id,
@@ -74,6 +76,7 @@ class CarWashPenaltyListInteractor:
     to_date: datetime.datetime | None
     car_wash_ids: list[int] | None
 
+    @profiled
     def execute(self) -> list[CarWashPenaltyListItem]:
         penalties = CarWashPenalty.objects.order_by("-created_at")
         if self.car_wash_ids is not None:
@@ -100,6 +103,7 @@ class CarWashPenaltyListInteractor:
 class CarWashPenaltyDeleteInteractor:
     penalty_id: int
 
+    @profiled
     def execute(self) -> None:
         deleted_count, _ = CarWashPenalty.objects.filter(id=self.penalty_id).delete()
         if deleted_count == 0:
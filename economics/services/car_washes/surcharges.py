@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from django.core.exceptions import ValidationError
 
 from car_washes.exceptions import CarWashNotFoundError
+from core.profiling import profiled
 from economics.models import CarWashSurcharge
 
 __all__ = (
@@ -42,6 +43,7 @@ class CarWashSurchargeCreateInteractor:
     amount: int
     date: datetime.date
 
+    @profiled
     def execute(self) -> CarWashSurchargeCreateResult:
         surcharge = CarWashSurcharge(
             car_wash_id=self.car_wash_id,
@@ -74,6 +76,7 @@ class CarWashSurchargeListInteractor:
     to_date: datetime.datetime | None
     car_wash_ids: list[int] | None
 
+    @profiled
     def execute(self) -> list[CarWashSurchargeListItem]:
         surcharges = CarWashSurcharge.objects.order_by("-created_at")
         if self.car_wash_ids is not None:
@@ -100,6 +103,7 @@ class CarWashSurchargeListInteractor:
 class CarWashSurchargeDeleteInteractor:
     surcharge_id: int
 
+    @profiled
     def execute(self) -> None:
         deleted_count, _ = CarWashSurcharge.objects.filter(
             id=self.surcharge_id
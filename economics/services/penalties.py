@@ -6,6 +6,7 @@ from typing import Final, TypeAlias, TypedDict
 
 from django.db import transaction
 
+from core.profiling import profiled
 from economics.exceptions import (
     CarTransporterPenaltyNotFoundError,
     CarTransporterSurchargeNotFoundError,
@@ -230,6 +231,7 @@ def create_penalty(
 class CarTransporterPenaltyDeleteInteractor:
     penalty_id: int
 
+    @profiled
     def execute(self) -> None:
         deleted_count = Penalty.objects.filter(id=self.penalty_id).delete()
         if deleted_count == 0:
@@ -240,6 +242,7 @@ class CarTransporterPenaltyDeleteInteractor:
 class CarTransporterSurchargeDeleteInteractor:
     surcharge_id: int
 
+    @profiled
     def execute(self) -> None:
         deleted_count = Surcharge.objects.filter(id=self.surcharge_id).delete()
         if deleted_count == 0:
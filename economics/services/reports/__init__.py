@@ -11,6 +11,15 @@ from .staff_shifts_statistics import (
     merge_shifts_statistics_and_penalties_and_surcharges,
     compute_washed_cars_total_cost,
 )
+from .single_flight import get_or_compute_report, get_report_cache_key
+from .snapshots import (
+    ReportPeriodCloseInteractor,
+    get_car_washes_revenue_snapshot,
+    get_staff_shifts_statistics_snapshot,
+    invalidate_report_snapshots,
+    is_report_period_closed,
+    reopen_report_periods,
+)
 
 __all__ = (
     "get_car_washes_sales_report",
@@ -24,4 +33,12 @@ __all__ = (
     "map_shift_statistics_with_penalty_and_surcharge",
     "merge_shifts_statistics_and_penalties_and_surcharges",
     "compute_washed_cars_total_cost",
+    "get_or_compute_report",
+    "get_report_cache_key",
+    "ReportPeriodCloseInteractor",
+    "get_car_washes_revenue_snapshot",
+    "get_staff_shifts_statistics_snapshot",
+    "invalidate_report_snapshots",
+    "is_report_period_closed",
+    "reopen_report_periods",
 )
@@ -2,6 +2,7 @@ import datetime
 from collections import defaultdict
 from collections.abc import Iterable
 
+from core.replica import using_replica
 from economics.selectors import (
     CarWashPenaltiesAndSurchargesByDate,
     get_car_wash_penalties_and_surcharges_for_period,
@@ -145,6 +146,7 @@ def group_cars_to_wash_by_shift_date(
     return result
 
 
+@using_replica()
 def get_car_washes_sales_report(
     *,
     car_wash_ids: Iterable[int],
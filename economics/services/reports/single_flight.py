@@ -0,0 +1,92 @@
+import hashlib
+import json
+import time
+import uuid
+from collections.abc import Callable, Mapping
+from typing import Any, TypeVar
+
+from django.conf import settings
+from django.core.cache import cache
+
+
+__all__ = (
+    "get_report_cache_key",
+    "get_or_compute_report",
+)
+
+T = TypeVar("T")
+
+REPORT_CACHE_KEY_PREFIX = "report"
+
+
+def get_report_cache_key(*, name: str, params: Mapping[str, Any]) -> str:
+    """
+    Cache key of the report that is the same for identical parameters
+    regardless of their order (list parameters are order-sensitive).
+    """
+    serialized_params = json.dumps(params, sort_keys=True, default=str)
+    params_hash = hashlib.sha256(serialized_params.encode()).hexdigest()
+    return f"{REPORT_CACHE_KEY_PREFIX}:{name}:{params_hash}"
+
+
+def get_or_compute_report(
+    *,
+    name: str,
+    params: Mapping[str, Any],
+    compute: Callable[[], T],
+) -> T:
+    """
+    Compute the report once for concurrent identical requests.
+
+    The first request takes a lock in the cache backend and computes
+    the report, the others wait for its result instead of running the
+    same aggregation again. The result is cached for
+    ``REPORT_CACHE_TTL`` seconds, so requests made right after it
+    get the same result too. If the computing request does not
+    finish in ``REPORT_LOCK_TIMEOUT`` seconds, waiting requests
+    compute the report themselves.
+
+    Coalescing works across worker processes only with a shared
+    cache backend (CACHE_URL).
+
+    Keyword Args:
+        name: name of the report.
+        params: parameters the report depends on.
+        compute: computes the report, result must be picklable.
+
+    Returns:
+        Report computed by this or by a concurrent request.
+    """
+    result_ttl: int = settings.REPORT_CACHE_TTL
+    if result_ttl <= 0:
+        return compute()
+
+    lock_timeout: float = settings.REPORT_LOCK_TIMEOUT
+    poll_interval: float = settings.REPORT_LOCK_POLL_INTERVAL
+
+    result_key = get_report_cache_key(name=name, params=params)
+    lock_key = f"{result_key}:lock"
+    # Sentinel distinguishes a missing result from a cached ``None``.
+    missing = object()
+
+    deadline = time.monotonic() + lock_timeout
+    while True:
+        result = cache.get(result_key, missing)
+        if result is not missing:
+            return result
+
+        lock_token = uuid.uuid4().hex
+        if cache.add(lock_key, lock_token, timeout=lock_timeout):
+            try:
+                result = compute()
+                cache.set(result_key, result, timeout=result_ttl)
+                return result
+            finally:
+                # The lock may have expired and been taken by another
+                # request, which must not be released here.
+                if cache.get(lock_key) == lock_token:
+                    cache.delete(lock_key)
+
+        if time.monotonic() >= deadline:
+            return compute()
+        time.sleep(poll_interval)
@@ -0,0 +1,338 @@
+import datetime
+import functools
+import json
+import operator
+import zlib
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.db.models import Q
+
+from core.profiling import profiled
+from core.replica import using_primary
+from core.services import get_month_date_range
+from economics.exceptions import InvalidReportPeriodError
+from economics.models import ClosedReportPeriod, ReportSnapshot
+
+
+__all__ = (
+    "CLOSED_REPORT_PERIODS_CACHE_KEY",
+    "get_closed_report_periods",
+    "is_report_period_closed",
+    "compress_report_payload",
+    "decompress_report_payload",
+    "get_or_create_report_snapshots",
+    "get_staff_shifts_statistics_snapshot",
+    "get_car_washes_revenue_snapshot",
+    "merge_car_washes_revenue",
+    "invalidate_report_snapshots",
+    "reopen_report_periods",
+    "ReportPeriodCloseInteractor",
+)
+
+CLOSED_REPORT_PERIODS_CACHE_KEY = "closed-report-periods"
+
+DatePeriod = tuple[datetime.date, datetime.date]
+
+
+def get_closed_report_periods() -> list[DatePeriod]:
+    """
+    Closed report periods as (from_date, to_date) pairs.
+
+    They are read on every report request, so they are cached for
+    ``CLOSED_REPORT_PERIODS_CACHE_TTL`` seconds. The cache of the current
+    worker is cleared when a period is closed or reopened. Writes do not
+    use them, a stale cache would leave stale snapshots behind.
+    """
+    closed_periods = cache.get(CLOSED_REPORT_PERIODS_CACHE_KEY)
+    if closed_periods is None:
+        closed_periods = list(
+            ClosedReportPeriod.objects.values_list("from_date", "to_date")
+        )
+        cache.set(
+            CLOSED_REPORT_PERIODS_CACHE_KEY,
+            closed_periods,
+            timeout=settings.CLOSED_REPORT_PERIODS_CACHE_TTL,
+        )
+    return closed_periods
+
+
+def clear_closed_report_periods_cache() -> None:
+    cache.delete(CLOSED_REPORT_PERIODS_CACHE_KEY)
+    transaction.on_commit(
+        lambda: cache.delete(CLOSED_REPORT_PERIODS_CACHE_KEY),
+    )
+
+
+def is_report_period_closed(
+    *,
+    from_date: datetime.date,
+    to_date: datetime.date,
+) -> bool:
+    return (from_date, to_date) in get_closed_report_periods()
+
+
+def compress_report_payload(payload: Any) -> bytes:
+    serialized_payload = json.dumps(
+        payload,
+        cls=DjangoJSONEncoder,
+        separators=(",", ":"),
+    )
+    return zlib.compress(serialized_payload.encode())
+
+
+def decompress_report_payload(data: bytes | memoryview) -> Any:
+    return json.loads(zlib.decompress(data))
+
+
+def get_or_create_report_snapshots(
+    *,
+    report_type: ReportSnapshot.ReportType,
+    from_date: datetime.date,
+    to_date: datetime.date,
+    object_ids: Iterable[int | None],
+    compute: Callable[[int | None], Any],
+) -> dict[int | None, Any]:
+    """
+    Read snapshots of the closed period report, computing missing ones.
+
+    Keyword Args:
+        report_type: type of the report.
+        from_date: start of the closed period.
+        to_date: end of the closed period.
+        object_ids: IDs of report objects (e.g. car washes),
+                    ``None`` for the report as a whole.
+        compute: computes JSON-serializable payload for the object ID.
+
+    Returns:
+        Payloads by object IDs.
+    """
+    object_ids = list(dict.fromkeys(object_ids))
+    not_null_object_ids = [
+        object_id for object_id in object_ids if object_id is not None
+    ]
+    object_ids_condition = Q(object_id__in=not_null_object_ids)
+    if None in object_ids:
+        object_ids_condition |= Q(object_id__isnull=True)
+
+    snapshots = ReportSnapshot.objects.filter(
+        object_ids_condition,
+        report_type=report_type,
+        from_date=from_date,
+        to_date=to_date,
+    ).values_list("object_id", "payload")
+    object_id_to_payload = {
+        object_id: decompress_report_payload(payload)
+        for object_id, payload in snapshots
+    }
+
+    missing_snapshots: list[ReportSnapshot] = []
+    for object_id in object_ids:
+        if object_id in object_id_to_payload:
+            continue
+        # Snapshots are kept until invalidated,
+        # so they are not computed from a lagging replica.
+        with using_primary():
+            payload = compute(object_id)
+        object_id_to_payload[object_id] = payload
+        missing_snapshots.append(
+            ReportSnapshot(
+                report_type=report_type,
+                from_date=from_date,
+                to_date=to_date,
+                object_id=object_id,
+                payload=compress_report_payload(payload),
+            )
+        )
+    # Snapshot may be created by a concurrent request in the meantime.
+    ReportSnapshot.objects.bulk_create(missing_snapshots, ignore_conflicts=True)
+
+    return {object_id: object_id_to_payload[object_id] for object_id in object_ids}
+
+
+def get_staff_shifts_statistics_snapshot(
+    *,
+    from_date: datetime.date,
+    to_date: datetime.date,
+    staff_ids: Iterable[int] | None,
+    compute: Callable[[], list[dict]],
+) -> list[dict]:
+    """
+    Staff shifts statistics of the closed period.
+
+    The snapshot holds statistics of all staff members, so it is
+    filtered by staff IDs on read.
+
+    Keyword Args:
+        from_date: start of the closed period.
+        to_date: end of the closed period.
+        staff_ids: staff IDs to filter by. If None, all staff are included.
+        compute: computes serialized statistics of all staff members.
+    """
+    object_id_to_payload = get_or_create_report_snapshots(
+        report_type=ReportSnapshot.ReportType.STAFF_SHIFTS_STATISTICS,
+        from_date=from_date,
+        to_date=to_date,
+        object_ids=[None],
+        compute=lambda _: compute(),
+    )
+    staff_list: list[dict] = object_id_to_payload[None]
+    if staff_ids is None:
+        return staff_list
+    staff_ids = set(staff_ids)
+    return [item for item in staff_list if item["staff"]["id"] in staff_ids]
+
+
+def merge_additional_services(additional_services: Iterable[dict]) -> list[dict]:
+    service_id_to_service: dict[str, dict] = {}
+    for service in additional_services:
+        if service["id"] in service_id_to_service:
+            service_id_to_service[service["id"]]["count"] += service["count"]
+        else:
+            service_id_to_service[service["id"]] = dict(service)
+    return list(service_id_to_service.values())
+
+
+def merge_car_washes_revenue(car_washes_revenue: Iterable[list[dict]]) -> list[dict]:
+    """
+    Merge serialized revenue reports of separate car washes by shift date.
+
+    All numeric fields of the report are additive, so merged report is
+    the same as the report computed for all car washes at once.
+    """
+    car_washes_revenue = list(car_washes_revenue)
+    if len(car_washes_revenue) == 1:
+        return car_washes_revenue[0]
+
+    shift_date_to_rows: dict[str, list[dict]] = defaultdict(list)
+    for car_wash_revenue in car_washes_revenue:
+        for row in car_wash_revenue:
+            shift_date_to_rows[row["shift_date"]].append(row)
+
+    result: list[dict] = []
+    for shift_date, rows in sorted(shift_date_to_rows.items()):
+        merged_row: dict = {"shift_date": shift_date}
+        for key in rows[0]:
+            if key == "shift_date":
+                continue
+            if key == "additional_services":
+                merged_row[key] = merge_additional_services(
+                    service for row in rows for service in row[key]
+                )
+            else:
+                merged_row[key] = sum(row[key] for row in rows)
+        result.append(merged_row)
+    return result
+
+
+def get_car_washes_revenue_snapshot(
+    *,
+    from_date: datetime.date,
+    to_date: datetime.date,
+    car_wash_ids: Iterable[int],
+    compute: Callable[[int], list[dict]],
+) -> list[dict]:
+    """
+    Car washes revenue of the closed period.
+
+    Snapshots are kept per car wash and merged on read, so any set of
+    car washes can be served from them.
+
+    Keyword Args:
+        from_date: start of the closed period.
+        to_date: end of the closed period.
+        car_wash_ids: car wash IDs.
+        compute: computes serialized revenue of the single car wash.
+    """
+    object_id_to_payload = get_or_create_report_snapshots(
+        report_type=ReportSnapshot.ReportType.CAR_WASHES_REVENUE,
+        from_date=from_date,
+        to_date=to_date,
+        object_ids=car_wash_ids,
+        compute=compute,
+    )
+    return merge_car_washes_revenue(object_id_to_payload.values())
+
+
+def invalidate_report_snapshots(dates: Iterable[datetime.date | None]) -> None:
+    """
+    Delete snapshots of closed periods that contain any of the dates.
+
+    Only closed periods have snapshots, so they are deleted by the dates
+    in the database, not by the cached closed periods, which may lag
+    behind a period closed in another worker.
+    Periods stay closed, their snapshots are computed again on next read.
+    """
+    dates = {date for date in dates if date is not None}
+    if not dates:
+        return
+
+    ReportSnapshot.objects.filter(
+        functools.reduce(
+            operator.or_,
+            [Q(from_date__lte=date, to_date__gte=date) for date in dates],
+        )
+    ).delete()
+
+
+def reopen_report_periods(periods: Iterable[DatePeriod]) -> None:
+    periods = list(periods)
+    if not periods:
+        return
+    condition = functools.reduce(
+        operator.or_,
+        [Q(from_date=from_date, to_date=to_date) for from_date, to_date in periods],
+    )
+    with transaction.atomic():
+        ReportSnapshot.objects.filter(condition).delete()
+        ClosedReportPeriod.objects.filter(condition).delete()
+        clear_closed_report_periods_cache()
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ReportPeriodCloseInteractor:
+    """
+    Close half-month report period, so its reports are served from
+    snapshots instead of being computed on every request.
+
+    Raises:
+        InvalidReportPeriodError: If dates are not the half-month period.
+    """
+
+    from_date: datetime.date
+    to_date: datetime.date
+
+    def ensure_period_is_valid(self) -> None:
+        month_start, next_month_start = get_month_date_range(
+            year=self.from_date.year,
+            month=self.from_date.month,
+        )
+        month_end = next_month_start - datetime.timedelta(days=1)
+        half_month_periods = (
+            (month_start, month_start.replace(day=15)),
+            (month_start.replace(day=16), month_end),
+        )
+        if (self.from_date, self.to_date) not in half_month_periods:
+            raise InvalidReportPeriodError
+
+    @profiled
+    @transaction.atomic
+    def execute(self) -> ClosedReportPeriod:
+        self.ensure_period_is_valid()
+        # Snapshots left from the previous close could be stale.
+        ReportSnapshot.objects.filter(
+            from_date=self.from_date,
+            to_date=self.to_date,
+        ).delete()
+        closed_period, _ = ClosedReportPeriod.objects.get_or_create(
+            from_date=self.from_date,
+            to_date=self.to_date,
+        )
+        clear_closed_report_periods_cache()
+        return closed_period
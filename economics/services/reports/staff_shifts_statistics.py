@@ -4,6 +4,9 @@ from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import Protocol, TypeVar
 
+from django.db.models import Sum
+
+from core.replica import using_replica
 from economics.models import StaffServicePrice
 from economics.selectors import (
     StaffPenaltiesOrSurchargesForSpecificShift,
@@ -397,36 +400,30 @@ def get_shifts_dry_cleaning_items(
     Returns:
         list of ShiftDryCleaningItems.
     """
-    shifts_dry_cleaning_items = (
-        CarToWashAdditionalService.objects.select_related(
-            'car__shift'
-        ).filter(
-            car__shift__date__range=(from_date, to_date),
-            service__is_dry_cleaning=True,
-        ))
+    # Shift and staff are copied to additional services,
+    # so neither cars nor shifts are joined.
+    shifts_dry_cleaning_items = CarToWashAdditionalService.objects.filter(
+        shift_date__range=(from_date, to_date),
+        service__is_dry_cleaning=True,
+    )
     if staff_ids is not None:
         shifts_dry_cleaning_items = shifts_dry_cleaning_items.filter(
-            car__shift__staff_id__in=staff_ids
+            staff_id__in=staff_ids
         )
 
-    shift_id_and_staff_id_to_items_count = defaultdict(int)
-
-    for additional_service in shifts_dry_cleaning_items:
-        key = (
-            additional_service.car.shift_id,
-            additional_service.car.shift.staff_id,
-        )
-        shift_id_and_staff_id_to_items_count[key] += additional_service.count
+    shifts_items_count = (
+        shifts_dry_cleaning_items
+        .values("shift_id", "staff_id")
+        .annotate(items_count=Sum("count"))
+        .order_by()
+    )
     return [
         ShiftDryCleaningItems(
-            staff_id=staff_id,
-            shift_id=shift_id,
-            items_count=items_count,
+            staff_id=shift_items_count["staff_id"],
+            shift_id=shift_items_count["shift_id"],
+            items_count=shift_items_count["items_count"],
         )
-        for (
-            shift_id,
-            staff_id,
-        ), items_count in shift_id_and_staff_id_to_items_count.items()
+        for shift_items_count in shifts_items_count
     ]
 
 
@@ -439,13 +436,19 @@ def get_cars_to_wash_statistics(
     prices = StaffServicePricesSet(StaffServicePrice.objects.all())
 
     cars_to_wash = CarToWash.objects.filter(
-        shift__date__range=(from_date, to_date),
+        shift_date__range=(from_date, to_date),
     )
     if staff_ids is not None:
-        cars_to_wash = cars_to_wash.filter(shift__staff_id__in=staff_ids)
-    shift_id_to_cars: dict[int, list[CarToWash]] = group_by_shift_id(
-        cars_to_wash
+        cars_to_wash = cars_to_wash.filter(staff_id__in=staff_ids)
+    # Columns included in the shift date and staff index of cars.
+    cars_to_wash = cars_to_wash.values_list(
+        "shift_id",
+        "car_class",
+        "wash_type",
+        "transfer_price",
+        named=True,
     )
+    shift_id_to_cars = group_by_shift_id(cars_to_wash)
 
     shifts = Shift.objects.filter(date__range=(from_date, to_date))
     if staff_ids is not None:
@@ -526,6 +529,7 @@ def group_shifts_statistics_by_staff(
     ]
 
 
+@using_replica()
 def get_staff_shifts_statistics(
         *,
         staff_ids: Iterable[int],
@@ -0,0 +1,94 @@
+import datetime
+from collections.abc import Callable
+
+from django.db.models.signals import post_delete, post_save, pre_save
+
+from economics.models import CarWashPenalty, CarWashSurcharge, Penalty, Surcharge
+from economics.services.reports.snapshots import invalidate_report_snapshots
+from shifts.models import CarToWash, CarToWashAdditionalService, Shift
+
+
+__all__ = ("connect_report_snapshot_invalidation",)
+
+
+def get_shift_date(shift_id: int) -> datetime.date | None:
+    return Shift.objects.filter(id=shift_id).values_list("date", flat=True).first()
+
+
+def get_instance_shift_date(
+    instance: Penalty | Surcharge,
+) -> datetime.date | None:
+    shift = instance._state.fields_cache.get("shift")
+    if shift is not None:
+        return shift.date
+    return get_shift_date(instance.shift_id)
+
+
+INSTANCE_DATE_GETTERS: dict[type, Callable[..., datetime.date | None]] = {
+    Shift: lambda instance: instance.date,
+    CarToWash: lambda instance: instance.shift_date,
+    CarToWashAdditionalService: lambda instance: instance.shift_date,
+    Penalty: get_instance_shift_date,
+    Surcharge: get_instance_shift_date,
+    CarWashPenalty: lambda instance: instance.date,
+    CarWashSurcharge: lambda instance: instance.date,
+}
+
+# Lookups of the stored date, read before saving changed rows.
+STORED_DATE_LOOKUPS: dict[type, str] = {
+    Shift: "date",
+    CarToWash: "shift_date",
+    CarToWashAdditionalService: "shift_date",
+    Penalty: "shift__date",
+    Surcharge: "shift__date",
+    CarWashPenalty: "date",
+    CarWashSurcharge: "date",
+}
+
+
+def remember_stored_date(sender: type, instance, **kwargs) -> None:
+    """
+    Keep the date the row had before saving, so snapshots of the period
+    it is moved out of are invalidated too.
+    """
+    instance._report_stored_date = None
+    if instance._state.adding or kwargs.get("raw"):
+        return
+    instance._report_stored_date = (
+        sender.objects.filter(pk=instance.pk)
+        .values_list(STORED_DATE_LOOKUPS[sender], flat=True)
+        .first()
+    )
+
+
+def on_report_source_changed(sender: type, instance, **kwargs) -> None:
+    invalidate_report_snapshots(
+        [
+            INSTANCE_DATE_GETTERS[sender](instance),
+            getattr(instance, "_report_stored_date", None),
+        ]
+    )
+
+
+def connect_report_snapshot_invalidation() -> None:
+    """
+    Invalidate snapshots of closed report periods on late edits of data
+    reports are computed from. Bulk operations do not send signals and
+    must call ``invalidate_report_snapshots`` themselves.
+    """
+    for model in INSTANCE_DATE_GETTERS:
+        pre_save.connect(
+            remember_stored_date,
+            sender=model,
+            dispatch_uid=f"report_snapshot_stored_date_{model.__name__}",
+        )
+        post_save.connect(
+            on_report_source_changed,
+            sender=model,
+            dispatch_uid=f"report_snapshot_invalidation_save_{model.__name__}",
+        )
+        post_delete.connect(
+            on_report_source_changed,
+            sender=model,
+            dispatch_uid=f"report_snapshot_invalidation_delete_{model.__name__}",
+        )
@@ -0,0 +1,51 @@
+import datetime
+
+import pytest
+from django.core.cache import cache
+from freezegun import freeze_time
+
+from economics.models import ClosedReportPeriod, ReportSnapshot
+from economics.services.reports.snapshots import (
+    compress_report_payload,
+    get_closed_report_periods,
+    invalidate_report_snapshots,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+
+
+@pytest.mark.django_db
+def test_period_closed_by_other_worker_seen_after_cache_ttl(settings):
+    settings.CLOSED_REPORT_PERIODS_CACHE_TTL = 5
+    period = (datetime.date(2025, 3, 1), datetime.date(2025, 3, 15))
+
+    with freeze_time("2025-04-01 12:00:00") as frozen_time:
+        assert get_closed_report_periods() == []
+        # Closed by another worker, the cache of this one is not cleared.
+        ClosedReportPeriod.objects.create(from_date=period[0], to_date=period[1])
+        assert get_closed_report_periods() == []
+
+        frozen_time.tick(datetime.timedelta(seconds=6))
+
+        assert get_closed_report_periods() == [period]
+
+
+@pytest.mark.django_db
+def test_snapshots_invalidated_while_closed_periods_are_cached():
+    period = (datetime.date(2025, 3, 1), datetime.date(2025, 3, 15))
+    assert get_closed_report_periods() == []
+    # Closed by another worker, the cache of this one is not cleared.
+    ClosedReportPeriod.objects.create(from_date=period[0], to_date=period[1])
+    ReportSnapshot.objects.create(
+        report_type=ReportSnapshot.ReportType.STAFF_SHIFTS_STATISTICS,
+        from_date=period[0],
+        to_date=period[1],
+        payload=compress_report_payload([]),
+    )
+
+    invalidate_report_snapshots([datetime.date(2025, 3, 10)])
+
+    assert not ReportSnapshot.objects.exists()
@@ -0,0 +1,81 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from economics.services.reports import get_or_compute_report, get_report_cache_key
+
+
+class CountingCompute:
+    def __init__(self, *, delay: float = 0):
+        self.calls_count = 0
+        self.delay = delay
+        self.lock = threading.Lock()
+
+    def __call__(self) -> dict:
+        with self.lock:
+            self.calls_count += 1
+        time.sleep(self.delay)
+        return {"total": 100}
+
+
+def test_report_cache_key_does_not_depend_on_params_order():
+    assert get_report_cache_key(
+        name="report",
+        params={"from_date": "2025-03-01", "to_date": "2025-03-15"},
+    ) == get_report_cache_key(
+        name="report",
+        params={"to_date": "2025-03-15", "from_date": "2025-03-01"},
+    )
+
+
+def test_identical_report_requests_computed_once():
+    compute = CountingCompute()
+
+    for _ in range(3):
+        report = get_or_compute_report(
+            name="report",
+            params={"staff_ids": [1, 2]},
+            compute=compute,
+        )
+
+    assert report == {"total": 100}
+    assert compute.calls_count == 1
+
+
+def test_reports_with_different_params_computed_separately():
+    compute = CountingCompute()
+
+    get_or_compute_report(name="report", params={"staff_ids": [1]}, compute=compute)
+    get_or_compute_report(name="report", params={"staff_ids": [2]}, compute=compute)
+
+    assert compute.calls_count == 2
+
+
+def test_concurrent_identical_report_requests_share_computation(settings):
+    settings.REPORT_LOCK_POLL_INTERVAL = 0.01
+    compute = CountingCompute(delay=0.2)
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        futures = [
+            executor.submit(
+                get_or_compute_report,
+                name="report",
+                params={"staff_ids": None},
+                compute=compute,
+            )
+            for _ in range(5)
+        ]
+        reports = [future.result() for future in futures]
+
+    assert reports == [{"total": 100}] * 5
+    assert compute.calls_count == 1
+
+
+def test_report_coalescing_disabled(settings):
+    settings.REPORT_CACHE_TTL = 0
+    compute = CountingCompute()
+
+    for _ in range(2):
+        get_or_compute_report(name="report", params={}, compute=compute)
+
+    assert compute.calls_count == 2
@@ -0,0 +1,97 @@
+import datetime
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from car_washes.tests.factories import CarWashServiceFactory
+from economics.models import StaffServicePrice
+from economics.services.reports import (
+    get_cars_to_wash_statistics,
+    get_shifts_dry_cleaning_items,
+)
+from economics.services.reports.staff_shifts_statistics import (
+    ShiftDryCleaningItems,
+)
+from shifts.models import CarToWash
+from shifts.tests.factories import (
+    ShiftFactory,
+    TransferredCarAdditionalServiceFactory,
+    TransferredCarFactory,
+)
+
+
+@pytest.fixture
+def staff_service_prices():
+    StaffServicePrice.objects.bulk_create(
+        [
+            StaffServicePrice(service=service, price=115)
+            for service in StaffServicePrice.ServiceType.values
+        ]
+    )
+
+
+@pytest.mark.django_db
+def test_shifts_dry_cleaning_items_counted_without_joining_shifts():
+    date = datetime.date(2025, 3, 10)
+    shift = ShiftFactory(date=date)
+    other_shift = ShiftFactory(date=date)
+    dry_cleaning = CarWashServiceFactory(is_dry_cleaning=True)
+    for car in TransferredCarFactory.create_batch(2, shift=shift):
+        TransferredCarAdditionalServiceFactory(
+            car=car,
+            service=dry_cleaning,
+            count=3,
+        )
+        TransferredCarAdditionalServiceFactory(
+            car=car,
+            service=CarWashServiceFactory(is_dry_cleaning=False),
+        )
+    TransferredCarAdditionalServiceFactory(
+        car=TransferredCarFactory(shift=other_shift),
+        service=dry_cleaning,
+        count=1,
+    )
+
+    with CaptureQueriesContext(connection) as context:
+        items = get_shifts_dry_cleaning_items(
+            from_date=date,
+            to_date=date,
+            staff_ids=[shift.staff_id],
+        )
+
+    assert items == [
+        ShiftDryCleaningItems(
+            staff_id=shift.staff_id,
+            shift_id=shift.id,
+            items_count=6,
+        ),
+    ]
+    assert len(context.captured_queries) == 1
+    assert "shifts_shift" not in context.captured_queries[0]["sql"]
+    assert 'shifts_cartowash"' not in context.captured_queries[0]["sql"]
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("staff_service_prices")
+def test_cars_to_wash_statistics_filter_cars_by_copied_staff():
+    date = datetime.date(2025, 3, 10)
+    shift = ShiftFactory(date=date, is_extra=False)
+    other_shift = ShiftFactory(date=date, is_extra=False)
+    TransferredCarFactory.create_batch(
+        2,
+        shift=shift,
+        car_class=CarToWash.CarType.VAN,
+        wash_type=CarToWash.WashType.PLANNED,
+    )
+    TransferredCarFactory(shift=other_shift)
+
+    shifts_statistics = get_cars_to_wash_statistics(
+        from_date=date,
+        to_date=date,
+        staff_ids=[shift.staff_id],
+    )
+
+    assert len(shifts_statistics) == 1
+    assert shifts_statistics[0].shift_id == shift.id
+    assert shifts_statistics[0].planned_vans_washed_count == 2
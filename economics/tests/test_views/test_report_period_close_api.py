@@ -0,0 +1,197 @@
+import datetime
+import json
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from car_washes.tests.factories import CarWashFactory
+from core import replica as replica_module
+from economics.services.reports import (
+    staff_shifts_statistics as staff_shifts_statistics_module,
+)
+from economics.models import ReportSnapshot, StaffServicePrice
+from shifts.models import CarToWash, Shift
+from shifts.services.cars_to_wash import update_shift_cars
+from shifts.tests.factories import ShiftFactory, TransferredCarFactory
+
+
+@pytest.fixture(autouse=True)
+def disable_report_coalescing(settings):
+    settings.REPORT_CACHE_TTL = 0
+
+
+@pytest.fixture
+def staff_service_prices():
+    StaffServicePrice.objects.bulk_create(
+        [
+            StaffServicePrice(service=service, price=100)
+            for service in StaffServicePrice.ServiceType.values
+        ]
+    )
+
+
+@pytest.fixture
+def car(staff_service_prices):
+    shift = ShiftFactory(date=datetime.date(2025, 3, 10))
+    return TransferredCarFactory(
+        shift=shift,
+        car_wash=CarWashFactory(),
+        car_class=CarToWash.CarType.COMFORT,
+        wash_type=CarToWash.WashType.PLANNED,
+        transfer_price=100,
+    )
+
+
+def read_json(response) -> dict:
+    return json.loads(b"".join(response.streaming_content))
+
+
+def get_staff_report(staff_id: int) -> dict:
+    url = reverse("economics:staff-shifts-statistics")
+    response = APIClient().get(
+        url,
+        data={
+            "from_date": "2025-03-01",
+            "to_date": "2025-03-15",
+            "staff_ids": [staff_id],
+        },
+    )
+    assert response.status_code == status.HTTP_200_OK
+    return read_json(response)["staff_list"][0]
+
+
+def close_period(from_date: str, to_date: str):
+    url = reverse("economics:report-period-close")
+    return APIClient().post(url, data={"from_date": from_date, "to_date": to_date})
+
+
+@pytest.mark.django_db
+def test_invalid_report_period_not_closed():
+    response = close_period("2025-03-01", "2025-03-31")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert not ReportSnapshot.objects.exists()
+
+
+@pytest.mark.django_db
+def test_closed_period_report_served_from_snapshot(car):
+    response = close_period("2025-03-01", "2025-03-15")
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert ReportSnapshot.objects.filter(
+        report_type=ReportSnapshot.ReportType.STAFF_SHIFTS_STATISTICS,
+    ).exists()
+    assert ReportSnapshot.objects.filter(
+        report_type=ReportSnapshot.ReportType.CAR_WASHES_REVENUE,
+        object_id=car.car_wash_id,
+    ).exists()
+
+    report = get_staff_report(car.shift.staff_id)
+    # Updates of querysets bypass invalidation, so the snapshot stays.
+    CarToWash.objects.filter(id=car.id).update(
+        wash_type=CarToWash.WashType.URGENT,
+    )
+
+    assert get_staff_report(car.shift.staff_id) == report
+
+
+@pytest.mark.django_db
+def test_closed_period_snapshot_invalidated_on_late_edit(car):
+    close_period("2025-03-01", "2025-03-15")
+    report = get_staff_report(car.shift.staff_id)
+
+    car.wash_type = CarToWash.WashType.URGENT
+    car.save()
+
+    assert not ReportSnapshot.objects.filter(
+        report_type=ReportSnapshot.ReportType.STAFF_SHIFTS_STATISTICS,
+    ).exists()
+    shifts_statistics = get_staff_report(car.shift.staff_id)["shifts_statistics"]
+    assert report["shifts_statistics"][0]["urgent_cars_washed_count"] == 0
+    assert shifts_statistics[0]["urgent_cars_washed_count"] == 1
+
+
+@pytest.mark.django_db
+def test_closed_period_snapshot_invalidated_when_shift_moved_out(car):
+    close_period("2025-03-01", "2025-03-15")
+    shift = car.shift
+
+    shift.date = datetime.date(2025, 3, 20)
+    shift.save()
+
+    assert not ReportSnapshot.objects.filter(
+        from_date=datetime.date(2025, 3, 1),
+    ).exists()
+
+
+@pytest.mark.django_db
+def test_closed_period_snapshot_invalidated_when_shift_cars_moved_out(car):
+    close_period("2025-03-01", "2025-03-15")
+    shift = car.shift
+    Shift.objects.filter(id=shift.id).update(date=datetime.date(2025, 3, 20))
+    shift.refresh_from_db()
+
+    update_shift_cars(shift)
+
+    assert not ReportSnapshot.objects.filter(
+        from_date=datetime.date(2025, 3, 1),
+    ).exists()
+
+
+@pytest.mark.django_db
+def test_car_washes_revenue_merged_from_snapshots(staff_service_prices):
+    shift = ShiftFactory(date=datetime.date(2025, 3, 20))
+    cars = [
+        TransferredCarFactory(
+            shift=shift,
+            car_wash=CarWashFactory(),
+            car_class=CarToWash.CarType.COMFORT,
+        )
+        for _ in range(2)
+    ]
+    url = reverse("economics:service-costs")
+    params = {
+        "from_date": "2025-03-16",
+        "to_date": "2025-03-31",
+        "car_wash_ids": [car.car_wash_id for car in cars],
+    }
+    live_report = read_json(APIClient().get(url, data=params))
+
+    close_period("2025-03-16", "2025-03-31")
+    snapshot_report = read_json(APIClient().get(url, data=params))
+
+    snapshots = ReportSnapshot.objects.filter(
+        report_type=ReportSnapshot.ReportType.CAR_WASHES_REVENUE,
+    )
+    assert snapshots.count() == 2
+    assert snapshot_report == live_report
+    assert snapshot_report["car_washes_revenue"][0]["comfort_cars_washed_count"] == 2
+
+
+@pytest.mark.django_db
+def test_snapshots_computed_from_primary(car, monkeypatch):
+    replica_reads: list[bool] = []
+    monkeypatch.setattr(
+        replica_module,
+        "is_replica_available",
+        lambda: True,
+    )
+    original_get_cars_to_wash_statistics = (
+        staff_shifts_statistics_module.get_cars_to_wash_statistics
+    )
+
+    def get_cars_to_wash_statistics(**kwargs):
+        replica_reads.append(replica_module.read_from_replica.get())
+        return original_get_cars_to_wash_statistics(**kwargs)
+
+    monkeypatch.setattr(
+        staff_shifts_statistics_module,
+        "get_cars_to_wash_statistics",
+        get_cars_to_wash_statistics,
+    )
+
+    close_period("2025-03-01", "2025-03-15")
+
+    assert replica_reads == [False]
@@ -0,0 +1,112 @@
+import datetime
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from car_washes.tests.factories import CarWashFactory
+from economics.models import Penalty, StaffServicePrice, Surcharge
+from economics.serializers import (
+    CarWashesRevenueReportOutputSerializer,
+    StaffShiftsStatisticsReportOutputSerializer,
+)
+from economics.services.reports import get_car_washes_sales_report
+from economics.services.reports.staff_shifts_statistics import (
+    get_staff_shifts_statistics,
+)
+from shifts.models import CarToWash
+from shifts.tests.factories import ShiftFactory, TransferredCarFactory
+
+
+@pytest.fixture(autouse=True)
+def disable_report_coalescing(settings):
+    settings.REPORT_CACHE_TTL = 0
+
+
+@pytest.fixture
+def cars():
+    StaffServicePrice.objects.bulk_create(
+        [
+            StaffServicePrice(service=service, price=115)
+            for service in StaffServicePrice.ServiceType.values
+        ]
+    )
+    car_wash = CarWashFactory()
+    shifts = [
+        ShiftFactory(date=datetime.date(2025, 3, day), staff__full_name="Иванов")
+        for day in (10, 11)
+    ]
+    Penalty.objects.create(shift=shifts[0], reason="Опоздание", amount=50)
+    Surcharge.objects.create(shift=shifts[1], reason="Доплата", amount=30)
+    return [
+        TransferredCarFactory(
+            shift=shift,
+            car_wash=car_wash,
+            car_class=car_class,
+            wash_type=CarToWash.WashType.PLANNED,
+            transfer_price=100,
+        )
+        for shift in shifts
+        for car_class in (CarToWash.CarType.COMFORT, CarToWash.CarType.BUSINESS)
+    ]
+
+
+def read_content(response) -> bytes:
+    assert response.status_code == status.HTTP_200_OK
+    assert response.streaming
+    assert response["Content-Type"] == "application/json"
+    return b"".join(response.streaming_content)
+
+
+@pytest.mark.django_db
+def test_staff_shifts_statistics_streamed_as_serializer_output(cars):
+    from_date = datetime.date(2025, 3, 1)
+    to_date = datetime.date(2025, 3, 15)
+    staff_ids = sorted({car.shift.staff_id for car in cars})
+
+    response = APIClient().get(
+        reverse("economics:staff-shifts-statistics"),
+        data={
+            "from_date": from_date.isoformat(),
+            "to_date": to_date.isoformat(),
+            "staff_ids": staff_ids,
+        },
+    )
+
+    staff_list = get_staff_shifts_statistics(
+        from_date=from_date,
+        to_date=to_date,
+        staff_ids=staff_ids,
+    )
+    serializer = StaffShiftsStatisticsReportOutputSerializer(
+        {"staff_list": staff_list},
+    )
+    assert read_content(response) == JSONRenderer().render(serializer.data)
+
+
+@pytest.mark.django_db
+def test_car_washes_revenue_streamed_as_serializer_output(cars):
+    from_date = datetime.date(2025, 3, 1)
+    to_date = datetime.date(2025, 3, 15)
+    car_wash_id = cars[0].car_wash_id
+
+    response = APIClient().get(
+        reverse("economics:service-costs"),
+        data={
+            "from_date": from_date.isoformat(),
+            "to_date": to_date.isoformat(),
+            "car_wash_ids": [car_wash_id],
+        },
+    )
+
+    report = get_car_washes_sales_report(
+        car_wash_ids=[car_wash_id],
+        from_date=from_date,
+        to_date=to_date,
+    )
+    serializer = CarWashesRevenueReportOutputSerializer(
+        {"car_washes_revenue": report},
+    )
+    assert read_content(response) == JSONRenderer().render(serializer.data)
@@ -11,6 +11,7 @@ from economics.views import (
     CarWashPenaltyDeleteApi,
     CarTransporterPenaltyDeleteApi,
     CarTransporterSurchargeDeleteApi,
+    ReportPeriodCloseApi,
 )
 
 
@@ -25,6 +26,11 @@ reports_urlpatterns = [
         StaffShiftsStatisticsReportApi.as_view(),
         name="staff-shifts-statistics",
     ),
+    path(
+        r"periods/close/",
+        ReportPeriodCloseApi.as_view(),
+        name="report-period-close",
+    ),
 ]
 
 app_name = "economics"
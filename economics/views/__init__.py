@@ -8,7 +8,11 @@ from .penalties import (
     CarTransporterPenaltyDeleteApi,
     PenaltyListCreateApi,
 )
-from .reports import ServiceCostsApi, StaffShiftsStatisticsReportApi
+from .reports import (
+    ReportPeriodCloseApi,
+    ServiceCostsApi,
+    StaffShiftsStatisticsReportApi,
+)
 from .surcharges import (
     CarTransporterSurchargeDeleteApi,
     SurchargeCreateApi,
@@ -25,4 +29,5 @@ __all__ = (
     "SurchargeCreateApi",
     "ServiceCostsApi",
     "StaffShiftsStatisticsReportApi",
+    "ReportPeriodCloseApi",
 )
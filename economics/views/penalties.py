@@ -3,12 +3,13 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from core.encoders import encode_dataclass
+from core.idempotency import idempotent
 from economics.selectors import get_penalties_page
 from economics.serializers import (
     PenaltyCreateInputSerializer,
     PenaltyCreateOutputSerializer,
     PenaltyListInputSerializer,
-    PenaltyListOutputSerializer,
 )
 from economics.services.penalties import (
     CarTransporterPenaltyDeleteInteractor,
@@ -36,9 +37,9 @@ class PenaltyListCreateApi(APIView):
             offset=offset,
         )
 
-        serializer = PenaltyListOutputSerializer(penalties_page)
-        return Response(serializer.data)
+        return Response(encode_dataclass(penalties_page))
 
+    @idempotent("penalty-create")
     def post(self, request: Request) -> Response:
         serializer = PenaltyCreateInputSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
@@ -1,5 +1,6 @@
 from .car_washes_revenue import ServiceCostsApi
+from .report_periods import ReportPeriodCloseApi
 from .staff_shifts_statistics import StaffShiftsStatisticsReportApi
 
 
-__all__ = ("StaffShiftsStatisticsReportApi", "ServiceCostsApi")
+__all__ = ("StaffShiftsStatisticsReportApi", "ServiceCostsApi", "ReportPeriodCloseApi")
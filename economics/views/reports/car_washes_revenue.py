@@ -1,34 +1,74 @@
 import datetime
+from collections.abc import Iterable
 
 from rest_framework.request import Request
-from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from core.streaming import StreamingJsonResponse
 from economics.serializers import (
-    CarWashesRevenueReportOutputSerializer,
     CarWashesRevenueReportInputSerializer,
+    serialize_car_wash_revenue,
 )
-from economics.services.reports import get_car_washes_sales_report
+from economics.services.reports import (
+    get_car_washes_revenue_snapshot,
+    get_car_washes_sales_report,
+    get_or_compute_report,
+    is_report_period_closed,
+)
+
+__all__ = ("ServiceCostsApi", "compute_car_washes_revenue_report")
+
 
-__all__ = ("ServiceCostsApi",)
+def compute_car_washes_revenue_report(
+    *,
+    from_date: datetime.date,
+    to_date: datetime.date,
+    car_wash_ids: Iterable[int],
+) -> list[dict]:
+    report = get_car_washes_sales_report(
+        car_wash_ids=car_wash_ids,
+        from_date=from_date,
+        to_date=to_date,
+    )
+    return [serialize_car_wash_revenue(row) for row in report]
 
 
 class ServiceCostsApi(APIView):
-    def get(self, request: Request) -> Response:
+    def get(self, request: Request) -> StreamingJsonResponse:
         serializer = CarWashesRevenueReportInputSerializer(data=request.query_params)
         serializer.is_valid(raise_exception=True)
-        serialized_data: dict = serializer.data
+        serialized_data: dict = serializer.validated_data
 
         from_date: datetime.date = serialized_data["from_date"]
         to_date: datetime.date = serialized_data["to_date"]
         car_wash_ids: list[int] = serialized_data["car_wash_ids"]
 
-        report = get_car_washes_sales_report(
-            car_wash_ids=car_wash_ids,
-            from_date=from_date,
-            to_date=to_date,
-        )
-        response_data = {"car_washes_revenue": report}
-        serializer = CarWashesRevenueReportOutputSerializer(response_data)
+        def compute_report() -> dict:
+            if is_report_period_closed(from_date=from_date, to_date=to_date):
+                car_washes_revenue = get_car_washes_revenue_snapshot(
+                    from_date=from_date,
+                    to_date=to_date,
+                    car_wash_ids=car_wash_ids,
+                    compute=lambda car_wash_id: compute_car_washes_revenue_report(
+                        from_date=from_date,
+                        to_date=to_date,
+                        car_wash_ids=[car_wash_id],
+                    ),
+                )
+            else:
+                car_washes_revenue = compute_car_washes_revenue_report(
+                    from_date=from_date,
+                    to_date=to_date,
+                    car_wash_ids=car_wash_ids,
+                )
+            return {"car_washes_revenue": car_washes_revenue}
 
-        return Response(serializer.data)
+        report = get_or_compute_report(
+            name="car-washes-revenue",
+            params=serialized_data,
+            compute=compute_report,
+        )
+        return StreamingJsonResponse(
+            key="car_washes_revenue",
+            items=report["car_washes_revenue"],
+        )
@@ -0,0 +1,65 @@
+import datetime
+
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from car_washes.selectors import get_car_washes
+from economics.serializers import (
+    ReportPeriodCloseInputSerializer,
+    ReportPeriodCloseOutputSerializer,
+)
+from economics.services.reports import (
+    ReportPeriodCloseInteractor,
+    get_car_washes_revenue_snapshot,
+    get_staff_shifts_statistics_snapshot,
+)
+from economics.views.reports.car_washes_revenue import (
+    compute_car_washes_revenue_report,
+)
+from economics.views.reports.staff_shifts_statistics import (
+    compute_staff_shifts_statistics_report,
+)
+
+__all__ = ("ReportPeriodCloseApi",)
+
+
+class ReportPeriodCloseApi(APIView):
+    def post(self, request: Request) -> Response:
+        serializer = ReportPeriodCloseInputSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        serialized_data: dict = serializer.validated_data
+
+        from_date: datetime.date = serialized_data["from_date"]
+        to_date: datetime.date = serialized_data["to_date"]
+
+        closed_period = ReportPeriodCloseInteractor(
+            from_date=from_date,
+            to_date=to_date,
+        ).execute()
+
+        # Snapshots are taken right away, so the first read after
+        # closing the period does not compute reports.
+        get_staff_shifts_statistics_snapshot(
+            from_date=from_date,
+            to_date=to_date,
+            staff_ids=None,
+            compute=lambda: compute_staff_shifts_statistics_report(
+                from_date=from_date,
+                to_date=to_date,
+            ),
+        )
+        get_car_washes_revenue_snapshot(
+            from_date=from_date,
+            to_date=to_date,
+            car_wash_ids=get_car_washes().values_list("id", flat=True),
+            compute=lambda car_wash_id: compute_car_washes_revenue_report(
+                from_date=from_date,
+                to_date=to_date,
+                car_wash_ids=[car_wash_id],
+            ),
+        )
+
+        serializer = ReportPeriodCloseOutputSerializer(closed_period)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
@@ -1,22 +1,53 @@
 import datetime
+from collections.abc import Iterable
 
 from rest_framework.request import Request
-from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from core.streaming import StreamingJsonResponse
 from economics.serializers import (
     StaffShiftsStatisticsReportInputSerializer,
-    StaffShiftsStatisticsReportOutputSerializer,
+    serialize_staff_shifts_statistics,
+)
+from economics.services.reports import (
+    get_or_compute_report,
+    get_staff_shifts_statistics_snapshot,
+    is_report_period_closed,
 )
 from economics.services.reports.staff_shifts_statistics import (
+    StaffShiftsStatistics,
     get_staff_shifts_statistics,
 )
 
-__all__ = ("StaffShiftsStatisticsReportApi",)
+__all__ = (
+    "StaffShiftsStatisticsReportApi",
+    "compute_staff_shifts_statistics_report",
+)
+
+
+def compute_staff_shifts_statistics_report(
+    *,
+    from_date: datetime.date,
+    to_date: datetime.date,
+    staff_ids: Iterable[int] | None = None,
+) -> list[dict]:
+    staff_shifts_statistics = get_staff_shifts_statistics(
+        from_date=from_date,
+        to_date=to_date,
+        staff_ids=staff_ids,
+    )
+    return [serialize_staff_shifts_statistics(item) for item in staff_shifts_statistics]
+
+
+def serialize_staff_list_item(item: StaffShiftsStatistics | dict) -> dict:
+    # Items of closed periods come from snapshots serialized already.
+    if isinstance(item, dict):
+        return item
+    return serialize_staff_shifts_statistics(item)
 
 
 class StaffShiftsStatisticsReportApi(APIView):
-    def get(self, request: Request) -> Response:
+    def get(self, request: Request) -> StreamingJsonResponse:
         serializer = StaffShiftsStatisticsReportInputSerializer(
             data=request.query_params
         )
@@ -27,11 +58,34 @@ class StaffShiftsStatisticsReportApi(APIView):
         to_date: datetime.date = serialized_data["to_date"]
         staff_ids: list[int] | None = serialized_data["staff_ids"]
 
-        staff_shifts_statistics = get_staff_shifts_statistics(
-            from_date=from_date,
-            to_date=to_date,
-            staff_ids=staff_ids,
+        def compute_report() -> dict:
+            if is_report_period_closed(from_date=from_date, to_date=to_date):
+                staff_list = get_staff_shifts_statistics_snapshot(
+                    from_date=from_date,
+                    to_date=to_date,
+                    staff_ids=staff_ids,
+                    compute=lambda: compute_staff_shifts_statistics_report(
+                        from_date=from_date,
+                        to_date=to_date,
+                    ),
+                )
+            else:
+                # Statistics are serialized per staff member while the
+                # response is sent.
+                staff_list = get_staff_shifts_statistics(
+                    from_date=from_date,
+                    to_date=to_date,
+                    staff_ids=staff_ids,
+                )
+            return {"staff_list": staff_list}
+
+        report = get_or_compute_report(
+            name="staff-shifts-statistics",
+            params=serialized_data,
+            compute=compute_report,
+        )
+        return StreamingJsonResponse(
+            key="staff_list",
+            items=report["staff_list"],
+            serialize=serialize_staff_list_item,
         )
-        response_data = {"staff_list": staff_shifts_statistics}
-        serializer = StaffShiftsStatisticsReportOutputSerializer(response_data)
-        return Response(serializer.data)
@@ -3,12 +3,12 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from core.encoders import encode_dataclass
 from economics.selectors import get_surcharges_page
 from economics.serializers import (
     SurchargeCreateInputSerializer,
     SurchargeCreateOutputSerializer,
     SurchargeListInputSerializer,
-    SurchargeListOutputSerializer,
 )
 from economics.services.penalties import (
     CarTransporterSurchargeDeleteInteractor,
@@ -36,8 +36,7 @@ class SurchargeCreateApi(APIView):
             offset=offset,
         )
 
-        serializer = SurchargeListOutputSerializer(surcharges_page)
-        return Response(serializer.data)
+        return Response(encode_dataclass(surcharges_page))
 
     def post(self, request: Request) -> Response:
         serializer = SurchargeCreateInputSerializer(data=request.data)
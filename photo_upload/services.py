@@ -3,18 +3,37 @@ import io
 from collections.abc import Iterable
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import BinaryIO
+from typing import TYPE_CHECKING, BinaryIO
 from uuid import uuid4
 
-import httpx
 from django.conf import settings
 from django.core.files.uploadedfile import InMemoryUploadedFile
-from minio import Minio
 
+from core.metrics import metrics_registry
 from photo_upload.exceptions import PhotoNotUploadedError
 
 
-def get_s3_client() -> Minio:
+# minio and httpx are slow to import and needed only when photos are
+# uploaded, so they are imported on first use.
+if TYPE_CHECKING:
+    from minio import Minio
+
+
+S3_REQUEST_DURATION = metrics_registry.histogram(
+    "s3_request_duration_seconds",
+    "Duration of S3 storage requests.",
+    labelnames=("operation", "outcome"),
+)
+PHOTO_DOWNLOAD_DURATION = metrics_registry.histogram(
+    "photo_download_duration_seconds",
+    "Duration of downloading photos by URL before uploading them to S3.",
+    labelnames=("outcome",),
+)
+
+
+def get_s3_client() -> "Minio":
+    from minio import Minio
+
     return Minio(
         endpoint=settings.S3_ENDPOINT,
         access_key=settings.S3_ACCESS_KEY,
@@ -33,17 +52,18 @@ def upload_binary(
     length: int,
     content_type: str,
     object_name: str,
-    client: Minio,
+    client: "Minio",
 ) -> UploadedFile:
     file_io.seek(0)
     try:
-        result = client.put_object(
-            bucket_name=settings.S3_BUCKET_NAME,
-            object_name=object_name,
-            data=file_io,
-            length=length,
-            content_type=content_type,
-        )
+        with S3_REQUEST_DURATION.time(operation="put_object"):
+            result = client.put_object(
+                bucket_name=settings.S3_BUCKET_NAME,
+                object_name=object_name,
+                data=file_io,
+                length=length,
+                content_type=content_type,
+            )
     except Exception as error:
         raise PhotoNotUploadedError from error
     return UploadedFile(
@@ -77,12 +97,15 @@ def build_object_name(name: str, folder: str | None = None) -> str:
 def upload_via_url(
     url: str,
     folder: str | None = None,
-    client: Minio | None = None,
+    client: "Minio | None" = None,
 ) -> UploadedFile:
+    import httpx
+
     if client is None:
         client = get_s3_client()
-    response = httpx.get(url)
-    response.raise_for_status()
+    with PHOTO_DOWNLOAD_DURATION.time():
+        response = httpx.get(url)
+        response.raise_for_status()
     object_name = build_object_name(url, folder)
     with io.BytesIO(response.content) as file_io:
         return upload_binary(
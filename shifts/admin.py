@@ -5,6 +5,7 @@ from import_export import resources, fields
 from import_export.admin import ExportActionModelAdmin, ImportExportModelAdmin
 from rangefilter.filters import DateTimeRangeFilterBuilder
 
+from core.admin import StreamingExportMixin
 from core.services import get_current_shift_date
 from shifts.exceptions import StaffHasActiveShiftError
 from shifts.models import (
@@ -14,6 +15,8 @@ from shifts.models import (
     Shift,
     ShiftFinishPhoto,
 )
+from shifts.selectors import invalidate_staff_active_shift
+from shifts.services.cars_to_wash import update_shift_cars
 from shifts.services.shifts.validators import ensure_staff_has_no_active_shift
 
 
@@ -31,8 +34,8 @@ class CurrentShiftFilter(admin.SimpleListFilter):
 
 
 class CarToWashAdditionalServiceResource(resources.ModelResource):
-    staff = fields.Field("car__shift__staff__full_name", column_name=_("staff"))
-    shift_date = fields.Field("car__shift__date", column_name=_("shift date"))
+    staff = fields.Field("staff__full_name", column_name=_("staff"))
+    shift_date = fields.Field("shift_date", column_name=_("shift date"))
     service_name = fields.Field("service__name", column_name=_("car wash service name"))
     car_number = fields.Field("car__number", column_name=_("car number"))
 
@@ -61,11 +64,11 @@ class CarToWashResource(resources.ModelResource):
         column_name=_("car wash"),
     )
     shift_date = resources.Field(
-        attribute="shift__date",
+        attribute="shift_date",
         column_name=_("shift date"),
     )
     staff = resources.Field(
-        attribute="shift__staff__full_name",
+        attribute="staff__full_name",
         column_name=_("staff"),
     )
     number = resources.Field(attribute="number", column_name=_("car number"))
@@ -184,8 +187,9 @@ class IsFinishedFilter(admin.SimpleListFilter):
 
 
 @admin.register(Shift)
-class ShiftAdmin(ImportExportModelAdmin):
+class ShiftAdmin(StreamingExportMixin, ImportExportModelAdmin):
     resource_class = ShiftResource
+    export_select_related = ("staff", "car_wash")
     readonly_fields = ("id",)
     list_display = (
         "staff",
@@ -221,11 +225,33 @@ class ShiftAdmin(ImportExportModelAdmin):
                 messages.error(request, gettext("staff has active shift"))
                 return
         super().save_model(request, obj, form, change)
+        if change:
+            # Cached active shift of the old and the new staff is stale.
+            invalidate_staff_active_shift(obj.staff_id)
+            if "staff" in form.changed_data:
+                invalidate_staff_active_shift(form.initial["staff"])
+        if change and {"date", "staff"} & set(form.changed_data):
+            update_shift_cars(obj)
+
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        invalidate_staff_active_shift(obj.staff_id)
+
+    def delete_queryset(self, request, queryset):
+        staff_ids = set(queryset.values_list("staff_id", flat=True))
+        super().delete_queryset(request, queryset)
+        for staff_id in staff_ids:
+            invalidate_staff_active_shift(staff_id)
 
 
 @admin.register(CarToWash)
-class CarToWashAdmin(ExportActionModelAdmin, ImportExportModelAdmin):
+class CarToWashAdmin(
+    StreamingExportMixin,
+    ExportActionModelAdmin,
+    ImportExportModelAdmin,
+):
     resource_class = CarToWashResource
+    export_select_related = ("shift__car_wash", "staff")
     readonly_fields = ("id",)
     inlines = (CarToWashAdditionalServiceInline,)
     list_display = (
@@ -247,7 +273,7 @@ class CarToWashAdmin(ExportActionModelAdmin, ImportExportModelAdmin):
         "car_wash",
         "wash_type",
         (
-            "shift__date",
+            "shift_date",
             DateTimeRangeFilterBuilder(
                 title=_("shift date"),
             ),
@@ -262,17 +288,27 @@ class CarToWashAdmin(ExportActionModelAdmin, ImportExportModelAdmin):
     list_select_related = ("shift", "car_wash")
     list_per_page = 100
 
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        if change and "shift" in form.changed_data:
+            obj.additional_services.update(
+                shift_date=obj.shift_date,
+                shift_id=obj.shift_id,
+                staff_id=obj.staff_id,
+            )
+
 
 @admin.register(CarToWashAdditionalService)
-class CarToWashAdditionalServiceAdmin(ImportExportModelAdmin):
+class CarToWashAdditionalServiceAdmin(StreamingExportMixin, ImportExportModelAdmin):
     resource_class = CarToWashAdditionalServiceResource
+    export_select_related = ("car", "shift", "staff", "service")
     list_display = ("staff", "shift_date", "car", "service", "count")
-    list_select_related = ("car", "service", "car__shift", "car__shift__staff")
+    list_select_related = ("car", "service", "staff")
     list_filter = (
         "service__is_countable",
         "service__is_dry_cleaning",
         (
-            "car__shift__date",
+            "shift_date",
             DateTimeRangeFilterBuilder(
                 title=_("shift date"),
             ),
@@ -283,17 +319,9 @@ class CarToWashAdditionalServiceAdmin(ImportExportModelAdmin):
         "car",
         "service",
     )
-    search_fields = ("car__shift__id__iexact", "car__number", "service__name")
+    search_fields = ("shift__id__iexact", "car__number", "service__name")
     search_help_text = _("search by shift ID, car number, service name")
 
-    @admin.display(description=_("staff"))
-    def staff(self, obj: CarToWashAdditionalService):
-        return obj.car.shift.staff.full_name
-
-    @admin.display(description=_("shift date"))
-    def shift_date(self, obj: CarToWashAdditionalService):
-        return obj.car.shift.date
-
 
 @admin.register(ShiftFinishPhoto)
 class ShiftFinishPhotoAdmin(ImportExportModelAdmin):
@@ -0,0 +1,95 @@
+import datetime
+from pathlib import Path
+
+from django.core.management import BaseCommand, CommandError
+
+from core.services import get_current_shift_date
+from economics.services.reports import is_report_period_closed
+from shifts.services.partitions import (
+    MonthPartition,
+    archive_month_partition,
+    get_month_partitions,
+    get_month_start,
+    get_partitioned_table_names,
+)
+
+
+def is_month_closed(month: datetime.date) -> bool:
+    """Both report periods of the month are closed, reports use snapshots."""
+    last_day = get_month_start(month, 1) - datetime.timedelta(days=1)
+    return is_report_period_closed(
+        from_date=month,
+        to_date=month.replace(day=15),
+    ) and is_report_period_closed(
+        from_date=month.replace(day=16),
+        to_date=last_day,
+    )
+
+
+class Command(BaseCommand):
+    help = (
+        "Detach monthly partitions of cars to wash and their additional"
+        " services older than the given number of months, optionally"
+        " dumping them to gzipped CSV files and dropping them"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--older-than-months",
+            type=int,
+            required=True,
+            help="Partitions ending before this many months ago are archived",
+        )
+        parser.add_argument(
+            "--dump-dir",
+            type=Path,
+            default=None,
+            help="Dump partitions to this directory and drop them",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Archive months whose report periods are not closed",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only print partitions that would be archived",
+        )
+
+    def handle(self, *args, **options):
+        older_than_months: int = options["older_than_months"]
+        dump_dir: Path | None = options["dump_dir"]
+        if older_than_months < 1:
+            raise CommandError("--older-than-months must be at least 1")
+        if dump_dir is not None and not dump_dir.is_dir():
+            raise CommandError(f"{dump_dir} is not a directory")
+
+        before_date = get_month_start(get_current_shift_date(), -older_than_months)
+        partitions: list[MonthPartition] = [
+            partition
+            for table_name in get_partitioned_table_names()
+            for partition in get_month_partitions(table_name)
+            if partition.to_date <= before_date
+        ]
+
+        for partition in partitions:
+            if not options["force"] and not is_month_closed(partition.from_date):
+                self.stderr.write(
+                    self.style.WARNING(
+                        f"Skipped {partition.name}:"
+                        f" report periods of the month are not closed"
+                    )
+                )
+                continue
+            if options["dry_run"]:
+                self.stdout.write(f"Would archive {partition.name}")
+                continue
+
+            file_path = archive_month_partition(partition, dump_dir=dump_dir)
+            if file_path is None:
+                self.stdout.write(self.style.SUCCESS(f"Detached {partition.name}"))
+            else:
+                self.stdout.write(
+                    self.style.SUCCESS(f"Dumped {partition.name} to {file_path}")
+                )
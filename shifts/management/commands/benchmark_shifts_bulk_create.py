@@ -0,0 +1,73 @@
+import datetime
+import time
+
+from django.core.management import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Max
+from django.test.utils import CaptureQueriesContext
+
+from shifts.models import Shift
+from shifts.services.shifts.create.bulk import ShiftBulkCreateInteractor
+from staff.models import Staff
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure bulk creation of extra shifts for many staff members and"
+        " days. Created staff and shifts are rolled back"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--staff",
+            type=int,
+            default=500,
+            help="Number of staff members to create shifts for",
+        )
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=30,
+            help="Number of days to create shifts on",
+        )
+
+    def handle(self, *args, **options):
+        staff_count: int = options["staff"]
+        days: int = options["days"]
+        first_date = datetime.date(2025, 1, 1)
+        dates = [first_date + datetime.timedelta(days=i) for i in range(days)]
+
+        with transaction.atomic():
+            first_staff_id = (Staff.objects.aggregate(Max("id"))["id__max"] or 0) + 1
+            staff_ids = range(first_staff_id, first_staff_id + staff_count)
+            Staff.objects.bulk_create(
+                [
+                    Staff(
+                        id=staff_id,
+                        full_name=f"Staff {staff_id}",
+                        car_sharing_phone_number="+79000000000",
+                        console_phone_number="+79000000000",
+                    )
+                    for staff_id in staff_ids
+                ]
+            )
+            shifts = [
+                {"staff_id": staff_id, "date": date}
+                for staff_id in staff_ids
+                for date in dates
+            ]
+
+            started_at = time.perf_counter()
+            with CaptureQueriesContext(connection) as context:
+                result = ShiftBulkCreateInteractor(
+                    shifts=shifts,
+                    shift_type=Shift.Type.EXTRA,
+                ).execute()
+            duration = time.perf_counter() - started_at
+            transaction.set_rollback(True)
+
+        self.stdout.write(
+            f"{staff_count} staff x {days} days:"
+            f" {len(result.created_shifts)} shifts created,"
+            f" {len(context.captured_queries)} queries, {duration:.3f}s"
+        )
@@ -0,0 +1,35 @@
+from django.conf import settings
+from django.core.management import BaseCommand
+
+from core.services import get_current_shift_date
+from shifts.services.partitions import create_month_partitions
+
+
+class Command(BaseCommand):
+    help = (
+        "Create monthly partitions of cars to wash and their additional"
+        " services for the current and next months"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--months-ahead",
+            type=int,
+            default=settings.CAR_PARTITIONS_MONTHS_AHEAD,
+            help="Number of months after the current one",
+        )
+
+    def handle(self, *args, **options):
+        partitions = create_month_partitions(
+            today=get_current_shift_date(),
+            months_ahead=options["months_ahead"],
+        )
+        for partition in partitions:
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Created {partition.name}"
+                    f" from {partition.from_date} to {partition.to_date}"
+                )
+            )
+        if not partitions:
+            self.stdout.write("All partitions exist")
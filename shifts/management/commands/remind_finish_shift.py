@@ -1,25 +1,18 @@
-import time
-
 from django.core.management import BaseCommand
 
-from shifts.selectors import get_staff_ids_with_active_shift
-from telegram.services import get_telegram_bot, try_send_message
+from shifts.services import send_finish_shift_reminders
+from telegram.services import get_telegram_bot
 
 
 class Command(BaseCommand):
     help = "Send notification to all staff who have not finished their shifts " "yet"
 
+    requires_system_checks = []
+
     def handle(self, *args, **options):
-        bot = get_telegram_bot()
-        staff_ids = get_staff_ids_with_active_shift()
+        staff_id_to_is_sent = send_finish_shift_reminders(get_telegram_bot())
 
-        text = "❗️ Не забудьте завершить смену"
-        for staff_id in staff_ids:
-            is_sent = try_send_message(
-                bot=bot,
-                chat_id=staff_id,
-                text=text,
-            )
+        for staff_id, is_sent in staff_id_to_is_sent.items():
             if is_sent:
                 self.stdout.write(
                     self.style.SUCCESS(
@@ -32,4 +25,3 @@ class Command(BaseCommand):
                         f"Message has not been sent to staff {staff_id}",
                     )
                 )
-            time.sleep(0.1)
@@ -1,11 +1,7 @@
-import time
-
 from django.core.management import BaseCommand
 
-from shifts.services.shifts import (
-    get_staff_ids_with_not_started_shifts_for_today,
-)
-from telegram.services import get_telegram_bot, try_send_message
+from shifts.services import send_start_shift_reminders
+from telegram.services import get_telegram_bot
 
 
 class Command(BaseCommand):
@@ -14,18 +10,14 @@ class Command(BaseCommand):
         " have not rejected their shifts yet"
     )
 
-    def handle(self, *args, **options):
-        bot = get_telegram_bot()
+    # Runs on schedule, checks are run on deploy. Skipping them also
+    # keeps URLconf and admin modules from being imported on every run.
+    requires_system_checks = []
 
-        staff_ids = get_staff_ids_with_not_started_shifts_for_today()
+    def handle(self, *args, **options):
+        staff_id_to_is_sent = send_start_shift_reminders(get_telegram_bot())
 
-        text = "❗ Не забудьте начать смену на сегодня"
-        for staff_id in staff_ids:
-            is_sent = try_send_message(
-                bot=bot,
-                chat_id=staff_id,
-                text=text,
-            )
+        for staff_id, is_sent in staff_id_to_is_sent.items():
             if is_sent:
                 self.stdout.write(
                     self.style.SUCCESS(
@@ -38,4 +30,3 @@ class Command(BaseCommand):
                         f"Message has not been sent to staff {staff_id}",
                     )
                 )
-            time.sleep(0.1)
@@ -0,0 +1,114 @@
+import datetime
+import functools
+import signal
+import threading
+
+from django.conf import settings
+from django.core.management import BaseCommand
+
+from core.scheduler import JobStats, ScheduledJob, Scheduler, get_job_stats
+from core.services import get_current_shift_date
+from shifts.services import (
+    send_finish_shift_reminders,
+    send_shift_finish_reports,
+    send_start_shift_reminders,
+)
+from shifts.services.partitions import create_month_partitions
+from telegram.services import get_telegram_bot
+
+
+def get_scheduled_jobs() -> list[ScheduledJob]:
+    # Single bot reuses its HTTP session between runs.
+    bot = get_telegram_bot()
+    jobs = [
+        ScheduledJob(
+            name="remind_start_shift",
+            time=settings.START_SHIFT_REMINDER_TIME,
+            run=functools.partial(send_start_shift_reminders, bot),
+        ),
+        ScheduledJob(
+            name="remind_finish_shift",
+            time=settings.FINISH_SHIFT_REMINDER_TIME,
+            run=functools.partial(send_finish_shift_reminders, bot),
+        ),
+        ScheduledJob(
+            name="create_car_partitions",
+            time=settings.CAR_PARTITIONS_CREATE_TIME,
+            run=lambda: create_month_partitions(
+                today=get_current_shift_date(),
+                months_ahead=settings.CAR_PARTITIONS_MONTHS_AHEAD,
+            ),
+        ),
+    ]
+    if settings.SHIFT_FINISH_REPORT_CHAT_ID is not None:
+        jobs.append(
+            ScheduledJob(
+                name="send_shift_finish_reports",
+                time=settings.SHIFT_FINISH_REPORT_TIME,
+                run=functools.partial(
+                    send_shift_finish_reports,
+                    bot=bot,
+                    chat_id=settings.SHIFT_FINISH_REPORT_CHAT_ID,
+                ),
+            )
+        )
+    return jobs
+
+
+class Command(BaseCommand):
+    help = (
+        "Run periodic shift jobs (reminders, finish reports, partitions of"
+        " cars to wash) in a single long-lived process"
+    )
+
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--status",
+            action="store_true",
+            help="Print last run duration and last success time of jobs",
+        )
+
+    def write_job_stats(self, stats: JobStats) -> None:
+        last_duration = (
+            "-" if stats.last_duration is None else f"{stats.last_duration:.3f}s"
+        )
+        text = (
+            f"{stats.name}: shift date {stats.shift_date},"
+            f" last duration {last_duration},"
+            f" last success at {stats.last_success_at},"
+            f" runs {stats.run_count}, failures {stats.failure_count}"
+        )
+        if stats.last_error is None:
+            self.stdout.write(self.style.SUCCESS(text))
+        else:
+            self.stderr.write(self.style.ERROR(f"{text}, error {stats.last_error}"))
+
+    def handle(self, *args, **options):
+        jobs = get_scheduled_jobs()
+
+        if options["status"]:
+            for stats in get_job_stats(job.name for job in jobs).values():
+                self.write_job_stats(stats)
+            return
+
+        scheduler = Scheduler(
+            jobs,
+            misfire_grace_time=datetime.timedelta(
+                seconds=settings.SCHEDULER_MISFIRE_GRACE_TIME,
+            ),
+        )
+
+        stop_event = threading.Event()
+        for signal_number in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signal_number, lambda *_: stop_event.set())
+
+        self.stdout.write(
+            f"Scheduler started with jobs: {', '.join(job.name for job in jobs)}"
+        )
+        while not stop_event.is_set():
+            for stats in scheduler.run_pending():
+                self.write_job_stats(stats)
+            stop_event.wait(settings.SCHEDULER_TICK_INTERVAL)
+        self.stdout.write("Scheduler stopped")
@@ -0,0 +1,81 @@
+# Generated by Django 5.2 on 2026-10-19 12:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def copy_shift_dates(apps, schema_editor):
+    Shift = apps.get_model("shifts", "Shift")
+    CarToWash = apps.get_model("shifts", "CarToWash")
+    CarToWashAdditionalService = apps.get_model(
+        "shifts",
+        "CarToWashAdditionalService",
+    )
+    CarToWash.objects.update(
+        shift_date=Subquery(
+            Shift.objects.filter(id=OuterRef("shift_id")).values("date")[:1],
+        ),
+    )
+    CarToWashAdditionalService.objects.update(
+        shift_date=Subquery(
+            CarToWash.objects.filter(id=OuterRef("car_id")).values("shift_date")[:1],
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("shifts", "0013_cartowash_windshield_washer_type"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="cartowash",
+            name="shift_date",
+            field=models.DateField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="cartowashadditionalservice",
+            name="shift_date",
+            field=models.DateField(editable=False, null=True),
+        ),
+        migrations.RunPython(copy_shift_dates, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="cartowash",
+            name="shift_date",
+            field=models.DateField(
+                db_index=True,
+                editable=False,
+                verbose_name="shift date",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="cartowashadditionalservice",
+            name="shift_date",
+            field=models.DateField(
+                db_index=True,
+                editable=False,
+                verbose_name="shift date",
+            ),
+        ),
+        migrations.AlterUniqueTogether(
+            name="cartowash",
+            unique_together={("number", "shift", "shift_date")},
+        ),
+        migrations.AlterUniqueTogether(
+            name="cartowashadditionalservice",
+            unique_together={("car", "service", "shift_date")},
+        ),
+        migrations.AlterField(
+            model_name="cartowashadditionalservice",
+            name="car",
+            field=models.ForeignKey(
+                db_constraint=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="additional_services",
+                to="shifts.cartowash",
+                verbose_name="car to wash",
+            ),
+        ),
+    ]
@@ -0,0 +1,161 @@
+# Generated by Django 5.2 on 2026-10-19 12:20
+
+import datetime
+
+from django.db import migrations
+from django.utils import timezone
+
+
+PARTITIONED_TABLES = ("shifts_cartowash", "shifts_cartowashadditionalservice")
+PARTITION_KEY = "shift_date"
+# Months after the current one partitions are created for.
+MONTHS_AHEAD = 3
+
+
+def get_month_start(date: datetime.date, months: int = 0) -> datetime.date:
+    month_index = date.year * 12 + date.month - 1 + months
+    return datetime.date(month_index // 12, month_index % 12 + 1, 1)
+
+
+def get_table_definitions(cursor, table_name: str) -> tuple[str, list[str]]:
+    """Name of the primary key and SQL of other constraints and indexes."""
+    cursor.execute(
+        """
+        SELECT conname, contype, pg_get_constraintdef(oid)
+        FROM pg_constraint
+        WHERE conrelid = %s::regclass AND contype <> 'n'
+        ORDER BY contype, conname
+        """,
+        [table_name],
+    )
+    primary_key_name = None
+    definitions = []
+    for name, constraint_type, definition in cursor.fetchall():
+        if constraint_type == "p":
+            primary_key_name = name
+        else:
+            definitions.append(
+                f'ALTER TABLE "{table_name}" ADD CONSTRAINT "{name}" {definition}'
+            )
+    cursor.execute(
+        """
+        SELECT pg_get_indexdef(index.indexrelid)
+        FROM pg_index AS index
+        WHERE index.indrelid = %s::regclass
+            AND NOT EXISTS (
+                SELECT 1 FROM pg_constraint
+                WHERE pg_constraint.conindid = index.indexrelid
+            )
+        ORDER BY index.indexrelid
+        """,
+        [table_name],
+    )
+    definitions += [definition for (definition,) in cursor.fetchall()]
+    return primary_key_name, definitions
+
+
+def rebuild_table(cursor, table_name: str, partition_key: str | None) -> None:
+    """
+    Copy the table to a new one, partitioned by months of the partition
+    key or not partitioned if it is None, keeping names of constraints,
+    indexes and the id sequence.
+    """
+    new_table_name = f"{table_name}__rebuilt"
+    primary_key_name, definitions = get_table_definitions(cursor, table_name)
+    cursor.execute("SELECT pg_get_serial_sequence(%s, 'id')", [table_name])
+    (sequence_name,) = cursor.fetchone()
+
+    if partition_key is None:
+        cursor.execute(
+            f'CREATE TABLE "{new_table_name}"'
+            f' (LIKE "{table_name}" INCLUDING DEFAULTS INCLUDING IDENTITY)'
+        )
+        primary_key_columns = "id"
+    else:
+        cursor.execute(
+            f'CREATE TABLE "{new_table_name}"'
+            f' (LIKE "{table_name}" INCLUDING DEFAULTS INCLUDING IDENTITY)'
+            f' PARTITION BY RANGE ("{partition_key}")'
+        )
+        primary_key_columns = f'id, "{partition_key}"'
+
+        cursor.execute(
+            f"SELECT DISTINCT date_trunc('month', \"{partition_key}\")::date"
+            f' FROM "{table_name}"'
+        )
+        current_month = get_month_start(timezone.localdate())
+        months = {month for (month,) in cursor.fetchall()} | {
+            get_month_start(current_month, offset) for offset in range(MONTHS_AHEAD + 1)
+        }
+        for month in sorted(months):
+            cursor.execute(
+                f'CREATE TABLE "{table_name}_p{month:%Y_%m}"'
+                f' PARTITION OF "{new_table_name}"'
+                f" FOR VALUES FROM (%s) TO (%s)",
+                [month, get_month_start(month, 1)],
+            )
+        cursor.execute(
+            f'CREATE TABLE "{table_name}_default"'
+            f' PARTITION OF "{new_table_name}" DEFAULT'
+        )
+
+    cursor.execute(f'INSERT INTO "{new_table_name}" SELECT * FROM "{table_name}"')
+
+    cursor.execute("SELECT pg_get_serial_sequence(%s, 'id')", [new_table_name])
+    (new_sequence_name,) = cursor.fetchone()
+    if new_sequence_name is not None and new_sequence_name != sequence_name:
+        cursor.execute(
+            f"SELECT setval(%s, coalesce(max(id), 0) + 1, false)"
+            f' FROM "{table_name}"',
+            [new_sequence_name],
+        )
+    elif sequence_name is not None:
+        # Default of a serial column still uses the old sequence.
+        cursor.execute(f'ALTER SEQUENCE {sequence_name} OWNED BY "{new_table_name}".id')
+
+    cursor.execute(f'DROP TABLE "{table_name}"')
+    cursor.execute(f'ALTER TABLE "{new_table_name}" RENAME TO "{table_name}"')
+    if new_sequence_name is not None and new_sequence_name != sequence_name:
+        sequence_short_name = sequence_name.rsplit(".", 1)[-1]
+        cursor.execute(
+            f"ALTER SEQUENCE {new_sequence_name} RENAME TO {sequence_short_name}"
+        )
+
+    cursor.execute(
+        f'ALTER TABLE "{table_name}" ADD CONSTRAINT "{primary_key_name}"'
+        f" PRIMARY KEY ({primary_key_columns})"
+    )
+    for definition in definitions:
+        cursor.execute(definition)
+
+
+def partition_tables(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    with schema_editor.connection.cursor() as cursor:
+        for table_name in PARTITIONED_TABLES:
+            rebuild_table(cursor, table_name, partition_key=PARTITION_KEY)
+
+
+def unpartition_tables(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    with schema_editor.connection.cursor() as cursor:
+        for table_name in PARTITIONED_TABLES:
+            rebuild_table(cursor, table_name, partition_key=None)
+
+
+class Migration(migrations.Migration):
+    """
+    Cars to wash and their additional services are partitioned by months
+    of the shift date. Primary keys include the partition key, so the
+    additional services do not have a foreign key constraint to cars.
+    """
+
+    dependencies = [
+        ("shifts", "0014_cartowash_shift_date"),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_tables, unpartition_tables),
+    ]
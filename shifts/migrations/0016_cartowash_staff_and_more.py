@@ -0,0 +1,130 @@
+# Generated by Django 5.2 on 2026-10-19 14:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def copy_shifts_and_staff(apps, schema_editor):
+    Shift = apps.get_model("shifts", "Shift")
+    CarToWash = apps.get_model("shifts", "CarToWash")
+    CarToWashAdditionalService = apps.get_model(
+        "shifts",
+        "CarToWashAdditionalService",
+    )
+    CarToWash.objects.update(
+        staff_id=Subquery(
+            Shift.objects.filter(id=OuterRef("shift_id")).values("staff_id")[:1],
+        ),
+    )
+    cars = CarToWash.objects.filter(
+        id=OuterRef("car_id"),
+        shift_date=OuterRef("shift_date"),
+    )
+    CarToWashAdditionalService.objects.update(
+        shift_id=Subquery(cars.values("shift_id")[:1]),
+        staff_id=Subquery(cars.values("staff_id")[:1]),
+    )
+    # Columns can not be altered while foreign key checks of the updated
+    # rows are deferred.
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("shifts", "0015_partition_cars_to_wash"),
+        ("staff", "0004_alter_staff_last_activity_at"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="cartowash",
+            name="staff",
+            field=models.ForeignKey(
+                db_index=False,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="+",
+                to="staff.staff",
+            ),
+        ),
+        migrations.AddField(
+            model_name="cartowashadditionalservice",
+            name="shift",
+            field=models.ForeignKey(
+                db_index=False,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="+",
+                to="shifts.shift",
+            ),
+        ),
+        migrations.AddField(
+            model_name="cartowashadditionalservice",
+            name="staff",
+            field=models.ForeignKey(
+                db_index=False,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="+",
+                to="staff.staff",
+            ),
+        ),
+        migrations.RunPython(copy_shifts_and_staff, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="cartowash",
+            name="staff",
+            field=models.ForeignKey(
+                db_index=False,
+                editable=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="+",
+                to="staff.staff",
+                verbose_name="staff",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="cartowashadditionalservice",
+            name="shift",
+            field=models.ForeignKey(
+                db_index=False,
+                editable=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="+",
+                to="shifts.shift",
+                verbose_name="shift",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="cartowashadditionalservice",
+            name="staff",
+            field=models.ForeignKey(
+                db_index=False,
+                editable=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="+",
+                to="staff.staff",
+                verbose_name="staff",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="cartowash",
+            index=models.Index(
+                fields=["shift_date", "staff"],
+                include=("shift", "car_class", "wash_type", "transfer_price"),
+                name="cartowash_date_staff_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="cartowashadditionalservice",
+            index=models.Index(
+                fields=["shift_date", "staff"],
+                include=("shift", "service", "count"),
+                name="cartowash_svc_date_staff_idx",
+            ),
+        ),
+    ]
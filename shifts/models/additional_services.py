@@ -3,6 +3,8 @@ from django.utils.translation import gettext_lazy as _
 
 from car_washes.models import CarWashService
 from shifts.models.cars_to_wash import CarToWash
+from shifts.models.shifts import Shift
+from staff.models import Staff
 
 __all__ = ("CarToWashAdditionalService",)
 
@@ -13,6 +15,32 @@ class CarToWashAdditionalService(models.Model):
         on_delete=models.CASCADE,
         related_name="additional_services",
         verbose_name=_("car to wash"),
+        # Foreign keys can not reference partitioned tables.
+        db_constraint=False,
+    )
+    # Copy of the shift date of the car, the table is partitioned by it.
+    shift_date = models.DateField(
+        db_index=True,
+        editable=False,
+        verbose_name=_("shift date"),
+    )
+    # Copies of the shift and its staff of the car,
+    # reports filter by them without joining cars and shifts.
+    shift = models.ForeignKey(
+        to=Shift,
+        on_delete=models.CASCADE,
+        related_name="+",
+        db_index=False,
+        editable=False,
+        verbose_name=_("shift"),
+    )
+    staff = models.ForeignKey(
+        to=Staff,
+        on_delete=models.CASCADE,
+        related_name="+",
+        db_index=False,
+        editable=False,
+        verbose_name=_("staff"),
     )
     service = models.ForeignKey(
         to=CarWashService,
@@ -31,7 +59,22 @@ class CarToWashAdditionalService(models.Model):
     class Meta:
         verbose_name = _("additional service")
         verbose_name_plural = _("additional services")
-        unique_together = ("car", "service")
+        unique_together = ("car", "service", "shift_date")
+        indexes = (
+            # Covers the rows that dry cleaning items are counted from.
+            models.Index(
+                fields=("shift_date", "staff"),
+                include=("shift", "service", "count"),
+                name="cartowash_svc_date_staff_idx",
+            ),
+        )
+
+    def save(self, *args, **kwargs):
+        # Bulk inserts do not call save() and copy these themselves.
+        self.shift_date = self.car.shift_date
+        self.shift_id = self.car.shift_id
+        self.staff_id = self.car.staff_id
+        super().save(*args, **kwargs)
 
     @property
     def total_price(self) -> int:
@@ -6,6 +6,7 @@ from django.utils import timezone
 
 from car_washes.models import CarWash
 from shifts.models.shifts import Shift
+from staff.models import Staff
 
 __all__ = ("CarToWash",)
 
@@ -41,6 +42,21 @@ class CarToWash(models.Model):
         on_delete=models.CASCADE,
         verbose_name=_("shift"),
     )
+    # Copy of the shift date, the table is partitioned by months of it.
+    shift_date = models.DateField(
+        db_index=True,
+        editable=False,
+        verbose_name=_("shift date"),
+    )
+    # Copy of the shift staff, reports filter by it without joining shifts.
+    staff = models.ForeignKey(
+        Staff,
+        on_delete=models.CASCADE,
+        related_name="+",
+        db_index=False,
+        editable=False,
+        verbose_name=_("staff"),
+    )
     car_class = models.CharField(
         max_length=16,
         choices=CarType.choices,
@@ -78,11 +94,34 @@ class CarToWash(models.Model):
     class Meta:
         verbose_name = _("car to wash")
         verbose_name_plural = _("cars to wash")
-        unique_together = ("number", "shift")
+        # Unique constraints of partitioned tables include the partition key.
+        unique_together = ("number", "shift", "shift_date")
+        indexes = (
+            # Covers the rows that staff shifts statistics are computed from.
+            models.Index(
+                fields=("shift_date", "staff"),
+                include=("shift", "car_class", "wash_type", "transfer_price"),
+                name="cartowash_date_staff_idx",
+            ),
+        )
 
     def __str__(self):
         return _("car number: %(number)s") % {"number": self.number}
 
+    def save(self, *args, **kwargs):
+        # New rows may take the shift date and staff from a snapshot of the
+        # shift, so the shift is not loaded again. Bulk inserts and updates
+        # do not call save() and copy them themselves.
+        if (
+            not self._state.adding
+            or CarToWash.shift.is_cached(self)
+            or self.shift_date is None
+            or self.staff_id is None
+        ):
+            self.shift_date = self.shift.date
+            self.staff_id = self.shift.staff_id
+        super().save(*args, **kwargs)
+
     @property
     def washing_price(self) -> int:
         if self.car_class == self.CarType.COMFORT:
@@ -7,8 +7,12 @@ from dataclasses import dataclass
 from functools import reduce
 from uuid import UUID
 
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
 from django.db.models import Q
 
+from core.cache import is_cache_shared
 from shifts.exceptions import (
     CarToWashNotFoundError,
     ShiftNotFoundError,
@@ -21,6 +25,14 @@ __all__ = (
     "get_staff_ids_by_shift_ids",
     "get_shift_by_id",
     "get_staff_current_shift",
+    "ActiveShiftDTO",
+    "get_staff_active_shift",
+    "get_cached_staff_active_shift",
+    "cache_staff_active_shift",
+    "invalidate_staff_active_shift",
+    "ShiftCarAdditionalServiceDTO",
+    "ShiftCarDTO",
+    "get_shift_cars",
     "has_any_finished_shift",
     "CarToWashDTO",
     "get_cars_to_wash_for_period",
@@ -93,6 +105,178 @@ def get_staff_current_shift(staff_id: int) -> Shift:
         raise StaffHasNoActiveShiftError
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ActiveShiftDTO:
+    """
+    Snapshot of started, not finished shift of staff member,
+    with prices of the car wash the staff member is currently at.
+    """
+
+    id: int
+    staff_id: int
+    date: datetime.date
+    is_extra: bool
+    car_wash_id: int | None
+    comfort_class_car_washing_price: int | None = None
+    business_class_car_washing_price: int | None = None
+    van_washing_price: int | None = None
+    windshield_washer_price_per_bottle: int | None = None
+
+
+def get_staff_active_shift_cache_key(staff_id: int) -> str:
+    # Versioned, so snapshots of the previous shape are not read.
+    return f"shifts:staff_active_shift:v2:{staff_id}"
+
+
+def map_active_shift(shift: Shift) -> ActiveShiftDTO:
+    car_wash = shift.car_wash
+    if car_wash is None:
+        return ActiveShiftDTO(
+            id=shift.id,
+            staff_id=shift.staff_id,
+            date=shift.date,
+            is_extra=shift.is_extra,
+            car_wash_id=None,
+        )
+    return ActiveShiftDTO(
+        id=shift.id,
+        staff_id=shift.staff_id,
+        date=shift.date,
+        is_extra=shift.is_extra,
+        car_wash_id=car_wash.id,
+        comfort_class_car_washing_price=car_wash.comfort_class_car_washing_price,
+        business_class_car_washing_price=car_wash.business_class_car_washing_price,
+        van_washing_price=car_wash.van_washing_price,
+        windshield_washer_price_per_bottle=car_wash.windshield_washer_price_per_bottle,
+    )
+
+
+def cache_staff_active_shift(shift: Shift) -> ActiveShiftDTO:
+    """
+    Put snapshot of the active shift to the cache for a short time.
+
+    Cars are created from the snapshot, so it is cached only if the cache
+    is shared: invalidation in one worker process would not reach the
+    others, and they would add cars to a finished shift.
+
+    Args:
+        shift: started, not finished shift with car wash loaded.
+    """
+    active_shift = map_active_shift(shift)
+    if not is_cache_shared():
+        return active_shift
+    cache.set(
+        get_staff_active_shift_cache_key(shift.staff_id),
+        active_shift,
+        timeout=settings.STAFF_ACTIVE_SHIFT_CACHE_TTL,
+    )
+    return active_shift
+
+
+def invalidate_staff_active_shift(staff_id: int) -> None:
+    key = get_staff_active_shift_cache_key(staff_id)
+    cache.delete(key)
+    # Concurrent request may re-cache the shift before the transaction
+    # that finishes or deletes it commits, so delete once more after commit.
+    transaction.on_commit(lambda: cache.delete(key))
+
+
+def get_cached_staff_active_shift(staff_id: int) -> ActiveShiftDTO | None:
+    if not is_cache_shared():
+        return None
+    return cache.get(get_staff_active_shift_cache_key(staff_id))
+
+
+def get_staff_active_shift(staff_id: int) -> ActiveShiftDTO:
+    """
+    Get snapshot of staff's active shift from cache or from the database.
+
+    Raises:
+        StaffHasNoActiveShiftError: If staff has no active shift.
+    """
+    active_shift = get_cached_staff_active_shift(staff_id)
+    if active_shift is not None:
+        return active_shift
+    shift = get_staff_current_shift(staff_id)
+    return cache_staff_active_shift(shift)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ShiftCarAdditionalServiceDTO:
+    id: UUID
+    count: int
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ShiftCarDTO:
+    id: int
+    number: str
+    car_class: str
+    wash_type: str
+    windshield_washer_refilled_bottle_percentage: int
+    created_at: datetime.datetime
+    additional_services: list[ShiftCarAdditionalServiceDTO]
+
+
+def get_shift_cars(
+    *,
+    shift_id: int,
+    since: datetime.datetime | None = None,
+) -> list[ShiftCarDTO]:
+    """
+    Get cars transferred on the shift with their additional services
+    in two queries.
+
+    Keyword Args:
+        shift_id: ID of the shift.
+        since: if provided, only cars created after this moment are returned.
+
+    Returns:
+        Cars ordered by creation time.
+    """
+    cars = CarToWash.objects.filter(shift_id=shift_id)
+    additional_services = CarToWashAdditionalService.objects.filter(
+        shift_id=shift_id,
+    )
+    if since is not None:
+        cars = cars.filter(created_at__gt=since)
+        additional_services = additional_services.filter(car__created_at__gt=since)
+
+    car_id_to_services: dict[int, list[ShiftCarAdditionalServiceDTO]] = (
+        defaultdict(list)
+    )
+    for service in additional_services.values("car_id", "service_id", "count"):
+        car_id_to_services[service["car_id"]].append(
+            ShiftCarAdditionalServiceDTO(
+                id=service["service_id"],
+                count=service["count"],
+            )
+        )
+
+    cars = cars.order_by("created_at", "id").values(
+        "id",
+        "number",
+        "car_class",
+        "wash_type",
+        "windshield_washer_refilled_bottle_percentage",
+        "created_at",
+    )
+    return [
+        ShiftCarDTO(
+            id=car["id"],
+            number=car["number"],
+            car_class=car["car_class"],
+            wash_type=car["wash_type"],
+            windshield_washer_refilled_bottle_percentage=(
+                car["windshield_washer_refilled_bottle_percentage"]
+            ),
+            created_at=car["created_at"],
+            additional_services=car_id_to_services[car["id"]],
+        )
+        for car in cars
+    ]
+
+
 def has_any_finished_shift(staff_id: int) -> bool:
     return Shift.objects.filter(staff_id=staff_id, finished_at__isnull=False).exists()
 
@@ -157,7 +341,7 @@ def map_car_to_wash(
             CarToWashDTO(
                 id=car_to_wash.id,
                 car_class=car_to_wash.car_class,
-                shift_date=car_to_wash.shift.date,
+                shift_date=car_to_wash.shift_date,
                 washing_price=car_to_wash.washing_price,
                 windshield_washer_price=car_to_wash.windshield_washer_price,
                 windshield_washer_refilled_bottle_count=bottle_count,
@@ -220,22 +404,26 @@ def get_cars_to_wash_for_period(
     if from_date > to_date:
         raise ValueError("from_date must be less than or equal to to_date")
 
-    cars_to_wash = (
-        CarToWash.objects.select_related("shift")
-        .filter(
-            shift__is_test=False,
-            shift__date__range=(from_date, to_date),
-            car_wash_id__in=car_wash_ids,
-        )
-    )
+    # Few shifts are test ones, excluding them by ids
+    # spares joining shifts to every car.
+    test_shift_ids = Shift.objects.filter(
+        is_test=True,
+        date__range=(from_date, to_date),
+    ).values("id")
+
+    cars_to_wash = CarToWash.objects.filter(
+        shift_date__range=(from_date, to_date),
+        car_wash_id__in=car_wash_ids,
+    ).exclude(shift_id__in=test_shift_ids)
 
     additional_services = (
         CarToWashAdditionalService.objects.select_related("service")
         .filter(
-            car__shift__is_test=False,
-            car__shift__date__range=(from_date, to_date),
+            shift_date__range=(from_date, to_date),
+            car__shift_date__range=(from_date, to_date),
             car__car_wash_id__in=car_wash_ids,
         )
+        .exclude(shift_id__in=test_shift_ids)
         .values(
             "service_id",
             "service__name",
@@ -254,10 +442,9 @@ def get_cars_to_wash_for_period(
 
 def get_staff_id_by_car_id(car_id: int) -> int:
     try:
-        car = CarToWash.objects.select_related("shift").get(id=car_id)
+        return CarToWash.objects.values_list("staff_id", flat=True).get(id=car_id)
     except CarToWash.DoesNotExist:
         raise CarToWashNotFoundError
-    return car.shift.staff_id
 
 
 def get_staff_ids_with_active_shift() -> set[int]:
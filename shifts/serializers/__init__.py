@@ -14,6 +14,8 @@ from .cars_to_wash import (
     TransferredCarAdditionService,
     TransferredCarListInputSerializer,
     TransferredCarDetailOutputSerializer,
+    TransferredCarBulkCreateInputSerializer,
+    TransferredCarBulkCreateOutputSerializer,
 )
 from .dry_cleaning_requests import (
     DryCleaningRequestCreateInputSerializer,
@@ -23,6 +25,8 @@ from .dry_cleaning_requests import (
 )
 from .report_periods import (
     StaffReportPeriodsOutputSerializer,
+    StaffListReportPeriodsInputSerializer,
+    StaffListReportPeriodsOutputSerializer,
     ReportPeriodSerializer,
 )
 from .shifts import (
@@ -41,6 +45,7 @@ from .shifts import (
     ShiftTestCreateOutputSerializer,
     ShiftExtraCreateOutputSerializer,
     ShiftExtraCreateInputSerializer,
+    ShiftBulkCreateInputSerializer,
     ShiftListV2InputSerializer,
     ShiftListV2ItemSerializer,
     ShiftListV2OutputSerializer,
@@ -48,6 +53,8 @@ from .shifts import (
     ShiftRejectOutputSerializer,
     DeadSoulsInputSerializer,
     DeadSoulsOutputSerializer,
+    DeadSoulsForMonthsInputSerializer,
+    DeadSoulsForMonthsOutputSerializer,
     StaffIdAndFullNameSerializer,
     StaffIdAndDateSerializer,
     ExtraShiftItemSerializer,
@@ -73,6 +80,7 @@ __all__ = (
     "ShiftTestCreateOutputSerializer",
     "ShiftExtraCreateOutputSerializer",
     "ShiftExtraCreateInputSerializer",
+    "ShiftBulkCreateInputSerializer",
     "ShiftListV2InputSerializer",
     "ShiftListV2ItemSerializer",
     "ShiftListV2OutputSerializer",
@@ -80,6 +88,8 @@ __all__ = (
     "ShiftRejectOutputSerializer",
     "DeadSoulsInputSerializer",
     "DeadSoulsOutputSerializer",
+    "DeadSoulsForMonthsInputSerializer",
+    "DeadSoulsForMonthsOutputSerializer",
     "StaffIdAndFullNameSerializer",
     "StaffIdAndDateSerializer",
     "ExtraShiftItemSerializer",
@@ -99,7 +109,11 @@ __all__ = (
     "TransferredCarAdditionService",
     "TransferredCarListInputSerializer",
     "TransferredCarDetailOutputSerializer",
+    "TransferredCarBulkCreateInputSerializer",
+    "TransferredCarBulkCreateOutputSerializer",
     "StaffReportPeriodsOutputSerializer",
+    "StaffListReportPeriodsInputSerializer",
+    "StaffListReportPeriodsOutputSerializer",
     "ReportPeriodSerializer",
     "AdditionalServiceSerializer",
     "AvailableDateSerializer",
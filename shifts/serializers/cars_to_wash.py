@@ -14,6 +14,8 @@ __all__ = (
     "TransferredCarAdditionService",
     "TransferredCarListInputSerializer",
     "TransferredCarDetailOutputSerializer",
+    "TransferredCarBulkCreateInputSerializer",
+    "TransferredCarBulkCreateOutputSerializer",
 )
 
 
@@ -98,6 +100,50 @@ class TransferredCarCreateOutputSerializer(serializers.Serializer):
     additional_services = AdditionalServiceSerializer(many=True)
 
 
+class TransferredCarBulkCreateItemInputSerializer(serializers.Serializer):
+    # Cars are bulk inserted without model validation, so the serializer
+    # checks what the columns do not accept.
+    number = serializers.CharField(max_length=20)
+    car_class = serializers.ChoiceField(choices=CarToWash.CarType.choices)
+    wash_type = serializers.ChoiceField(choices=CarToWash.WashType.choices)
+    windshield_washer_type = serializers.ChoiceField(
+        choices=CarToWash.WindshieldWasherType.choices,
+    )
+    windshield_washer_refilled_bottle_percentage = serializers.IntegerField(
+        min_value=0,
+        max_value=100,
+    )
+    additional_services = AdditionalServiceSerializer(many=True, default=list)
+
+
+class TransferredCarBulkCreateInputSerializer(serializers.Serializer):
+    shift_id = serializers.IntegerField()
+    car_wash_id = serializers.IntegerField(allow_null=True, default=None)
+    cars = TransferredCarBulkCreateItemInputSerializer(
+        many=True,
+        allow_empty=False,
+        max_length=500,
+    )
+
+
+class TransferredCarBulkCreateItemOutputSerializer(serializers.Serializer):
+    index = serializers.IntegerField()
+    number = serializers.CharField()
+    status = serializers.CharField()
+    transferred_car = TransferredCarCreateOutputSerializer(allow_null=True)
+    service_ids = serializers.ListField(
+        child=serializers.UUIDField(),
+        allow_null=True,
+    )
+
+
+class TransferredCarBulkCreateOutputSerializer(serializers.Serializer):
+    shift_id = serializers.IntegerField()
+    created_count = serializers.IntegerField()
+    skipped_count = serializers.IntegerField()
+    results = TransferredCarBulkCreateItemOutputSerializer(many=True)
+
+
 class CarToWashAdditionalServiceSerializer(serializers.ModelSerializer):
     id = serializers.UUIDField(source="service_id")
 
@@ -43,6 +43,14 @@ class DryCleaningRequestListInputSerializer(serializers.Serializer):
         ),
         default=None,
     )
+    staff_ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        default=None,
+    )
+    from_date = serializers.DateField(default=None)
+    to_date = serializers.DateField(default=None)
+    cursor = serializers.IntegerField(min_value=1, default=None)
+    limit = serializers.IntegerField(min_value=1, max_value=1000, default=100)
 
 
 class DryCleaningRequestServiceOutputSerializer(serializers.Serializer):
@@ -1,6 +1,11 @@
 from rest_framework import serializers
 
-__all__ = ("StaffReportPeriodsOutputSerializer", "ReportPeriodSerializer")
+__all__ = (
+    "StaffReportPeriodsOutputSerializer",
+    "ReportPeriodSerializer",
+    "StaffListReportPeriodsInputSerializer",
+    "StaffListReportPeriodsOutputSerializer",
+)
 
 
 class ReportPeriodSerializer(serializers.Serializer):
@@ -11,3 +16,16 @@ class ReportPeriodSerializer(serializers.Serializer):
 class StaffReportPeriodsOutputSerializer(serializers.Serializer):
     staff_id = serializers.IntegerField()
     periods = ReportPeriodSerializer(many=True)
+
+
+class StaffListReportPeriodsInputSerializer(serializers.Serializer):
+    staff_ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        min_length=1,
+        max_length=1000,
+    )
+
+
+class StaffListReportPeriodsOutputSerializer(serializers.Serializer):
+    staff_list = StaffReportPeriodsOutputSerializer(many=True)
+    missing_staff_ids = serializers.ListField(child=serializers.IntegerField())
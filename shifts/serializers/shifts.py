@@ -20,6 +20,7 @@ __all__ = (
     "ShiftTestCreateOutputSerializer",
     "ShiftExtraCreateOutputSerializer",
     "ShiftExtraCreateInputSerializer",
+    "ShiftBulkCreateInputSerializer",
     "ShiftListV2InputSerializer",
     "ShiftListV2ItemSerializer",
     "ShiftListV2OutputSerializer",
@@ -27,6 +28,8 @@ __all__ = (
     "ShiftRejectOutputSerializer",
     "DeadSoulsInputSerializer",
     "DeadSoulsOutputSerializer",
+    "DeadSoulsForMonthsInputSerializer",
+    "DeadSoulsForMonthsOutputSerializer",
     "StaffIdAndFullNameSerializer",
     "StaffIdAndDateSerializer",
     "ExtraShiftItemSerializer",
@@ -125,6 +128,15 @@ class ShiftExtraCreateInputSerializer(serializers.Serializer):
     )
 
 
+class ShiftBulkCreateInputSerializer(serializers.Serializer):
+    shift_type = serializers.ChoiceField(choices=Shift.Type.choices)
+    shifts = serializers.ListField(
+        child=StaffIdAndDateSerializer(),
+        min_length=1,
+        max_length=50000,
+    )
+
+
 class ShiftCreateInputSerializer(serializers.Serializer):
     staff_id = serializers.IntegerField()
     dates = serializers.ListField(child=serializers.DateField(), min_length=1)
@@ -261,6 +273,19 @@ class DeadSoulsOutputSerializer(serializers.Serializer):
     )
 
 
+class DeadSoulsForMonthsInputSerializer(serializers.Serializer):
+    year = serializers.IntegerField(min_value=2000, max_value=2100)
+    months = serializers.ListField(
+        child=serializers.IntegerField(min_value=1, max_value=12),
+        min_length=1,
+        max_length=12,
+    )
+
+
+class DeadSoulsForMonthsOutputSerializer(serializers.Serializer):
+    months = DeadSoulsOutputSerializer(many=True)
+
+
 class ShiftConfirmInputSerializer(serializers.Serializer):
     shift_id = serializers.IntegerField()
 
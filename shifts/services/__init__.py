@@ -2,6 +2,7 @@ from .shifts import (
     ShiftDeleteByIdInteractor,
     ShiftsDeleteOnStaffBanInteractor,
     DeadSoulsReadInteractor,
+    DeadSoulsForMonthsReadInteractor,
     ShiftRegularCreateInteractor,
     ShiftTestCreateInteractor,
     ShiftFinishInteractor,
@@ -14,6 +15,10 @@ from .shifts import (
     ShiftConfirmInteractor,
     StaffShiftsMonthListInteractor,
     ShiftExtraCreateInteractor,
+    ShiftBulkCreateInteractor,
+    send_start_shift_reminders,
+    send_finish_shift_reminders,
+    send_shift_finish_reports,
 )
 from .transferred_cars import (
     TransferredCarListInteractor,
@@ -32,6 +37,7 @@ __all__ = (
     "ShiftsDeleteOnStaffBanInteractor",
     "ShiftDeleteByIdInteractor",
     "DeadSoulsReadInteractor",
+    "DeadSoulsForMonthsReadInteractor",
     "ShiftRegularCreateInteractor",
     "ShiftTestCreateInteractor",
     "ShiftFinishInteractor",
@@ -44,6 +50,10 @@ __all__ = (
     "ShiftConfirmInteractor",
     "StaffShiftsMonthListInteractor",
     "ShiftExtraCreateInteractor",
+    "ShiftBulkCreateInteractor",
+    "send_start_shift_reminders",
+    "send_finish_shift_reminders",
+    "send_shift_finish_reports",
     "TransferredCarListInteractor",
     "TransferredCarRetrieveInteractor",
     "DryCleaningRequestCreateInteractor",
@@ -1,22 +1,29 @@
 import datetime
+import operator
+from collections import defaultdict
 from typing import Final
 from uuid import UUID
 from collections.abc import Iterable
 
 from django.db.models import Count, Sum
 
+from economics.services.reports.snapshots import invalidate_report_snapshots
 from shifts.exceptions import (
     CarAlreadyWashedOnShiftError,
     CarWashSameAsCurrentError,
 )
 from shifts.models import CarToWash, CarToWashAdditionalService, Shift
+from shifts.selectors import (
+    cache_staff_active_shift,
+    invalidate_staff_active_shift,
+)
 from car_washes.models import CarWashServicePrice
 from shifts.exceptions import AdditionalServiceCouldNotBeProvidedError
 
 
 error_messages_and_exceptions = (
     (
-        "Car to wash with this Number and Shift already exists.",
+        "Car to wash with this Number, Shift and Shift date already exists.",
         CarAlreadyWashedOnShiftError,
     ),
 )
@@ -95,33 +102,70 @@ def get_staff_cars_count_by_date(date: datetime.date) -> dict:
     Raises:
         ValueError: If the provided date is invalid or in the future
     """
-    active_shifts_cars_count = (
-        CarToWash.objects.filter(shift__date=date, shift__finished_at__isnull=True)
-        .values("shift__staff_id", "shift__staff__full_name")
+    # Cars are counted without joining shifts, the few shifts of the date
+    # are read separately.
+    shifts_cars_count = (
+        CarToWash.objects.filter(shift_date=date)
+        .values("shift_id")
         .annotate(cars_count=Count("id"))
-        .order_by("-cars_count")
+        .order_by()
     )
-    completed_shifts_cars_count = (
-        CarToWash.objects.filter(shift__date=date, shift__finished_at__isnull=False)
-        .values("shift__staff_id", "shift__staff__full_name")
-        .annotate(cars_count=Count("id"))
-        .order_by("-cars_count")
+    shift_id_to_staff_id_and_is_finished: dict[int, tuple[int, bool]] = {}
+    staff_id_to_full_name: dict[int, str] = {}
+    shifts = Shift.objects.filter(date=date).values_list(
+        "id",
+        "staff_id",
+        "staff__full_name",
+        "finished_at",
     )
+    for shift_id, staff_id, staff_full_name, finished_at in shifts:
+        shift_id_to_staff_id_and_is_finished[shift_id] = (
+            staff_id,
+            finished_at is not None,
+        )
+        staff_id_to_full_name[staff_id] = staff_full_name
+
+    active_staff_cars_count: dict[int, int] = defaultdict(int)
+    completed_staff_cars_count: dict[int, int] = defaultdict(int)
+    for shift_cars_count in shifts_cars_count:
+        # Cars whose shift is not of the date (e.g. the shift was moved
+        # and its cars are not updated yet) are not counted, as before
+        # the date was copied to cars.
+        staff_id_and_is_finished = shift_id_to_staff_id_and_is_finished.get(
+            shift_cars_count["shift_id"],
+        )
+        if staff_id_and_is_finished is None:
+            continue
+        staff_id, is_finished = staff_id_and_is_finished
+        if is_finished:
+            staff_cars_count = completed_staff_cars_count
+        else:
+            staff_cars_count = active_staff_cars_count
+        staff_cars_count[staff_id] += shift_cars_count["cars_count"]
+
     active_shifts = [
         {
-            "staff_id": staff["shift__staff_id"],
-            "staff_full_name": staff["shift__staff__full_name"],
-            "cars_count": staff["cars_count"],
+            "staff_id": staff_id,
+            "staff_full_name": staff_id_to_full_name[staff_id],
+            "cars_count": cars_count,
         }
-        for staff in active_shifts_cars_count
+        for staff_id, cars_count in sorted(
+            active_staff_cars_count.items(),
+            key=operator.itemgetter(1),
+            reverse=True,
+        )
     ]
     completed_shifts = [
         {
-            "staff_id": staff["shift__staff_id"],
-            "staff_full_name": staff["shift__staff__full_name"],
-            "cars_count": staff["cars_count"],
+            "staff_id": staff_id,
+            "staff_full_name": staff_id_to_full_name[staff_id],
+            "cars_count": cars_count,
         }
-        for staff in completed_shifts_cars_count
+        for staff_id, cars_count in sorted(
+            completed_staff_cars_count.items(),
+            key=operator.itemgetter(1),
+            reverse=True,
+        )
     ]
     return {
         "date": date,
@@ -134,7 +178,7 @@ def get_cars_without_windshield_washer_by_date(
     date: datetime.date,
 ) -> list[str]:
     cars_to_wash = CarToWash.objects.filter(
-        shift__date=date,
+        shift_date=date,
         windshield_washer_refilled_bottle_percentage=0,
         windshield_washer_type=CarToWash.WindshieldWasherType.ANTIFREEZE,
     )
@@ -151,6 +195,8 @@ def update_shift_car_wash(
         raise CarWashSameAsCurrentError
     shift.car_wash_id = car_wash_id
     shift.save(update_fields=["car_wash_id"])
+    if shift.is_started and not shift.is_finished:
+        cache_staff_active_shift(shift)
 
 
 TRUNK_VACUUM_SERVICE_ID: Final[UUID] = UUID("8d263cb9-f11c-456e-b055-ee89655682f1")
@@ -163,7 +209,7 @@ def compute_trunk_vacuum_count(
 ) -> int:
     result = CarToWashAdditionalService.objects.filter(
         car__car_wash_id=car_wash_id,
-        car__shift_id=shift_id,
+        shift_id=shift_id,
         service_id=TRUNK_VACUUM_SERVICE_ID,
     ).aggregate(count=Sum("count"))
     return result["count"] or 0
@@ -176,7 +222,34 @@ def compute_dry_cleaning_items_count(
 ) -> int:
     result = CarToWashAdditionalService.objects.filter(
         car__car_wash_id=car_wash_id,
-        car__shift_id=shift_id,
+        shift_id=shift_id,
         service__is_dry_cleaning=True,
     ).aggregate(count=Sum("count"))
     return result["count"] or 0
+
+
+def update_shift_cars(shift: Shift) -> None:
+    """
+    Copy the changed date and staff of the shift to its cars and their
+    additional services, moving them to the partitions of the new date.
+    Updates send no signals, so snapshots of both the old and the new
+    date and cached active shifts of both staff are invalidated here.
+    """
+    cars = CarToWash.objects.filter(shift_id=shift.id)
+    old_dates_and_staff_ids = set(
+        cars.values_list("shift_date", "staff_id").distinct(),
+    )
+    old_dates = {date for date, _ in old_dates_and_staff_ids}
+    old_staff_ids = {staff_id for _, staff_id in old_dates_and_staff_ids}
+    cars.update(
+        shift_date=shift.date,
+        staff_id=shift.staff_id,
+    )
+    CarToWashAdditionalService.objects.filter(shift_id=shift.id).update(
+        shift_date=shift.date,
+        staff_id=shift.staff_id,
+    )
+    invalidate_report_snapshots([*old_dates, shift.date])
+    # Cached active shift keeps the date and staff it was cached with.
+    for staff_id in {*old_staff_ids, shift.staff_id}:
+        invalidate_staff_active_shift(staff_id)
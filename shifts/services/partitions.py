@@ -0,0 +1,200 @@
+import datetime
+import gzip
+import re
+from dataclasses import dataclass
+from pathlib import Path
+
+from django.db import connection, transaction
+
+from shifts.models import CarToWash, CarToWashAdditionalService
+
+
+__all__ = (
+    "MonthPartition",
+    "get_month_start",
+    "get_partitioned_table_names",
+    "get_month_partitions",
+    "create_month_partition",
+    "create_month_partitions",
+    "archive_month_partition",
+)
+
+PARTITION_BOUNDS_PATTERN = re.compile(
+    r"FOR VALUES FROM \('(?P<from_date>[\d-]+)'\) TO \('(?P<to_date>[\d-]+)'\)"
+)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class MonthPartition:
+    table_name: str
+    name: str
+    # Inclusive start and exclusive end of the month.
+    from_date: datetime.date
+    to_date: datetime.date
+
+
+def get_month_start(date: datetime.date, months: int = 0) -> datetime.date:
+    """First day of the month of the date, shifted by the number of months."""
+    month_index = date.year * 12 + date.month - 1 + months
+    return datetime.date(month_index // 12, month_index % 12 + 1, 1)
+
+
+def get_partitioned_table_names() -> tuple[str, ...]:
+    """Tables partitioned by months of the shift date."""
+    return (
+        CarToWash._meta.db_table,
+        CarToWashAdditionalService._meta.db_table,
+    )
+
+
+def get_month_partition_name(table_name: str, month: datetime.date) -> str:
+    return f"{table_name}_p{month:%Y_%m}"
+
+
+def get_default_partition_name(table_name: str) -> str:
+    return f"{table_name}_default"
+
+
+def get_month_partitions(table_name: str) -> list[MonthPartition]:
+    """Attached month partitions of the table, the oldest first."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT child.relname, pg_get_expr(child.relpartbound, child.oid)
+            FROM pg_inherits
+            JOIN pg_class AS child ON child.oid = pg_inherits.inhrelid
+            WHERE pg_inherits.inhparent = %s::regclass
+            """,
+            [table_name],
+        )
+        rows = cursor.fetchall()
+
+    partitions: list[MonthPartition] = []
+    for name, bounds in rows:
+        match = PARTITION_BOUNDS_PATTERN.fullmatch(bounds)
+        # Default partition has no bounds.
+        if match is None:
+            continue
+        partitions.append(
+            MonthPartition(
+                table_name=table_name,
+                name=name,
+                from_date=datetime.date.fromisoformat(match["from_date"]),
+                to_date=datetime.date.fromisoformat(match["to_date"]),
+            )
+        )
+    return sorted(partitions, key=lambda partition: partition.from_date)
+
+
+@transaction.atomic
+def create_month_partition(table_name: str, month: datetime.date) -> MonthPartition:
+    """
+    Create the partition of the month. Rows of the month that got to the
+    default partition, e.g. shifts created far in advance, are moved to it.
+    """
+    partition = MonthPartition(
+        table_name=table_name,
+        name=get_month_partition_name(table_name, month),
+        from_date=get_month_start(month),
+        to_date=get_month_start(month, 1),
+    )
+    default_partition_name = get_default_partition_name(table_name)
+    bounds = [partition.from_date, partition.to_date]
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'SELECT EXISTS (SELECT 1 FROM "{default_partition_name}"'
+            f" WHERE shift_date >= %s AND shift_date < %s)",
+            bounds,
+        )
+        (has_default_rows,) = cursor.fetchone()
+
+        if has_default_rows:
+            cursor.execute(
+                f'ALTER TABLE "{table_name}"'
+                f' DETACH PARTITION "{default_partition_name}"'
+            )
+        cursor.execute(
+            f'CREATE TABLE "{partition.name}" PARTITION OF "{table_name}"'
+            f" FOR VALUES FROM (%s) TO (%s)",
+            bounds,
+        )
+        if has_default_rows:
+            cursor.execute(
+                f'INSERT INTO "{partition.name}" SELECT * FROM'
+                f' "{default_partition_name}"'
+                f" WHERE shift_date >= %s AND shift_date < %s",
+                bounds,
+            )
+            cursor.execute(
+                f'DELETE FROM "{default_partition_name}"'
+                f" WHERE shift_date >= %s AND shift_date < %s",
+                bounds,
+            )
+            cursor.execute(
+                f'ALTER TABLE "{table_name}"'
+                f' ATTACH PARTITION "{default_partition_name}" DEFAULT'
+            )
+    return partition
+
+
+def create_month_partitions(
+    *,
+    today: datetime.date,
+    months_ahead: int,
+) -> list[MonthPartition]:
+    """
+    Create missing partitions from the current month
+    to ``months_ahead`` months after it.
+
+    Returns:
+        Created partitions.
+    """
+    months = [get_month_start(today, offset) for offset in range(months_ahead + 1)]
+    created_partitions: list[MonthPartition] = []
+    for table_name in get_partitioned_table_names():
+        existing_months = {
+            partition.from_date for partition in get_month_partitions(table_name)
+        }
+        for month in months:
+            if month not in existing_months:
+                created_partitions.append(create_month_partition(table_name, month))
+    return created_partitions
+
+
+def dump_table(table_name: str, file_path: Path) -> None:
+    with gzip.open(file_path, "wb") as file:
+        with connection.cursor() as cursor:
+            cursor.copy_expert(
+                f'COPY "{table_name}" TO STDOUT WITH (FORMAT csv, HEADER)',
+                file,
+            )
+
+
+@transaction.atomic
+def archive_month_partition(
+    partition: MonthPartition,
+    *,
+    dump_dir: Path | None = None,
+) -> Path | None:
+    """
+    Detach the partition from its table, so queries of the table do not
+    touch it. With ``dump_dir`` its rows are written to a gzipped CSV file
+    there and the partition is dropped.
+
+    Returns:
+        Path of the dump file if the partition was dumped.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'ALTER TABLE "{partition.table_name}"'
+            f' DETACH PARTITION "{partition.name}"'
+        )
+    if dump_dir is None:
+        return None
+
+    file_path = dump_dir / f"{partition.name}.csv.gz"
+    dump_table(partition.name, file_path)
+    with connection.cursor() as cursor:
+        cursor.execute(f'DROP TABLE "{partition.name}"')
+    return file_path
@@ -1,19 +1,28 @@
 import datetime
+from collections import defaultdict
 from collections.abc import Iterable
 from dataclasses import dataclass
 
 import pendulum
+from django.db.models import BooleanField, ExpressionWrapper, Q
+from django.db.models.functions import TruncMonth
 
+from core.profiling import profiled
 from shifts.models import Shift
 
 __all__ = (
     "Period",
+    "get_report_period",
     "get_report_periods_of_dates",
     "get_shift_dates_of_staff",
+    "get_report_periods_of_staff",
     "StaffReportPeriods",
+    "StaffListReportPeriods",
     "StaffReportPeriodsReadInteractor",
+    "StaffListReportPeriodsReadInteractor",
 )
 
+from staff.models import Staff
 from staff.selectors import ensure_staff_exists
 
 
@@ -39,6 +48,32 @@ class StaffReportPeriods:
     periods: list[Period]
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
+class StaffListReportPeriods:
+    staff_list: list[StaffReportPeriods]
+    missing_staff_ids: list[int]
+
+
+def get_report_period(
+    *,
+    year: int,
+    month: int,
+    is_first_half_of_month: bool,
+) -> Period:
+    """
+    Get report period: either 1-15 days of month or 16-last days of month.
+    """
+    if is_first_half_of_month:
+        return Period(
+            from_date=pendulum.date(year, month, 1),
+            to_date=pendulum.date(year, month, 15),
+        )
+    return Period(
+        from_date=pendulum.date(year, month, 16),
+        to_date=pendulum.date(year, month, 1).end_of("month"),
+    )
+
+
 def get_report_periods_of_dates(dates: Iterable[datetime.date]) -> list[Period]:
     """
     Generates an array of unique periods that at least one date belongs to.
@@ -49,43 +84,104 @@ def get_report_periods_of_dates(dates: Iterable[datetime.date]) -> list[Period]:
     Returns:
         list[Period]: Array of unique periods covering at least one date.
     """
-    periods: set[Period] = set()
+    periods: set[Period] = {
+        get_report_period(
+            year=date.year,
+            month=date.month,
+            is_first_half_of_month=date.day <= 15,
+        )
+        for date in dates
+    }
+    return sorted(periods)
 
-    dates = [pendulum.instance(date) for date in dates]
 
-    for date in dates:
-        is_first_half_of_month = date.day <= 15
-        if is_first_half_of_month:
-            period = Period(
-                from_date=pendulum.date(date.year, date.month, 1),
-                to_date=pendulum.date(date.year, date.month, 15),
-            )
-        else:
-            next_month = date.add(months=1)
-            last_day = next_month.start_of("month").subtract(days=1)
-            period = Period(
-                from_date=pendulum.date(date.year, date.month, 16),
-                to_date=last_day,
-            )
+def get_shift_dates_of_staff(staff_id: int) -> tuple[datetime.date, ...]:
+    return tuple(Shift.objects.filter(staff_id=staff_id).values_list("date", flat=True))
 
-        periods.add(period)
 
-    return sorted(periods)
+def get_report_periods_of_staff(
+    staff_ids: Iterable[int],
+) -> dict[int, list[Period]]:
+    """
+    Get report periods of staff members based on their shifts.
 
+    Shifts are bucketed by month and month half in the database,
+    so only distinct buckets are fetched instead of every shift date.
 
-def get_shift_dates_of_staff(staff_id: int) -> tuple[datetime.date, ...]:
-    return tuple(Shift.objects.filter(staff_id=staff_id).values_list("date", flat=True))
+    Args:
+        staff_ids: IDs of staff members.
+
+    Returns:
+        Sorted report periods by staff ID.
+    """
+    buckets = (
+        Shift.objects.filter(staff_id__in=staff_ids)
+        .annotate(
+            month=TruncMonth("date"),
+            is_first_half_of_month=ExpressionWrapper(
+                Q(date__day__lte=15),
+                output_field=BooleanField(),
+            ),
+        )
+        .values_list("staff_id", "month", "is_first_half_of_month")
+        .distinct()
+        .order_by("staff_id", "month", "-is_first_half_of_month")
+    )
+
+    staff_id_to_periods: dict[int, list[Period]] = defaultdict(list)
+    for staff_id, month, is_first_half_of_month in buckets:
+        staff_id_to_periods[staff_id].append(
+            get_report_period(
+                year=month.year,
+                month=month.month,
+                is_first_half_of_month=is_first_half_of_month,
+            )
+        )
+    return staff_id_to_periods
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
 class StaffReportPeriodsReadInteractor:
     staff_id: int
 
+    @profiled
     def execute(self) -> StaffReportPeriods:
         ensure_staff_exists(self.staff_id)
-        shift_dates = get_shift_dates_of_staff(self.staff_id)
-        report_periods = get_report_periods_of_dates(shift_dates)
+        staff_id_to_periods = get_report_periods_of_staff([self.staff_id])
         return StaffReportPeriods(
             staff_id=self.staff_id,
-            periods=report_periods,
+            periods=staff_id_to_periods[self.staff_id],
+        )
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class StaffListReportPeriodsReadInteractor:
+    """
+    Read report periods of many staff members at once.
+
+    Args:
+        staff_ids: IDs of staff members.
+    """
+
+    staff_ids: Iterable[int]
+
+    @profiled
+    def execute(self) -> StaffListReportPeriods:
+        staff_ids = list(dict.fromkeys(self.staff_ids))
+        existing_staff_ids = set(
+            Staff.objects.filter(id__in=staff_ids).values_list("id", flat=True)
+        )
+        staff_id_to_periods = get_report_periods_of_staff(existing_staff_ids)
+        return StaffListReportPeriods(
+            staff_list=[
+                StaffReportPeriods(
+                    staff_id=staff_id,
+                    periods=staff_id_to_periods[staff_id],
+                )
+                for staff_id in staff_ids
+                if staff_id in existing_staff_ids
+            ],
+            missing_staff_ids=[
+                staff_id for staff_id in staff_ids if staff_id not in existing_staff_ids
+            ],
         )
@@ -1,13 +1,19 @@
 from .confirm import ShiftConfirmInteractor
 from .create import (
+    ShiftBulkCreateInteractor,
     ShiftExtraCreateInteractor,
     ShiftRegularCreateInteractor,
     ShiftTestCreateInteractor,
 )
-from .dead_souls import DeadSoulsReadInteractor
+from .dead_souls import DeadSoulsForMonthsReadInteractor, DeadSoulsReadInteractor
 from .delete import ShiftDeleteByIdInteractor, ShiftsDeleteOnStaffBanInteractor
 from .finish import ShiftFinishInteractor, ShiftSummaryInteractor
 from .months import StaffShiftsMonthListInteractor
+from .notifications import (
+    send_finish_shift_reminders,
+    send_shift_finish_reports,
+    send_start_shift_reminders,
+)
 from .read import (
     get_current_shift_date,
     get_shifts_by_staff_id,
@@ -21,6 +27,8 @@ __all__ = (
     "ShiftsDeleteOnStaffBanInteractor",
     "ShiftDeleteByIdInteractor",
     "DeadSoulsReadInteractor",
+    "DeadSoulsForMonthsReadInteractor",
+    "ShiftBulkCreateInteractor",
     "ShiftExtraCreateInteractor",
     "ShiftRegularCreateInteractor",
     "ShiftTestCreateInteractor",
@@ -33,4 +41,7 @@ __all__ = (
     "ShiftStartInteractor",
     "ShiftConfirmInteractor",
     "StaffShiftsMonthListInteractor",
+    "send_start_shift_reminders",
+    "send_finish_shift_reminders",
+    "send_shift_finish_reports",
 )
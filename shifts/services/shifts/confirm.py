@@ -2,6 +2,7 @@ from dataclasses import dataclass
 
 from django.utils import timezone
 
+from core.profiling import profiled
 from shifts.exceptions import ShiftAlreadyConfirmedError, ShiftNotFoundError
 from shifts.models import Shift
 
@@ -16,6 +17,7 @@ class ShiftConfirmResult:
 class ShiftConfirmInteractor:
     shift_id: int
 
+    @profiled
     def execute(self) -> ShiftConfirmResult:
         try:
             shift = Shift.objects.get(id=self.shift_id)
@@ -1,9 +1,11 @@
+from .bulk import ShiftBulkCreateInteractor
 from .extra_shift import ShiftExtraCreateInteractor
 from .regular_shift import ShiftRegularCreateInteractor
 from .test_shift import ShiftTestCreateInteractor
 
 
 __all__ = (
+    "ShiftBulkCreateInteractor",
     "ShiftExtraCreateInteractor",
     "ShiftRegularCreateInteractor",
     "ShiftTestCreateInteractor",
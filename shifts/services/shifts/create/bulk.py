@@ -0,0 +1,236 @@
+import datetime
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from typing import Final, TypeAlias, TypedDict, TypeVar
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from core.profiling import profiled
+from economics.services.reports.snapshots import invalidate_report_snapshots
+from shifts.models import Shift
+from shifts.selectors import invalidate_staff_active_shift
+from staff.models import Staff
+
+
+__all__ = (
+    "SHIFTS_CHUNK_SIZE",
+    "StaffIdAndDateTypedDict",
+    "StaffIdAndDate",
+    "CreatedShift",
+    "ShiftsBulkCreateResult",
+    "chunked",
+    "get_existing_shift_keys",
+    "get_existing_shifts",
+    "ShiftBulkCreateInteractor",
+)
+
+T = TypeVar("T")
+
+SHIFTS_CHUNK_SIZE: Final[int] = 1000
+
+
+class StaffIdAndDateTypedDict(TypedDict):
+    staff_id: int
+    date: datetime.date
+
+
+StaffIdAndDate: TypeAlias = tuple[int, datetime.date]
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CreatedShift:
+    id: int
+    staff_id: int
+    date: datetime.date
+    created_at: datetime.datetime
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ShiftsBulkCreateResult:
+    missing_staff_ids: tuple[int, ...]
+    created_shifts: list[CreatedShift]
+    conflict_shifts: list[StaffIdAndDateTypedDict]
+
+
+def chunked(items: Sequence[T], size: int) -> Iterator[Sequence[T]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def get_existing_shifts(
+    shift_keys: Iterable[StaffIdAndDate],
+    *,
+    is_test: bool,
+) -> list[CreatedShift]:
+    """
+    Get shifts matching any of the given (staff_id, date) pairs.
+
+    Pairs are passed as two arrays and joined via ``unnest`` instead of
+    one ``OR`` clause per pair, so the statement and its plan stay the
+    same size no matter how many pairs are checked.
+
+    Args:
+        shift_keys: (staff_id, date) pairs to look up.
+
+    Keyword Args:
+        is_test: whether to look up test or non-test shifts.
+
+    Returns:
+        Existing shifts matching the pairs.
+    """
+    shift_keys = list(set(shift_keys))
+    if not shift_keys:
+        return []
+
+    table_name = connection.ops.quote_name(Shift._meta.db_table)
+    query = f"""
+        SELECT shift.id, shift.staff_id, shift.date, shift.created_at
+        FROM {table_name} AS shift
+        JOIN unnest(%s::bigint[], %s::date[]) AS expected(staff_id, date)
+            ON shift.staff_id = expected.staff_id
+            AND shift.date = expected.date
+        WHERE shift.is_test = %s
+    """
+
+    existing_shifts: list[CreatedShift] = []
+    with connection.cursor() as cursor:
+        for chunk in chunked(shift_keys, SHIFTS_CHUNK_SIZE * 10):
+            staff_ids = [staff_id for staff_id, _ in chunk]
+            dates = [date for _, date in chunk]
+            cursor.execute(query, [staff_ids, dates, is_test])
+            existing_shifts += [
+                CreatedShift(
+                    id=shift_id,
+                    staff_id=staff_id,
+                    date=date,
+                    created_at=created_at,
+                )
+                for shift_id, staff_id, date, created_at in cursor.fetchall()
+            ]
+    return existing_shifts
+
+
+def get_existing_shift_keys(
+    shift_keys: Iterable[StaffIdAndDate],
+    *,
+    is_test: bool,
+) -> set[StaffIdAndDate]:
+    return {
+        (shift.staff_id, shift.date)
+        for shift in get_existing_shifts(shift_keys, is_test=is_test)
+    }
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ShiftBulkCreateInteractor:
+    """
+    Schedule shifts of any type for many staff members at once.
+
+    Shifts of missing staff are skipped, shifts conflicting with
+    existing ones are reported back, and the rest are inserted in chunks.
+    Test shifts replace the previous test shift of the staff member,
+    so only the latest date per staff member is kept.
+
+    Args:
+        shifts: staff IDs and dates of shifts to create.
+        shift_type: type of all shifts to create.
+    """
+
+    shifts: list[StaffIdAndDateTypedDict]
+    shift_type: Shift.Type
+
+    def get_missing_staff_ids(self) -> tuple[int, ...]:
+        staff_ids = {shift["staff_id"] for shift in self.shifts}
+        existing_staff_ids = set(
+            Staff.objects.filter(id__in=staff_ids).values_list("id", flat=True)
+        )
+        return tuple(staff_ids - existing_staff_ids)
+
+    def get_expected_shift_keys(
+        self,
+        missing_staff_ids: Iterable[int],
+    ) -> tuple[list[StaffIdAndDate], list[StaffIdAndDate]]:
+        missing_staff_ids = set(missing_staff_ids)
+        shift_keys: list[StaffIdAndDate] = list(
+            dict.fromkeys(
+                (shift["staff_id"], shift["date"])
+                for shift in self.shifts
+                if shift["staff_id"] not in missing_staff_ids
+            )
+        )
+        if self.shift_type != Shift.Type.TEST:
+            return shift_keys, []
+
+        staff_id_to_date: dict[int, datetime.date] = {}
+        for staff_id, date in shift_keys:
+            staff_id_to_date[staff_id] = max(date, staff_id_to_date.get(staff_id, date))
+        expected = list(staff_id_to_date.items())
+        expected_keys = set(expected)
+        superseded = [key for key in shift_keys if key not in expected_keys]
+        return expected, superseded
+
+    def build_shift(self, staff_id: int, date: datetime.date) -> Shift:
+        now = timezone.now()
+        return Shift(
+            staff_id=staff_id,
+            date=date,
+            is_extra=self.shift_type == Shift.Type.EXTRA,
+            is_test=self.shift_type == Shift.Type.TEST,
+            confirmed_at=None if self.shift_type == Shift.Type.REGULAR else now,
+            created_at=now,
+        )
+
+    @profiled
+    @transaction.atomic
+    def execute(self) -> ShiftsBulkCreateResult:
+        missing_staff_ids = self.get_missing_staff_ids()
+        expected_shift_keys, conflict_shift_keys = self.get_expected_shift_keys(
+            missing_staff_ids,
+        )
+        is_test = self.shift_type == Shift.Type.TEST
+
+        if is_test:
+            staff_ids = {staff_id for staff_id, _ in expected_shift_keys}
+            Shift.objects.filter(staff_id__in=staff_ids, is_test=True).delete()
+            # Deleted test shift may be the cached active shift.
+            for staff_id in staff_ids:
+                invalidate_staff_active_shift(staff_id)
+        else:
+            existing_shift_keys = get_existing_shift_keys(
+                expected_shift_keys,
+                is_test=False,
+            )
+            conflict_shift_keys = [
+                key for key in expected_shift_keys if key in existing_shift_keys
+            ]
+            expected_shift_keys = [
+                key for key in expected_shift_keys if key not in existing_shift_keys
+            ]
+
+        # Conflicts are already filtered out, but a concurrent request may
+        # still insert the same shift, so rows violating the unique
+        # constraint are skipped instead of failing the whole batch.
+        Shift.objects.bulk_create(
+            [
+                self.build_shift(staff_id, date)
+                for staff_id, date in expected_shift_keys
+            ],
+            batch_size=SHIFTS_CHUNK_SIZE,
+            ignore_conflicts=True,
+        )
+        # PostgreSQL does not return IDs of rows inserted with
+        # ignore_conflicts, so they are read back in one query.
+        created_shifts = get_existing_shifts(expected_shift_keys, is_test=is_test)
+        created_shifts.sort(key=lambda shift: (shift.staff_id, shift.date))
+        # Bulk inserts do not send signals snapshots are invalidated on.
+        invalidate_report_snapshots(shift.date for shift in created_shifts)
+
+        return ShiftsBulkCreateResult(
+            missing_staff_ids=missing_staff_ids,
+            created_shifts=created_shifts,
+            conflict_shifts=[
+                {"staff_id": staff_id, "date": date}
+                for staff_id, date in conflict_shift_keys
+            ],
+        )
@@ -1,23 +1,21 @@
-import datetime
-import functools
-import operator
 from collections.abc import Iterable
 from dataclasses import dataclass
-from typing import TypeAlias, TypedDict
-
-from django.db.models import Q, QuerySet
-from django.utils import timezone
 
+from core.profiling import profiled
 from shifts.models import Shift
+from shifts.services.shifts.create.bulk import (
+    CreatedShift,
+    ShiftBulkCreateInteractor,
+    ShiftsBulkCreateResult,
+    StaffIdAndDate,
+    StaffIdAndDateTypedDict,
+    get_existing_shift_keys,
+)
 from staff.models import Staff
 
 
-class StaffIdAndDateTypedDict(TypedDict):
-    staff_id: int
-    date: datetime.date
-
-
-StaffIdAndDate: TypeAlias = tuple[int, datetime.date]
+CreatedExtraShift = CreatedShift
+ExtraShiftsCreateResult = ShiftsBulkCreateResult
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -26,39 +24,13 @@ class ConflictAndNonConflictShifts:
     non_conflict_shifts: list[StaffIdAndDateTypedDict]
 
 
-@dataclass(frozen=True, slots=True, kw_only=True)
-class CreatedExtraShift:
-    id: int
-    staff_id: int
-    date: datetime.date
-    created_at: datetime.datetime
-
-
-@dataclass(frozen=True, slots=True, kw_only=True)
-class ExtraShiftsCreateResult:
-    missing_staff_ids: tuple[int, ...]
-    created_shifts: list[CreatedExtraShift]
-    conflict_shifts: list[StaffIdAndDateTypedDict]
-
-
 def separate_conflict_non_test_shifts(
     shifts: Iterable[StaffIdAndDateTypedDict],
 ) -> ConflictAndNonConflictShifts:
     expected_shifts: set[StaffIdAndDate] = {
         (shift["staff_id"], shift["date"]) for shift in shifts
     }
-    filters = functools.reduce(
-        operator.or_,
-        [Q(staff_id=staff_id, date=date) for staff_id, date in expected_shifts],
-        Q(),
-    )
-
-    existing_shifts: QuerySet[Shift | dict] = Shift.objects.filter(
-        filters, is_test=False
-    ).values("staff_id", "date")
-    existing_shifts: set[StaffIdAndDate] = {
-        (shift["staff_id"], shift["date"]) for shift in existing_shifts
-    }
+    existing_shifts = get_existing_shift_keys(expected_shifts, is_test=False)
 
     conflict_shifts = expected_shifts.intersection(existing_shifts)
     non_conflict_shifts = expected_shifts - conflict_shifts
@@ -99,43 +71,9 @@ def separate_staff_by_existence(
 class ShiftExtraCreateInteractor:
     shifts: list[StaffIdAndDateTypedDict]
 
-    def get_shifts_of_staff(
-        self,
-        staff_ids: Iterable[int],
-    ) -> list[StaffIdAndDateTypedDict]:
-        staff_ids = set(staff_ids)
-        return [shift for shift in self.shifts if shift["staff_id"] in staff_ids]
-
+    @profiled
     def execute(self) -> ExtraShiftsCreateResult:
-        staff_ids = [shift["staff_id"] for shift in self.shifts]
-        separated_staff = separate_staff_by_existence(staff_ids)
-        shifts_of_existing_staff = self.get_shifts_of_staff(
-            separated_staff.existing_staff_ids,
-        )
-        separated_shifts = separate_conflict_non_test_shifts(
-            shifts=shifts_of_existing_staff
-        )
-        shifts_to_create = [
-            Shift(
-                staff_id=shift["staff_id"],
-                date=shift["date"],
-                is_extra=True,
-                confirmed_at=timezone.now(),
-            )
-            for shift in separated_shifts.non_conflict_shifts
-        ]
-        created_shifts = Shift.objects.bulk_create(shifts_to_create)
-        created_shifts = [
-            CreatedExtraShift(
-                id=shift.id,
-                staff_id=shift.staff_id,
-                date=shift.date,
-                created_at=shift.created_at,
-            )
-            for shift in created_shifts
-        ]
-        return ExtraShiftsCreateResult(
-            created_shifts=created_shifts,
-            missing_staff_ids=separated_staff.missing_staff_ids,
-            conflict_shifts=separated_shifts.conflict_shifts,
-        )
+        return ShiftBulkCreateInteractor(
+            shifts=self.shifts,
+            shift_type=Shift.Type.EXTRA,
+        ).execute()
@@ -2,8 +2,10 @@ import datetime
 from collections.abc import Iterable
 from dataclasses import dataclass
 
+from core.profiling import profiled
 from shifts.exceptions import ShiftAlreadyExistsError
 from shifts.models import Shift
+from shifts.services.shifts.create.bulk import SHIFTS_CHUNK_SIZE
 from staff.models import Staff
 
 
@@ -63,7 +65,6 @@ def validate_conflict_shift_dates(
         staff_id=staff_id,
         expected_dates=expected_dates,
     )
-    print(existing_shift_dates, set(expected_dates))
     conflict_dates = set(expected_dates).intersection(existing_shift_dates)
     if conflict_dates:
         raise ShiftAlreadyExistsError(conflict_dates=conflict_dates)
@@ -82,6 +83,7 @@ class ShiftRegularCreateInteractor:
     staff: Staff
     dates: Iterable[datetime.date]
 
+    @profiled
     def execute(self) -> ShiftsCreateResult:
         """
         Raises:
@@ -96,7 +98,10 @@ class ShiftRegularCreateInteractor:
         )
 
         shifts_to_create = [Shift(staff=self.staff, date=date) for date in self.dates]
-        shifts = Shift.objects.bulk_create(shifts_to_create)
+        shifts = Shift.objects.bulk_create(
+            shifts_to_create,
+            batch_size=SHIFTS_CHUNK_SIZE,
+        )
 
         shifts = [ShiftItem(id=shift.id, date=shift.date) for shift in shifts]
         return ShiftsCreateResult(
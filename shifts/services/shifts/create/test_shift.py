@@ -4,7 +4,9 @@ from dataclasses import dataclass
 from django.db import transaction
 from django.utils import timezone
 
+from core.profiling import profiled
 from shifts.models import Shift
+from shifts.selectors import invalidate_staff_active_shift
 from staff.models import Staff
 
 
@@ -30,9 +32,11 @@ class ShiftTestCreateInteractor:
     staff: Staff
     date: datetime.date
 
+    @profiled
     @transaction.atomic
     def execute(self) -> ShiftTestCreateResult:
         Shift.objects.filter(staff_id=self.staff.id, is_test=True).delete()
+        invalidate_staff_active_shift(self.staff.id)
         shift = Shift(
             staff_id=self.staff.id,
             date=self.date,
@@ -1,8 +1,13 @@
+import functools
+import operator
 from collections.abc import Iterable
 from dataclasses import dataclass
 
-from django.db.models import Count, Q
+from django.db.models import Count, FilteredRelation, Q
 
+from core.profiling import profiled
+from core.replica import using_replica
+from core.services import get_month_date_range
 from shifts.exceptions import MonthNotAvailableError
 from shifts.models import AvailableDate
 from staff.models import Staff
@@ -21,13 +26,19 @@ class DeadSoulsForMonth:
     staff_list: list[StaffIdAndName]
 
 
-def map_dict_to_staff_id_and_name(
-    staff_list: Iterable[dict],
-) -> list[StaffIdAndName]:
-    return [
-        StaffIdAndName(id=staff["id"], full_name=staff["full_name"])
-        for staff in staff_list
-    ]
+@dataclass(frozen=True, slots=True, kw_only=True)
+class StaffMonthShiftCounts:
+    staff: StaffIdAndName
+    all_shift_count: int
+    test_shift_count: int
+
+    @property
+    def has_no_shifts(self) -> bool:
+        return self.all_shift_count == 0
+
+    @property
+    def has_only_one_test_shift(self) -> bool:
+        return self.all_shift_count == 1 and self.test_shift_count == 1
 
 
 def ensure_month_is_available(*, month: int, year: int) -> None:
@@ -35,28 +46,143 @@ def ensure_month_is_available(*, month: int, year: int) -> None:
         raise MonthNotAvailableError(month=month, year=year)
 
 
+def ensure_months_are_available(months: Iterable[tuple[int, int]]) -> None:
+    """
+    Args:
+        months: pairs of (year, month).
+
+    Raises:
+        MonthNotAvailableError: If any of months is not available.
+    """
+    months = set(months)
+    if not months:
+        return
+    available_months = set(
+        AvailableDate.objects.filter(
+            functools.reduce(
+                operator.or_,
+                [Q(year=year, month=month) for year, month in months],
+            )
+        ).values_list("year", "month")
+    )
+    not_available_months = sorted(months - available_months)
+    if not_available_months:
+        year, month = not_available_months[0]
+        raise MonthNotAvailableError(month=month, year=year)
+
+
+@using_replica()
+def get_staff_month_shift_counts(
+    months: Iterable[tuple[int, int]],
+) -> dict[tuple[int, int], list[StaffMonthShiftCounts]]:
+    """
+    Count all and test shifts of each not banned staff member per month.
+
+    Everything is computed in a single query: shifts are joined with
+    a date range condition (so the staff_id + date index can be used)
+    and counted per month with conditional aggregation. Only staff who
+    are "dead souls" in at least one of the months are returned.
+
+    Args:
+        months: pairs of (year, month).
+
+    Returns:
+        Shift counts of staff grouped by (year, month).
+    """
+    months = list(dict.fromkeys(months))
+    if not months:
+        return {}
+
+    month_date_ranges = [
+        get_month_date_range(year=year, month=month) for year, month in months
+    ]
+    month_shifts_condition = functools.reduce(
+        operator.or_,
+        [
+            Q(shift__date__gte=from_date, shift__date__lt=to_date)
+            for from_date, to_date in month_date_ranges
+        ],
+    )
+
+    annotations = {}
+    dead_soul_conditions = []
+    for index, (from_date, to_date) in enumerate(month_date_ranges):
+        in_month = Q(
+            month_shifts__date__gte=from_date,
+            month_shifts__date__lt=to_date,
+        )
+        all_shift_count = f"all_shift_count_{index}"
+        test_shift_count = f"test_shift_count_{index}"
+        annotations[all_shift_count] = Count("month_shifts", filter=in_month)
+        annotations[test_shift_count] = Count(
+            "month_shifts",
+            filter=in_month & Q(month_shifts__is_test=True),
+        )
+        dead_soul_conditions.append(Q(**{all_shift_count: 0}))
+        dead_soul_conditions.append(Q(**{all_shift_count: 1, test_shift_count: 1}))
+
+    staff_list = (
+        Staff.objects.filter(banned_at__isnull=True)
+        .annotate(
+            month_shifts=FilteredRelation("shift", condition=month_shifts_condition),
+        )
+        .annotate(**annotations)
+        .filter(functools.reduce(operator.or_, dead_soul_conditions))
+        .values("id", "full_name", *annotations)
+        .order_by("id")
+    )
+
+    result: dict[tuple[int, int], list[StaffMonthShiftCounts]] = {
+        month: [] for month in months
+    }
+    for staff in staff_list:
+        staff_id_and_name = StaffIdAndName(id=staff["id"], full_name=staff["full_name"])
+        for index, month in enumerate(months):
+            result[month].append(
+                StaffMonthShiftCounts(
+                    staff=staff_id_and_name,
+                    all_shift_count=staff[f"all_shift_count_{index}"],
+                    test_shift_count=staff[f"test_shift_count_{index}"],
+                )
+            )
+    return result
+
+
+def get_dead_souls_for_months(
+    months: Iterable[tuple[int, int]],
+) -> list[DeadSoulsForMonth]:
+    """
+    Get staff without shifts or with only one test shift for each month.
+
+    Args:
+        months: pairs of (year, month).
+    """
+    month_shift_counts = get_staff_month_shift_counts(months)
+    return [
+        DeadSoulsForMonth(
+            month=month,
+            year=year,
+            staff_list=[
+                counts.staff
+                for counts in staff_counts
+                if counts.has_no_shifts or counts.has_only_one_test_shift
+            ],
+        )
+        for (year, month), staff_counts in month_shift_counts.items()
+    ]
+
+
 def get_staff_with_one_test_shift(
     *,
     year: int,
     month: int,
 ) -> list[StaffIdAndName]:
-    staff_list = (
-        Staff.objects.filter(
-            banned_at__isnull=True,
-            shift__date__year=year,
-            shift__date__month=month,
-        )
-        .annotate(
-            test_shift_count=Count("shift", filter=Q(shift__is_test=True)),
-            all_shift_count=Count("shift"),
-        )
-        .filter(
-            test_shift_count=1,
-            all_shift_count=1,
-        )
-        .values("id", "full_name")
-    )
-    return map_dict_to_staff_id_and_name(staff_list)
+    month_shift_counts = get_staff_month_shift_counts([(year, month)])
+    return [
+        counts.staff
+        for counts in month_shift_counts[(year, month)]
+        if counts.has_only_one_test_shift
+    ]
 
 
 def get_staff_with_no_shifts(
@@ -64,16 +190,12 @@ def get_staff_with_no_shifts(
     year: int,
     month: int,
 ) -> list[StaffIdAndName]:
-    staff_list = (
-        Staff.objects.filter(banned_at__isnull=True)
-        .exclude(
-            shift__date__year=year,
-            shift__date__month=month,
-        )
-        .distinct("id")
-        .values("id", "full_name")
-    )
-    return map_dict_to_staff_id_and_name(staff_list)
+    month_shift_counts = get_staff_month_shift_counts([(year, month)])
+    return [
+        counts.staff
+        for counts in month_shift_counts[(year, month)]
+        if counts.has_no_shifts
+    ]
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -81,16 +203,27 @@ class DeadSoulsReadInteractor:
     month: int
     year: int
 
-    def execute(self):
+    @profiled
+    def execute(self) -> DeadSoulsForMonth:
         ensure_month_is_available(month=self.month, year=self.year)
+        dead_souls_for_month, *_ = get_dead_souls_for_months(
+            [(self.year, self.month)],
+        )
+        return dead_souls_for_month
 
-        staff_list = {
-            *get_staff_with_no_shifts(month=self.month, year=self.year),
-            *get_staff_with_one_test_shift(month=self.month, year=self.year),
-        }
 
-        return DeadSoulsForMonth(
-            month=self.month,
-            year=self.year,
-            staff_list=list(staff_list),
-        )
+@dataclass(frozen=True, slots=True, kw_only=True)
+class DeadSoulsForMonthsReadInteractor:
+    """
+    Read dead souls for several months (e.g. a quarter) at once.
+
+    Args:
+        months: pairs of (year, month).
+    """
+
+    months: list[tuple[int, int]]
+
+    @profiled
+    def execute(self) -> list[DeadSoulsForMonth]:
+        ensure_months_are_available(self.months)
+        return get_dead_souls_for_months(self.months)
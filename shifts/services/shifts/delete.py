@@ -1,8 +1,10 @@
 import datetime
 from dataclasses import dataclass
 
+from core.profiling import profiled
 from shifts.exceptions import ShiftNotFoundError
 from shifts.models import Shift
+from shifts.selectors import invalidate_staff_active_shift
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -14,12 +16,14 @@ class ShiftsDeleteOnStaffBanInteractor:
     staff_id: int
     from_date: datetime.date
 
+    @profiled
     def execute(self) -> None:
         (
             Shift.objects.filter(
                 staff_id=self.staff_id, date__gte=self.from_date
             ).delete()
         )
+        invalidate_staff_active_shift(self.staff_id)
 
 
 @dataclass(frozen=True, slots=True)
@@ -30,7 +34,14 @@ class ShiftDeleteByIdInteractor:
 
     shift_id: int
 
+    @profiled
     def execute(self) -> None:
-        deleted_count, _ = Shift.objects.filter(id=self.shift_id).delete()
-        if deleted_count == 0:
+        staff_id = (
+            Shift.objects.filter(id=self.shift_id)
+            .values_list("staff_id", flat=True)
+            .first()
+        )
+        if staff_id is None:
             raise ShiftNotFoundError
+        Shift.objects.filter(id=self.shift_id).delete()
+        invalidate_staff_active_shift(staff_id)
@@ -8,8 +8,9 @@ from django.db.models import QuerySet
 from django.utils import timezone
 
 from car_washes.models import CarWash
+from core.profiling import profiled
 from shifts.models import CarToWash, Shift, ShiftFinishPhoto
-from shifts.selectors import has_any_finished_shift
+from shifts.selectors import has_any_finished_shift, invalidate_staff_active_shift
 from shifts.services.cars_to_wash import (
     compute_dry_cleaning_items_count,
     compute_trunk_vacuum_count,
@@ -88,10 +89,12 @@ class ShiftFinishInteractor:
             finish_photo_file_ids=self.__photo_file_ids,
         )
 
+    @profiled
     @transaction.atomic
     def finish_shift(self) -> ShiftFinishResult:
         is_first_shift = not has_any_finished_shift(self.__shift.staff_id)
         self.save_shift_finish_date()
+        invalidate_staff_active_shift(self.__shift.staff_id)
         self.delete_shift_finish_photos()
         self.create_shift_finish_photos()
         return self.create_result(is_first_shift=is_first_shift)
@@ -110,6 +113,7 @@ class ShiftSummaryInteractor:
             shift=self.get_shift()
         )
 
+    @profiled
     def execute(self) -> ShiftSummary:
         shift = self.get_shift()
         cars_to_wash = self.get_cars_to_wash()
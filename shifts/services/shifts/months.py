@@ -3,6 +3,8 @@ from dataclasses import dataclass
 from django.db.models.functions import TruncMonth
 from django.utils import timezone
 
+from core.profiling import profiled
+from core.services import get_month_date_range
 from shifts.models import Shift
 from staff.selectors import ensure_staff_exists
 
@@ -23,14 +25,18 @@ class StaffShiftsMonths:
 class StaffShiftsMonthListInteractor:
     staff_id: int
 
+    @profiled
     def execute(self) -> StaffShiftsMonths:
         ensure_staff_exists(self.staff_id)
         now = timezone.localdate()
+        current_month_start, _ = get_month_date_range(
+            year=now.year,
+            month=now.month,
+        )
         months = (
             Shift.objects.filter(
                 staff_id=self.staff_id,
-                date__month__gte=now.month,
-                date__year__gte=now.year,
+                date__gte=current_month_start,
             )
             .annotate(month_year=TruncMonth("date"))
             .values("month_year")
@@ -0,0 +1,141 @@
+import time
+from typing import TYPE_CHECKING
+
+from core.services import get_current_shift_date
+from shifts.models import Shift
+from shifts.selectors import get_staff_ids_with_active_shift
+from shifts.services.shifts.finish import (
+    CarWashTransferredCarsSummary,
+    ShiftSummary,
+    ShiftSummaryInteractor,
+)
+from shifts.services.shifts.read import (
+    get_staff_ids_with_not_started_shifts_for_today,
+)
+from telegram.services import (
+    try_get_chat_username,
+    try_send_message,
+    try_send_photos_media_group,
+)
+
+
+if TYPE_CHECKING:
+    from telebot import TeleBot
+
+
+__all__ = (
+    "send_start_shift_reminders",
+    "send_finish_shift_reminders",
+    "send_shift_finish_reports",
+)
+
+# Delay between messages to stay within Telegram rate limits.
+MESSAGE_SEND_DELAY: float = 0.1
+
+
+def send_reminders(
+    *,
+    bot: "TeleBot",
+    staff_ids: set[int],
+    text: str,
+) -> dict[int, bool]:
+    staff_id_to_is_sent: dict[int, bool] = {}
+    for staff_id in staff_ids:
+        staff_id_to_is_sent[staff_id] = try_send_message(
+            bot=bot,
+            chat_id=staff_id,
+            text=text,
+        )
+        time.sleep(MESSAGE_SEND_DELAY)
+    return staff_id_to_is_sent
+
+
+def send_start_shift_reminders(bot: "TeleBot") -> dict[int, bool]:
+    """
+    Remind staff who have neither started nor rejected today's shift.
+
+    Returns:
+        Whether the reminder is sent by staff IDs.
+    """
+    return send_reminders(
+        bot=bot,
+        staff_ids=get_staff_ids_with_not_started_shifts_for_today(),
+        text="❗ Не забудьте начать смену на сегодня",
+    )
+
+
+def send_finish_shift_reminders(bot: "TeleBot") -> dict[int, bool]:
+    """
+    Remind staff who have not finished their shifts yet.
+
+    Returns:
+        Whether the reminder is sent by staff IDs.
+    """
+    return send_reminders(
+        bot=bot,
+        staff_ids=get_staff_ids_with_active_shift(),
+        text="❗️ Не забудьте завершить смену",
+    )
+
+
+def format_shift_car_wash_finish_summary(
+    car_wash_summary: CarWashTransferredCarsSummary,
+) -> str:
+    return (
+        f"\nМойка: {car_wash_summary.car_wash_name}"
+        f"\nВсего: {car_wash_summary.total_cars_count}"
+        f"\n🔶 Комфорт: {car_wash_summary.comfort_cars_count}"
+        f"\n🔶 Бизнес: {car_wash_summary.business_cars_count}"
+        f"\n🔶 Фургон: {car_wash_summary.vans_count}"
+        f"\nПлановая мойка: {car_wash_summary.planned_cars_count}"
+        f"\nСрочная мойка: {car_wash_summary.urgent_cars_count}"
+        f"\nХимчистки: {car_wash_summary.dry_cleaning_count}"
+        f"\nПБ: {car_wash_summary.trunk_vacuum_count}"
+        f"\nДолив: {car_wash_summary.refilled_cars_count}"
+        f"\nНедолив: {car_wash_summary.not_refilled_cars_count}"
+    )
+
+
+def format_shift_finish_text(shift_summary: ShiftSummary, username: str | None) -> str:
+    lines: list[str] = []
+    if username is None:
+        lines.append(f"Перегонщик: {shift_summary.staff_full_name}")
+    else:
+        lines.append(f"Перегонщик: {shift_summary.staff_full_name} (@{username})")
+    for car_wash_summary in shift_summary.car_washes:
+        lines.append(format_shift_car_wash_finish_summary(car_wash_summary))
+    if not shift_summary.car_washes:
+        lines.append("\nНет добавленных авто")
+    return "\n".join(lines)
+
+
+def send_shift_finish_reports(*, bot: "TeleBot", chat_id: int) -> dict[int, bool]:
+    """
+    Send reports of shifts finished on the current shift date to the chat.
+
+    Returns:
+        Whether the report is sent by staff IDs.
+    """
+    shifts = Shift.objects.prefetch_related("finish_photos").filter(
+        date=get_current_shift_date(),
+        finished_at__isnull=False,
+    )
+    staff_id_to_is_sent: dict[int, bool] = {}
+    for shift in shifts:
+        shift_summary = ShiftSummaryInteractor(shift_id=shift.id).execute()
+
+        photo_file_ids = [photo.file_id for photo in shift.finish_photos.all()]
+
+        username = try_get_chat_username(
+            bot=bot,
+            chat_id=shift_summary.staff_id,
+        )
+
+        text = format_shift_finish_text(shift_summary, username=username)
+        staff_id_to_is_sent[shift.staff_id] = try_send_photos_media_group(
+            bot=bot,
+            chat_id=chat_id,
+            file_ids=photo_file_ids,
+            caption=text,
+        )
+    return staff_id_to_is_sent
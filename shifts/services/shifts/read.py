@@ -1,6 +1,10 @@
 from django.db.models import QuerySet
 
-from core.services import get_current_shift_date
+from core.services import (
+    get_current_shift_date,
+    get_month_date_range,
+    get_year_date_range,
+)
 from shifts.models import Shift
 
 
@@ -21,8 +25,13 @@ def get_shifts_by_staff_id(
     year: int | None,
 ) -> QuerySet[Shift]:
     shifts = Shift.objects.select_related("car_wash").filter(staff_id=staff_id)
-    if month is not None:
-        shifts = shifts.filter(date__month=month)
-    if year is not None:
-        shifts = shifts.filter(date__year=year)
-    return shifts
+    if month is not None and year is not None:
+        from_date, to_date = get_month_date_range(year=year, month=month)
+    elif year is not None:
+        from_date, to_date = get_year_date_range(year)
+    elif month is not None:
+        # The same month of any year can not be expressed as a single range.
+        return shifts.filter(date__month=month)
+    else:
+        return shifts
+    return shifts.filter(date__gte=from_date, date__lt=to_date)
@@ -1,6 +1,7 @@
 from django.utils import timezone
 
 from shifts.models import Shift
+from shifts.selectors import invalidate_staff_active_shift
 
 
 __all__ = ("mark_shift_as_rejected_now",)
@@ -9,5 +10,11 @@ __all__ = ("mark_shift_as_rejected_now",)
 def mark_shift_as_rejected_now(
     shift_id: int,
 ) -> bool:
-    updated_count = Shift.objects.filter(id=shift_id).update(rejected_at=timezone.now())
-    return bool(updated_count)
+    staff_id = (
+        Shift.objects.filter(id=shift_id).values_list("staff_id", flat=True).first()
+    )
+    if staff_id is None:
+        return False
+    Shift.objects.filter(id=shift_id).update(rejected_at=timezone.now())
+    invalidate_staff_active_shift(staff_id)
+    return True
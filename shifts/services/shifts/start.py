@@ -2,8 +2,10 @@ from dataclasses import dataclass
 
 from django.utils import timezone
 
+from core.profiling import profiled
 from shifts.exceptions import ShiftNotFoundError
 from shifts.models import Shift
+from shifts.selectors import cache_staff_active_shift
 from shifts.services.shifts.validators import (
     ensure_shift_not_finished,
     ensure_staff_has_no_active_shift,
@@ -22,9 +24,10 @@ class ShiftStartResult:
 class ShiftStartInteractor:
     shift_id: int
 
+    @profiled
     def execute(self) -> ShiftStartResult:
         try:
-            shift = Shift.objects.get(id=self.shift_id)
+            shift = Shift.objects.select_related("car_wash").get(id=self.shift_id)
         except Shift.DoesNotExist:
             raise ShiftNotFoundError
 
@@ -35,6 +38,7 @@ class ShiftStartInteractor:
 
         shift.started_at = timezone.now()
         shift.save(update_fields=("started_at",))
+        cache_staff_active_shift(shift)
 
         return ShiftStartResult(
             id=shift.id,
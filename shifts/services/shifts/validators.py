@@ -11,9 +11,12 @@ from shifts.exceptions import (
     StaffHasActiveShiftError,
 )
 from shifts.models import Shift
+from shifts.selectors import get_cached_staff_active_shift
 
 
 def ensure_staff_has_no_active_shift(staff_id: int) -> None:
+    if get_cached_staff_active_shift(staff_id) is not None:
+        raise StaffHasActiveShiftError
     if Shift.objects.filter(
         staff_id=staff_id,
         started_at__isnull=False,
@@ -3,6 +3,7 @@ from collections import defaultdict
 from dataclasses import dataclass
 from uuid import UUID
 
+from core.profiling import profiled
 from shifts.models import CarToWash, CarToWashAdditionalService
 from shifts.selectors import get_shift_by_id
 
@@ -41,12 +42,13 @@ class TransferredCarListResponseData:
 class TransferredCarListInteractor:
     shift_id: int
 
+    @profiled
     def execute(self) -> TransferredCarListResponseData:
         shift = get_shift_by_id(self.shift_id)
 
         transferred_cars = (
             CarToWash.objects.select_related("shift__staff", "car_wash")
-            .filter(shift_id=self.shift_id)
+            .filter(shift_id=self.shift_id, shift_date=shift.date)
             .only(
                 "id",
                 "number",
@@ -63,7 +65,7 @@ class TransferredCarListInteractor:
         )
         additional_services = (
             CarToWashAdditionalService.objects.select_related("service")
-            .filter(car__shift_id=self.shift_id)
+            .filter(shift_id=self.shift_id, shift_date=shift.date)
             .only("car_id", "service_id", "service__name", "count")
         )
 
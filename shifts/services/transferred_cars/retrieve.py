@@ -2,6 +2,7 @@ import datetime
 from dataclasses import dataclass
 from uuid import UUID
 
+from core.profiling import profiled
 from shifts.exceptions import CarToWashNotFoundError
 from shifts.models import CarToWash, CarToWashAdditionalService
 
@@ -35,6 +36,7 @@ class TransferredCarRetrieveResponseData:
 class TransferredCarRetrieveInteractor:
     transferred_car_id: int
 
+    @profiled
     def execute(self) -> TransferredCarRetrieveResponseData:
         try:
             transferred_car = (
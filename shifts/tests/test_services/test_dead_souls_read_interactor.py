@@ -3,8 +3,12 @@ import datetime
 import pytest
 from django.utils import timezone
 
+from shifts.exceptions import MonthNotAvailableError
 from shifts.models import AvailableDate
-from shifts.services.shifts import DeadSoulsReadInteractor
+from shifts.services.shifts import (
+    DeadSoulsForMonthsReadInteractor,
+    DeadSoulsReadInteractor,
+)
 from shifts.tests.factories import AvailableDateFactory, ShiftFactory
 from staff.tests.factories import StaffFactory
 
@@ -69,3 +73,46 @@ def test_staff_banned(available_date):
     staff_without_shifts = interactor.execute()
 
     assert not staff_without_shifts.staff_list
+
+
+@pytest.mark.django_db
+def test_dead_souls_for_quarter_in_single_query(django_assert_num_queries):
+    for month in (1, 2, 3):
+        AvailableDateFactory(month=month, year=2025)
+    staff_without_shifts = StaffFactory()
+    staff_with_test_shift = StaffFactory()
+    staff_with_shifts = StaffFactory()
+    ShiftFactory(
+        staff=staff_with_test_shift,
+        date=datetime.date(2025, 2, 10),
+        is_test=True,
+    )
+    for month in (1, 2, 3):
+        ShiftFactory(staff=staff_with_shifts, date=datetime.date(2025, month, 1))
+    ShiftFactory(staff=staff_with_test_shift, date=datetime.date(2025, 3, 31))
+
+    # available months check and dead souls themselves
+    with django_assert_num_queries(2):
+        dead_souls = DeadSoulsForMonthsReadInteractor(
+            months=[(2025, 1), (2025, 2), (2025, 3)],
+        ).execute()
+
+    staff_ids_by_month = {
+        dead_souls_for_month.month: {
+            staff.id for staff in dead_souls_for_month.staff_list
+        }
+        for dead_souls_for_month in dead_souls
+    }
+    assert staff_ids_by_month == {
+        1: {staff_without_shifts.id, staff_with_test_shift.id},
+        2: {staff_without_shifts.id, staff_with_test_shift.id},
+        3: {staff_without_shifts.id},
+    }
+
+
+@pytest.mark.django_db
+def test_dead_souls_for_months_with_not_available_month(available_date):
+    with pytest.raises(MonthNotAvailableError):
+        DeadSoulsForMonthsReadInteractor(
+            months=[(2025, 1), (2025, 2)],
+        ).execute()
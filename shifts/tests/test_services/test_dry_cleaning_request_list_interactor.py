@@ -0,0 +1,93 @@
+import datetime
+
+import pytest
+
+from car_washes.tests.factories import CarWashServiceFactory
+from dry_cleaning.models import (
+    DryCleaningRequest,
+    DryCleaningRequestPhoto,
+    DryCleaningRequestService,
+)
+from shifts.services import DryCleaningRequestListInteractor
+from shifts.tests.factories import ShiftFactory
+
+
+def create_dry_cleaning_request(
+    *,
+    shift,
+    status: int = DryCleaningRequest.Status.PENDING,
+) -> DryCleaningRequest:
+    request = DryCleaningRequest.objects.create(
+        shift=shift,
+        car_number="А123БВ456",
+        status=status,
+    )
+    DryCleaningRequestService.objects.create(
+        request=request,
+        service=CarWashServiceFactory(),
+        count=1,
+    )
+    DryCleaningRequestPhoto.objects.create(
+        request=request,
+        url="https://example.com/photo.jpg",
+    )
+    return request
+
+
+@pytest.mark.django_db
+def test_dry_cleaning_requests_paginated_by_cursor():
+    shift = ShiftFactory()
+    requests = [create_dry_cleaning_request(shift=shift) for _ in range(5)]
+    expected_ids = [request.id for request in reversed(requests)]
+
+    first_page = DryCleaningRequestListInteractor(limit=3).execute()
+    second_page = DryCleaningRequestListInteractor(
+        limit=3,
+        cursor=first_page.next_cursor,
+    ).execute()
+
+    assert [item.id for item in first_page.dry_cleaning_requests] == (expected_ids[:3])
+    assert not first_page.is_end_of_list_reached
+    assert first_page.next_cursor == expected_ids[2]
+    assert [item.id for item in second_page.dry_cleaning_requests] == (expected_ids[3:])
+    assert second_page.is_end_of_list_reached
+    assert second_page.next_cursor is None
+
+
+@pytest.mark.django_db
+def test_dry_cleaning_requests_filtered():
+    shift = ShiftFactory(date=datetime.date(2025, 3, 10))
+    other_shift = ShiftFactory(date=datetime.date(2025, 4, 10))
+    expected = create_dry_cleaning_request(shift=shift)
+    create_dry_cleaning_request(
+        shift=shift,
+        status=DryCleaningRequest.Status.APPROVED,
+    )
+    create_dry_cleaning_request(shift=other_shift)
+
+    page = DryCleaningRequestListInteractor(
+        staff_ids=[shift.staff_id],
+        statuses=[DryCleaningRequest.Status.PENDING],
+        from_date=datetime.date(2025, 3, 1),
+        to_date=datetime.date(2025, 3, 31),
+    ).execute()
+
+    assert [item.id for item in page.dry_cleaning_requests] == [expected.id]
+    assert page.is_end_of_list_reached
+
+
+@pytest.mark.django_db
+def test_dry_cleaning_requests_read_with_constant_query_count(
+    django_assert_num_queries,
+):
+    shift = ShiftFactory()
+    for _ in range(10):
+        create_dry_cleaning_request(shift=shift)
+
+    # requests page, services and photos of the page
+    with django_assert_num_queries(3):
+        page = DryCleaningRequestListInteractor(limit=5).execute()
+
+    assert len(page.dry_cleaning_requests) == 5
+    assert all(len(item.services) == 1 for item in page.dry_cleaning_requests)
+    assert all(len(item.photo_urls) == 1 for item in page.dry_cleaning_requests)
@@ -0,0 +1,89 @@
+import datetime
+
+import pytest
+from django.db import connection
+
+from shifts.models import Shift
+from shifts.services import get_shifts_by_staff_id
+from shifts.tests.factories import ShiftFactory
+from staff.tests.factories import StaffFactory
+
+
+@pytest.fixture
+def staff_shifts():
+    staff = StaffFactory()
+    dates = (
+        datetime.date(2024, 12, 31),
+        datetime.date(2025, 1, 1),
+        datetime.date(2025, 1, 31),
+        datetime.date(2025, 2, 1),
+        datetime.date(2026, 1, 15),
+    )
+    return [ShiftFactory(staff=staff, date=date) for date in dates]
+
+
+def explain(queryset) -> str:
+    sql, params = queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        # Tables in tests are tiny, so force the planner to show whether
+        # the (staff_id, date, is_test) index is usable at all.
+        cursor.execute("SET LOCAL enable_seqscan = off")
+        cursor.execute(f"EXPLAIN {sql}", params)
+        return "\n".join(row[0] for row in cursor.fetchall())
+
+
+@pytest.mark.django_db
+def test_shifts_filtered_by_month_and_year(staff_shifts):
+    shifts = get_shifts_by_staff_id(
+        staff_id=staff_shifts[0].staff_id,
+        month=1,
+        year=2025,
+    )
+
+    assert sorted(shift.date for shift in shifts) == [
+        datetime.date(2025, 1, 1),
+        datetime.date(2025, 1, 31),
+    ]
+
+
+@pytest.mark.django_db
+def test_shifts_filtered_by_year(staff_shifts):
+    shifts = get_shifts_by_staff_id(
+        staff_id=staff_shifts[0].staff_id,
+        month=None,
+        year=2025,
+    )
+
+    assert len(shifts) == 3
+
+
+@pytest.mark.django_db
+def test_shifts_filtered_by_month_of_any_year(staff_shifts):
+    shifts = get_shifts_by_staff_id(
+        staff_id=staff_shifts[0].staff_id,
+        month=1,
+        year=None,
+    )
+
+    assert len(shifts) == 3
+
+
+@pytest.mark.django_db
+def test_month_filter_uses_index_on_date(staff_shifts):
+    staff_id = staff_shifts[0].staff_id
+    extract_plan = explain(
+        Shift.objects.filter(
+            staff_id=staff_id,
+            date__month=1,
+            date__year=2025,
+        )
+    )
+    range_plan = explain(get_shifts_by_staff_id(staff_id=staff_id, month=1, year=2025))
+
+    assert "EXTRACT" in extract_plan
+    assert "EXTRACT" not in range_plan
+    assert "Index Cond" in range_plan
+    index_condition = next(
+        line for line in range_plan.splitlines() if "Index Cond" in line
+    )
+    assert "date >=" in index_condition.replace('"', "")
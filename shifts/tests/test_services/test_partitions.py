@@ -0,0 +1,200 @@
+import datetime
+
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from freezegun import freeze_time
+
+from economics.models import ClosedReportPeriod
+from economics.services.reports.snapshots import CLOSED_REPORT_PERIODS_CACHE_KEY
+from shifts.models import CarToWash, CarToWashAdditionalService
+from shifts.services.cars_to_wash import update_shift_cars
+from shifts.services.partitions import (
+    create_month_partition,
+    create_month_partitions,
+    get_month_partitions,
+    get_month_start,
+    get_partitioned_table_names,
+)
+from shifts.tests.factories import (
+    ShiftFactory,
+    TransferredCarAdditionalServiceFactory,
+    TransferredCarFactory,
+)
+
+
+def get_car_partition_name(car: CarToWash) -> str:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT tableoid::regclass::text FROM shifts_cartowash WHERE id = %s",
+            [car.id],
+        )
+        (partition_name,) = cursor.fetchone()
+    return partition_name
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+
+
+@pytest.mark.parametrize(
+    "date, months, expected",
+    [
+        (datetime.date(2025, 1, 31), 0, datetime.date(2025, 1, 1)),
+        (datetime.date(2025, 1, 31), 1, datetime.date(2025, 2, 1)),
+        (datetime.date(2025, 12, 5), 1, datetime.date(2026, 1, 1)),
+        (datetime.date(2025, 1, 5), -1, datetime.date(2024, 12, 1)),
+        (datetime.date(2025, 3, 5), -14, datetime.date(2024, 1, 1)),
+    ],
+)
+def test_get_month_start(date, months, expected):
+    assert get_month_start(date, months) == expected
+
+
+@pytest.mark.django_db
+def test_tables_are_partitioned():
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT partrelid::regclass::text FROM pg_partitioned_table",
+        )
+        partitioned_tables = {table_name for (table_name,) in cursor.fetchall()}
+
+    assert set(get_partitioned_table_names()) <= partitioned_tables
+
+
+@pytest.mark.django_db
+def test_create_month_partitions_is_idempotent():
+    today = datetime.date(2021, 5, 20)
+
+    created_partitions = create_month_partitions(today=today, months_ahead=2)
+
+    assert {partition.from_date for partition in created_partitions} == {
+        datetime.date(2021, 5, 1),
+        datetime.date(2021, 6, 1),
+        datetime.date(2021, 7, 1),
+    }
+    assert {partition.table_name for partition in created_partitions} == set(
+        get_partitioned_table_names()
+    )
+    assert create_month_partitions(today=today, months_ahead=2) == []
+
+
+@pytest.mark.django_db
+def test_create_month_partition_moves_rows_from_default_partition():
+    shift = ShiftFactory(date=datetime.date(2021, 3, 10))
+    car = TransferredCarFactory(shift=shift)
+    service = TransferredCarAdditionalServiceFactory(car=car)
+    assert get_car_partition_name(car) == "shifts_cartowash_default"
+
+    for table_name in get_partitioned_table_names():
+        create_month_partition(table_name, datetime.date(2021, 3, 1))
+
+    assert get_car_partition_name(car) == "shifts_cartowash_p2021_03"
+    assert CarToWash.objects.filter(shift_date=shift.date).get() == car
+    assert CarToWashAdditionalService.objects.get(car=car) == service
+
+
+@pytest.mark.django_db
+def test_update_shift_cars_moves_rows_between_partitions():
+    create_month_partition("shifts_cartowash", datetime.date(2021, 3, 1))
+    shift = ShiftFactory(date=datetime.date(2021, 3, 10))
+    car = TransferredCarFactory(shift=shift)
+    service = TransferredCarAdditionalServiceFactory(car=car)
+    new_date = datetime.date(2021, 4, 2)
+    shift.date = new_date
+    shift.save()
+
+    update_shift_cars(shift)
+
+    assert get_car_partition_name(car) == "shifts_cartowash_default"
+    assert CarToWash.objects.get(id=car.id).shift_date == new_date
+    service.refresh_from_db()
+    assert service.shift_date == new_date
+
+
+@pytest.mark.django_db
+@freeze_time("2021-06-10 12:00:00+00:00")
+def test_archive_car_partitions_skips_months_with_open_report_periods(capsys):
+    create_month_partition("shifts_cartowash", datetime.date(2021, 3, 1))
+    car = TransferredCarFactory(shift=ShiftFactory(date=datetime.date(2021, 3, 10)))
+
+    call_command("archive_car_partitions", older_than_months=2)
+
+    assert "shifts_cartowash_p2021_03" in capsys.readouterr().err
+    assert CarToWash.objects.filter(id=car.id).exists()
+
+
+@pytest.mark.django_db
+@freeze_time("2021-06-10 12:00:00+00:00")
+def test_archive_car_partitions_detaches_closed_months():
+    create_month_partition("shifts_cartowash", datetime.date(2021, 3, 1))
+    create_month_partition("shifts_cartowash", datetime.date(2021, 4, 1))
+    old_car = TransferredCarFactory(
+        shift=ShiftFactory(date=datetime.date(2021, 3, 10)),
+    )
+    recent_car = TransferredCarFactory(
+        shift=ShiftFactory(date=datetime.date(2021, 4, 10)),
+    )
+    ClosedReportPeriod.objects.bulk_create(
+        [
+            ClosedReportPeriod(
+                from_date=datetime.date(2021, 3, 1),
+                to_date=datetime.date(2021, 3, 15),
+            ),
+            ClosedReportPeriod(
+                from_date=datetime.date(2021, 3, 16),
+                to_date=datetime.date(2021, 3, 31),
+            ),
+        ]
+    )
+    cache.delete(CLOSED_REPORT_PERIODS_CACHE_KEY)
+
+    call_command("archive_car_partitions", older_than_months=2)
+
+    assert not CarToWash.objects.filter(id=old_car.id).exists()
+    assert CarToWash.objects.filter(id=recent_car.id).exists()
+    month_starts = [
+        partition.from_date for partition in get_month_partitions("shifts_cartowash")
+    ]
+    assert datetime.date(2021, 3, 1) not in month_starts
+    assert datetime.date(2021, 4, 1) in month_starts
+
+
+# Rows inserted in the same transaction keep pending foreign key triggers,
+# which do not let the partition be dropped.
+@pytest.mark.django_db(transaction=True)
+@freeze_time("2021-06-10 12:00:00+00:00")
+def test_archive_car_partitions_dumps_and_drops_partitions(tmp_path):
+    create_month_partition("shifts_cartowash", datetime.date(2021, 3, 1))
+    car = TransferredCarFactory(shift=ShiftFactory(date=datetime.date(2021, 3, 10)))
+
+    call_command(
+        "archive_car_partitions",
+        older_than_months=2,
+        dump_dir=tmp_path,
+        force=True,
+    )
+
+    assert (tmp_path / "shifts_cartowash_p2021_03.csv.gz").exists()
+    assert not CarToWash.objects.filter(id=car.id).exists()
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT to_regclass('shifts_cartowash_p2021_03')")
+        assert cursor.fetchone() == (None,)
+
+
+@pytest.mark.django_db
+def test_shift_date_is_derived_on_save():
+    car = TransferredCarFactory(shift=ShiftFactory(date=datetime.date(2021, 3, 10)))
+    service = TransferredCarAdditionalServiceFactory(car=car)
+    assert (car.shift_date, service.shift_date) == (datetime.date(2021, 3, 10),) * 2
+
+    car.shift = ShiftFactory(date=datetime.date(2021, 4, 2))
+    car.save()
+    service.save()
+
+    assert CarToWash.objects.get(id=car.id).shift_date == datetime.date(2021, 4, 2)
+    assert CarToWashAdditionalService.objects.get(id=service.id).shift_date == (
+        datetime.date(2021, 4, 2)
+    )
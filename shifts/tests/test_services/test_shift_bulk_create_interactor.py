@@ -0,0 +1,85 @@
+import datetime
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from shifts.models import Shift
+from shifts.services.shifts.create import bulk
+from shifts.services.shifts.create.bulk import ShiftBulkCreateInteractor
+from shifts.tests.factories import ShiftFactory
+from staff.tests.factories import StaffFactory
+
+
+@pytest.mark.django_db
+def test_regular_shifts_bulk_created_skipping_conflicts_and_missing_staff():
+    staff = StaffFactory()
+    ShiftFactory(staff=staff, date=datetime.date(2025, 1, 1))
+
+    result = ShiftBulkCreateInteractor(
+        shifts=[
+            {"staff_id": staff.id, "date": datetime.date(2025, 1, 1)},
+            {"staff_id": staff.id, "date": datetime.date(2025, 1, 2)},
+            {"staff_id": staff.id, "date": datetime.date(2025, 1, 2)},
+            {"staff_id": 1, "date": datetime.date(2025, 1, 2)},
+        ],
+        shift_type=Shift.Type.REGULAR,
+    ).execute()
+
+    assert result.missing_staff_ids == (1,)
+    assert result.conflict_shifts == [
+        {"staff_id": staff.id, "date": datetime.date(2025, 1, 1)},
+    ]
+    assert [(shift.staff_id, shift.date) for shift in result.created_shifts] == [
+        (staff.id, datetime.date(2025, 1, 2)),
+    ]
+    shift = Shift.objects.get(id=result.created_shifts[0].id)
+    assert shift.type == Shift.Type.REGULAR
+    assert shift.confirmed_at is None
+
+
+@pytest.mark.django_db
+def test_test_shifts_bulk_created_replacing_previous_test_shift():
+    staff = StaffFactory()
+    ShiftFactory(staff=staff, date=datetime.date(2025, 1, 1), is_test=True)
+
+    result = ShiftBulkCreateInteractor(
+        shifts=[
+            {"staff_id": staff.id, "date": datetime.date(2025, 1, 3)},
+            {"staff_id": staff.id, "date": datetime.date(2025, 1, 5)},
+        ],
+        shift_type=Shift.Type.TEST,
+    ).execute()
+
+    assert result.conflict_shifts == [
+        {"staff_id": staff.id, "date": datetime.date(2025, 1, 3)},
+    ]
+    assert list(
+        Shift.objects.filter(staff=staff, is_test=True).values_list("date", flat=True)
+    ) == [datetime.date(2025, 1, 5)]
+
+
+@pytest.mark.django_db
+def test_shifts_bulk_created_in_chunks_with_constant_number_of_queries(
+    monkeypatch,
+):
+    monkeypatch.setattr(bulk, "SHIFTS_CHUNK_SIZE", 4)
+    staff_list = StaffFactory.create_batch(3)
+    dates = [datetime.date(2025, 1, 1) + datetime.timedelta(days=i) for i in range(3)]
+    ShiftFactory(staff=staff_list[0], date=dates[0])
+    shifts = [
+        {"staff_id": staff.id, "date": date} for staff in staff_list for date in dates
+    ]
+
+    with CaptureQueriesContext(connection) as context:
+        result = ShiftBulkCreateInteractor(
+            shifts=shifts,
+            shift_type=Shift.Type.EXTRA,
+        ).execute()
+
+    assert len(result.created_shifts) == 3 * 3 - 1
+    assert len(result.conflict_shifts) == 1
+    # Staff lookup, conflict lookup, 2 insert chunks of 4 rows, read back,
+    # report snapshots deletion, savepoint and its release;
+    # no query per shift.
+    assert len(context.captured_queries) == 8
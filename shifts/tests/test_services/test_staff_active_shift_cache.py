@@ -0,0 +1,194 @@
+import datetime
+
+import pytest
+from django.contrib import admin
+from django.core.management import call_command
+from django.db import connection
+from django.forms import modelform_factory
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from freezegun import freeze_time
+
+from car_washes.tests.factories import CarWashFactory
+from shifts import selectors
+from shifts.admin import ShiftAdmin
+from shifts.exceptions import StaffHasActiveShiftError, StaffHasNoActiveShiftError
+from shifts.models import CarToWash, Shift
+from shifts.selectors import get_cached_staff_active_shift, get_staff_active_shift
+from shifts.services.cars_to_wash import update_shift_car_wash
+from shifts.services.shifts import (
+    ShiftDeleteByIdInteractor,
+    ShiftStartInteractor,
+    mark_shift_as_rejected_now,
+)
+from shifts.services.shifts.create.bulk import ShiftBulkCreateInteractor
+from shifts.services.shifts.validators import ensure_staff_has_no_active_shift
+from shifts.tests.factories import ShiftFactory
+from shifts.use_cases.transferred_car_create import TransferredCarCreateUseCase
+from staff.tests.factories import StaffFactory
+
+
+@pytest.fixture(scope="session", autouse=True)
+def run_management_command(django_db_setup, django_db_blocker):
+    with django_db_blocker.unblock():
+        call_command("init_staff_service_prices")
+
+
+@pytest.fixture(autouse=True)
+def shared_cache(monkeypatch):
+    """Tests run with locmem cache, the snapshot is cached only if shared."""
+    monkeypatch.setattr(selectors, "is_cache_shared", lambda: True)
+
+
+@pytest.fixture
+def active_shift() -> Shift:
+    return ShiftFactory(
+        started_at=timezone.now(),
+        finished_at=None,
+        car_wash=CarWashFactory(),
+    )
+
+
+@pytest.mark.django_db
+@freeze_time("2025-01-01 20:00:00+00:00")
+def test_shift_start_caches_active_shift():
+    car_wash = CarWashFactory()
+    shift = ShiftFactory(
+        date=datetime.date(2025, 1, 1),
+        started_at=None,
+        finished_at=None,
+        rejected_at=None,
+        car_wash=car_wash,
+    )
+
+    ShiftStartInteractor(shift_id=shift.id).execute()
+
+    active_shift = get_cached_staff_active_shift(shift.staff_id)
+    assert active_shift.id == shift.id
+    assert active_shift.car_wash_id == car_wash.id
+    assert active_shift.van_washing_price == car_wash.van_washing_price
+    with pytest.raises(StaffHasActiveShiftError):
+        ensure_staff_has_no_active_shift(shift.staff_id)
+
+
+@pytest.mark.django_db
+def test_repeated_car_create_skips_shift_lookup(active_shift):
+    def create_car(number: str) -> None:
+        TransferredCarCreateUseCase(
+            staff_id=active_shift.staff_id,
+            number=number,
+            car_class=CarToWash.CarType.COMFORT,
+            wash_type=CarToWash.WashType.PLANNED,
+            windshield_washer_type=CarToWash.WindshieldWasherType.ANTIFREEZE,
+            windshield_washer_refilled_bottle_percentage=100,
+            additional_services=[],
+        ).execute()
+
+    create_car("а001ыв152")
+    with CaptureQueriesContext(connection) as context:
+        create_car("а002ыв152")
+
+    shift_table = Shift._meta.db_table
+    assert not any(
+        f'FROM "{shift_table}"' in query["sql"] for query in context.captured_queries
+    )
+    assert len(context.captured_queries) <= 7
+    assert CarToWash.objects.filter(shift=active_shift).count() == 2
+
+
+@pytest.mark.django_db
+def test_car_wash_switch_updates_cached_prices(active_shift):
+    new_car_wash = CarWashFactory()
+
+    update_shift_car_wash(shift=active_shift, car_wash_id=new_car_wash.id)
+
+    active_shift_snapshot = get_cached_staff_active_shift(active_shift.staff_id)
+    assert active_shift_snapshot.car_wash_id == new_car_wash.id
+    assert (
+        active_shift_snapshot.comfort_class_car_washing_price
+        == new_car_wash.comfort_class_car_washing_price
+    )
+
+
+@pytest.mark.django_db
+def test_shift_reject_invalidates_cached_active_shift(active_shift):
+    update_shift_car_wash(shift=active_shift, car_wash_id=CarWashFactory().id)
+
+    mark_shift_as_rejected_now(active_shift.id)
+
+    assert get_cached_staff_active_shift(active_shift.staff_id) is None
+
+
+@pytest.mark.django_db
+def test_shift_delete_invalidates_cached_active_shift(active_shift):
+    update_shift_car_wash(shift=active_shift, car_wash_id=CarWashFactory().id)
+
+    ShiftDeleteByIdInteractor(shift_id=active_shift.id).execute()
+
+    assert get_cached_staff_active_shift(active_shift.staff_id) is None
+
+
+@pytest.mark.django_db
+def test_test_shifts_bulk_create_invalidates_cached_active_shift(active_shift):
+    update_shift_car_wash(shift=active_shift, car_wash_id=CarWashFactory().id)
+    Shift.objects.filter(id=active_shift.id).update(is_test=True)
+
+    ShiftBulkCreateInteractor(
+        shifts=[{"staff_id": active_shift.staff_id, "date": active_shift.date}],
+        shift_type=Shift.Type.TEST,
+    ).execute()
+
+    assert get_cached_staff_active_shift(active_shift.staff_id) is None
+
+
+@pytest.mark.django_db
+def test_admin_staff_change_invalidates_cached_active_shifts(active_shift, rf):
+    new_staff = StaffFactory()
+    update_shift_car_wash(shift=active_shift, car_wash_id=CarWashFactory().id)
+    other_shift = ShiftFactory(
+        staff=new_staff,
+        date=active_shift.date - datetime.timedelta(days=1),
+        started_at=timezone.now(),
+        finished_at=None,
+        car_wash=CarWashFactory(),
+    )
+    update_shift_car_wash(shift=other_shift, car_wash_id=CarWashFactory().id)
+    shift_admin = ShiftAdmin(Shift, admin.site)
+    form_class = modelform_factory(Shift, fields=("staff",))
+    form = form_class(
+        data={"staff": new_staff.id},
+        instance=active_shift,
+        initial={"staff": active_shift.staff_id},
+    )
+    assert form.is_valid()
+    old_staff_id = active_shift.staff_id
+
+    shift_admin.save_model(rf.post("/"), form.save(commit=False), form, True)
+
+    assert get_cached_staff_active_shift(old_staff_id) is None
+    assert get_cached_staff_active_shift(new_staff.id) is None
+
+
+@pytest.mark.django_db
+def test_admin_delete_invalidates_cached_active_shift(active_shift, rf):
+    update_shift_car_wash(shift=active_shift, car_wash_id=CarWashFactory().id)
+    shift_admin = ShiftAdmin(Shift, admin.site)
+
+    shift_admin.delete_queryset(
+        rf.post("/"),
+        Shift.objects.filter(id=active_shift.id),
+    )
+
+    assert get_cached_staff_active_shift(active_shift.staff_id) is None
+
+
+@pytest.mark.django_db
+def test_active_shift_not_cached_in_process_local_cache(active_shift, monkeypatch):
+    monkeypatch.setattr(selectors, "is_cache_shared", lambda: False)
+
+    update_shift_car_wash(shift=active_shift, car_wash_id=CarWashFactory().id)
+
+    assert get_cached_staff_active_shift(active_shift.staff_id) is None
+    Shift.objects.filter(id=active_shift.id).update(finished_at=timezone.now())
+    with pytest.raises(StaffHasNoActiveShiftError):
+        get_staff_active_shift(active_shift.staff_id)
@@ -0,0 +1,121 @@
+import datetime
+
+import pytest
+from django.utils import timezone
+
+from car_washes.tests.factories import CarWashFactory
+from shifts.models import CarToWash, CarToWashAdditionalService, Shift
+from shifts import selectors
+from shifts.selectors import (
+    cache_staff_active_shift,
+    get_cached_staff_active_shift,
+)
+from shifts.services.cars_to_wash import (
+    get_staff_cars_count_by_date,
+    update_shift_cars,
+)
+from shifts.tests.factories import (
+    ShiftFactory,
+    TransferredCarAdditionalServiceFactory,
+    TransferredCarFactory,
+)
+from staff.tests.factories import StaffFactory
+
+
+@pytest.mark.django_db
+def test_staff_cars_count_by_date():
+    date = datetime.date(2025, 3, 10)
+    active_shift = ShiftFactory(date=date, finished_at=None)
+    finished_shift = ShiftFactory(date=date, finished_at=timezone.now())
+    other_date_shift = ShiftFactory(
+        date=datetime.date(2025, 3, 11),
+        staff=active_shift.staff,
+        finished_at=None,
+    )
+    TransferredCarFactory.create_batch(3, shift=active_shift)
+    TransferredCarFactory.create_batch(2, shift=finished_shift)
+    TransferredCarFactory(shift=other_date_shift)
+
+    assert get_staff_cars_count_by_date(date) == {
+        "date": date,
+        "active_shifts": [
+            {
+                "staff_id": active_shift.staff_id,
+                "staff_full_name": active_shift.staff.full_name,
+                "cars_count": 3,
+            },
+        ],
+        "completed_shifts": [
+            {
+                "staff_id": finished_shift.staff_id,
+                "staff_full_name": finished_shift.staff.full_name,
+                "cars_count": 2,
+            },
+        ],
+    }
+
+
+@pytest.mark.django_db
+def test_staff_cars_count_by_date_skips_cars_of_moved_shifts():
+    date = datetime.date(2025, 3, 10)
+    shift = ShiftFactory(date=date, finished_at=None)
+    TransferredCarFactory(shift=shift)
+    Shift.objects.filter(id=shift.id).update(
+        date=datetime.date(2025, 3, 11),
+    )
+
+    assert get_staff_cars_count_by_date(date) == {
+        "date": date,
+        "active_shifts": [],
+        "completed_shifts": [],
+    }
+
+
+@pytest.mark.django_db
+def test_update_shift_cars_copies_staff():
+    shift = ShiftFactory()
+    car = TransferredCarFactory(shift=shift)
+    TransferredCarAdditionalServiceFactory(car=car)
+    shift.staff = StaffFactory()
+    shift.save()
+
+    update_shift_cars(shift)
+
+    assert CarToWash.objects.get(id=car.id).staff_id == shift.staff_id
+    assert CarToWashAdditionalService.objects.get(car=car).staff_id == (shift.staff_id)
+
+
+@pytest.mark.django_db
+def test_update_shift_cars_invalidates_cached_active_shifts(monkeypatch):
+    monkeypatch.setattr(selectors, "is_cache_shared", lambda: True)
+    shift = ShiftFactory(
+        started_at=timezone.now(),
+        finished_at=None,
+        car_wash=CarWashFactory(),
+    )
+    TransferredCarFactory(shift=shift)
+    cache_staff_active_shift(shift)
+    old_staff_id = shift.staff_id
+    shift.staff = StaffFactory()
+    shift.save()
+
+    update_shift_cars(shift)
+
+    assert get_cached_staff_active_shift(old_staff_id) is None
+    assert get_cached_staff_active_shift(shift.staff_id) is None
+
+
+@pytest.mark.django_db
+def test_staff_is_derived_on_save():
+    car = TransferredCarFactory()
+    service = TransferredCarAdditionalServiceFactory(car=car)
+    assert car.staff_id == car.shift.staff_id
+    assert (service.shift_id, service.staff_id) == (car.shift_id, car.staff_id)
+
+    car.shift = ShiftFactory()
+    car.save()
+    service.save()
+
+    assert CarToWash.objects.get(id=car.id).staff_id == car.shift.staff_id
+    service = CarToWashAdditionalService.objects.get(id=service.id)
+    assert (service.shift_id, service.staff_id) == (car.shift_id, car.shift.staff_id)
@@ -0,0 +1,89 @@
+import datetime
+
+import pendulum
+import pytest
+
+from shifts.services.report_periods import (
+    Period,
+    StaffListReportPeriodsReadInteractor,
+    StaffReportPeriodsReadInteractor,
+)
+from shifts.tests.factories import ShiftFactory
+from staff.exceptions import StaffNotFoundError
+from staff.tests.factories import StaffFactory
+
+
+@pytest.mark.django_db
+def test_staff_not_found():
+    with pytest.raises(StaffNotFoundError):
+        StaffReportPeriodsReadInteractor(staff_id=1).execute()
+
+
+@pytest.mark.django_db
+def test_report_periods_bucketed_by_month_halves():
+    staff = StaffFactory()
+    for date in (
+        datetime.date(2024, 2, 16),
+        datetime.date(2024, 2, 29),
+        datetime.date(2025, 1, 1),
+        datetime.date(2025, 1, 15),
+        datetime.date(2025, 1, 16),
+    ):
+        ShiftFactory(staff=staff, date=date)
+
+    staff_report_periods = StaffReportPeriodsReadInteractor(
+        staff_id=staff.id,
+    ).execute()
+
+    assert staff_report_periods.periods == [
+        Period(
+            from_date=pendulum.date(2024, 2, 16),
+            to_date=pendulum.date(2024, 2, 29),
+        ),
+        Period(
+            from_date=pendulum.date(2025, 1, 1),
+            to_date=pendulum.date(2025, 1, 15),
+        ),
+        Period(
+            from_date=pendulum.date(2025, 1, 16),
+            to_date=pendulum.date(2025, 1, 31),
+        ),
+    ]
+
+
+@pytest.mark.django_db
+def test_report_periods_of_staff_list(django_assert_num_queries):
+    staff_1 = StaffFactory()
+    staff_2 = StaffFactory()
+    ShiftFactory(staff=staff_1, date=datetime.date(2025, 3, 20))
+    ShiftFactory(staff=staff_2, date=datetime.date(2025, 3, 1))
+
+    with django_assert_num_queries(2):
+        staff_list_report_periods = StaffListReportPeriodsReadInteractor(
+            staff_ids=[staff_1.id, staff_2.id, 1],
+        ).execute()
+
+    assert staff_list_report_periods.missing_staff_ids == [1]
+    assert [
+        (staff.staff_id, staff.periods)
+        for staff in staff_list_report_periods.staff_list
+    ] == [
+        (
+            staff_1.id,
+            [
+                Period(
+                    from_date=pendulum.date(2025, 3, 16),
+                    to_date=pendulum.date(2025, 3, 31),
+                )
+            ],
+        ),
+        (
+            staff_2.id,
+            [
+                Period(
+                    from_date=pendulum.date(2025, 3, 1),
+                    to_date=pendulum.date(2025, 3, 15),
+                )
+            ],
+        ),
+    ]
@@ -132,3 +132,21 @@ def test_shifts_in_current_month_before_current_time():
     assert len(staff_shifts_months.months) == 1
     assert staff_shifts_months.months[0].year == 2025
     assert staff_shifts_months.months[0].month == 2
+
+
+@pytest.mark.django_db
+@freeze_time("2025-12-10")
+def test_staff_has_shifts_in_next_year():
+    staff = StaffFactory()
+    ShiftFactory(staff=staff, date=datetime.date(2025, 11, 30))
+    ShiftFactory(staff=staff, date=datetime.date(2025, 12, 20))
+    ShiftFactory(staff=staff, date=datetime.date(2026, 1, 5))
+
+    staff_shifts_months = StaffShiftsMonthListInteractor(
+        staff_id=staff.id,
+    ).execute()
+
+    assert [(month.year, month.month) for month in staff_shifts_months.months] == [
+        (2025, 12),
+        (2026, 1),
+    ]
@@ -0,0 +1,122 @@
+import pytest
+from django.core.management import call_command
+from django.db import IntegrityError, connection
+from django.test.utils import CaptureQueriesContext
+
+from car_washes.tests.factories import (
+    CarWashFactory,
+    CarWashServicePriceFactory,
+)
+from shifts.models import CarToWash, CarToWashAdditionalService
+from shifts.serializers.cars_to_wash import (
+    TransferredCarBulkCreateItemInputSerializer,
+)
+from shifts.tests.factories import ShiftFactory, TransferredCarFactory
+from shifts.use_cases.transferred_car_bulk_create import (
+    TransferredCarBulkCreateItemStatus,
+    TransferredCarBulkCreateUseCase,
+)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def run_management_command(django_db_setup, django_db_blocker):
+    with django_db_blocker.unblock():
+        call_command("init_staff_service_prices")
+
+
+def build_car(number: str, additional_services=None) -> dict:
+    return {
+        "number": number,
+        "car_class": CarToWash.CarType.COMFORT,
+        "wash_type": CarToWash.WashType.PLANNED,
+        "windshield_washer_type": CarToWash.WindshieldWasherType.ANTIFREEZE,
+        "windshield_washer_refilled_bottle_percentage": 100,
+        "additional_services": additional_services or [],
+    }
+
+
+@pytest.mark.django_db
+def test_transferred_cars_bulk_created_with_constant_query_count():
+    car_wash = CarWashFactory()
+    shift = ShiftFactory(car_wash=car_wash)
+    service_prices = CarWashServicePriceFactory.create_batch(3, car_wash=car_wash)
+    additional_services = [
+        {"id": service_price.service.id, "count": 2} for service_price in service_prices
+    ]
+    cars = [build_car(f"а{i:03}ыв152", additional_services) for i in range(50)]
+
+    with CaptureQueriesContext(connection) as context:
+        result = TransferredCarBulkCreateUseCase(
+            shift_id=shift.id,
+            cars=cars,
+        ).execute()
+
+    assert len(context.captured_queries) <= 10
+    assert result.created_count == 50
+    assert result.skipped_count == 0
+    assert CarToWash.objects.filter(shift=shift).count() == 50
+    assert CarToWashAdditionalService.objects.filter(car__shift=shift).count() == 150
+    assert all(
+        item.status == TransferredCarBulkCreateItemStatus.CREATED
+        for item in result.results
+    )
+
+
+@pytest.mark.django_db
+def test_transferred_cars_bulk_create_reports_skipped_items():
+    car_wash = CarWashFactory()
+    shift = ShiftFactory(car_wash=car_wash)
+    TransferredCarFactory(shift=shift, number="а001ыв152")
+    not_provided_service = CarWashServicePriceFactory()
+
+    result = TransferredCarBulkCreateUseCase(
+        shift_id=shift.id,
+        cars=[
+            build_car("А001ЫВ152"),
+            build_car("а002ыв152"),
+            build_car("а002ыв152"),
+            build_car(
+                "а003ыв152",
+                [{"id": not_provided_service.service.id, "count": 1}],
+            ),
+        ],
+    ).execute()
+
+    assert [item.status for item in result.results] == [
+        TransferredCarBulkCreateItemStatus.ALREADY_EXISTS,
+        TransferredCarBulkCreateItemStatus.CREATED,
+        TransferredCarBulkCreateItemStatus.DUPLICATE_IN_REQUEST,
+        TransferredCarBulkCreateItemStatus.ADDITIONAL_SERVICE_COULD_NOT_BE_PROVIDED,
+    ]
+    assert result.results[3].service_ids == [not_provided_service.service.id]
+    assert result.created_count == 1
+    assert result.skipped_count == 3
+    assert CarToWash.objects.filter(shift=shift).count() == 2
+
+
+@pytest.mark.parametrize(
+    "field, value",
+    [
+        ("number", "а" * 30),
+        ("windshield_washer_refilled_bottle_percentage", -5),
+        ("windshield_washer_refilled_bottle_percentage", 101),
+    ],
+)
+def test_transferred_car_bulk_create_item_rejects_invalid_values(field, value):
+    serializer = TransferredCarBulkCreateItemInputSerializer(
+        data=build_car("а001ыв152") | {field: value},
+    )
+
+    assert not serializer.is_valid()
+    assert field in serializer.errors
+
+
+@pytest.mark.django_db
+def test_transferred_cars_bulk_create_does_not_hide_check_violations():
+    shift = ShiftFactory(car_wash=CarWashFactory())
+    car = build_car("а001ыв152") | {
+        "windshield_washer_refilled_bottle_percentage": -5,
+    }
+
+    with pytest.raises(IntegrityError):
+        TransferredCarBulkCreateUseCase(shift_id=shift.id, cars=[car]).execute()
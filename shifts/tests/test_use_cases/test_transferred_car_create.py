@@ -5,6 +5,7 @@ from django.core.management import call_command
 
 from shifts.use_cases.transferred_car_create import TransferredCarCreateUseCase
 from shifts.tests.factories import ShiftFactory
+from shifts.exceptions import CarAlreadyWashedOnShiftError
 from shifts.models import CarToWash
 from car_washes.tests.factories import (
     CarWashFactory,
@@ -74,3 +75,48 @@ def test_transferred_car_successully_created_with_additional_services():
     assert transferred_car.windshield_washer_refilled_bottle_percentage == 50
     assert transferred_car.number == "а123ыв152"
     assert len(transferred_car.additional_services) == len(additional_services)
+
+
+@pytest.mark.django_db
+def test_transferred_car_already_washed_on_shift():
+    shift = ShiftFactory(finished_at=None, car_wash=CarWashFactory())
+    use_case = TransferredCarCreateUseCase(
+        staff_id=shift.staff.id,
+        number="а123ыв152",
+        car_class=CarToWash.CarType.COMFORT,
+        wash_type=CarToWash.WashType.PLANNED,
+        windshield_washer_type=CarToWash.WindshieldWasherType.ANTIFREEZE,
+        windshield_washer_refilled_bottle_percentage=50,
+        additional_services=[],
+    )
+    use_case.execute()
+
+    with pytest.raises(CarAlreadyWashedOnShiftError):
+        use_case.execute()
+
+    assert CarToWash.objects.filter(shift=shift).count() == 1
+
+
+@pytest.mark.django_db
+def test_transferred_car_shift_date_and_staff_copied():
+    car_wash = CarWashFactory()
+    shift = ShiftFactory(finished_at=None, car_wash=car_wash)
+    service_price = CarWashServicePriceFactory(car_wash=car_wash)
+
+    transferred_car = TransferredCarCreateUseCase(
+        staff_id=shift.staff.id,
+        number="а123ыв153",
+        car_class=CarToWash.CarType.COMFORT,
+        wash_type=CarToWash.WashType.PLANNED,
+        windshield_washer_type=CarToWash.WindshieldWasherType.ANTIFREEZE,
+        windshield_washer_refilled_bottle_percentage=50,
+        additional_services=[{"id": service_price.service.id, "count": 1}],
+    ).execute()
+
+    car = CarToWash.objects.get(id=transferred_car.id)
+    assert car.shift_date == shift.date
+    assert car.staff_id == shift.staff_id
+    service = car.additional_services.get()
+    assert service.shift_date == shift.date
+    assert service.shift_id == shift.id
+    assert service.staff_id == shift.staff_id
@@ -0,0 +1,111 @@
+import io
+
+import pytest
+from django.contrib import admin
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from import_export.formats.base_formats import CSV, XLSX
+from openpyxl import load_workbook
+
+from shifts.admin import (
+    CarToWashAdditionalServiceAdmin,
+    CarToWashAdmin,
+    ShiftAdmin,
+)
+from shifts.models import CarToWash, CarToWashAdditionalService, Shift
+from shifts.tests.factories import TransferredCarAdditionalServiceFactory
+
+
+ADMIN_CLASSES = {
+    CarToWash: CarToWashAdmin,
+    CarToWashAdditionalService: CarToWashAdditionalServiceAdmin,
+    Shift: ShiftAdmin,
+}
+
+
+@pytest.fixture
+def request_with_superuser():
+    request = RequestFactory().post("/")
+    request.user = get_user_model().objects.create_superuser(
+        username="admin",
+        password="password",
+    )
+    return request
+
+
+@pytest.fixture
+def additional_services() -> list[CarToWashAdditionalService]:
+    return TransferredCarAdditionalServiceFactory.create_batch(5)
+
+
+def read_xlsx(content: bytes) -> list[tuple]:
+    workbook = load_workbook(io.BytesIO(content), read_only=True)
+    return list(workbook.active.values)
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("additional_services")
+@pytest.mark.parametrize("model", [CarToWash, CarToWashAdditionalService, Shift])
+def test_csv_export_streamed_as_dataset_export(model, request_with_superuser):
+    model_admin = ADMIN_CLASSES[model](model, admin.site)
+    queryset = model.objects.order_by("pk")
+
+    response = model_admin._do_file_export(
+        CSV(),
+        request_with_superuser,
+        queryset,
+    )
+
+    assert response.streaming
+    assert response["Content-Disposition"].startswith("attachment; filename=")
+    expected = model_admin.get_export_data(
+        CSV(),
+        request_with_superuser,
+        queryset,
+    )
+    assert b"".join(response.streaming_content).decode() == expected
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("additional_services")
+@pytest.mark.parametrize("model", [CarToWash, CarToWashAdditionalService, Shift])
+def test_xlsx_export_written_as_dataset_export(model, request_with_superuser):
+    model_admin = ADMIN_CLASSES[model](model, admin.site)
+    queryset = model.objects.order_by("pk")
+
+    response = model_admin._do_file_export(
+        XLSX(),
+        request_with_superuser,
+        queryset,
+    )
+
+    expected = model_admin.get_export_data(
+        XLSX(),
+        request_with_superuser,
+        queryset,
+    )
+    assert read_xlsx(b"".join(response.streaming_content)) == read_xlsx(expected)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("model", [CarToWash, CarToWashAdditionalService, Shift])
+def test_export_queries_do_not_grow_with_rows(model, request_with_superuser):
+    model_admin = ADMIN_CLASSES[model](model, admin.site)
+
+    def count_export_queries() -> int:
+        with CaptureQueriesContext(connection) as context:
+            response = model_admin._do_file_export(
+                CSV(),
+                request_with_superuser,
+                model.objects.all(),
+            )
+            b"".join(response.streaming_content)
+        return len(context.captured_queries)
+
+    TransferredCarAdditionalServiceFactory()
+    queries_count = count_export_queries()
+    TransferredCarAdditionalServiceFactory.create_batch(5)
+
+    assert count_export_queries() == queries_count
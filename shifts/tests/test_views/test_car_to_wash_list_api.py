@@ -0,0 +1,78 @@
+import datetime
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from car_washes.tests.factories import CarWashFactory
+from shifts.tests.factories import (
+    ShiftFactory,
+    TransferredCarAdditionalServiceFactory,
+    TransferredCarFactory,
+)
+
+
+@pytest.fixture
+def shift():
+    return ShiftFactory(
+        started_at=timezone.now(),
+        finished_at=None,
+        car_wash=CarWashFactory(),
+    )
+
+
+@pytest.mark.django_db
+def test_staff_has_no_active_shift():
+    shift = ShiftFactory(finished_at=timezone.now())
+    url = reverse("shifts:car-list", kwargs={"staff_id": shift.staff_id})
+
+    response = APIClient().get(url)
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+def test_cars_listed_with_constant_query_count(shift, django_assert_num_queries):
+    cars = TransferredCarFactory.create_batch(10, shift=shift)
+    for car in cars:
+        TransferredCarAdditionalServiceFactory.create_batch(2, car=car)
+    url = reverse("shifts:car-list", kwargs={"staff_id": shift.staff_id})
+
+    # active shift, cars and additional services
+    with django_assert_num_queries(3):
+        response = APIClient().get(url)
+
+    assert response.status_code == status.HTTP_200_OK
+    response_cars = response.json()["cars"]
+    assert len(response_cars) == 10
+    assert all(len(car["additional_services"]) == 2 for car in response_cars)
+    assert set(response_cars[0]) == {
+        "id",
+        "number",
+        "car_class",
+        "wash_type",
+        "windshield_washer_refilled_bottle_percentage",
+        "created_at",
+        "additional_services",
+    }
+
+
+@pytest.mark.django_db
+def test_cars_listed_since_created_at(shift):
+    now = timezone.now()
+    TransferredCarFactory(shift=shift, created_at=now - datetime.timedelta(hours=1))
+    new_car = TransferredCarFactory(shift=shift, created_at=now)
+    TransferredCarAdditionalServiceFactory(car=new_car)
+    url = reverse("shifts:car-list", kwargs={"staff_id": shift.staff_id})
+
+    response = APIClient().get(
+        url,
+        data={"since": (now - datetime.timedelta(minutes=1)).isoformat()},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    response_cars = response.json()["cars"]
+    assert [car["id"] for car in response_cars] == [new_car.id]
+    assert len(response_cars[0]["additional_services"]) == 1
@@ -3,6 +3,7 @@ from rest_framework.routers import DefaultRouter
 
 from shifts.views import (
     AvailableDateApi,
+    TransferredCarBulkCreateApi,
     TransferredCarListCreateApi,
     CarToWashListApi,
     CarsToWashCountByEachStaffApi,
@@ -10,6 +11,7 @@ from shifts.views import (
     CurrentShiftCarWashUpdateApi,
     RetrieveUpdateCarsToWashApi,
     ShiftConfirmApi,
+    ShiftBulkCreateApi,
     ShiftExtraCreateApi,
     ShiftFinishApi,
     ShiftListApi,
@@ -22,9 +24,11 @@ from shifts.views import (
     ShiftTestCreateApi,
     StaffCurrentShiftRetrieveApi,
     StaffReportPeriodsListApi,
+    StaffListReportPeriodsListApi,
     StaffShiftListApi,
     ShiftListApiV2,
     DeadSoulsApi,
+    DeadSoulsForMonthsApi,
     StaffShiftsMonthListApi,
 )
 
@@ -58,6 +62,16 @@ urlpatterns = [
         DeadSoulsApi.as_view(),
         name="dead-souls",
     ),
+    path(
+        r"dead-souls/months/",
+        DeadSoulsForMonthsApi.as_view(),
+        name="dead-souls-months",
+    ),
+    path(
+        r"report-periods/staff/",
+        StaffListReportPeriodsListApi.as_view(),
+        name="staff-list-report-periods",
+    ),
     path(
         r"report-periods/staff/<int:staff_id>/",
         StaffReportPeriodsListApi.as_view(),
@@ -93,6 +107,11 @@ urlpatterns = [
         ShiftExtraCreateApi.as_view(),
         name="create-extra",
     ),
+    path(
+        r"create/bulk/",
+        ShiftBulkCreateApi.as_view(),
+        name="create-bulk",
+    ),
     path(
         r"<int:shift_id>/",
         ShiftRetrieveDeleteApi.as_view(),
@@ -132,6 +151,11 @@ urlpatterns = [
         TransferredCarListCreateApi.as_view(),
         name="transferred-car-list-create",
     ),
+    path(
+        r"cars/bulk/",
+        TransferredCarBulkCreateApi.as_view(),
+        name="transferred-car-bulk-create",
+    ),
     path(
         r"cars/staff/<int:staff_id>/",
         CarToWashListApi.as_view(),
@@ -0,0 +1,238 @@
+from collections import defaultdict
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import TypedDict
+from uuid import UUID
+
+from django.db import IntegrityError, transaction
+from psycopg2.errorcodes import UNIQUE_VIOLATION
+
+from car_washes.exceptions import CarWashNotFoundError
+from car_washes.models import CarWash, CarWashServicePrice
+from core.profiling import profiled
+from economics.models import StaffServicePrice
+from economics.services.reports.snapshots import invalidate_report_snapshots
+from shifts.exceptions import (
+    CarAlreadyWashedOnShiftError,
+    StaffServicePriceNotFoundError,
+)
+from shifts.models import CarToWash, CarToWashAdditionalService
+from shifts.selectors import get_shift_by_id
+from shifts.use_cases.transferred_car_create import (
+    AdditionalService,
+    TransferredCarCreateResultDto,
+    get_car_transfer_service_type,
+    map_create_result_to_dto,
+)
+
+
+__all__ = (
+    "TransferredCarBulkCreateItem",
+    "TransferredCarBulkCreateItemStatus",
+    "TransferredCarBulkCreateItemResultDto",
+    "TransferredCarBulkCreateResultDto",
+    "TransferredCarBulkCreateUseCase",
+)
+
+
+class TransferredCarBulkCreateItem(TypedDict):
+    number: str
+    car_class: str
+    wash_type: str
+    windshield_washer_type: str
+    windshield_washer_refilled_bottle_percentage: int
+    additional_services: list[AdditionalService]
+
+
+class TransferredCarBulkCreateItemStatus(StrEnum):
+    CREATED = "created"
+    ALREADY_EXISTS = "already_exists"
+    DUPLICATE_IN_REQUEST = "duplicate_in_request"
+    ADDITIONAL_SERVICE_COULD_NOT_BE_PROVIDED = (
+        "additional_service_could_not_be_provided"
+    )
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class TransferredCarBulkCreateItemResultDto:
+    index: int
+    number: str
+    status: TransferredCarBulkCreateItemStatus
+    transferred_car: TransferredCarCreateResultDto | None = None
+    service_ids: list[UUID] | None = None
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class TransferredCarBulkCreateResultDto:
+    shift_id: int
+    created_count: int
+    skipped_count: int
+    results: list[TransferredCarBulkCreateItemResultDto]
+
+
+def get_staff_service_prices() -> dict[str, int]:
+    return dict(StaffServicePrice.objects.values_list("service", "price"))
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class TransferredCarBulkCreateUseCase:
+    """
+    Create many transferred cars for one shift at once.
+
+    All lookups (existing car numbers, staff service prices, car wash
+    service prices) are done once for the whole batch, and cars with their
+    additional services are inserted with two bulk inserts in a single
+    transaction. Items that can not be created are skipped and reported
+    in the result instead of failing the whole batch.
+    """
+
+    shift_id: int
+    cars: list[TransferredCarBulkCreateItem]
+    car_wash_id: int | None = None
+
+    def get_car_wash(self, shift_car_wash_id: int | None) -> CarWash:
+        car_wash_id = self.car_wash_id or shift_car_wash_id
+        if car_wash_id is None:
+            raise CarWashNotFoundError
+        try:
+            return CarWash.objects.get(id=car_wash_id)
+        except CarWash.DoesNotExist:
+            raise CarWashNotFoundError
+
+    @profiled
+    @transaction.atomic
+    def execute(self) -> TransferredCarBulkCreateResultDto:
+        shift = get_shift_by_id(self.shift_id)
+        car_wash = self.get_car_wash(shift.car_wash_id)
+
+        numbers = {car["number"].lower() for car in self.cars}
+        existing_numbers: set[str] = set(
+            CarToWash.objects.filter(
+                shift_id=shift.id,
+                number__in=numbers,
+            ).values_list("number", flat=True)
+        )
+        staff_service_prices = get_staff_service_prices()
+        service_id_to_price: dict[UUID, int] = dict(
+            CarWashServicePrice.objects.filter(
+                car_wash_id=car_wash.id,
+            ).values_list("service_id", "price")
+        )
+
+        results: dict[int, TransferredCarBulkCreateItemResultDto] = {}
+        index_to_car: dict[int, CarToWash] = {}
+        seen_numbers: set[str] = set()
+
+        for index, car in enumerate(self.cars):
+            number = car["number"].lower()
+            if number in existing_numbers:
+                results[index] = TransferredCarBulkCreateItemResultDto(
+                    index=index,
+                    number=number,
+                    status=TransferredCarBulkCreateItemStatus.ALREADY_EXISTS,
+                )
+                continue
+            if number in seen_numbers:
+                results[index] = TransferredCarBulkCreateItemResultDto(
+                    index=index,
+                    number=number,
+                    status=TransferredCarBulkCreateItemStatus.DUPLICATE_IN_REQUEST,
+                )
+                continue
+            seen_numbers.add(number)
+
+            unavailable_service_ids = [
+                service["id"]
+                for service in car["additional_services"]
+                if service["id"] not in service_id_to_price
+            ]
+            if unavailable_service_ids:
+                results[index] = TransferredCarBulkCreateItemResultDto(
+                    index=index,
+                    number=number,
+                    status=(
+                        TransferredCarBulkCreateItemStatus.ADDITIONAL_SERVICE_COULD_NOT_BE_PROVIDED
+                    ),
+                    service_ids=unavailable_service_ids,
+                )
+                continue
+
+            service_name = get_car_transfer_service_type(
+                class_type=car["car_class"],
+                wash_type=car["wash_type"],
+                is_extra_shift=shift.is_extra,
+            )
+            try:
+                transfer_price = staff_service_prices[service_name]
+            except KeyError:
+                raise StaffServicePriceNotFoundError(f"Not found {service_name}")
+
+            index_to_car[index] = CarToWash(
+                shift_id=shift.id,
+                shift_date=shift.date,
+                staff_id=shift.staff_id,
+                number=number,
+                car_class=car["car_class"],
+                wash_type=car["wash_type"],
+                windshield_washer_type=car["windshield_washer_type"],
+                windshield_washer_refilled_bottle_percentage=(
+                    car["windshield_washer_refilled_bottle_percentage"]
+                ),
+                transfer_price=transfer_price,
+                car_wash=car_wash,
+                comfort_class_car_washing_price=car_wash.comfort_class_car_washing_price,
+                business_class_car_washing_price=car_wash.business_class_car_washing_price,
+                van_washing_price=car_wash.van_washing_price,
+                windshield_washer_price_per_bottle=car_wash.windshield_washer_price_per_bottle,
+            )
+
+        try:
+            CarToWash.objects.bulk_create(index_to_car.values())
+        except IntegrityError as error:
+            # Only a car of the same shift inserted concurrently is expected,
+            # other violations are bugs and are not hidden.
+            if getattr(error.__cause__, "pgcode", None) == UNIQUE_VIOLATION:
+                raise CarAlreadyWashedOnShiftError
+            raise
+
+        index_to_services: dict[int, list[CarToWashAdditionalService]] = defaultdict(
+            list
+        )
+        for index, transferred_car in index_to_car.items():
+            for service in self.cars[index]["additional_services"]:
+                index_to_services[index].append(
+                    CarToWashAdditionalService(
+                        car=transferred_car,
+                        shift_date=transferred_car.shift_date,
+                        shift_id=transferred_car.shift_id,
+                        staff_id=transferred_car.staff_id,
+                        service_id=service["id"],
+                        count=service["count"],
+                        price=service_id_to_price[service["id"]],
+                    )
+                )
+        CarToWashAdditionalService.objects.bulk_create(
+            [service for services in index_to_services.values() for service in services]
+        )
+
+        # Bulk inserts do not send signals snapshots are invalidated on.
+        if index_to_car:
+            invalidate_report_snapshots([shift.date])
+
+        for index, transferred_car in index_to_car.items():
+            results[index] = TransferredCarBulkCreateItemResultDto(
+                index=index,
+                number=transferred_car.number,
+                status=TransferredCarBulkCreateItemStatus.CREATED,
+                transferred_car=map_create_result_to_dto(
+                    transferred_car,
+                    index_to_services[index],
+                ),
+            )
+
+        return TransferredCarBulkCreateResultDto(
+            shift_id=shift.id,
+            created_count=len(index_to_car),
+            skipped_count=len(self.cars) - len(index_to_car),
+            results=[results[index] for index in range(len(self.cars))],
+        )
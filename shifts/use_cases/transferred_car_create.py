@@ -4,37 +4,48 @@ from collections.abc import Iterable
 from typing import TypedDict
 
 from django.core.exceptions import ValidationError
-from django.db import transaction
+from django.db import IntegrityError, transaction
 
+from core.profiling import profiled
 from shifts.models import CarToWash, CarToWashAdditionalService
 from economics.models import StaffServicePrice
 from shifts.exceptions import (
     StaffServicePriceNotFoundError,
     CarAlreadyWashedOnShiftError,
 )
-from shifts.selectors import get_staff_current_shift
+from shifts.selectors import get_staff_active_shift
 from shifts.services.cars_to_wash import get_car_wash_service_prices
 
 
-def compute_car_transfer_price(
+def get_car_transfer_service_type(
     *,
     class_type: str,
     wash_type: str,
     is_extra_shift: bool,
-) -> int:
+) -> str:
     if wash_type == CarToWash.WashType.URGENT:
-        service_name = StaffServicePrice.ServiceType.URGENT_CAR_WASH
-    else:
-        if is_extra_shift:
-            service_name = StaffServicePrice.ServiceType.CAR_TRANSPORTER_EXTRA_SHIFT
-        else:
-            car_class_type_to_service_name: dict[str, str] = {
-                CarToWash.CarType.COMFORT: StaffServicePrice.ServiceType.COMFORT_CLASS_CAR_TRANSFER,
-                CarToWash.CarType.BUSINESS: StaffServicePrice.ServiceType.BUSINESS_CLASS_CAR_TRANSFER,
-                CarToWash.CarType.VAN: StaffServicePrice.ServiceType.VAN_TRANSFER,
-            }
-            service_name = car_class_type_to_service_name[class_type]
+        return StaffServicePrice.ServiceType.URGENT_CAR_WASH
+    if is_extra_shift:
+        return StaffServicePrice.ServiceType.CAR_TRANSPORTER_EXTRA_SHIFT
+    car_class_type_to_service_name: dict[str, str] = {
+        CarToWash.CarType.COMFORT: StaffServicePrice.ServiceType.COMFORT_CLASS_CAR_TRANSFER,
+        CarToWash.CarType.BUSINESS: StaffServicePrice.ServiceType.BUSINESS_CLASS_CAR_TRANSFER,
+        CarToWash.CarType.VAN: StaffServicePrice.ServiceType.VAN_TRANSFER,
+    }
+    return car_class_type_to_service_name[class_type]
 
+
+def compute_car_transfer_price(
+    *,
+    class_type: str,
+    wash_type: str,
+    is_extra_shift: bool,
+) -> int:
+    service_name = get_car_transfer_service_type(
+        class_type=class_type,
+        wash_type=wash_type,
+        is_extra_shift=is_extra_shift,
+    )
     try:
         staff_service_price = StaffServicePrice.objects.get(service=service_name)
     except StaffServicePrice.DoesNotExist:
@@ -102,17 +113,20 @@ class TransferredCarCreateUseCase:
     windshield_washer_refilled_bottle_percentage: int
     additional_services: list[AdditionalService]
 
+    @profiled
     @transaction.atomic
     def execute(self) -> TransferredCarCreateResultDto:
-        shift = get_staff_current_shift(self.staff_id)
+        shift = get_staff_active_shift(self.staff_id)
         transfer_price = compute_car_transfer_price(
             class_type=self.car_class,
             wash_type=self.wash_type,
             is_extra_shift=shift.is_extra,
         )
-        car_wash = shift.car_wash
         transferred_car = CarToWash(
             shift_id=shift.id,
+            # Copies of the snapshot, save() would load the shift for them.
+            shift_date=shift.date,
+            staff_id=self.staff_id,
             number=self.number.lower(),
             car_class=self.car_class,
             wash_type=self.wash_type,
@@ -121,21 +135,23 @@ class TransferredCarCreateUseCase:
                 self.windshield_washer_refilled_bottle_percentage
             ),
             transfer_price=transfer_price,
-            car_wash=car_wash,
-            comfort_class_car_washing_price=car_wash.comfort_class_car_washing_price,
-            business_class_car_washing_price=car_wash.business_class_car_washing_price,
-            van_washing_price=car_wash.van_washing_price,
-            windshield_washer_price_per_bottle=car_wash.windshield_washer_price_per_bottle,
+            car_wash_id=shift.car_wash_id,
+            comfort_class_car_washing_price=shift.comfort_class_car_washing_price,
+            business_class_car_washing_price=shift.business_class_car_washing_price,
+            van_washing_price=shift.van_washing_price,
+            windshield_washer_price_per_bottle=shift.windshield_washer_price_per_bottle,
         )
         try:
-            transferred_car.full_clean()
+            # Shift and car wash come from the active shift snapshot,
+            # foreign keys are still guarded by the database constraints.
+            transferred_car.full_clean(exclude=("shift", "staff", "car_wash"))
             transferred_car.save()
-        except ValidationError:
+        except (ValidationError, IntegrityError):
             raise CarAlreadyWashedOnShiftError
 
         service_ids = [service["id"] for service in self.additional_services]
         service_id_to_price = get_car_wash_service_prices(
-            car_wash_id=car_wash.id,
+            car_wash_id=shift.car_wash_id,
             car_wash_service_ids=service_ids,
         )
         CarToWashAdditionalService.objects.filter(car=transferred_car).delete()
@@ -143,6 +159,9 @@ class TransferredCarCreateUseCase:
             services = [
                 CarToWashAdditionalService(
                     car=transferred_car,
+                    shift_date=transferred_car.shift_date,
+                    shift_id=transferred_car.shift_id,
+                    staff_id=transferred_car.staff_id,
                     service_id=service["id"],
                     count=service["count"],
                     price=service_id_to_price[service["id"]],
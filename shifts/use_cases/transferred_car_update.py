@@ -2,6 +2,7 @@ from dataclasses import dataclass
 
 from django.db import transaction
 
+from core.profiling import profiled
 from shifts.models import CarToWash, CarToWashAdditionalService
 from shifts.services.cars_to_wash import get_car_wash_service_prices
 
@@ -31,12 +32,15 @@ class TransferredCarUpdateUseCase:
     windshield_washer_refilled_bottle_percentage: int | None = None
     additional_services: list[dict] | None = None
 
+    @profiled
     @transaction.atomic
     def execute(self) -> list[CarToWashAdditionalService]:
         """
         Update all fields of CarToWash and its additional services.
         """
-        transferred_car = CarToWash.objects.get(id=self.car_id)
+        transferred_car = CarToWash.objects.select_related("shift").get(
+            id=self.car_id,
+        )
         old_car_wash_id = transferred_car.car_wash_id
 
         if self.number is not None:
@@ -69,6 +73,9 @@ class TransferredCarUpdateUseCase:
             services = [
                 CarToWashAdditionalService(
                     car_id=self.car_id,
+                    shift_date=transferred_car.shift_date,
+                    shift_id=transferred_car.shift_id,
+                    staff_id=transferred_car.staff_id,
                     service_id=service["id"],
                     count=service["count"],
                     price=service_id_to_price[service["id"]],
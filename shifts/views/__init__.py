@@ -2,12 +2,14 @@ from .available_dates import AvailableDateApi
 from .cars_to_wash import (
     CarToWashListApi,
     RetrieveUpdateCarsToWashApi,
+    TransferredCarBulkCreateApi,
     TransferredCarListCreateApi,
     CarsToWashCountByEachStaffApi,
     CarsWithoutWindshieldWasherApi,
 )
 from .shifts import (
     DeadSoulsApi,
+    DeadSoulsForMonthsApi,
     ShiftListApi,
     ShiftListApiV2,
     ShiftStartApi,
@@ -17,11 +19,13 @@ from .shifts import (
     ShiftRetrieveApi,
     StaffShiftListApi,
     ShiftTestCreateApi,
+    ShiftBulkCreateApi,
     ShiftExtraCreateApi,
     ShiftRegularCreateApi,
     ShiftRetrieveDeleteApi,
     StaffShiftsMonthListApi,
     StaffReportPeriodsListApi,
+    StaffListReportPeriodsListApi,
     ShiftListForSpecificDateApi,
     CurrentShiftCarWashUpdateApi,
     StaffCurrentShiftRetrieveApi,
@@ -32,10 +36,12 @@ __all__ = (
     "AvailableDateApi",
     "CarToWashListApi",
     "RetrieveUpdateCarsToWashApi",
+    "TransferredCarBulkCreateApi",
     "TransferredCarListCreateApi",
     "CarsToWashCountByEachStaffApi",
     "CarsWithoutWindshieldWasherApi",
     "DeadSoulsApi",
+    "DeadSoulsForMonthsApi",
     "ShiftListApi",
     "ShiftListApiV2",
     "ShiftStartApi",
@@ -45,11 +51,13 @@ __all__ = (
     "ShiftRetrieveApi",
     "StaffShiftListApi",
     "ShiftTestCreateApi",
+    "ShiftBulkCreateApi",
     "ShiftExtraCreateApi",
     "ShiftRegularCreateApi",
     "ShiftRetrieveDeleteApi",
     "StaffShiftsMonthListApi",
     "StaffReportPeriodsListApi",
+    "StaffListReportPeriodsListApi",
     "ShiftListForSpecificDateApi",
     "CurrentShiftCarWashUpdateApi",
     "StaffCurrentShiftRetrieveApi",
@@ -1,3 +1,4 @@
+from .bulk_create import TransferredCarBulkCreateApi
 from .list_create import TransferredCarListCreateApi
 from .current_shift_cars import CarToWashListApi
 from .retrieve_update import RetrieveUpdateCarsToWashApi
@@ -5,6 +6,7 @@ from .statistics import CarsToWashCountByEachStaffApi, CarsWithoutWindshieldWash
 
 
 __all__ = (
+    "TransferredCarBulkCreateApi",
     "TransferredCarListCreateApi",
     "CarToWashListApi",
     "RetrieveUpdateCarsToWashApi",
@@ -0,0 +1,31 @@
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from shifts.serializers import (
+    TransferredCarBulkCreateInputSerializer,
+    TransferredCarBulkCreateOutputSerializer,
+)
+from shifts.use_cases.transferred_car_bulk_create import (
+    TransferredCarBulkCreateUseCase,
+)
+
+
+class TransferredCarBulkCreateApi(APIView):
+    def post(self, request: Request) -> Response:
+        serializer = TransferredCarBulkCreateInputSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        serialized_data = serializer.validated_data
+        shift_id: int = serialized_data["shift_id"]
+        car_wash_id: int | None = serialized_data["car_wash_id"]
+        cars = serialized_data["cars"]
+
+        result = TransferredCarBulkCreateUseCase(
+            shift_id=shift_id,
+            car_wash_id=car_wash_id,
+            cars=cars,
+        ).execute()
+
+        serializer = TransferredCarBulkCreateOutputSerializer(result)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
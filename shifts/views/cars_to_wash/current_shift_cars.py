@@ -1,50 +1,36 @@
-from django.db.models import Prefetch
 from rest_framework import serializers, views
 from rest_framework.response import Response
 
-from shifts.models import CarToWash, CarToWashAdditionalService
-from shifts.selectors import get_staff_current_shift
+from shifts.selectors import get_shift_cars, get_staff_active_shift
 
 
-class CarToWashAdditionalServiceSerializer(serializers.ModelSerializer):
-    id = serializers.UUIDField(source="service_id")
+class CarToWashListInputSerializer(serializers.Serializer):
+    since = serializers.DateTimeField(default=None, allow_null=True)
 
-    class Meta:
-        model = CarToWashAdditionalService
-        fields = ("id", "count")
 
+class CarToWashAdditionalServiceSerializer(serializers.Serializer):
+    id = serializers.UUIDField()
+    count = serializers.IntegerField()
 
-class CarToWashSerializer(serializers.ModelSerializer):
-    additional_services = CarToWashAdditionalServiceSerializer(
-        many=True, read_only=True
-    )
 
-    class Meta:
-        model = CarToWash
-        fields = [
-            "id",
-            "number",
-            "car_class",
-            "wash_type",
-            "windshield_washer_refilled_bottle_percentage",
-            "created_at",
-            "additional_services",
-        ]
+class CarToWashSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    number = serializers.CharField()
+    car_class = serializers.CharField()
+    wash_type = serializers.CharField()
+    windshield_washer_refilled_bottle_percentage = serializers.IntegerField()
+    created_at = serializers.DateTimeField()
+    additional_services = CarToWashAdditionalServiceSerializer(many=True)
 
 
 class CarToWashListApi(views.APIView):
     def get(self, request, staff_id: int):
-        shift = get_staff_current_shift(staff_id)
-        queryset = CarToWash.objects.filter(
-            shift__staff_id=staff_id,
-            shift_id=shift.id,
-        ).prefetch_related(
-            Prefetch(
-                "additional_services",
-                queryset=CarToWashAdditionalService.objects.all(),
-                to_attr="additional_services_prefetched",
-            )
-        )
-
-        serializer = CarToWashSerializer(queryset, many=True)
+        serializer = CarToWashListInputSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        since = serializer.validated_data["since"]
+
+        shift = get_staff_active_shift(staff_id)
+        cars = get_shift_cars(shift_id=shift.id, since=since)
+
+        serializer = CarToWashSerializer(cars, many=True)
         return Response({"cars": serializer.data})
@@ -3,11 +3,12 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from core.encoders import encode_dataclass
+from core.idempotency import idempotent
 from shifts.serializers import (
     TransferredCarCreateInputSerializer,
     TransferredCarCreateOutputSerializer,
     TransferredCarListInputSerializer,
-    TransferredCarListOutputSerializer,
 )
 from shifts.services import TransferredCarListInteractor
 from staff.services import update_last_activity_time
@@ -25,9 +26,9 @@ class TransferredCarListCreateApi(APIView):
         interactor = TransferredCarListInteractor(shift_id=shift_id)
         transferred_cars = interactor.execute()
 
-        serializer = TransferredCarListOutputSerializer(transferred_cars)
-        return Response(serializer.data)
+        return Response(encode_dataclass(transferred_cars))
 
+    @idempotent("transferred-car-create")
     def post(self, request: Request) -> Response:
         serializer = TransferredCarCreateInputSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
@@ -1,5 +1,6 @@
 from .confirm import ShiftConfirmApi
 from .create import (
+    ShiftBulkCreateApi,
     ShiftExtraCreateApi,
     ShiftRegularCreateApi,
     ShiftTestCreateApi,
@@ -9,11 +10,14 @@ from .current import (
     CurrentShiftCarWashUpdateApi,
     StaffCurrentShiftRetrieveApi,
 )
-from .dead_souls import DeadSoulsApi
+from .dead_souls import DeadSoulsApi, DeadSoulsForMonthsApi
 from .list import ShiftListApi, ShiftListApiV2
 from .months import StaffShiftsMonthListApi
 from .reject import ShiftRejectApi
-from .report_periods import StaffReportPeriodsListApi
+from .report_periods import (
+    StaffListReportPeriodsListApi,
+    StaffReportPeriodsListApi,
+)
 from .retrieve import ShiftRetrieveApi
 from .retrieve_delete import ShiftRetrieveDeleteApi
 from .shift_dates import StaffShiftListApi
@@ -23,6 +27,7 @@ from .start import ShiftStartApi
 
 __all__ = (
     "ShiftConfirmApi",
+    "ShiftBulkCreateApi",
     "ShiftExtraCreateApi",
     "ShiftRegularCreateApi",
     "ShiftTestCreateApi",
@@ -30,11 +35,13 @@ __all__ = (
     "CurrentShiftCarWashUpdateApi",
     "StaffCurrentShiftRetrieveApi",
     "DeadSoulsApi",
+    "DeadSoulsForMonthsApi",
     "ShiftListApi",
     "ShiftListApiV2",
     "StaffShiftsMonthListApi",
     "ShiftRejectApi",
     "StaffReportPeriodsListApi",
+    "StaffListReportPeriodsListApi",
     "ShiftRetrieveApi",
     "ShiftRetrieveDeleteApi",
     "StaffShiftListApi",
@@ -1,9 +1,11 @@
+from .bulk import ShiftBulkCreateApi
 from .extra import ShiftExtraCreateApi
 from .regular import ShiftRegularCreateApi
 from .test import ShiftTestCreateApi
 
 
 __all__ = (
+    "ShiftBulkCreateApi",
     "ShiftExtraCreateApi",
     "ShiftRegularCreateApi",
     "ShiftTestCreateApi",
@@ -0,0 +1,27 @@
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from shifts.serializers import (
+    ShiftBulkCreateInputSerializer,
+    ShiftExtraCreateOutputSerializer,
+)
+from shifts.services.shifts import ShiftBulkCreateInteractor
+
+
+class ShiftBulkCreateApi(APIView):
+    def post(self, request: Request) -> Response:
+        serializer = ShiftBulkCreateInputSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        validated_data: dict = serializer.validated_data
+        shift_type: str = validated_data["shift_type"]
+        shifts: list[dict] = validated_data["shifts"]
+
+        created_shifts = ShiftBulkCreateInteractor(
+            shifts=shifts,
+            shift_type=shift_type,
+        ).execute()
+
+        serializer = ShiftExtraCreateOutputSerializer(created_shifts)
+        return Response(serializer.data, status.HTTP_201_CREATED)
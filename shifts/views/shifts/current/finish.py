@@ -2,6 +2,7 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from core.idempotency import idempotent
 from shifts.selectors import get_staff_current_shift
 from shifts.serializers import (
     ShiftFinishInputSerializer,
@@ -15,6 +16,7 @@ __all__ = ("ShiftFinishApi",)
 
 
 class ShiftFinishApi(APIView):
+    @idempotent("shift-finish")
     def post(self, request: Request) -> Response:
         serializer = ShiftFinishInputSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
@@ -3,13 +3,18 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from shifts.serializers import (
+    DeadSoulsForMonthsInputSerializer,
+    DeadSoulsForMonthsOutputSerializer,
     DeadSoulsInputSerializer,
     DeadSoulsOutputSerializer,
 )
-from shifts.services import DeadSoulsReadInteractor
+from shifts.services import (
+    DeadSoulsForMonthsReadInteractor,
+    DeadSoulsReadInteractor,
+)
 
 
-__all__ = ("DeadSoulsApi",)
+__all__ = ("DeadSoulsApi", "DeadSoulsForMonthsApi")
 
 
 class DeadSoulsApi(APIView):
@@ -27,3 +32,19 @@ class DeadSoulsApi(APIView):
 
         serializer = DeadSoulsOutputSerializer(dead_souls)
         return Response(serializer.data)
+
+
+class DeadSoulsForMonthsApi(APIView):
+    def get(self, request: Request):
+        serializer = DeadSoulsForMonthsInputSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        data: dict = serializer.validated_data
+        year: int = data["year"]
+        months: list[int] = data["months"]
+
+        dead_souls = DeadSoulsForMonthsReadInteractor(
+            months=[(year, month) for month in months],
+        ).execute()
+
+        serializer = DeadSoulsForMonthsOutputSerializer({"months": dead_souls})
+        return Response(serializer.data)
@@ -4,13 +4,13 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from core.encoders import encode_dataclass
 from shifts.models import Shift
 from shifts.selectors import get_shifts_page
 from shifts.serializers import (
     ShiftListInputSerializer,
     ShiftListOutputSerializer,
     ShiftListV2InputSerializer,
-    ShiftListV2OutputSerializer,
 )
 
 __all__ = ("ShiftListApi", "ShiftListApiV2")
@@ -37,8 +37,7 @@ class ShiftListApiV2(APIView):
             shift_types=shift_types,
         )
 
-        serializer = ShiftListV2OutputSerializer(shifts_page)
-        return Response(serializer.data)
+        return Response(encode_dataclass(shifts_page))
 
 
 class ShiftListApi(APIView):
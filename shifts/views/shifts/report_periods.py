@@ -2,10 +2,17 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from shifts.serializers import StaffReportPeriodsOutputSerializer
-from shifts.services.report_periods import StaffReportPeriodsReadInteractor
+from shifts.serializers import (
+    StaffListReportPeriodsInputSerializer,
+    StaffListReportPeriodsOutputSerializer,
+    StaffReportPeriodsOutputSerializer,
+)
+from shifts.services.report_periods import (
+    StaffListReportPeriodsReadInteractor,
+    StaffReportPeriodsReadInteractor,
+)
 
-__all__ = ("StaffReportPeriodsListApi",)
+__all__ = ("StaffReportPeriodsListApi", "StaffListReportPeriodsListApi")
 
 
 class StaffReportPeriodsListApi(APIView):
@@ -19,3 +26,24 @@ class StaffReportPeriodsListApi(APIView):
 
         serializer = StaffReportPeriodsOutputSerializer(staff_report_periods)
         return Response(serializer.data)
+
+
+class StaffListReportPeriodsListApi(APIView):
+    """
+    Get all report periods for each of many staff members at once.
+    """
+
+    def get(self, request: Request) -> Response:
+        serializer = StaffListReportPeriodsInputSerializer(
+            data=request.query_params,
+        )
+        serializer.is_valid(raise_exception=True)
+        staff_ids: list[int] = serializer.validated_data["staff_ids"]
+
+        interactor = StaffListReportPeriodsReadInteractor(staff_ids=staff_ids)
+        staff_list_report_periods = interactor.execute()
+
+        serializer = StaffListReportPeriodsOutputSerializer(
+            staff_list_report_periods,
+        )
+        return Response(serializer.data)
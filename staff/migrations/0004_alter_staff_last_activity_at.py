@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:03
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("staff", "0003_staffregisterrequest"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="staff",
+            name="last_activity_at",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
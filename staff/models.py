@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 __all__ = ("Staff", "AdminStaff", "StaffRegisterRequest")
@@ -11,7 +12,7 @@ class Staff(models.Model):
     console_phone_number = models.CharField(max_length=32)
     banned_at = models.DateTimeField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
-    last_activity_at = models.DateTimeField(auto_now=True)
+    last_activity_at = models.DateTimeField(default=timezone.now)
 
     class Meta:
         verbose_name = _("staff")
@@ -1,10 +1,14 @@
+import atexit
 import datetime
+import threading
 from dataclasses import dataclass
 
+from django.conf import settings
 from django.core.exceptions import ValidationError
-from django.db import IntegrityError, transaction
+from django.db import IntegrityError, connection, transaction
 from django.utils import timezone
 
+from core.profiling import profiled
 from shifts.services import ShiftsDeleteOnStaffBanInteractor
 from staff.exceptions import (
     StaffRegisterRequestAlreadyExistsError,
@@ -18,6 +22,8 @@ __all__ = (
     "StaffRegisterRequestAcceptInteractor",
     "update_staff",
     "update_last_activity_time",
+    "StaffActivityTracker",
+    "get_staff_activity_tracker",
     "StaffRegisterRequestCreateInteractor",
     "StaffRegisterRequestRejectInteractor",
 )
@@ -53,6 +59,7 @@ class StaffRegisterRequestCreateInteractor:
     car_sharing_phone_number: str
     console_phone_number: str
 
+    @profiled
     def execute(self):
         ensure_staff_not_exists(self.staff_id)
 
@@ -83,6 +90,7 @@ class StaffRegisterRequestCreateInteractor:
 class StaffRegisterRequestAcceptInteractor:
     request_id: int
 
+    @profiled
     @transaction.atomic
     def execute(self) -> StaffCreateResult:
         try:
@@ -129,6 +137,7 @@ class StaffRegisterRequestAcceptInteractor:
 class StaffRegisterRequestRejectInteractor:
     request_id: int
 
+    @profiled
     def execute(self) -> None:
         try:
             staff_register_request = StaffRegisterRequest.objects.get(
@@ -161,11 +170,125 @@ def update_staff(
         ).execute()
 
     is_updated = Staff.objects.filter(id=staff_id).update(banned_at=banned_at)
-    update_last_activity_time(staff_id=staff_id)
     if not is_updated:
         raise StaffNotFoundError
+    update_last_activity_time(staff_id=staff_id)
+
+
+class StaffActivityTracker:
+    """
+    Write-behind tracker of staff last activity time.
+
+    Touches are coalesced in memory (only the latest time per staff member
+    is kept) and written with a single UPDATE ... FROM (VALUES ...)
+    at most once per flush interval, instead of an UPDATE per request.
+    Each process has its own buffer, flushed only by a timer thread, so
+    stored values lag behind by at most the interval. Touches never flush
+    the buffer in the caller's transaction: it would hold locks of other
+    staff rows until the caller commits and lose their touches on rollback.
+
+    Args:
+        flush_interval: seconds between flushes, 0 to write immediately.
+            Defaults to STAFF_ACTIVITY_FLUSH_INTERVAL setting.
+    """
+
+    def __init__(self, flush_interval: float | None = None):
+        self.__flush_interval = flush_interval
+        self.__lock = threading.Lock()
+        self.__pending: dict[int, datetime.datetime] = {}
+        self.__timer: threading.Timer | None = None
+
+    @property
+    def flush_interval(self) -> float:
+        if self.__flush_interval is None:
+            return settings.STAFF_ACTIVITY_FLUSH_INTERVAL
+        return self.__flush_interval
+
+    @property
+    def pending_staff_ids(self) -> set[int]:
+        with self.__lock:
+            return set(self.__pending)
+
+    def touch(self, staff_id: int) -> None:
+        now = timezone.now()
+        if self.flush_interval <= 0:
+            # Only the touched row is written, as a part of the caller's work.
+            self.__write({staff_id: now})
+            return
+        with self.__lock:
+            self.__pending[staff_id] = now
+            self.__schedule_flush()
+
+    def __schedule_flush(self) -> None:
+        if self.__timer is not None:
+            return
+        self.__timer = threading.Timer(
+            self.flush_interval,
+            self.__flush_in_background,
+        )
+        self.__timer.daemon = True
+        self.__timer.start()
+
+    def __flush_in_background(self) -> None:
+        try:
+            self.flush()
+        finally:
+            # Timer threads get their own database connection.
+            connection.close()
+
+    def flush(self) -> int:
+        """
+        Write all pending touches to the database.
+
+        Returns:
+            Number of staff members whose activity time was written.
+        """
+        with self.__lock:
+            pending, self.__pending = self.__pending, {}
+            if self.__timer is not None:
+                self.__timer.cancel()
+                self.__timer = None
+
+        if not pending:
+            return 0
+        self.__write(pending)
+        return len(pending)
+
+    @staticmethod
+    def __write(pending: dict[int, datetime.datetime]) -> None:
+        values = ", ".join(["(%s::bigint, %s::timestamptz)"] * len(pending))
+        params = [
+            param
+            for staff_id, last_activity_at in pending.items()
+            for param in (staff_id, last_activity_at)
+        ]
+        table_name = connection.ops.quote_name(Staff._meta.db_table)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                UPDATE {table_name} AS staff
+                SET last_activity_at = GREATEST(
+                    staff.last_activity_at, activity.last_activity_at
+                )
+                FROM (VALUES {values}) AS activity(staff_id, last_activity_at)
+                WHERE staff.id = activity.staff_id
+                """,
+                params,
+            )
+
+
+_staff_activity_tracker: StaffActivityTracker | None = None
+_staff_activity_tracker_lock = threading.Lock()
+
+
+def get_staff_activity_tracker() -> StaffActivityTracker:
+    global _staff_activity_tracker
+    with _staff_activity_tracker_lock:
+        if _staff_activity_tracker is None:
+            _staff_activity_tracker = StaffActivityTracker()
+            atexit.register(_staff_activity_tracker.flush)
+        return _staff_activity_tracker
 
 
 def update_last_activity_time(*, staff_id: int) -> None:
-    now = timezone.now()
-    Staff.objects.filter(id=staff_id).update(last_activity_at=now)
+    get_staff_activity_tracker().touch(staff_id)
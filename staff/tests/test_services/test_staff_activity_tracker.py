@@ -0,0 +1,97 @@
+import datetime
+
+import pytest
+from django.db import transaction
+from django.utils import timezone
+from freezegun import freeze_time
+
+from staff import services as staff_services
+from staff.exceptions import StaffNotFoundError
+from staff.models import Staff
+from staff.services import StaffActivityTracker, update_staff
+from staff.tests.factories import StaffFactory
+
+
+@pytest.mark.django_db
+def test_touches_are_written_immediately_without_flush_interval():
+    staff = StaffFactory(
+        last_activity_at=datetime.datetime(2025, 1, 1, tzinfo=datetime.UTC),
+    )
+    tracker = StaffActivityTracker(flush_interval=0)
+
+    with freeze_time("2025-01-02 10:00:00+00:00"):
+        tracker.touch(staff.id)
+
+    staff.refresh_from_db()
+    assert staff.last_activity_at == datetime.datetime(
+        2025, 1, 2, 10, tzinfo=datetime.UTC
+    )
+    assert tracker.pending_staff_ids == set()
+
+
+@pytest.mark.django_db
+def test_touches_are_coalesced_and_flushed_in_single_query(
+    django_assert_num_queries,
+):
+    staff_list = StaffFactory.create_batch(
+        3,
+        last_activity_at=datetime.datetime(2025, 1, 1, tzinfo=datetime.UTC),
+    )
+    tracker = StaffActivityTracker(flush_interval=3600)
+
+    with django_assert_num_queries(0):
+        for staff in staff_list * 5:
+            tracker.touch(staff.id)
+
+    assert tracker.pending_staff_ids == {staff.id for staff in staff_list}
+
+    with django_assert_num_queries(1):
+        assert tracker.flush() == 3
+
+    assert tracker.pending_staff_ids == set()
+    assert not Staff.objects.filter(
+        last_activity_at=datetime.datetime(2025, 1, 1, tzinfo=datetime.UTC)
+    ).exists()
+
+
+@pytest.mark.django_db
+def test_flush_does_not_move_last_activity_back():
+    later = timezone.now() + datetime.timedelta(days=1)
+    staff = StaffFactory(last_activity_at=later)
+    tracker = StaffActivityTracker(flush_interval=3600)
+
+    tracker.touch(staff.id)
+    tracker.flush()
+
+    staff.refresh_from_db()
+    assert staff.last_activity_at == later
+
+
+@pytest.mark.django_db
+def test_touches_in_transaction_do_not_flush_pending_touches(
+    django_assert_num_queries,
+):
+    staff, other_staff = StaffFactory.create_batch(2)
+    tracker = StaffActivityTracker(flush_interval=60)
+
+    with freeze_time("2025-01-02 10:00:00+00:00") as frozen_datetime:
+        tracker.touch(other_staff.id)
+        frozen_datetime.tick(datetime.timedelta(minutes=5))
+        with pytest.raises(RuntimeError), transaction.atomic():
+            with django_assert_num_queries(0):
+                tracker.touch(staff.id)
+            raise RuntimeError
+
+    assert tracker.pending_staff_ids == {staff.id, other_staff.id}
+    assert tracker.flush() == 2
+
+
+@pytest.mark.django_db
+def test_update_of_missing_staff_does_not_touch_activity(monkeypatch):
+    tracker = StaffActivityTracker(flush_interval=3600)
+    monkeypatch.setattr(staff_services, "_staff_activity_tracker", tracker)
+
+    with pytest.raises(StaffNotFoundError):
+        update_staff(staff_id=1, is_banned=False)
+
+    assert tracker.pending_staff_ids == set()
@@ -3,11 +3,9 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from core.encoders import encode_dataclass
 from staff.selectors import get_all_staff
-from staff.serializers import (
-    StaffListInputSerializer,
-    StaffListOutputSerializer,
-)
+from staff.serializers import StaffListInputSerializer
 
 __all__ = ("StaffListApi",)
 
@@ -29,5 +27,4 @@ class StaffListApi(APIView):
             limit=limit,
             offset=offset,
         )
-        serializer = StaffListOutputSerializer(staff_list_page)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return Response(encode_dataclass(staff_list_page), status=status.HTTP_200_OK)
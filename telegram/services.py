@@ -1,8 +1,17 @@
 from collections.abc import Iterable
+from typing import TYPE_CHECKING
 
 from django.conf import settings
-from telebot import TeleBot
-from telebot.types import InlineKeyboardMarkup, InputMediaPhoto
+
+from core.metrics import metrics_registry
+
+
+# telebot pulls in requests and its own dependencies, which most
+# processes (e.g. workers serving reports) never use, so it is
+# imported on first use.
+if TYPE_CHECKING:
+    from telebot import TeleBot
+    from telebot.types import InlineKeyboardMarkup
 
 
 __all__ = (
@@ -11,34 +20,45 @@ __all__ = (
     "try_send_photos_media_group",
     "try_get_chat_username",
     "get_dry_cleaning_telegram_bot",
+    "get_file_url",
+)
+
+TELEGRAM_REQUEST_DURATION = metrics_registry.histogram(
+    "telegram_request_duration_seconds",
+    "Duration of Telegram Bot API requests, retries are observed separately.",
+    labelnames=("method", "outcome"),
 )
 
 
-def get_telegram_bot() -> TeleBot:
+def get_telegram_bot() -> "TeleBot":
+    from telebot import TeleBot
+
     return TeleBot(token=settings.TELEGRAM_BOT_TOKEN)
 
 
-def get_dry_cleaning_telegram_bot() -> TeleBot:
+def get_dry_cleaning_telegram_bot() -> "TeleBot":
+    from telebot import TeleBot
+
     return TeleBot(token=settings.DRY_CLEANING_TELEGRAM_BOT_TOKEN)
 
 
 def try_send_message(
-    bot: TeleBot,
+    bot: "TeleBot",
     chat_id: int,
     text: str,
     parse_mode: str | None = "html",
-    reply_markup: InlineKeyboardMarkup | None = None,
+    reply_markup: "InlineKeyboardMarkup | None" = None,
 ) -> bool:
     for _ in range(5):
         try:
-            return bool(
-                bot.send_message(
+            with TELEGRAM_REQUEST_DURATION.time(method="send_message"):
+                message = bot.send_message(
                     chat_id,
                     text,
                     parse_mode=parse_mode,
                     reply_markup=reply_markup,
-                ),
-            )
+                )
+            return bool(message)
         except Exception:
             pass
     else:
@@ -46,12 +66,14 @@ def try_send_message(
 
 
 def try_send_photos_media_group(
-    bot: TeleBot,
+    bot: "TeleBot",
     chat_id: int,
     file_ids: Iterable[str],
     caption: str | None,
     parse_mode: str | None = "html",
 ) -> bool:
+    from telebot.types import InputMediaPhoto
+
     media = []
     file_ids = tuple(file_ids)
 
@@ -71,10 +93,11 @@ def try_send_photos_media_group(
 
     for _ in range(5):
         try:
-            bot.send_media_group(
-                chat_id=chat_id,
-                media=media,
-            )
+            with TELEGRAM_REQUEST_DURATION.time(method="send_media_group"):
+                bot.send_media_group(
+                    chat_id=chat_id,
+                    media=media,
+                )
         except Exception as error:
             print(error)
             return False
@@ -84,14 +107,20 @@ def try_send_photos_media_group(
 
 
 def try_get_chat_username(
-    bot: TeleBot,
+    bot: "TeleBot",
     chat_id: int,
 ) -> str | None:
     for _ in range(5):
         try:
-            chat = bot.get_chat(chat_id)
+            with TELEGRAM_REQUEST_DURATION.time(method="get_chat"):
+                chat = bot.get_chat(chat_id)
             return chat.username
         except Exception:
             return None
     else:
         return None
+
+
+def get_file_url(bot: "TeleBot", file_id: str) -> str:
+    with TELEGRAM_REQUEST_DURATION.time(method="get_file_url"):
+        return bot.get_file_url(file_id)